@@ -11,6 +11,8 @@ import re
 from pathlib import Path
 from typing import Iterator, List, Optional
 
+from qa_engine.infrastructure.indexing.code_blocks import find_code_blocks
+
 from .config import DedupConfig
 from .models import ChapterChunk
 
@@ -26,17 +28,6 @@ class ChapterChunker:
     def __init__(self, config: Optional[DedupConfig] = None) -> None:
         """Initialize chunker with configuration."""
         self._config = config or DedupConfig()
-        self._excluded_pattern = self._build_exclusion_pattern()
-
-    def _build_exclusion_pattern(self) -> re.Pattern:
-        """Build regex pattern for excluded environments."""
-        envs = self._config.excluded_environments
-        if not envs:
-            return re.compile(r"(?!)")  # Never matches
-
-        env_names = "|".join(re.escape(env) for env in envs)
-        pattern = rf"\\begin\{{({env_names})\}}.*?\\end\{{\1\}}"
-        return re.compile(pattern, re.DOTALL)
 
     def _extract_chapter_num(self, file_path: Path) -> int:
         """Extract chapter number from filename."""
@@ -46,8 +37,15 @@ class ChapterChunker:
         return 0
 
     def _strip_excluded_environments(self, content: str) -> str:
-        """Remove excluded environments from content."""
-        return self._excluded_pattern.sub("", content)
+        """Remove excluded environments from content; unclosed ones are kept."""
+        blocks = find_code_blocks(content, self._config.excluded_environments)
+        pieces, last = [], 0
+        for block in blocks:
+            if not block.closed:
+                continue  # Would strip to the end of the chapter
+            pieces.append(content[last:block.start])
+            last = block.end
+        return "".join(pieces) + content[last:]
 
     def _clean_content(self, content: str) -> str:
         """Clean content for comparison - remove LaTeX commands."""
@@ -9,6 +9,7 @@ This validator catches syntax issues BEFORE they cause compilation failures.
 
 import re
 from typing import Dict, List
+from ...infrastructure.indexing.code_blocks import find_code_blocks
 from .base import BCValidatorInterface, BCValidationIssue
 
 
@@ -37,8 +38,13 @@ class BCCodeSyntaxValidator(BCValidatorInterface):
         """
         issues = []
         lines = content.split("\n")
+        # Only pythonbox begin lines can break these rules
+        begin_lines = {
+            block.line for block in find_code_blocks(content, ("pythonbox", "pythonbox*"))
+        }
 
-        for i, line in enumerate(lines, 1):
+        for i in sorted(begin_lines):
+            line = lines[i - 1]
             # Rule 1: pythonbox with curly braces instead of square brackets
             # WRONG: \begin{pythonbox}{Title}
             # RIGHT: \begin{pythonbox}[Title]
@@ -106,7 +112,7 @@ class BCCodeSyntaxValidator(BCValidatorInterface):
             if r"\end{english}" in line:
                 in_english = False
 
-            if pythonbox_pattern.search(line) and not in_english:
+            if i in begin_lines and pythonbox_pattern.search(line) and not in_english:
                 # Check if english started on same line
                 if not english_pattern.search(line):
                     issues.append(BCValidationIssue(
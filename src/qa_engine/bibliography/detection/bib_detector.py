@@ -6,10 +6,13 @@ Implements qa-bib-detect skill.md v1.1 - detects citation and bibliography issue
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from ...infrastructure.indexing.build_artifacts import build_artifact_analyzer
+from ...infrastructure.indexing.xref_graph import CITE, XrefGraph
 from .bib_models import (
     BibDetectResult, BibIssue, BibIssueType, BibSeverity, CitationLocation
 )
@@ -26,6 +29,9 @@ class BibDetector:
     - Step 4: Check for bibliography command
     - Step 5: Verify TOC entry
     - Step 6: Verify bibliography rendered
+
+    Citations and .bib keys are read into an XrefGraph, which answers the
+    cross-reference check; detect_in_project() updates it per changed file.
     """
 
     # Citation command patterns (Step 1)
@@ -52,8 +58,8 @@ class BibDetector:
         r"\\bibliography\{",
     ]
 
-    # TOC entry pattern (Step 5)
-    TOC_PATTERN = r"contentsline.*\{.*(?:References|Bibliography|מקורות).*\}"
+    # TOC entry title pattern (Step 5)
+    TOC_PATTERN = r"References|Bibliography|מקורות"
 
     # English environment pattern (Pattern 6 - v1.1)
     ENGLISH_ENV_PATTERN = r"\\begin\{english\}"
@@ -61,6 +67,9 @@ class BibDetector:
     # Bibitemsep pattern (Pattern 7 - v1.1)
     BIBITEMSEP_PATTERN = r"\\setlength\{\\bibitemsep\}"
 
+    def __init__(self, graph: Optional[XrefGraph] = None) -> None:
+        self.graph = graph if graph is not None else XrefGraph()
+
     def detect_in_project(self, project_path: Path,
                           bib_file: Optional[Path] = None) -> BibDetectResult:
         """Detect bibliography issues in a LaTeX project."""
@@ -69,26 +78,18 @@ class BibDetector:
         # Find all .tex files
         tex_files = list(project_path.rglob("*.tex"))
 
-        # Step 1: Extract citations
-        for tex_file in tex_files:
-            citations = self.extract_citations(tex_file)
-            for key, line in citations:
-                result.citation_locations.append(CitationLocation(
-                    key=key, file=str(tex_file.relative_to(project_path)), line=line
-                ))
-                if key not in result.citations_unique:
-                    result.citations_unique.append(key)
-        result.citations_total = len(result.citation_locations)
-
-        # Step 2: Parse .bib file
+        # Step 2: Find the .bib file
         if bib_file is None:
             bib_file = self._find_bib_file(project_path, tex_files)
         if bib_file and bib_file.exists():
             result.bib_file = str(bib_file.relative_to(project_path))
-            result.bib_entries = self.extract_bib_keys(bib_file)
+        else:
+            bib_file = None
 
-        # Step 3: Cross-reference check
-        self._check_cross_references(result)
+        # Steps 1-3: Citations, .bib keys and their cross-check, from the graph
+        self.graph.scan_files(tex_files + ([bib_file] if bib_file else []))
+        self._collect(result, self.graph, tex_files, bib_file,
+                      lambda name: os.path.relpath(name, project_path))
 
         # Step 4-6: Check bibliography commands and TOC
         self._check_bibliography_setup(result, tex_files, project_path)
@@ -101,17 +102,7 @@ class BibDetector:
             return []
 
         content = tex_file.read_text(encoding="utf-8", errors="ignore")
-        citations = []
-
-        for line_num, line in enumerate(content.split("\n"), 1):
-            for pattern in self.CITE_PATTERNS:
-                for match in re.finditer(pattern, line):
-                    # Handle multiple citations: \cite{key1,key2,key3}
-                    keys = match.group(1).split(",")
-                    for key in keys:
-                        citations.append((key.strip(), line_num))
-
-        return citations
+        return self.extract_citations_from_content(content)
 
     def extract_citations_from_content(self, content: str) -> List[Tuple[str, int]]:
         """Extract citations from content string."""
@@ -119,6 +110,7 @@ class BibDetector:
         for line_num, line in enumerate(content.split("\n"), 1):
             for pattern in self.CITE_PATTERNS:
                 for match in re.finditer(pattern, line):
+                    # Handle multiple citations: \cite{key1,key2,key3}
                     keys = match.group(1).split(",")
                     for key in keys:
                         citations.append((key.strip(), line_num))
@@ -152,25 +144,40 @@ class BibDetector:
         bib_files = list(project_path.rglob("*.bib"))
         return bib_files[0] if bib_files else None
 
-    def _check_cross_references(self, result: BibDetectResult) -> None:
-        """Cross-check citations vs bib entries (Step 3)."""
-        cited_keys = set(result.citations_unique)
-        bib_keys = set(result.bib_entries)
-
-        # Missing entries
-        for key in cited_keys - bib_keys:
-            loc = next((l for l in result.citation_locations if l.key == key), None)
+    def _collect(self, result: BibDetectResult, graph: XrefGraph, tex_files: Sequence[Union[str, Path]],
+                 bib_file: Optional[Union[str, Path]], display: Callable[[str], str]) -> None:
+        """Fill citations and .bib entries from the graph and cross-check them."""
+        for tex_file in tex_files:
+            for occ in graph.occurrences(tex_file):
+                if occ.kind == CITE and not occ.defines:
+                    location = CitationLocation(key=occ.key, file=display(occ.file), line=occ.line)
+                    result.citation_locations.append(location)
+        result.citations_unique = list(dict.fromkeys(loc.key for loc in result.citation_locations))
+        result.citations_total = len(result.citation_locations)
+        if bib_file is not None:
+            result.bib_entries = [o.key for o in graph.occurrences(bib_file) if o.defines and o.kind == CITE]
+        self._check_cross_references(result, graph, display)
+
+    def _check_cross_references(self, result: BibDetectResult, graph: XrefGraph,
+                                display: Callable[[str], str]) -> None:
+        """Cross-check citations vs bib entries (Step 3) with the graph's key lookups."""
+        # Missing entries, reported at their first citation
+        reported = set()
+        for occ in graph.undefined(CITE):
+            if occ.key in reported:
+                continue
+            reported.add(occ.key)
             result.issues.append(BibIssue(
                 type=BibIssueType.MISSING_ENTRY,
                 severity=BibSeverity.CRITICAL,
-                key=key,
-                cited_in=loc.file if loc else None,
-                line=loc.line if loc else None,
-                message=f"Citation '{key}' not found in bibliography"
+                key=occ.key,
+                cited_in=display(occ.file),
+                line=occ.line,
+                message=f"Citation '{occ.key}' not found in bibliography"
             ))
 
         # Unused entries (WARNING per skill.md verdict logic)
-        for key in bib_keys - cited_keys:
+        for key in dict.fromkeys(occ.key for occ in graph.unused(CITE)):
             result.issues.append(BibIssue(
                 type=BibIssueType.UNUSED_ENTRY,
                 severity=BibSeverity.WARNING,
@@ -198,12 +205,13 @@ class BibDetector:
             if "bibintoc" in content or re.search(r"\\addcontentsline\{toc\}.*bib", content):
                 result.bib_in_toc = True
 
-        # Check .toc file if exists
-        toc_files = list(project_path.rglob("*.toc"))
-        for toc_file in toc_files:
-            toc_content = toc_file.read_text(encoding="utf-8", errors="ignore")
-            if re.search(self.TOC_PATTERN, toc_content, re.IGNORECASE):
+        # Check .toc entries and the rendered bibliography (Step 6) in the build artifacts
+        for toc_file in project_path.rglob("*.toc"):
+            artifacts = build_artifact_analyzer().analyze(toc_file)
+            if any(re.search(self.TOC_PATTERN, e.title, re.IGNORECASE) for e in artifacts.toc):
                 result.bib_in_toc = True
+            if ".bbl" in artifacts.files and not artifacts.bib_entries and result.citations_total:
+                result.bib_rendered = False
 
         # Add issues for missing setup
         if not result.has_printbib and result.citations_total > 0:
@@ -213,6 +221,10 @@ class BibDetector:
                 message="No \\printbibliography command found"
             ))
 
+        if not result.bib_rendered:
+            result.issues.append(BibIssue(type=BibIssueType.EMPTY_BIBLIOGRAPHY, severity=BibSeverity.CRITICAL,
+                                          message="Compiled bibliography (.bbl) has no entries"))
+
         if result.has_printbib and not result.bib_in_toc:
             result.issues.append(BibIssue(
                 type=BibIssueType.NOT_IN_TOC,
@@ -251,20 +263,12 @@ class BibDetector:
         """Detect issues in content strings (for testing)."""
         result = BibDetectResult()
 
-        # Extract citations
-        citations = self.extract_citations_from_content(tex_content)
-        for key, line in citations:
-            result.citation_locations.append(CitationLocation(key=key, file="test.tex", line=line))
-            if key not in result.citations_unique:
-                result.citations_unique.append(key)
-        result.citations_total = len(result.citation_locations)
-
-        # Extract bib keys
+        # Citations, bib keys and cross-reference, from a graph of these strings
+        graph = XrefGraph()
+        graph.update("test.tex", tex_content)
         if bib_content:
-            result.bib_entries = self.extract_bib_keys_from_content(bib_content)
-
-        # Cross-reference
-        self._check_cross_references(result)
+            graph.update("test.bib", bib_content)
+        self._collect(result, graph, ["test.tex"], "test.bib" if bib_content else None, os.path.basename)
 
         # Check setup
         for pattern in self.PRINTBIB_PATTERNS:
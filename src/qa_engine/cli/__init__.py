@@ -6,6 +6,7 @@ Provides command-line tools for managing:
 - Tools (list, add, remove, generate)
 - Resources (list, create, update)
 - Pipeline (show, insert, remove, move, run)
+- Regex (audit)
 """
 
 from .main import main
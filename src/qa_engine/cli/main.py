@@ -14,6 +14,7 @@ from .skill_commands import SkillCommands
 from .tool_commands import ToolCommands
 from .resource_commands import ResourceCommands
 from .pipeline_commands import PipelineCommands
+from .regex_commands import RegexCommands
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -42,6 +43,7 @@ def create_parser() -> argparse.ArgumentParser:
     ToolCommands.register(subparsers)
     ResourceCommands.register(subparsers)
     PipelineCommands.register(subparsers)
+    RegexCommands.register(subparsers)
 
     return parser
 
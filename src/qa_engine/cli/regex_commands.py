@@ -0,0 +1,97 @@
+"""
+Regex audit CLI commands.
+
+Commands: audit, bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from ..infrastructure.matching import (
+    RegexAuditor, available_backends, backend_named, benchmark_backends, load_corpus
+)
+from ..infrastructure.matching.regex_auditor import DEFAULT_LENGTHS
+from ..domain.models.issue import Severity
+
+
+class RegexCommands:
+    """Regex audit commands."""
+
+    @staticmethod
+    def register(subparsers: argparse._SubParsersAction) -> None:
+        """Register regex subcommands."""
+        regex_parser = subparsers.add_parser("regex", help="Rule regex auditing")
+        regex_sub = regex_parser.add_subparsers(dest="subcommand")
+
+        # audit
+        audit_p = regex_sub.add_parser("audit", help="Lint and fuzz all rule patterns")
+        audit_p.add_argument("--budget-ms", type=float, default=250.0,
+                             help="Per-probe time budget before growth stops")
+        audit_p.add_argument("--max-length", type=int, default=DEFAULT_LENGTHS[-1],
+                             help="Longest adversarial input")
+        audit_p.add_argument("--json", action="store_true", help="Output as JSON")
+        audit_p.add_argument("--backend", default="re", help="Regex backend (re, re2)")
+        audit_p.add_argument(
+            "--fail-on", choices=["critical", "warning"], default="critical",
+            help="Exit non-zero at this severity"
+        )
+        audit_p.set_defaults(func=RegexCommands.audit)
+
+        # bench
+        bench_p = regex_sub.add_parser("bench", help="Compare regex backends on a corpus")
+        bench_p.add_argument("paths", nargs="+", type=Path, help="Files or directories")
+        bench_p.add_argument("--top", type=int, default=5, help="Slowest patterns to list")
+        bench_p.set_defaults(func=RegexCommands.bench)
+
+    @staticmethod
+    def audit(args: argparse.Namespace) -> int:
+        """Audit every rule pattern and report risky ones."""
+        lengths = [n for n in DEFAULT_LENGTHS if n <= args.max_length]
+        backend = backend_named(args.backend)
+        audits = RegexAuditor(lengths, args.budget_ms, backend=backend).audit_rules()
+
+        if args.json:
+            print(json.dumps([{
+                "label": a.label,
+                "pattern": a.pattern,
+                "severity": a.severity.value if a.severity else None,
+                "findings": [f.code for f in a.findings],
+                "slope": round(a.slope, 2),
+                "worst_ms": round(a.worst_ms, 3),
+                "curve": [[n, round(ms, 3)] for n, ms in a.curve],
+            } for a in audits], indent=2, ensure_ascii=False))
+        else:
+            for a in audits:
+                if a.severity is None:
+                    continue
+                codes = ", ".join(f.code for f in a.findings) or "-"
+                print(f"[{a.severity.value}] {a.label}")
+                print(f"  pattern: {a.pattern}")
+                print(f"  lint: {codes}  slope: {a.slope:.2f}  worst: {a.worst_ms:.1f}ms"
+                      f" at {a.curve[-1][0] if a.curve else 0} chars")
+            print(f"{len(audits)} patterns audited with backend '{backend.name}'")
+
+        failing = {Severity.CRITICAL}
+        if args.fail_on == "warning":
+            failing.add(Severity.WARNING)
+        return 1 if any(a.severity in failing for a in audits) else 0
+
+    @staticmethod
+    def bench(args: argparse.Namespace) -> int:
+        """Time all rule patterns on a corpus with every available backend."""
+        texts = load_corpus(args.paths)
+        if not texts:
+            print("No .tex files found")
+            return 1
+        missing = sorted({"re", "re2"} - set(available_backends()))
+        for timing in benchmark_backends(texts):
+            print(f"{timing.backend}: {timing.total_ms:.1f}ms over {len(texts)} files "
+                  f"({timing.native} native, {timing.fallback} via re, {timing.matches} matches)")
+            for label, ms in timing.slowest(args.top):
+                print(f"  {ms:8.2f}ms  {label}")
+        if missing:
+            print(f"Not installed: {', '.join(missing)}")
+        return 0
@@ -10,9 +10,20 @@ from .coordination import Coordinator, HeartbeatMonitor
 from .detection import BiDiDetector, CodeDetector, TypesetDetector
 from .bidi_orchestrator import BiDiOrchestrator, BiDiOrchestratorResult, BiDiDetectResult, BiDiFixResult
 from .image_orchestrator import ImageOrchestrator, ImageOrchestratorResult, ImageDetectResult, ImageFixResult
-from .super_orchestrator import SuperOrchestrator, SuperOrchestratorResult, FamilyResult
 from .typeset_orchestrator import TypesetOrchestrator, TypesetOrchestratorResult
 
+# The super orchestrator imports every family package, and family detectors
+# import infrastructure.indexing; loading it on first access keeps importing
+# a family package first (qa_engine.table, qa_engine.bibliography) cycle-free.
+_SUPER_ORCHESTRATOR_NAMES = ("FamilyResult", "SuperOrchestrator", "SuperOrchestratorResult")
+
+
+def __getattr__(name: str):
+    if name in _SUPER_ORCHESTRATOR_NAMES:
+        from . import super_orchestrator
+        return getattr(super_orchestrator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "BackupResult",
     "Coordinator",
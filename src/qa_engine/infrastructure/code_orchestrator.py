@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from ..domain.models.issue import Issue
 from .detection.code_detector import CodeDetector
+from .detection.listing_syntax_detector import ListingSyntaxDetector
 from .fixing.code_fixer import CodeFixer
 
 
@@ -15,11 +16,12 @@ class CodeDetectResult:
     hebrew_content_issues: List[Issue] = field(default_factory=list)
     fstring_issues: List[Issue] = field(default_factory=list)
     other_issues: List[Issue] = field(default_factory=list)
+    syntax_issues: List[Issue] = field(default_factory=list)
 
     @property
     def total(self) -> int:
         return len(self.overflow_issues) + len(self.hebrew_content_issues) + \
-               len(self.fstring_issues) + len(self.other_issues)
+               len(self.fstring_issues) + len(self.other_issues) + len(self.syntax_issues)
 
     @property
     def verdict(self) -> str:
@@ -56,9 +58,10 @@ class CodeOrchestratorResult:
 class CodeOrchestrator:
     """Level 1 family orchestrator for Code QA."""
 
-    def __init__(self) -> None:
+    def __init__(self, check_syntax: bool = False, syntax_cache: Optional[Path] = None) -> None:
         self.detector = CodeDetector()
         self.fixer = CodeFixer()
+        self.syntax_detector = ListingSyntaxDetector(syntax_cache) if check_syntax else None
 
     def run(self, content: str, file_path: str = "", apply_fixes: bool = True) -> CodeOrchestratorResult:
         """Run full Code QA pipeline."""
@@ -92,6 +95,8 @@ class CodeOrchestrator:
                 result.fstring_issues.append(issue)
             else:
                 result.other_issues.append(issue)
+        if self.syntax_detector:
+            result.syntax_issues = self.syntax_detector.detect(content, file_path)
         return result
 
     def _run_fixes(self, content: str, detect: CodeDetectResult) -> CodeFixResult:
@@ -117,7 +122,8 @@ class CodeOrchestrator:
             "family": "code", "status": result.status, "verdict": result.verdict,
             "detection": {"overflow": len(detect.overflow_issues),
                          "hebrew_content": len(detect.hebrew_content_issues),
-                         "fstring": len(detect.fstring_issues), "total": detect.total},
+                         "fstring": len(detect.fstring_issues),
+                         "syntax": len(detect.syntax_issues), "total": detect.total},
             "fixes": {"overflow_fixed": fix.overflow_fixed if fix else 0,
                      "hebrew_fixed": fix.hebrew_fixed if fix else 0},
             "skills_executed": list(result.skills_executed.items()),
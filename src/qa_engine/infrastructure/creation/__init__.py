@@ -1,9 +1,24 @@
 """
 Creation tools for QA Engine.
 
-Provides file creation implementations for images and other assets.
+Provides file creation implementations for images and other assets,
+and build-copy tooling (image downsampling, TikZ externalization).
 """
 
 from .image_creator import ImageCreator
+from .image_optimizer import ImageOptimizer, OptimizationCandidate, OptimizationResult
+from .tikz_externalizer import (
+    CommandCompiler, ExternalizeResult, TikzCompiler, TikzExternalizer, TikzPicture,
+)
 
-__all__ = ["ImageCreator"]
+__all__ = [
+    "CommandCompiler",
+    "ExternalizeResult",
+    "ImageCreator",
+    "ImageOptimizer",
+    "OptimizationCandidate",
+    "OptimizationResult",
+    "TikzCompiler",
+    "TikzExternalizer",
+    "TikzPicture",
+]
@@ -7,12 +7,16 @@ Used when LaTeX references images that don't exist.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ...domain.interfaces import CreatorInterface
 from ...domain.models.issue import Issue
+from ..indexing.project_files import file_lookup
 
 # PIL import with graceful fallback
 try:
@@ -40,43 +44,78 @@ class ImageCreator(CreatorInterface):
 
     Supports PNG, JPG, and PDF formats.
     Uses PIL (Pillow) for image generation.
+
+    Batches render each distinct placeholder (size, colours, label,
+    format) once, in parallel, and copy it to the other targets - or
+    hardlink it with link_duplicates, at the cost of the targets sharing
+    one inode until replaced.
     """
 
     SUPPORTED_FORMATS = [".png", ".jpg", ".jpeg", ".pdf"]
     DEFAULT_CONFIG = ImageConfig()
 
-    def __init__(self, project_root: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        max_workers: int = 4,
+        link_duplicates: bool = False,
+    ) -> None:
         """Initialize creator with project root."""
         self._project_root = project_root or Path.cwd()
+        self._index_root = project_root
         self._config = self.DEFAULT_CONFIG
+        self._max_workers = max_workers
+        self._link_duplicates = link_duplicates
 
     def create(self, path: str, **options) -> bool:
         """Create a placeholder image at the specified path."""
+        return self.create_batch([path], **options).get(path, False)
+
+    def create_batch(self, paths: Iterable[str], **options) -> Dict[str, bool]:
+        """Create placeholders for many paths, rendering each distinct image once."""
+        paths = list(dict.fromkeys(paths))
         if not PIL_AVAILABLE:
-            return False
+            return {path: False for path in paths}
 
-        full_path = self._resolve_path(path)
         config = self._merge_config(options)
+        groups: Dict[Tuple, List[Tuple[str, Path]]] = {}
+        for path in paths:
+            full_path = self._resolve_path(path)
+            groups.setdefault(self._placeholder_key(config, full_path), []).append((path, full_path))
+
+        firsts = [targets[0][1] for targets in groups.values()]
+        if len(firsts) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                rendered = list(executor.map(lambda p: self._render(config, p), firsts))
+        else:
+            rendered = [self._render(config, p) for p in firsts]
 
-        # Create parent directory
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create and save image
-        img = self._create_placeholder_image(config, full_path.stem)
-        return self._save_image(img, full_path)
+        results: Dict[str, bool] = {}
+        for ok, targets in zip(rendered, groups.values()):
+            (path, source), duplicates = targets[0], targets[1:]
+            results[path] = ok
+            for dup_path, dup_full in duplicates:
+                results[dup_path] = ok and self._duplicate(source, dup_full)
+        return results
 
     def create_from_issues(self, issues: List[Issue]) -> Dict[str, bool]:
         """Create placeholder images for all missing file issues."""
         results: Dict[str, bool] = {}
+        files = file_lookup(self._index_root)
 
         for issue in issues:
             if issue.rule != "img-file-not-found":
                 continue
 
             path = issue.context.get("image_path", issue.content)
-            if path:
-                results[path] = self.create(path)
-
+            # Skip images created since detection (e.g. by another file's issue)
+            if path and not files.exists(self._resolve_path(path)):
+                results[path] = False
+
+        results.update(self.create_batch(results))
+        for path, created in results.items():
+            if created:
+                files.add(self._resolve_path(path))
         return results
 
     def get_supported_formats(self) -> List[str]:
@@ -90,6 +129,34 @@ class ImageCreator(CreatorInterface):
             return p
         return self._project_root / path
 
+    @staticmethod
+    def _placeholder_key(config: ImageConfig, full_path: Path) -> Tuple:
+        """Render parameters that fully determine a placeholder's bytes."""
+        suffix = full_path.suffix.lower()
+        fmt = "PDF" if suffix == ".pdf" else "JPEG" if suffix in (".jpg", ".jpeg") else "PNG"
+        return astuple(config) + (full_path.stem, fmt)
+
+    def _render(self, config: ImageConfig, full_path: Path) -> bool:
+        """Render one placeholder and save it, creating parent directories."""
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        img = self._create_placeholder_image(config, full_path.stem)
+        return self._save_image(img, full_path)
+
+    def _duplicate(self, source: Path, target: Path) -> bool:
+        """Copy (or hardlink) an already rendered placeholder to another target."""
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if self._link_duplicates:
+                try:
+                    os.link(source, target)
+                    return True
+                except OSError:
+                    pass  # Cross-device or unsupported: fall back to a copy
+            shutil.copyfile(source, target)
+            return True
+        except OSError:
+            return False
+
     def _merge_config(self, options: Dict) -> ImageConfig:
         """Merge options with default config."""
         return ImageConfig(
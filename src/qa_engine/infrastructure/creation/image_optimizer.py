@@ -0,0 +1,213 @@
+"""
+Raster image optimizer.
+
+Finds raster images that are embedded at far more pixels than they are
+printed with - e.g. a 6000px screenshot at 8cm - and writes downsampled
+copies at a target DPI into a cache directory. Planning uses header
+metadata only; resampling needs PIL and runs in parallel. With
+recompress, PNG images already within the target DPI are re-encoded
+losslessly at their own size and used only when that makes them smaller;
+JPEGs are only ever re-encoded when they are downsampled. Outputs are keyed by the source file's content hash
+and target size, so each image is processed once however many builds or
+documents use it.
+
+rewrite() points the \\includegraphics of a build copy at the cached
+images, matching each reference by the file it resolves to; the
+project's own sources and images are never modified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..detection.image_size_check import DEFAULT_TEXT_WIDTH_PT, displayed_width_pt
+from ..indexing import FloatInventory, Graphic, ImageMetadataCache, image_metadata_cache, parse_graphicspath
+from ..indexing.project_files import file_lookup
+from ..indexing.image_metadata import PT_PER_INCH
+
+# PIL import with graceful fallback
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+@dataclass
+class OptimizationCandidate:
+    """A raster image printed above the target DPI."""
+
+    source: str
+    width_px: int
+    target_px: int
+    effective_dpi: float
+    references: List[str] = field(default_factory=list)  # \includegraphics names
+
+    @property
+    def recompress_only(self) -> bool:
+        """True when the image keeps its size and is only re-encoded."""
+        return self.target_px >= self.width_px
+
+
+@dataclass
+class OptimizationResult:
+    """Outcome of one optimization pass."""
+
+    candidates: List[OptimizationCandidate] = field(default_factory=list)
+    optimized: Dict[str, str] = field(default_factory=dict)  # source -> cached copy
+    reused: int = 0
+    bytes_saved: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+class ImageOptimizer:
+    """Downsamples over-resolved raster images into a content-addressed cache."""
+
+    DEFAULT_CACHE_DIR = ".qa-cache/images"
+    JPEG_QUALITY = 85
+    LOSSLESS_SUFFIXES = (".png",)  # Re-encoded at their own size with recompress
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        target_dpi: int = 300,
+        cache_dir: Optional[Path] = None,
+        text_width_pt: float = DEFAULT_TEXT_WIDTH_PT,
+        max_workers: int = 4,
+        metadata: Optional[ImageMetadataCache] = None,
+        recompress: bool = False,
+    ) -> None:
+        self._project_root = Path(project_root) if project_root else Path.cwd()
+        self._index_root = project_root
+        self._target_dpi = target_dpi
+        self._recompress = recompress
+        self._cache_dir = Path(cache_dir) if cache_dir else self._project_root / self.DEFAULT_CACHE_DIR
+        self._text_width_pt = text_width_pt
+        self._max_workers = max_workers
+        self._metadata = metadata or image_metadata_cache()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    def plan(self, content: str, source_dir: Optional[Path] = None) -> List[OptimizationCandidate]:
+        """List raster images the document prints above the target DPI."""
+        candidates: Dict[str, OptimizationCandidate] = {}
+        for graphic, found in self._resolved(content, source_dir):
+            info = self._metadata.get(found) if found else None
+            if info is None or not info.is_raster:
+                continue
+            width = displayed_width_pt(graphic.options, info, self._text_width_pt)
+            if not width:
+                continue
+            dpi = info.width_px / (width / PT_PER_INCH)
+            target_px = math.ceil(width / PT_PER_INCH * self._target_dpi)
+            # The widest use of an image decides its size
+            current = candidates.get(found)
+            if current is None:
+                current = candidates[found] = OptimizationCandidate(found, info.width_px, target_px, dpi)
+            elif target_px > current.target_px:
+                current.target_px, current.effective_dpi = target_px, dpi
+            current.references.append(graphic.path)
+        planned = []
+        for candidate in candidates.values():
+            if candidate.target_px < candidate.width_px:
+                planned.append(candidate)
+            elif self._recompress and Path(candidate.source).suffix.lower() in self.LOSSLESS_SUFFIXES:
+                candidate.target_px = candidate.width_px
+                planned.append(candidate)
+        return planned
+
+    def optimize(self, content: str, source_dir: Optional[Path] = None) -> OptimizationResult:
+        """Plan and resample a document's images; reuses cached outputs."""
+        result = OptimizationResult(candidates=self.plan(content, source_dir))
+        if not PIL_AVAILABLE or not result.candidates:
+            return result
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        if len(result.candidates) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                outcomes = list(executor.map(self._optimize_one, result.candidates))
+        else:
+            outcomes = [self._optimize_one(c) for c in result.candidates]
+        for candidate, (output, reused, error) in zip(result.candidates, outcomes):
+            if error:
+                result.errors[candidate.source] = error
+                continue
+            saved = os.path.getsize(candidate.source) - os.path.getsize(output)
+            if candidate.recompress_only and saved <= 0:
+                continue  # Re-encoding did not help; keep the original
+            result.optimized[candidate.source] = output
+            result.reused += reused
+            result.bytes_saved += max(0, saved)
+        return result
+
+    def rewrite(
+        self, content: str, result: OptimizationResult, build_dir: Path,
+        source_dir: Optional[Path] = None,
+    ) -> str:
+        """Point \\includegraphics at the optimized copies, relative to build_dir.
+
+        References are resolved as plan() resolved them, so only those
+        naming an optimized file are rewritten.
+        """
+        optimized = {os.path.abspath(source): output for source, output in result.optimized.items()}
+        pieces, last = [], 0
+        for graphic, found in self._resolved(content, source_dir):
+            output = optimized.get(os.path.abspath(found)) if found else None
+            if output is None:
+                continue
+            new = Path(os.path.relpath(output, build_dir)).as_posix()
+            brace = content.rindex("{", graphic.start, graphic.end)  # Path argument
+            pieces += [content[last:brace + 1], new]
+            last = graphic.end - 1
+        return "".join(pieces) + content[last:]
+
+    def _resolved(
+        self, content: str, source_dir: Optional[Path]
+    ) -> Iterator[Tuple[Graphic, Optional[str]]]:
+        """Each \\includegraphics of content with the file it resolves to."""
+        files = file_lookup(self._index_root)
+        graphicspath = parse_graphicspath(content)
+        for graphic in FloatInventory(content).graphics:
+            yield graphic, files.find_graphic(graphic.path, source_dir or self._project_root, graphicspath)
+
+    def _optimize_one(self, candidate: OptimizationCandidate) -> Tuple[str, bool, str]:
+        """Resample or re-encode one image into the cache; returns (output, reused, error)."""
+        try:
+            suffix = Path(candidate.source).suffix.lower() or ".png"
+            output = self._cache_dir / f"{self._digest(candidate.source)[:20]}-{candidate.target_px}{suffix}"
+            if output.exists():
+                return str(output), True, ""
+            with Image.open(candidate.source) as img:
+                if candidate.recompress_only:
+                    small, dpi = img, img.info.get("dpi") or (self._target_dpi, self._target_dpi)
+                else:
+                    # Round half up; round() would round half to even
+                    height = max(1, int(img.height * candidate.target_px / img.width + 0.5))
+                    small = img.resize((candidate.target_px, height), Image.LANCZOS)
+                    dpi = (self._target_dpi, self._target_dpi)
+                tmp = output.with_name(f".{output.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+                if suffix in (".jpg", ".jpeg"):
+                    small.convert("RGB").save(tmp, "JPEG", quality=self.JPEG_QUALITY, optimize=True, dpi=dpi)
+                else:
+                    small.save(tmp, "PNG", optimize=True, dpi=dpi)
+            os.replace(tmp, output)  # Atomic, so concurrent builds never see partial files
+            return str(output), False, ""
+        except Exception as exc:
+            return "", False, str(exc)
+
+    def _digest(self, path: str) -> str:
+        """SHA-256 of a file's bytes, memoized by mtime and size."""
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key not in self._digests:
+            sha = hashlib.sha256()
+            with open(path, "rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    sha.update(block)
+            self._digests[key] = sha.hexdigest()
+        return self._digests[key]
@@ -0,0 +1,249 @@
+"""
+TikZ externalization cache.
+
+Every top-level tikzpicture is keyed by a SHA-256 of its source, the
+preamble statements that can change how it renders (packages, TikZ
+libraries and styles, colours, macro definitions) and the compiler
+command. Pictures without a cached PDF are compiled standalone in
+parallel; the build copy of the document then includes the cached PDFs
+with \\includegraphics, so a full build only compiles changed figures.
+
+The compiler is pluggable: anything with compile(tex_path, out_dir) that
+returns the produced PDF (or None). CommandCompiler runs a LaTeX engine.
+A compiler's part of the key is its cache_key attribute, else its
+command tuple, else its class name - never anything run-specific.
+Pictures referring to the rest of the document (\\ref, \\cite,
+remember picture) cannot be compiled standalone and are left in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Protocol, Sequence
+
+from ..indexing import EnvironmentTree
+
+STANDALONE_CLASS = r"\documentclass[tikz]{standalone}"
+
+# Preamble statements that affect how a picture renders
+_PREAMBLE_RE = re.compile(
+    r"(?<!\\)%[^\n]*|\\(?:usepackage|RequirePackage|usetikzlibrary|usepgfplotslibrary|tikzset"
+    r"|pgfplotsset|tikzstyle|definecolor|colorlet|newcommand|renewcommand|providecommand"
+    r"|DeclareMathOperator|newlength|setlength)(?![A-Za-z])"
+)
+_NOT_STANDALONE_RE = re.compile(r"\\(?:ref|eqref|pageref|cite|autoref|cref)\b|remember picture|overlay")
+
+
+class TikzCompiler(Protocol):
+    """Compiles a standalone .tex file."""
+
+    def compile(self, tex_path: Path, out_dir: Path) -> Optional[Path]:
+        """Return the produced PDF, or None on failure."""
+
+
+class CommandCompiler:
+    """Runs a LaTeX engine on a standalone file."""
+
+    def __init__(
+        self,
+        command: Sequence[str] = ("lualatex", "-interaction=nonstopmode", "-halt-on-error"),
+        timeout: int = 180,
+    ) -> None:
+        self.command = tuple(command)
+        self.timeout = timeout
+
+    def compile(self, tex_path: Path, out_dir: Path) -> Optional[Path]:
+        try:
+            subprocess.run(
+                [*self.command, f"-output-directory={out_dir}", tex_path.name],
+                cwd=tex_path.parent, timeout=self.timeout,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        pdf = out_dir / (tex_path.stem + ".pdf")
+        return pdf if pdf.exists() else None
+
+    @property
+    def cache_key(self) -> str:
+        return " ".join(self.command)
+
+
+@dataclass
+class TikzPicture:
+    """One top-level tikzpicture of a document."""
+
+    start: int
+    end: int
+    line: int
+    source: str
+    digest: str = ""
+    standalone: bool = True
+
+
+@dataclass
+class ExternalizeResult:
+    """Outcome of externalizing one document."""
+
+    content: str
+    pictures: List[TikzPicture] = field(default_factory=list)
+    compiled: int = 0
+    reused: int = 0
+    failed: Dict[int, str] = field(default_factory=dict)  # line -> reason
+
+
+class TikzExternalizer:
+    """Compiles changed tikzpictures once and substitutes cached PDFs."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        compiler: Optional[TikzCompiler] = None,
+        max_workers: int = 4,
+        standalone_class: str = STANDALONE_CLASS,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.compiler = compiler or CommandCompiler()
+        self._max_workers = max_workers
+        self._standalone_class = standalone_class
+
+    def pictures(self, content: str, preamble: Optional[str] = None) -> List[TikzPicture]:
+        """Find top-level pictures and compute their cache keys."""
+        tree = EnvironmentTree(content)
+        header = self._header(content if preamble is None else preamble)
+        pictures = []
+        for node in tree.nodes("tikzpicture"):
+            if not node.closed or (node.parent and tree.is_inside(node.parent.start, "tikzpicture")):
+                continue
+            source = content[node.start:node.end]
+            picture = TikzPicture(node.start, node.end, tree.line_of(node.start), source)
+            picture.standalone = not _NOT_STANDALONE_RE.search(source)
+            key = "\n".join((header, source, _compiler_key(self.compiler)))
+            picture.digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+            pictures.append(picture)
+        return pictures
+
+    def externalize(
+        self, content: str, preamble: Optional[str] = None, build_dir: Optional[Path] = None
+    ) -> ExternalizeResult:
+        """Compile pictures missing from the cache and return the build copy.
+
+        The copy's \\includegraphics paths are relative to build_dir when
+        given, absolute otherwise.
+        """
+        pictures = self.pictures(content, preamble)
+        header = self._header(content if preamble is None else preamble)
+        result = ExternalizeResult(content=content, pictures=pictures)
+        pending = {p.digest: p for p in pictures if p.standalone and not self._pdf(p).exists()}
+        result.reused = sum(1 for p in pictures if p.standalone and p.digest not in pending)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        jobs = list(pending.values())
+        if len(jobs) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                errors = list(executor.map(lambda p: self._compile(p, header), jobs))
+        else:
+            errors = [self._compile(p, header) for p in jobs]
+        for picture, error in zip(jobs, errors):
+            if error:
+                result.failed[picture.line] = error
+            else:
+                result.compiled += 1
+
+        pieces, last = [], 0
+        for picture in pictures:
+            pdf = self._pdf(picture)
+            if not picture.standalone or not pdf.exists():
+                continue
+            target = os.path.relpath(pdf, build_dir) if build_dir else str(pdf)
+            pieces += [content[last:picture.start], "\\includegraphics{%s}" % Path(target).as_posix()]
+            last = picture.end
+        result.content = "".join(pieces) + content[last:]
+        return result
+
+    def write_build_copy(self, source: Path, build_dir: Path, preamble: Optional[str] = None) -> Path:
+        """Write the externalized copy of a source file into build_dir."""
+        build_dir.mkdir(parents=True, exist_ok=True)
+        content = source.read_text(encoding="utf-8")
+        target = build_dir / source.name
+        target.write_text(self.externalize(content, preamble, build_dir).content, encoding="utf-8")
+        return target
+
+    def _compile(self, picture: TikzPicture, header: str) -> str:
+        """Compile one picture into the cache; returns an error or ''."""
+        work = self.cache_dir / "work" / picture.digest
+        work.mkdir(parents=True, exist_ok=True)
+        tex = work / f"{picture.digest}.tex"
+        tex.write_text(
+            f"{self._standalone_class}\n{header}\n\\begin{{document}}\n{picture.source}\n\\end{{document}}\n",
+            encoding="utf-8",
+        )
+        pdf = self.compiler.compile(tex, work)
+        if pdf is None:
+            return "standalone compile failed (see %s)" % work
+        os.replace(pdf, self._pdf(picture))  # Atomic, so readers never see partial PDFs
+        shutil.rmtree(work, ignore_errors=True)
+        return ""
+
+    def _pdf(self, picture: TikzPicture) -> Path:
+        return self.cache_dir / f"{picture.digest}.pdf"
+
+    @staticmethod
+    def _header(preamble: str) -> str:
+        """Preamble statements relevant to pictures, one per line."""
+        begin = preamble.find("\\begin{document}")
+        text = preamble if begin < 0 else preamble[:begin]
+        statements = []
+        for match in _PREAMBLE_RE.finditer(text):
+            if match.group(0).startswith("%"):
+                continue
+            end = _statement_end(text, match.end())
+            statements.append(text[match.start():end].strip())
+        return "\n".join(statements)
+
+
+def _statement_end(text: str, pos: int) -> int:
+    """End of a command's arguments: *, [..], {..} and =[..] groups."""
+    pairs = {"[": "]", "{": "}"}
+    while pos < len(text):
+        probe = pos
+        while probe < len(text) and text[probe] in " \t":
+            probe += 1
+        if text.startswith("\n", probe) and not text.startswith(("{", "["), probe + 1):
+            return pos
+        probe = probe + 1 if text.startswith("\n", probe) else probe
+        if text.startswith(("*", "="), probe):
+            pos = probe + 1
+            continue
+        opener = text[probe:probe + 1]
+        if opener not in pairs:
+            return pos
+        depth, end = 0, probe
+        while end < len(text):
+            char = text[end]
+            if char == "\\":
+                end += 2
+                continue
+            depth += 1 if char == opener else -1 if char == pairs[opener] else 0
+            end += 1
+            if depth == 0:
+                break
+        pos = end
+    return pos
+
+
+def _compiler_key(compiler: TikzCompiler) -> str:
+    """Stable identity of a compiler for cache keys."""
+    key = getattr(compiler, "cache_key", None)
+    if key is None and getattr(compiler, "command", None) is not None:
+        key = " ".join(compiler.command)
+    if key is None:
+        key = f"{type(compiler).__module__}.{type(compiler).__qualname__}"
+    return str(key)
@@ -13,10 +13,12 @@ from .heb_math_detector import HebMathDetector
 from .image_detector import ImageDetector
 from .infra_scanner import InfraScanner, ScanResult, MisplacedFile
 from .infra_validator import InfraValidator, ValidationResult, ValidationIssue
+from .listing_syntax_detector import ListingSyntaxDetector
 from .subfiles_detector import SubfilesDetector
 from .table_detector import TableDetector
 from .toc_detector import TOCDetector
 from .typeset_detector import TypesetDetector
+from .xref_detector import XrefDetector
 from .caption_length_detector import CaptionLengthDetector
 from .cls_sync_detector import CLSSyncDetector, CLSFileInfo
 
@@ -31,6 +33,7 @@ __all__ = [
     "ImageDetector",
     "InfraScanner",
     "InfraValidator",
+    "ListingSyntaxDetector",
     "MisplacedFile",
     "ScanResult",
     "SubfilesDetector",
@@ -39,6 +42,7 @@ __all__ = [
     "TypesetDetector",
     "ValidationIssue",
     "ValidationResult",
+    "XrefDetector",
     "CaptionLengthDetector",
     "CLSSyncDetector",
     "CLSFileInfo",
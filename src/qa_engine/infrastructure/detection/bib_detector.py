@@ -12,6 +12,7 @@ from typing import Dict, List, Set
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..matching import compile_rule, compile_rule_field
 from .bib_rules import BIB_RULES
 
 
@@ -39,23 +40,23 @@ class BibDetector(DetectorInterface):
         defined_entries = self._load_bib_entries(content, file_path)
 
         for rule_name, rule_def in self._rules.items():
-            pattern = re.compile(rule_def["pattern"])
-            context_pattern = rule_def.get("context_pattern")
+            pattern = compile_rule(rule_def["pattern"], label=rule_name)
+            context_pattern = compile_rule_field(rule_def, "context_pattern", rule_name)
             document_context = rule_def.get("document_context", False)
-            negative_pattern = rule_def.get("negative_pattern")
-            has_cite_pattern = rule_def.get("has_cite_pattern")
+            negative_pattern = compile_rule_field(rule_def, "negative_pattern", rule_name)
+            has_cite_pattern = compile_rule_field(rule_def, "has_cite_pattern", rule_name)
 
             # Negative pattern check
-            if negative_pattern and re.search(negative_pattern, content):
+            if negative_pattern and negative_pattern.search(content):
                 continue
 
             # Has cite pattern check (for standalone rule)
-            if has_cite_pattern and not re.search(has_cite_pattern, content):
+            if has_cite_pattern and not has_cite_pattern.search(content):
                 continue
 
             # Document context check
             if document_context and context_pattern:
-                if not re.search(context_pattern, content):
+                if not context_pattern.search(content):
                     continue
 
             for line_num, line in enumerate(lines, start=1):
@@ -64,7 +65,7 @@ class BibDetector(DetectorInterface):
 
                 # Line context check
                 if context_pattern and not document_context:
-                    if not re.search(context_pattern, line):
+                    if not context_pattern.search(line):
                         continue
 
                 for match in pattern.finditer(line):
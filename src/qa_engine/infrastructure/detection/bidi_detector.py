@@ -4,27 +4,25 @@ BiDi (Bidirectional text) detector.
 Implements FR-401 from PRD - detects BiDi issues in Hebrew-English LaTeX.
 All 15 rules as specified in QA-CLAUDE-MECHANISM-ARCHITECTURE-REPORT.md.
 
+v1.3.0: Environment-wrapper checks use a cumulative EnvironmentDepthTable
+        instead of re-counting over the document prefix for every match,
+        and are located by line number rather than content.find(line)
+v1.2.0: Math, cite, TikZ, color and wrapper checks query a per-document
+        LatexContextIndex instead of re-scanning the line for every match
 v1.1.0: Added TikZ environment exclusion to prevent corrupting TikZ code
 """
 
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..indexing import ContextKind, EnvironmentDepthTable, LatexContextIndex
+from ..matching import compile_rule, compile_rule_field
 from .bidi_rules import BIDI_RULES
 
-# Environments where BiDi fixes should NOT be applied
-SKIP_ENVIRONMENTS = [
-    "tikzpicture",
-    "pgfpicture",
-    "axis",          # pgfplots
-    "semilogyaxis",  # pgfplots
-    "loglogaxis",    # pgfplots
-]
-
 
 class BiDiDetector(DetectorInterface):
     """
@@ -55,68 +53,68 @@ class BiDiDetector(DetectorInterface):
         """
         issues: List[Issue] = []
         lines = content.split("\n")
+        index = LatexContextIndex(content)
+        env_table = EnvironmentDepthTable(content, filter(None, (
+            self._wrapper_environment(r.get("exclude_pattern", "")) for r in self._rules.values()
+        )))
 
         for rule_name, rule_def in self._rules.items():
-            pattern = re.compile(rule_def["pattern"])
-            context_pattern = rule_def.get("context_pattern")
-            negative_pattern = rule_def.get("negative_pattern")
+            pattern = compile_rule(rule_def["pattern"], label=rule_name)
+            context_pattern = compile_rule_field(rule_def, "context_pattern", rule_name)
+            negative_pattern = compile_rule_field(rule_def, "negative_pattern", rule_name)
             exclude_pattern = rule_def.get("exclude_pattern")
             document_context = rule_def.get("document_context", False)
 
             # For rules with negative_pattern, check whole content first
-            if negative_pattern and re.search(negative_pattern, content):
+            if negative_pattern and negative_pattern.search(content):
                 continue
 
             # For document_context rules, check Hebrew exists anywhere
             if document_context and context_pattern:
-                if not re.search(context_pattern, content):
+                if not context_pattern.search(content):
                     continue
 
             skip_math = rule_def.get("skip_math_mode", False)
             skip_cite = rule_def.get("skip_cite_context", False)
             skip_tikz = rule_def.get("skip_tikz_env", False)
             skip_color = rule_def.get("skip_color_context", False)
-
-            # Track TikZ environment state across lines
-            tikz_depth = 0
+            wrappers = self._wrapper_commands(exclude_pattern or "")
+            wrapper_env = self._wrapper_environment(exclude_pattern or "")
 
             for line_num, line in enumerate(lines, start=1):
                 if line.strip().startswith("%"):
                     continue
 
-                # Track TikZ environment depth
-                tikz_depth = self._update_tikz_depth(line, tikz_depth)
-
                 # Skip entire line if inside TikZ and rule says to skip
-                if skip_tikz and tikz_depth > 0:
+                if skip_tikz and index.line_in(ContextKind.TIKZ_ENV, line_num):
                     continue
 
                 # Line-level context check (skip for document_context rules)
                 if context_pattern and not document_context:
-                    if not re.search(context_pattern, line):
+                    if not context_pattern.search(line):
                         continue
 
                 for match in pattern.finditer(line):
+                    pos = index.offset(line_num, match.start())
                     # Skip if inside math mode
-                    if skip_math and self._is_inside_math(line, match.start()):
+                    if skip_math and index.contains(ContextKind.MATH, pos):
                         continue
                     # Skip if inside \cite{} command
-                    if skip_cite and self._is_inside_cite(line, match.start()):
+                    if skip_cite and index.contains(ContextKind.CITE, pos):
                         continue
                     # Skip if inside TikZ on this specific line (for rules without skip_tikz)
-                    if self._is_inside_tikz_on_line(line, match.start()):
+                    if index.contains(ContextKind.TIKZ, pos):
                         continue
                     # Skip if inside color context (colback=purple!5, \textcolor{green})
-                    if skip_color and self._is_inside_color_context(line, match.start()):
+                    if skip_color and index.contains(ContextKind.COLOR, pos):
                         continue
                     # Check exclude_pattern - skip if match is inside a wrapper
                     if exclude_pattern:
                         # Check if match is inside a wrapper on the same line
-                        if self._is_inside_wrapper(line, match.start(), exclude_pattern):
+                        if self._is_inside_wrapper(index, pos, wrappers):
                             continue
                         # For environment wrappers, check document context
-                        prefix = content[:content.find(line) + match.start()]
-                        if self._has_active_wrapper(prefix, exclude_pattern):
+                        if wrapper_env and env_table.is_active(wrapper_env, line_num, match.start()):
                             continue
 
                     matched_text = match.group(1) if match.lastindex else match.group(0)
@@ -134,172 +132,31 @@ class BiDiDetector(DetectorInterface):
 
         return issues
 
-    def _is_inside_cite(self, line: str, pos: int) -> bool:
-        """Check if position is inside a \\cite{} command (handles nested braces)."""
-        # Find all \cite commands with optional brackets
-        cite_patterns = [r"\\cite\{", r"\\cite\["]
-        for pattern in cite_patterns:
-            for match in re.finditer(pattern, line):
-                start = match.end()
-                if start > pos:
-                    continue
-                # Count braces to find the end of the cite command
-                depth = 1
-                i = start
-                while i < len(line) and depth > 0:
-                    if line[i] == "{":
-                        depth += 1
-                    elif line[i] == "}":
-                        depth -= 1
-                    i += 1
-                # If pos is between start and end, we're inside the cite
-                if start <= pos < i:
-                    return True
-        return False
-
-    def _is_inside_math(self, line: str, pos: int) -> bool:
-        """Check if position is inside math mode ($...$, \\[...\\], etc.)."""
-        # Check inline math $...$
-        in_math = False
-        for i, char in enumerate(line):
-            if char == "$" and (i == 0 or line[i - 1] != "\\"):
-                in_math = not in_math
-            if i == pos:
-                return in_math
-        # Check display math \[...\] or equation environments
-        before = line[:pos]
-        if r"\[" in before and r"\]" not in before:
-            return True
-        return False
-
-    def _update_tikz_depth(self, line: str, current_depth: int) -> int:
-        """Update TikZ environment depth based on begin/end commands in line."""
-        depth = current_depth
-        for env in SKIP_ENVIRONMENTS:
-            # Count opens and closes
-            opens = len(re.findall(rf"\\begin\{{{env}\}}", line))
-            closes = len(re.findall(rf"\\end\{{{env}\}}", line))
-            depth += opens - closes
-        return max(0, depth)
-
-    def _is_inside_tikz_on_line(self, line: str, pos: int) -> bool:
-        """Check if position is inside a TikZ command on the same line."""
-        # Check for TikZ-specific commands that shouldn't be wrapped
-        tikz_commands = [
-            r"\\draw\[",
-            r"\\fill\[",
-            r"\\node\[",
-            r"\\path\[",
-            r"\\coordinate",
-            r"\\tikzset",
-            r"\\foreach",
-            r"\\addplot",
-        ]
-        for cmd in tikz_commands:
-            for match in re.finditer(cmd, line):
-                # If the command starts before our position and we haven't
-                # seen a semicolon (TikZ statement terminator), we're inside
-                if match.start() < pos:
-                    # Check if there's a semicolon between command and pos
-                    between = line[match.start():pos]
-                    if ";" not in between:
-                        return True
-        return False
-
-    def _is_inside_color_context(self, line: str, pos: int) -> bool:
-        """Check if position is inside a color specification context.
-
-        Detects color contexts like:
-        - colback=purple!5 (tcolorbox options)
-        - colframe=green!60!black
-        - coltitle=white
-        - \\textcolor{red!50}
-        - \\color{blue}
-        - \\definecolor{mycolor}{RGB}{255,0,0}
-        """
-        # Pattern 1: tcolorbox color options (colback=, colframe=, coltitle=, etc.)
-        # Match from option name through ! separated color specs until , or ]
-        tcolorbox_color_opts = [
-            r"colback\s*=",
-            r"colframe\s*=",
-            r"coltitle\s*=",
-            r"colbacktitle\s*=",
-            r"coltext\s*=",
-        ]
-        for opt_pattern in tcolorbox_color_opts:
-            for match in re.finditer(opt_pattern, line):
-                opt_end = match.end()
-                if opt_end <= pos:
-                    # Find the end of this color spec (next , or ] or end of line)
-                    rest = line[opt_end:]
-                    spec_end = len(rest)
-                    for i, char in enumerate(rest):
-                        if char in ",]}\n":
-                            spec_end = i
-                            break
-                    # Check if pos falls within this color spec
-                    if pos < opt_end + spec_end:
-                        return True
-
-        # Pattern 2: LaTeX color commands (\textcolor{...}, \color{...})
-        color_commands = [
-            r"\\textcolor\{",
-            r"\\color\{",
-            r"\\definecolor\{",
-            r"\\colorlet\{",
-        ]
-        for cmd_pattern in color_commands:
-            for match in re.finditer(cmd_pattern, line):
-                cmd_start = match.start()
-                if cmd_start < pos:
-                    # Find matching closing brace
-                    brace_start = match.end() - 1  # Position of {
-                    depth = 1
-                    i = match.end()
-                    while i < len(line) and depth > 0:
-                        if line[i] == "{":
-                            depth += 1
-                        elif line[i] == "}":
-                            depth -= 1
-                        i += 1
-                    # i is now just after the closing }
-                    if pos < i:
-                        return True
-
-        return False
-
-    def _is_inside_wrapper(self, line: str, pos: int, exclude_pattern: str) -> bool:
-        """Check if position is inside a wrapper command on the same line."""
-        # Split exclude_pattern by | and check each pattern
-        patterns = exclude_pattern.split("|")
-        for pat in patterns:
+    def _wrapper_commands(self, exclude_pattern: str) -> Tuple[str, ...]:
+        r"""Extract wrapper command names (\\en\{ -> en) and the $ marker from exclude_pattern."""
+        commands = []
+        for pat in exclude_pattern.split("|"):
             pat = pat.strip()
-            if not pat:
-                continue
-            # For command-style wrappers like \num{, \en{, etc.
-            if pat.endswith(r"\{"):
-                cmd_pattern = pat.replace(r"\{", r"\{[^}]*\}")
-                for match in re.finditer(cmd_pattern, line):
-                    if match.start() < pos < match.end():
-                        return True
-            # For math mode $...$
-            elif pat.startswith(r"\$"):
-                for match in re.finditer(r"\$[^$]+\$", line):
-                    if match.start() < pos < match.end():
-                        return True
-        return False
+            if pat.startswith(r"\$"):
+                commands.append("$")
+            else:
+                cmd = re.fullmatch(r"\\\\(\w+)\\\{", pat)
+                if cmd:
+                    commands.append(cmd.group(1))
+        return tuple(commands)
+
+    def _is_inside_wrapper(
+        self, index: LatexContextIndex, pos: int, commands: Tuple[str, ...]
+    ) -> bool:
+        """Check if position is inside a wrapper command or $...$ pair on its line."""
+        if "$" in commands and index.contains(ContextKind.DOLLAR_PAIR, pos):
+            return True
+        return index.in_wrapper(pos, commands)
 
-    def _has_active_wrapper(self, prefix: str, exclude_pattern: str) -> bool:
-        """Check if there's an unclosed wrapper before match position."""
-        # For environment wrappers like \begin{english}
-        if "begin" in exclude_pattern:
-            env_name = re.search(r"begin\\{(\w+)\\}", exclude_pattern)
-            if env_name:
-                env = env_name.group(1)
-                opens = len(re.findall(rf"\\begin\{{{env}\}}", prefix))
-                closes = len(re.findall(rf"\\end\{{{env}\}}", prefix))
-                return opens > closes
-        return False
+    def _wrapper_environment(self, exclude_pattern: str) -> str:
+        r"""Return the wrapper environment (\begin{english} -> english) in exclude_pattern."""
+        env_name = re.search(r"begin\\{(\w+)\\}", exclude_pattern)
+        return env_name.group(1) if env_name else ""
 
     def _suggest_fix(self, rule: str, content: str) -> str:
         """Suggest fix for detected issue."""
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..indexing import FloatInventory
+from ..matching import compile_rule, compile_rule_field
 from .caption_length_rules import CAPTION_LENGTH_RULES, MAX_CAPTION_LENGTH
 
 
@@ -43,9 +45,15 @@ class CaptionLengthDetector(DetectorInterface):
             return issues
 
         lines = content.split("\n")
+        inventory = None
 
         for rule_name, rule_def in self._rules.items():
-            if rule_def.get("multiline"):
+            if rule_def.get("context_required"):
+                inventory = inventory or FloatInventory(content)
+                issues.extend(self._check_float_rule(
+                    rule_name, rule_def, inventory, file_path, offset
+                ))
+            elif rule_def.get("multiline"):
                 issues.extend(self._check_multiline_rule(
                     rule_name, rule_def, content, file_path, offset
                 ))
@@ -66,8 +74,8 @@ class CaptionLengthDetector(DetectorInterface):
     ) -> List[Issue]:
         """Check rule against individual lines."""
         issues = []
-        pattern = re.compile(rule_def["pattern"])
-        neg_pattern = rule_def.get("negative_pattern")
+        pattern = compile_rule(rule_def["pattern"], label=rule_name)
+        neg_pattern = compile_rule_field(rule_def, "negative_pattern", rule_name)
         is_brace_balanced = rule_def.get("brace_balanced", False)
         max_length = rule_def.get("max_length", MAX_CAPTION_LENGTH)
 
@@ -77,7 +85,7 @@ class CaptionLengthDetector(DetectorInterface):
                 continue
 
             # Check negative pattern first (skip if matches)
-            if neg_pattern and re.search(neg_pattern, line):
+            if neg_pattern and neg_pattern.search(line):
                 continue
 
             # Check main pattern
@@ -106,15 +114,15 @@ class CaptionLengthDetector(DetectorInterface):
     ) -> List[Issue]:
         """Check multiline patterns (e.g., figure environments)."""
         issues = []
-        pattern = re.compile(rule_def["pattern"], re.DOTALL)
-        neg_pattern = rule_def.get("negative_pattern")
+        pattern = compile_rule(rule_def["pattern"], re.DOTALL, rule_name)
+        neg_pattern = compile_rule_field(rule_def, "negative_pattern", rule_name)
         is_brace_balanced = rule_def.get("brace_balanced", False)
         max_length = rule_def.get("max_length", 80)  # Stricter for figures
 
         for match in pattern.finditer(content):
             # Skip if negative pattern matches in this region
             region = match.group(0)
-            if neg_pattern and re.search(neg_pattern, region):
+            if neg_pattern and neg_pattern.search(region):
                 continue
 
             # Calculate line number
@@ -132,6 +140,33 @@ class CaptionLengthDetector(DetectorInterface):
 
         return issues
 
+    def _check_float_rule(
+        self,
+        rule_name: str,
+        rule_def: Dict,
+        inventory: FloatInventory,
+        file_path: str,
+        offset: int,
+    ) -> List[Issue]:
+        """Check the first caption of each float of the required environment."""
+        issues = []
+        max_length = rule_def.get("max_length", 80)  # Stricter for figures
+
+        for flt in inventory.floats(rule_def["context_required"]):
+            caption = flt.caption
+            # Captions with a short title already have a clean LOF entry
+            if caption is None or caption.short is not None:
+                continue
+            if rule_def.get("brace_balanced") and len(caption.text) < max_length:
+                continue  # Skip short captions
+
+            issues.append(self._create_issue(
+                rule_name, rule_def, caption.text,
+                file_path, flt.line + offset
+            ))
+
+        return issues
+
     def _create_issue(
         self,
         rule_name: str,
@@ -48,6 +48,8 @@ CAPTION_LENGTH_RULES = {
         "fix_template": "Use first sentence as short title for LOF",
     },
     # Rule 4: Figure caption specifically (more strict)
+    # Checked per figure through FloatInventory (context_required); the
+    # pattern documents the match for reports and the regex audit
     "figure-caption-too-long": {
         "description": "Figure caption too long for clean List of Figures",
         "pattern": r"\\begin\{figure\}.*?\\caption\{(" + BRACE_BALANCED_PATTERN + r")\}",
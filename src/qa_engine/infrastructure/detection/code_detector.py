@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 import re
-from typing import Dict, List
+from typing import Dict, Iterator, List, Sequence, Tuple
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
-from .code_rules import CODE_RULES, CODE_ENV_PATTERN, HEBREW_WRAPPERS, FIX_SUGGESTIONS
+from ..indexing.byte_scan import ByteHit, scan_text
+from ..indexing.code_blocks import code_line_envs, find_code_blocks
+from .code_rules import CODE_RULES, HEBREW_WRAPPERS, FIX_SUGGESTIONS
 
 
 class CodeDetector(DetectorInterface):
@@ -18,26 +20,43 @@ class CodeDetector(DetectorInterface):
         """Detect code block issues."""
         issues: List[Issue] = []
         lines = content.split("\n")
-        in_code, in_english, code_env = False, False, ""
+        in_english = False
+        code_lines = code_line_envs(find_code_blocks(content))
+        byte_hits: Dict[int, List[ByteHit]] = {}
+        for hit in scan_text(content):
+            byte_hits.setdefault(hit.line, []).append(hit)
 
         for line_num, line in enumerate(lines, start=1):
             in_english = self._track_english(line, in_english)
-            in_code, code_env = self._track_code(line, in_code, code_env)
+            code_env = code_lines.get(line_num, "")
+            in_code = bool(code_env)
 
             for rule_name, rule_def in self._rules.items():
                 if not self._should_check(rule_name, rule_def, line, in_code, in_english):
                     continue
 
-                for match in re.finditer(rule_def["pattern"], line):
+                for text, start in self._matches(rule_def, line, byte_hits.get(line_num, ())):
                     if rule_name == "code-direction-hebrew":
-                        if self._is_wrapped(line, match.start()):
+                        if self._is_wrapped(line, start):
                             continue
                     issues.append(self._create_issue(
                         rule_name, rule_def, file_path, line_num + offset,
-                        match.group(0)[:50], in_code, code_env
+                        text[:50], in_code, code_env
                     ))
         return issues
 
+    def _matches(self, rule_def: dict, line: str,
+                 hits: Sequence[ByteHit]) -> Iterator[Tuple[str, int]]:
+        """(text, column) of rule matches; byte-class rules only look at scanner hits."""
+        classes = rule_def.get("byte_classes")
+        if classes is None:
+            for match in re.finditer(rule_def["pattern"], line):
+                yield match.group(0), match.start()
+            return
+        for hit in hits:
+            if hit.kind in classes and re.fullmatch(rule_def["pattern"], hit.char):
+                yield (hit.char if hit.char.isprintable() else hit.label), hit.column - 1
+
     def _track_english(self, line: str, in_english: bool) -> bool:
         if "\\begin{english}" in line:
             return True
@@ -45,14 +64,6 @@ class CodeDetector(DetectorInterface):
             return False
         return in_english
 
-    def _track_code(self, line: str, in_code: bool, code_env: str) -> tuple:
-        begin = re.search(r"\\begin\{" + CODE_ENV_PATTERN + r"\}", line)
-        if begin:
-            return True, begin.group(1)
-        if re.search(r"\\end\{" + CODE_ENV_PATTERN + r"\}", line):
-            return False, ""
-        return in_code, code_env
-
     def _should_check(self, rule: str, rule_def: dict, line: str,
                       in_code: bool, in_english: bool) -> bool:
         if rule_def.get("in_code_block") and not in_code:
@@ -2,6 +2,8 @@
 
 from ...domain.models.issue import Severity
 
+# Rules with "byte_classes" match on ByteScanner hits of those classes
+# instead of running their pattern over every line.
 CODE_RULES = {
     "code-background-overflow": {
         "description": "Code block without english wrapper causing overflow",
@@ -12,6 +14,14 @@ CODE_RULES = {
         "description": "Emoji characters in code that may cause font issues",
         "pattern": r"[\U0001F300-\U0001F9FF]",
         "severity": Severity.INFO,
+        "byte_classes": ("non_bmp",),
+    },
+    "code-encoding-invisible": {
+        "description": "Zero-width or bidi-control character in code",
+        "pattern": r"[\u200b-\u200f\u202a-\u202e\u2060\u2066-\u2069\u061c\ufeff]",
+        "severity": Severity.WARNING,
+        "in_code_block": True,
+        "byte_classes": ("zero_width", "bidi_control", "bom"),
     },
     "code-direction-hebrew": {
         "description": "Hebrew text in code without proper wrapper",
@@ -39,7 +49,20 @@ HEBREW_WRAPPERS = ["texthebrew{", "hebtitle{", "he{", "hebtext{"]
 FIX_SUGGESTIONS = {
     "code-background-overflow": r"Wrap in \begin{english}...\end{english}",
     "code-encoding-emoji": "Remove emoji or use appropriate font setup",
+    "code-encoding-invisible": "Delete the invisible character",
     "code-direction-hebrew": r"Use \texthebrew{} for Hebrew text",
     "code-hebrew-content": "Translate Hebrew comments/strings to English",
     "code-fstring-brace": "Escape braces with {{ and }}",
 }
+
+# Listing body checks (ListingSyntaxDetector)
+LISTING_SYNTAX_RULES = {
+    "code-python-syntax-error": {
+        "description": "Python listing does not parse",
+        "severity": Severity.WARNING,
+        "fix": "Fix the code, or mark the listing with % qa-code: fragment / doctest / skip",
+    },
+}
+PYTHON_LANGUAGES = frozenset({"python", "python3", "py", "pycon", "ipython"})
+# Annotation on the line before \begin (or on the \begin line): % qa-code: <mode>
+LISTING_ANNOTATION_PATTERN = r"%\s*qa-code:\s*(doctest|fragment|skip)\b"
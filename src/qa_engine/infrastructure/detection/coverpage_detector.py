@@ -12,6 +12,8 @@ from typing import Dict, List
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..indexing import Direction, segment_line
+from ..matching import compile_rule, compile_rule_field
 from .coverpage_rules import COVERPAGE_RULES
 
 
@@ -66,20 +68,20 @@ class CoverpageDetector(DetectorInterface):
                 if rule_def.get("require_presence"):
                     continue
 
-                pattern = re.compile(rule_def["pattern"])
+                pattern = compile_rule(rule_def["pattern"], label=rule_name)
                 matches = pattern.finditer(line)
 
                 for match in matches:
                     # Check exclude pattern
-                    if self._should_exclude(line, match, rule_def):
+                    if self._should_exclude(line, match, rule_name, rule_def):
                         continue
 
                     # Check context pattern
-                    if not self._has_context(line, rule_def):
+                    if not self._has_context(line, rule_name, rule_def):
                         continue
 
                     # Validate format if required
-                    if not self._validate_format(match, rule_def):
+                    if not self._validate_format(match, rule_name, rule_def):
                         issues.append(self._create_issue(
                             rule_name, rule_def, match, file_path,
                             line_num + offset
@@ -112,12 +114,12 @@ class CoverpageDetector(DetectorInterface):
                 continue
 
             # Check if trigger pattern exists
-            trigger = re.compile(rule_def["pattern"])
+            trigger = compile_rule(rule_def["pattern"], label=rule_name)
             if not trigger.search(scan_content):
                 continue  # No cover page found
 
             # Check if required content is present
-            required = re.compile(require)
+            required = compile_rule_field(rule_def, "require_presence", rule_name)
             if not required.search(scan_content):
                 issues.append(Issue(
                     rule=rule_name,
@@ -132,42 +134,50 @@ class CoverpageDetector(DetectorInterface):
         return issues
 
     def _should_exclude(
-        self, line: str, match: re.Match, rule_def: Dict
+        self, line: str, match: re.Match, rule_name: str, rule_def: Dict
     ) -> bool:
         """Check if match should be excluded."""
-        exclude = rule_def.get("exclude_pattern")
+        exclude = compile_rule_field(rule_def, "exclude_pattern", rule_name)
         if not exclude:
             return False
         # Check if excluded wrapper exists around match
         before = line[:match.start()]
-        return bool(re.search(exclude, before))
+        return bool(exclude.search(before))
 
-    def _has_context(self, line: str, rule_def: Dict) -> bool:
+    def _has_context(self, line: str, rule_name: str, rule_def: Dict) -> bool:
         """Check if required context exists."""
-        context = rule_def.get("context_pattern")
+        context = compile_rule_field(rule_def, "context_pattern", rule_name, re.IGNORECASE)
         if not context:
             return True
-        return bool(re.search(context, line, re.IGNORECASE))
+        return bool(context.search(line))
 
-    def _validate_format(self, match: re.Match, rule_def: Dict) -> bool:
+    def _validate_format(self, match: re.Match, rule_name: str, rule_def: Dict) -> bool:
         """Validate content format if required."""
-        format_pattern = rule_def.get("validate_format")
+        format_pattern = compile_rule_field(rule_def, "validate_format", rule_name)
         if not format_pattern:
             return True
         content = match.group(1) if match.lastindex else match.group(0)
-        return bool(re.fullmatch(format_pattern, content.strip()))
+        return bool(format_pattern.fullmatch(content.strip()))
 
     def _has_bidi_issue(self, match: re.Match) -> bool:
         """Check if matched content has BiDi issues."""
         content = match.group(1) if match.lastindex else match.group(0)
-        # Check for unwrapped English (3+ chars)
-        if re.search(r"(?<!\\en\{)[a-zA-Z]{3,}", content):
-            return True
+        segmentation = segment_line(content)
+        # Check for unwrapped English (3+ chars, not a command name)
+        for run in segmentation.of(Direction.LATIN, min_length=3):
+            if not segmentation.preceded_by(run, "\\") and not self._in_group(content, run.start, "\\en{"):
+                return True
         # Check for unwrapped numbers
-        if re.search(r"(?<!\\en\{)(?<!\\num\{)\d+[.,]?\d*", content):
-            return True
+        for run in segmentation.of(Direction.DIGIT):
+            if not self._in_group(content, run.start, "\\en{", "\\num{"):
+                return True
         return False
 
+    def _in_group(self, content: str, pos: int, *wrappers: str) -> bool:
+        """Check if pos lies inside a wrapper group that is still open."""
+        opened = max(content.rfind(w, 0, pos) for w in wrappers)
+        return opened != -1 and content.rfind("}", opened, pos) == -1
+
     def _create_issue(
         self,
         rule_name: str,
@@ -1,9 +1,16 @@
-"""Hebrew math detector for LaTeX documents."""
+"""Hebrew math detector for LaTeX documents.
+
+Math-context rules match only inside the math spans of the shared
+LatexContextIndex: inline $...$ and display \\[...\\] on the line of the
+match. Lines inside multi-line math environments are not matched.
+"""
 from __future__ import annotations
 import re
 from typing import Dict, List
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..indexing import ContextKind, LatexContextIndex
+from ..matching import compile_rule
 from .heb_math_rules import HEB_MATH_RULES, HEBREW_RANGE
 
 
@@ -17,6 +24,7 @@ class HebMathDetector(DetectorInterface):
         """Detect Hebrew-in-math issues."""
         issues: List[Issue] = []
         lines = content.split("\n")
+        index = LatexContextIndex(content)
         in_math, in_cases = False, False
         for line_num, line in enumerate(lines, start=1):
             if line.strip().startswith("%"):
@@ -24,16 +32,17 @@ class HebMathDetector(DetectorInterface):
             in_math, in_cases = self._update_context(line, in_math, in_cases)
             for rule_name, rule_def in self._rules.items():
                 if rule_def.get("math_context"):
-                    if not in_math and not self._has_inline_math(line):
+                    if not in_math and not self._has_inline_math(line) and r"\[" not in line:
                         continue
                 if rule_def.get("cases_context") and not in_cases:
                     continue
                 if rule_name == "heb-math-definition":
                     issues.extend(self._check_definition(line, line_num, file_path, offset))
                     continue
-                pattern = re.compile(rule_def["pattern"])
+                pattern = compile_rule(rule_def["pattern"], label=rule_name)
                 for match in pattern.finditer(line):
-                    if rule_def.get("math_context") and not self._is_in_math_at(line, match.start()):
+                    pos = index.offset(line_num, match.start())
+                    if rule_def.get("math_context") and not index.contains(ContextKind.MATH, pos):
                         continue
                     matched = match.group(1) if match.lastindex else match.group(0)
                     issues.append(Issue(
@@ -48,16 +57,6 @@ class HebMathDetector(DetectorInterface):
         """Check if line contains inline math $...$."""
         return "$" in line and line.count("$") >= 2
 
-    def _is_in_math_at(self, line: str, pos: int) -> bool:
-        """Check if position is inside math mode."""
-        in_math = False
-        for i, char in enumerate(line):
-            if char == "$" and (i == 0 or line[i - 1] != "\\"):
-                in_math = not in_math
-            if i == pos:
-                return in_math
-        return in_math
-
     def _update_context(self, line: str, in_math: bool, in_cases: bool) -> tuple:
         """Update math/cases context based on line content."""
         if r"\begin{cases}" in line or r"\begin{dcases}" in line:
@@ -7,14 +7,16 @@ PDF-level validation (rendered images) requires LLM.
 
 from __future__ import annotations
 
-import os
-import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..indexing.image_metadata import ImageInfo, ImageMetadataCache, image_metadata_cache
+from ..indexing.project_files import FileLookup, ProjectFileIndex, file_lookup, parse_graphicspath
+from ..matching import compile_rule, compile_rule_field
 from .image_rules import IMAGE_RULES
+from .image_size_check import DEFAULT_TEXT_WIDTH_PT, check_image_size
 
 
 class ImageDetector(DetectorInterface):
@@ -26,16 +28,30 @@ class ImageDetector(DetectorInterface):
     - Wrong paths/extensions
     - Placeholder boxes
     - Empty figure environments
+    - Images overflowing the text width, oversized or low-resolution
+      (from file headers, see ImageMetadataCache)
 
     PDF-level validation (LLM only):
     - Verify image renders in PDF
     - Detect empty boxes visually
     """
 
-    def __init__(self, project_root: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        case_insensitive_paths: bool = False,
+        text_width_pt: float = DEFAULT_TEXT_WIDTH_PT,
+        metadata: Optional[ImageMetadataCache] = None,
+    ) -> None:
         """Initialize detector with optional project root for file checks."""
         self._rules = IMAGE_RULES
         self._project_root = project_root or Path.cwd()
+        self._index_root = project_root  # The file index needs an explicit root
+        self._case_insensitive = case_insensitive_paths
+        self._text_width_pt = text_width_pt
+        self._metadata = metadata or image_metadata_cache()
+        self._files: Optional[Union[ProjectFileIndex, FileLookup]] = None
+        self._graphicspath: List[str] = []
 
     def detect(
         self,
@@ -47,6 +63,9 @@ class ImageDetector(DetectorInterface):
         issues: List[Issue] = []
         lines = content.split("\n")
         source_dir = Path(file_path).parent if file_path else self._project_root
+        self._files = None  # Refreshed on first file check of this document
+        self._graphicspath = parse_graphicspath(content)
+        self._prefetch_metadata(content, source_dir)
 
         for rule_name, rule_def in self._rules.items():
             # Handle document-context rules
@@ -74,11 +93,11 @@ class ImageDetector(DetectorInterface):
     ) -> List[Issue]:
         """Check document-wide rules."""
         issues = []
-        pattern = re.compile(rule_def["pattern"])
-        neg_pattern = rule_def.get("negative_pattern")
+        pattern = compile_rule(rule_def["pattern"], label=rule_name)
+        neg_pattern = compile_rule_field(rule_def, "negative_pattern", rule_name)
 
         if pattern.search(content):
-            if neg_pattern and not re.search(neg_pattern, content):
+            if neg_pattern and not neg_pattern.search(content):
                 issues.append(self._create_issue(
                     rule_name, rule_def, "Document", file_path, 1 + offset
                 ))
@@ -90,12 +109,12 @@ class ImageDetector(DetectorInterface):
     ) -> List[Issue]:
         """Check single line against rule."""
         issues = []
-        pattern = re.compile(rule_def["pattern"])
+        pattern = compile_rule(rule_def["pattern"], label=rule_name)
+        ctx = compile_rule_field(rule_def, "context_pattern", rule_name)
 
         for match in pattern.finditer(line):
             # Context check
-            ctx = rule_def.get("context_pattern")
-            if ctx and not re.search(ctx, line):
+            if ctx and not ctx.search(line):
                 continue
 
             # File existence check
@@ -106,6 +125,15 @@ class ImageDetector(DetectorInterface):
                         rule_name, rule_def, img_path, file_path, line_num,
                         {"image_path": img_path}
                     ))
+            elif rule_def.get("check_image_size"):
+                info = self._image_info(match.group(2), source_dir)
+                context = info and check_image_size(
+                    rule_def["check_image_size"], rule_def, match.group(1), info, self._text_width_pt
+                )
+                if context:
+                    issues.append(self._create_issue(
+                        rule_name, rule_def, match.group(2), file_path, line_num, context
+                    ))
             else:
                 content = match.group(1) if match.lastindex else match.group(0)
                 issues.append(self._create_issue(
@@ -115,21 +143,27 @@ class ImageDetector(DetectorInterface):
         return issues
 
     def _image_exists(self, img_path: str, source_dir: Path) -> bool:
-        """Check if image file exists."""
-        # Try common locations
-        search_paths = [
-            source_dir / img_path,
-            source_dir / "images" / img_path,
-            source_dir / "figures" / img_path,
-            self._project_root / img_path,
-            self._project_root / "images" / img_path,
-        ]
-        # Add common extensions if not specified
-        if not Path(img_path).suffix:
-            for ext in [".png", ".jpg", ".jpeg", ".pdf"]:
-                search_paths.extend([p.with_suffix(ext) for p in search_paths])
-
-        return any(p.exists() for p in search_paths)
+        """Check if image file exists, using the shared project file index."""
+        if self._files is None:
+            self._files = file_lookup(self._index_root, self._case_insensitive)
+        return self._files.find_graphic(img_path, source_dir, self._graphicspath) is not None
+
+    def _image_info(self, img_path: str, source_dir: Path) -> Optional[ImageInfo]:
+        """Header metadata of a referenced image, if it exists."""
+        if self._files is None:
+            self._files = file_lookup(self._index_root, self._case_insensitive)
+        found = self._files.find_graphic(img_path.strip(), source_dir, self._graphicspath)
+        return self._metadata.get(found) if found else None
+
+    def _prefetch_metadata(self, content: str, source_dir: Path) -> None:
+        """Read the headers of all images the document references in parallel."""
+        pattern = compile_rule(self._rules["img-file-not-found"]["pattern"], label="img-file-not-found")
+        names = {m.group(1).strip() for m in pattern.finditer(content)}
+        if not names:
+            return
+        self._files = file_lookup(self._index_root, self._case_insensitive)
+        found = (self._files.find_graphic(n, source_dir, self._graphicspath) for n in names)
+        self._metadata.scan(path for path in found if path)
 
     def _create_issue(
         self, rule_name: str, rule_def: Dict, content: str,
@@ -76,4 +76,30 @@ IMAGE_RULES = {
         "severity": Severity.INFO,
         "fix_template": "Add [width=0.8\\textwidth] for better control",
     },
+    # Rules 9-11: Size checks from image headers (no decoding, no LaTeX run)
+    "img-overflows-textwidth": {
+        "description": "Image is typeset wider than the text width",
+        "pattern": r"\\includegraphics(?:\[([^\]]*)\])?\{([^}]+)\}",
+        "check_image_size": "overflow",
+        "tolerance_pt": 1.0,
+        "severity": Severity.WARNING,
+        "fix_template": "Set [width=\\textwidth] or smaller",
+    },
+    "img-oversized-file": {
+        "description": "Image file or resolution is far larger than needed and bloats the PDF",
+        "pattern": r"\\includegraphics(?:\[([^\]]*)\])?\{([^}]+)\}",
+        "check_image_size": "oversized",
+        "max_dpi": 600,
+        "max_file_bytes": 5 * 1024 * 1024,
+        "severity": Severity.INFO,
+        "fix_template": "Downsample or recompress the image",
+    },
+    "img-low-resolution": {
+        "description": "Raster image is printed below 150 dpi",
+        "pattern": r"\\includegraphics(?:\[([^\]]*)\])?\{([^}]+)\}",
+        "check_image_size": "low_resolution",
+        "min_dpi": 150,
+        "severity": Severity.INFO,
+        "fix_template": "Use a higher-resolution or vector image",
+    },
 }
@@ -0,0 +1,90 @@
+"""
+Image size checks from header metadata.
+
+Computes the width an \\includegraphics will be typeset at, from its
+options and the image's natural size, and compares it and the image's
+effective resolution against the limits of the image-size rules.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional
+
+from ..indexing.image_metadata import PT_PER_INCH, ImageInfo
+
+# a4paper with margin=2.5cm, as set by hebrew-academic-template.cls
+DEFAULT_TEXT_WIDTH_PT = 455.24
+
+_UNIT_PT = {
+    "pt": 1.0, "bp": PT_PER_INCH / 72, "in": PT_PER_INCH, "cm": PT_PER_INCH / 2.54,
+    "mm": PT_PER_INCH / 25.4, "pc": 12.0,
+}
+_LENGTH_RE = re.compile(
+    r"^\s*(-?[\d.]*)\s*(?:(\\(?:textwidth|linewidth|columnwidth|hsize))|(pt|bp|in|cm|mm|pc))\s*$"
+)
+# Options that change the visible box in ways not modelled here
+_UNMODELLED = frozenset({"angle", "origin", "trim", "viewport", "bb", "natwidth", "totalheight"})
+
+
+def parse_length(value: str, text_width_pt: float) -> Optional[float]:
+    r"""A LaTeX length like 0.8\textwidth or 5cm in points; None if unknown."""
+    match = _LENGTH_RE.match(value)
+    if not match:
+        return None
+    factor = float(match.group(1)) if match.group(1) not in ("", "-", ".") else 1.0
+    if match.group(2):
+        return factor * text_width_pt
+    return factor * _UNIT_PT[match.group(3)]
+
+
+def displayed_width_pt(options: str, info: ImageInfo, text_width_pt: float) -> Optional[float]:
+    """Width the image is typeset at, or None if it cannot be determined."""
+    natural = info.natural_size_pt
+    opts = {}
+    for item in filter(None, (part.strip() for part in (options or "").split(","))):
+        key, _, value = item.partition("=")
+        opts[key.strip()] = value.strip()
+    if _UNMODELLED & opts.keys():
+        return None
+    width = parse_length(opts["width"], text_width_pt) if "width" in opts else None
+    height = parse_length(opts["height"], text_width_pt) if "height" in opts else None
+    if ("width" in opts and width is None) or ("height" in opts and height is None):
+        return None
+    if height is not None and natural:
+        scaled = natural[0] * height / natural[1]
+        if width is None or "keepaspectratio" in opts:
+            return scaled if width is None else min(width, scaled)
+    if width is not None:
+        return width
+    if natural is None:
+        return None
+    try:
+        return natural[0] * float(opts.get("scale", 1))
+    except ValueError:
+        return None
+
+
+def check_image_size(
+    kind: str, rule_def: Dict, options: str, info: ImageInfo, text_width_pt: float
+) -> Optional[Dict]:
+    """Return issue context if the image violates the rule, else None."""
+    width = displayed_width_pt(options, info, text_width_pt)
+    context: Dict = {"image_path": info.path, "format": info.format}
+    if kind == "overflow":
+        if width is None or width <= text_width_pt + rule_def.get("tolerance_pt", 1.0):
+            return None
+        context.update(width_pt=round(width, 1), text_width_pt=text_width_pt)
+        return context
+    if kind == "oversized" and info.file_size > rule_def["max_file_bytes"]:
+        context["file_size"] = info.file_size
+        return context
+    if not info.is_raster or not width:
+        return None
+    dpi = info.width_px / (width / PT_PER_INCH)
+    context["effective_dpi"] = round(dpi)
+    if kind == "oversized" and dpi > rule_def["max_dpi"]:
+        return context
+    if kind == "low_resolution" and dpi < rule_def["min_dpi"]:
+        return context
+    return None
@@ -0,0 +1,187 @@
+"""
+Python listing syntax detector.
+
+Checks that the body of every Python listing parses, so readers never
+copy broken code. Bodies are dedented and compiled (never run); large
+batches run in a process pool. Results are cached by the listing's
+content digest (in memory, and optionally in a JSON file), so warm runs
+only compile listings that changed. detect_file() and detect_project()
+take their blocks from a CodeBlockStore, so unchanged files are not
+re-read either.
+
+A LaTeX comment on the line before \\begin (or on the \\begin line) sets
+how a listing is checked:
+
+    % qa-code: doctest   - only the >>> examples are compiled
+    % qa-code: fragment  - may be an indented or incomplete excerpt
+    % qa-code: skip      - not checked
+
+Listings whose body starts with a >>> prompt are treated as doctests
+without annotation.
+"""
+
+from __future__ import annotations
+
+import doctest
+import json
+import re
+import textwrap
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from ...domain.interfaces import DetectorInterface
+from ...domain.models.issue import Issue
+from ..indexing.code_blocks import CodeBlock, CodeBlockStore, find_code_blocks
+from ..indexing.project_files import project_file_index
+from .code_rules import LISTING_ANNOTATION_PATTERN, LISTING_SYNTAX_RULES, PYTHON_LANGUAGES
+
+# (line in the listing body, message), or None if the listing parses
+SyntaxResult = Optional[Tuple[int, str]]
+
+_ANNOTATION_RE = re.compile(LISTING_ANNOTATION_PATTERN)
+
+
+def check_python_source(source: str, mode: str = "module") -> SyntaxResult:
+    """Compile a listing body; module-level so process pools can pickle it."""
+    source = textwrap.dedent(source)
+    if mode == "doctest":
+        return _check_doctest(source)
+    try:
+        compile(source, "<listing>", "exec", dont_inherit=True)
+        return None
+    except (SyntaxError, ValueError) as exc:
+        error = (getattr(exc, "lineno", None) or 1, getattr(exc, "msg", str(exc)))
+    if mode == "fragment":
+        # An excerpt of a function body: allow return/await/yield and indentation
+        wrapped = "async def _fragment():\n" + textwrap.indent(source or "pass", "    ") + "\n    pass\n"
+        try:
+            compile(wrapped, "<listing>", "exec", dont_inherit=True)
+            return None
+        except (SyntaxError, ValueError):
+            pass
+    return error
+
+
+def _check_doctest(source: str) -> SyntaxResult:
+    """Compile each >>> example of a doctest listing."""
+    try:
+        examples = doctest.DocTestParser().get_examples(source)
+    except ValueError as exc:
+        return 1, str(exc)
+    for example in examples:
+        try:
+            compile(example.source, "<listing>", "single", dont_inherit=True)
+        except (SyntaxError, ValueError) as exc:
+            return example.lineno + (exc.lineno or 1), exc.msg
+    return None
+
+
+class ListingSyntaxDetector(DetectorInterface):
+    """Detects Python listings that do not parse."""
+
+    def __init__(
+        self,
+        cache_path: Optional[Union[str, Path]] = None,
+        max_workers: Optional[int] = None,
+        min_parallel: int = 64,
+        store: Optional[CodeBlockStore] = None,
+    ) -> None:
+        self._rules = LISTING_SYNTAX_RULES
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._max_workers = max_workers
+        self._min_parallel = min_parallel
+        self._store = store if store is not None else CodeBlockStore()
+        self._cache: Dict[str, SyntaxResult] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def detect(self, content: str, file_path: str, offset: int = 0) -> List[Issue]:
+        """Detect Python listings with syntax errors."""
+        return self._issues(find_code_blocks(content, file_path=file_path), file_path, offset)
+
+    def detect_file(self, path: Union[str, Path], changed_only: bool = False) -> List[Issue]:
+        """Detect in a file on disk; changed_only skips blocks reported before."""
+        blocks = self._store.changed(path) if changed_only else self._store.blocks(path)
+        return self._issues(blocks, str(path))
+
+    def detect_project(self, root: Union[str, Path], changed_only: bool = False) -> List[Issue]:
+        """Detect in every .tex file of a project."""
+        paths = sorted(project_file_index(root).files(".tex"))
+        issues = [issue for path in paths for issue in self.detect_file(path, changed_only)]
+        if changed_only:
+            self._store.save()
+        return issues
+
+    def _issues(self, blocks: Iterable[CodeBlock], file_path: str, offset: int = 0) -> List[Issue]:
+        jobs: List[Tuple[CodeBlock, str]] = []
+        for block in blocks:
+            mode = self._mode(block)
+            if mode != "skip" and block.language in PYTHON_LANGUAGES:
+                jobs.append((block, mode))
+        results = self.check([(block.content, mode) for block, mode in jobs], [b.digest for b, _ in jobs])
+
+        rule_def = self._rules["code-python-syntax-error"]
+        issues = []
+        for (block, mode), result in zip(jobs, results):
+            if result is None:
+                continue
+            line, message = result
+            issues.append(Issue(
+                rule="code-python-syntax-error", file=file_path,
+                line=block.body_line + line - 1 + offset, content=message[:50],
+                severity=rule_def["severity"], fix=rule_def["fix"],
+                context={"code_env": block.env, "mode": mode, "listing_line": block.line + offset},
+            ))
+        return issues
+
+    def check(self, sources: List[Tuple[str, str]], digests: List[str]) -> List[SyntaxResult]:
+        """Check (source, mode) pairs, compiling only digests not cached yet."""
+        keys = [f"{digest}:{mode}" for digest, (_, mode) in zip(digests, sources)]
+        with self._lock:
+            pending = {k: src for k, src in zip(keys, sources) if k not in self._cache}
+        if pending:
+            items = list(pending.items())
+            if len(items) >= self._min_parallel:
+                with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+                    found = list(executor.map(
+                        check_python_source, [s for _, (s, _) in items], [m for _, (_, m) in items],
+                        chunksize=16,
+                    ))
+            else:
+                found = [check_python_source(source, mode) for _, (source, mode) in items]
+            with self._lock:
+                self._cache.update(zip(pending, found))
+            self._save()
+        return [self._cache[key] for key in keys]
+
+    def get_rules(self) -> Dict[str, str]:
+        return {n: r["description"] for n, r in self._rules.items()}
+
+    @staticmethod
+    def _mode(block: CodeBlock) -> str:
+        """Annotation on the \\begin line or the line before it; doctest if >>> leads."""
+        match = _ANNOTATION_RE.search(block.lead)
+        if match:
+            return match.group(1)
+        if block.content.lstrip().startswith(">>>") or block.language == "pycon":
+            return "doctest"
+        return "module"
+
+    def _load(self) -> None:
+        if self._cache_path is None or not self._cache_path.exists():
+            return
+        try:
+            stored = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        self._cache = {key: tuple(value) if value else None for key, value in stored.items()}
+
+    def _save(self) -> None:
+        if self._cache_path is None:
+            return
+        with self._lock:
+            data = json.dumps(self._cache)
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache_path.write_text(data, encoding="utf-8")
@@ -6,12 +6,12 @@ Detects issues related to subfiles package usage for modular documents.
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 from typing import Dict, List
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..matching import compile_rule, compile_rule_field
 from .subfiles_rules import SUBFILES_RULES
 
 
@@ -37,16 +37,16 @@ class SubfilesDetector(DetectorInterface):
         filename = Path(file_path).stem.lower()
 
         for rule_name, rule_def in self._rules.items():
-            pattern = re.compile(rule_def["pattern"])
-            file_pattern = rule_def.get("file_pattern")
-            negative_pattern = rule_def.get("negative_pattern")
+            pattern = compile_rule(rule_def["pattern"], label=rule_name)
+            file_pattern = compile_rule_field(rule_def, "file_pattern", rule_name)
+            negative_pattern = compile_rule_field(rule_def, "negative_pattern", rule_name)
 
             # File pattern check - only apply to matching files
-            if file_pattern and not re.search(file_pattern, filename):
+            if file_pattern and not file_pattern.search(filename):
                 continue
 
             # Negative pattern check
-            if negative_pattern and re.search(negative_pattern, content):
+            if negative_pattern and negative_pattern.search(content):
                 continue
 
             for line_num, line in enumerate(lines, start=1):
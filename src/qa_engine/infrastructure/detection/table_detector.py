@@ -7,10 +7,11 @@ Implements detection of table-related issues in RTL context.
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+from typing import Any, Dict, List
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue
+from ..matching import compile_rule, compile_rule_field
 from .table_rules import TABLE_RULES
 
 
@@ -35,14 +36,14 @@ class TableDetector(DetectorInterface):
         lines = content.split("\n")
 
         for rule_name, rule_def in self._rules.items():
-            pattern = re.compile(rule_def["pattern"])
-            context_pattern = rule_def.get("context_pattern")
+            pattern = compile_rule(rule_def["pattern"], label=rule_name)
+            context_pattern = compile_rule_field(rule_def, "context_pattern", rule_name)
             document_context = rule_def.get("document_context", False)
-            exclude_pattern = rule_def.get("exclude_pattern")
+            exclude_pattern = compile_rule_field(rule_def, "exclude_pattern", rule_name)
 
             # Document context check
             if document_context and context_pattern:
-                if not re.search(context_pattern, content):
+                if not context_pattern.search(content):
                     continue
 
             for line_num, line in enumerate(lines, start=1):
@@ -51,7 +52,7 @@ class TableDetector(DetectorInterface):
 
                 # Line context check (non-document)
                 if context_pattern and not document_context:
-                    if not re.search(context_pattern, line):
+                    if not context_pattern.search(line):
                         continue
 
                 for match in pattern.finditer(line):
@@ -76,15 +77,15 @@ class TableDetector(DetectorInterface):
 
         return issues
 
-    def _check_exclude(self, prefix: str, exclude_pattern: str) -> bool:
+    def _check_exclude(self, prefix: str, exclude_pattern: Any) -> bool:
         """Check if exclude pattern exists in prefix."""
         # For resizebox check - look for unclosed resizebox
-        if "resizebox" in exclude_pattern:
+        if "resizebox" in exclude_pattern.pattern:
             opens = len(re.findall(r"\\resizebox", prefix))
             closes = prefix.count("}")
             # Simplified check - if resizebox appears before, skip
             return opens > 0
-        return re.search(exclude_pattern, prefix) is not None
+        return exclude_pattern.search(prefix) is not None
 
     def get_rules(self) -> Dict[str, str]:
         """Return dict of rule_name -> description."""
@@ -12,6 +12,7 @@ from typing import Dict, List
 
 from ...domain.interfaces import DetectorInterface
 from ...domain.models.issue import Issue, Severity
+from ..matching import compile_rule
 
 
 class TypesetDetector(DetectorInterface):
@@ -97,7 +98,7 @@ class TypesetDetector(DetectorInterface):
                 current_file = file_match.group(1)
 
             for rule_name, rule_def in self._rules.items():
-                pattern = re.compile(rule_def["pattern"])
+                pattern = compile_rule(rule_def["pattern"], label=rule_name)
                 match = pattern.search(line)
 
                 if match:
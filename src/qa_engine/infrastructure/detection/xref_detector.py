@@ -0,0 +1,99 @@
+"""
+Cross-reference detector.
+
+Reports undefined, orphaned and duplicate labels and references to
+chapters the document does not have, from a shared XrefGraph.
+detect_project() indexes the sources, .aux/.bbl and .bib files of a
+project's root document (main.tex, or the given main), re-parsing only
+files that changed since the previous call; without a root document it
+indexes every file under the project.
+detect() re-indexes one file and reports its issues. Whether a label is
+undefined, unused or defined elsewhere too depends on the other files,
+so until a project scan covers the file detect() reports only labels
+defined twice within it.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ...domain.interfaces import DetectorInterface
+from ...domain.models.issue import Issue
+from ..indexing.xref_graph import XrefGraph, XrefOccurrence
+from .xref_rules import XREF_RULES
+
+
+class XrefDetector(DetectorInterface):
+    """Detects label, reference and chapter-reference issues."""
+
+    def __init__(self, graph: Optional[XrefGraph] = None) -> None:
+        self._rules = XREF_RULES
+        self.graph = graph if graph is not None else XrefGraph()
+
+    def detect(self, content: str, file_path: str, offset: int = 0) -> List[Issue]:
+        """Index the file's current content and report its issues."""
+        self.graph.update(file_path, content)
+        return self.issues(file_path, offset)
+
+    MAIN_DOCUMENT = "main.tex"
+
+    def detect_project(self, root: Union[str, Path], main: Optional[Union[str, Path]] = None) -> List[Issue]:
+        """Index a project's root document incrementally and report all issues.
+
+        Standalone chapter files are separate documents; they are not merged
+        into main's namespace, where their labels would all be duplicates.
+        """
+        main = main or os.path.join(root, self.MAIN_DOCUMENT)
+        if os.path.isfile(main):
+            self.graph.scan_document(main)
+        else:
+            self.graph.scan_project(root)
+        return self.issues()
+
+    def issues(self, file_path: Optional[str] = None, offset: int = 0) -> List[Issue]:
+        """Issues from the current graph, optionally for one file.
+
+        A file outside the scanned projects gets its in-file duplicates only.
+        """
+        name = os.path.abspath(file_path) if file_path is not None else None
+        if name is not None and not self.graph.covers(name):
+            return [
+                self._create_issue(rule_name, rule_def, occ, offset, file_path)
+                for rule_name, rule_def in self._rules.items() if rule_def["query"] == "duplicates"
+                for occ in self._local_duplicates(rule_def["kind"], name)
+            ]
+        issues: List[Issue] = []
+        for rule_name, rule_def in self._rules.items():
+            for occ in self._query(rule_def):
+                if name is None or occ.file == name:
+                    issues.append(self._create_issue(rule_name, rule_def, occ, offset, file_path))
+        return issues
+
+    def _local_duplicates(self, kind: str, name: str) -> List[XrefOccurrence]:
+        """Definitions of keys defined more than once in one file."""
+        defs = [o for o in self.graph.occurrences(name) if o.defines and o.kind == kind and o.in_source]
+        counts = Counter(o.key for o in defs)
+        return [o for o in defs if counts[o.key] > 1]
+
+    def _query(self, rule_def: Dict) -> List[XrefOccurrence]:
+        kind = rule_def["kind"]
+        if rule_def["query"] == "undefined":
+            return self.graph.undefined(kind)
+        if rule_def["query"] == "unused":
+            return self.graph.unused(kind)
+        return [occ for occs in self.graph.duplicates(kind).values() for occ in occs]
+
+    def _create_issue(
+        self, rule: str, rule_def: Dict, occ: XrefOccurrence, offset: int, file_path: Optional[str] = None
+    ) -> Issue:
+        return Issue(
+            rule=rule, file=file_path or occ.file, line=occ.line + offset, content=occ.key,
+            severity=rule_def["severity"], fix=rule_def["fix_template"].format(occ.key),
+            context={"command": occ.command},
+        )
+
+    def get_rules(self) -> Dict[str, str]:
+        return {name: rule["description"] for name, rule in self._rules.items()}
@@ -0,0 +1,39 @@
+"""
+Cross-reference detection rules definitions.
+
+Each rule is a query on the XrefGraph: undefined uses, unused source
+definitions, or keys defined more than once.
+"""
+
+from ...domain.models.issue import Severity
+
+XREF_RULES = {
+    "ref-undefined-label": {
+        "description": "Reference to a label that is not defined",
+        "kind": "label",
+        "query": "undefined",
+        "severity": Severity.WARNING,
+        "fix_template": "Define \\label{{{}}} or fix the reference",
+    },
+    "ref-orphan-label": {
+        "description": "Label that is never referenced",
+        "kind": "label",
+        "query": "unused",
+        "severity": Severity.INFO,
+        "fix_template": "Reference \\label{{{}}} or remove it",
+    },
+    "ref-duplicate-label": {
+        "description": "Label defined more than once",
+        "kind": "label",
+        "query": "duplicates",
+        "severity": Severity.CRITICAL,
+        "fix_template": "Rename one of the \\label{{{}}} definitions",
+    },
+    "ref-undefined-chapter": {
+        "description": "Chapter reference to a chapter number the document does not have",
+        "kind": "chapter",
+        "query": "undefined",
+        "severity": Severity.WARNING,
+        "fix_template": "Check the chapter number in \\chapterref{{{}}}",
+    },
+}
@@ -63,13 +63,12 @@ def handle_infra(orchestrator, content: str, file_path: str, apply_fixes: bool,
 
 
 def handle_typeset(orchestrator, content: str, file_path: str, apply_fixes: bool, result: "FamilyResult") -> None:
-    """Handle typeset family."""
-    log_content = ""
-    if file_path:
-        log_path = Path(file_path).with_suffix(".log")
-        if log_path.exists():
-            log_content = log_path.read_text(encoding="utf-8", errors="ignore")
-    orch_result = orchestrator.run(log_content, content, file_path, apply_fixes)
+    """Handle typeset family; the sibling .log is parsed once per change."""
+    log_path = Path(file_path).with_suffix(".log") if file_path else None
+    if log_path is not None and log_path.exists():
+        orch_result = orchestrator.run_log(log_path, content, file_path, apply_fixes)
+    else:
+        orch_result = orchestrator.run("", content, file_path, apply_fixes)
     result.verdict = orch_result.verdict
     result.issues_found = orch_result.total_detected
     result.issues_fixed = orch_result.total_fixed
@@ -21,6 +21,7 @@ from .tikz_overflow_fixer import TikzOverflowFixer, TikzOverflowFixResult, TikzO
 from .caption_length_fixer import CaptionLengthFixer, CaptionLengthFixResult, CaptionLengthFix
 from .caption_to_body_fixer import CaptionToBodyFixer, CaptionToBodyResult, CaptionToBodyFix
 from .hebrew_content_fixer import HebrewContentFixer, HebrewContentResult, HebrewContentFix
+from .translation_memory import BatchTranslator, TranslationMemory
 from .hebrewchapter_fixer import HebrewChapterFixer, HebrewChapterResult, HebrewChapterFix
 from .cls_sync_fixer import CLSSyncFixer, CLSSyncFixResult
 
@@ -61,6 +62,8 @@ __all__ = [
     "HebrewContentFixer",
     "HebrewContentResult",
     "HebrewContentFix",
+    "BatchTranslator",
+    "TranslationMemory",
     "HebrewChapterFixer",
     "HebrewChapterResult",
     "HebrewChapterFix",
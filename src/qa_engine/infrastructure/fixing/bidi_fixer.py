@@ -4,6 +4,9 @@ BiDi fixer for Hebrew-English LaTeX.
 Implements FR-501 from PRD - fixes BiDi text issues.
 Uses CLS built-in commands: \en{}, \num{}, \hebyear{}, \percent{}
 
+v1.4.0: TikZ-line and color-context checks query a LatexContextIndex built
+        once per document instead of re-scanning each line; the per-line
+        _get_tikz_lines() and _is_inside_color_context() helpers are gone
 v1.3.0: Added color context exclusion to prevent corrupting color syntax
         - Added _is_inside_color_context() method
         - Detects tcolorbox options (colback=, colframe=, coltitle=, etc.)
@@ -26,6 +29,7 @@ from typing import Dict, List, Tuple
 
 from ...domain.interfaces import FixerInterface
 from ...domain.models.issue import Issue
+from ..indexing import ContextKind, LatexContextIndex
 
 # Regex patterns for detecting already-wrapped content
 WRAPPER_PATTERNS = [
@@ -36,15 +40,6 @@ WRAPPER_PATTERNS = [
     re.compile(r"\\textenglish\{[^}]*\}"),
 ]
 
-# Environments where BiDi fixes should NOT be applied
-SKIP_ENVIRONMENTS = [
-    "tikzpicture",
-    "pgfpicture",
-    "axis",
-    "semilogyaxis",
-    "loglogaxis",
-]
-
 
 class BiDiFixer(FixerInterface):
     r"""
@@ -69,38 +64,26 @@ class BiDiFixer(FixerInterface):
                 issues_by_line[line_num] = []
             issues_by_line[line_num].append(issue)
 
-        # Build a map of which lines are inside TikZ environments
-        tikz_lines = self._get_tikz_lines(lines)
+        # Index TikZ environments and color contexts once per document
+        index = LatexContextIndex(content)
 
         # Apply fixes line by line (reverse order to preserve positions)
         for line_num in sorted(issues_by_line.keys(), reverse=True):
             if 1 <= line_num <= len(lines):
                 # Skip lines inside TikZ environments
-                if line_num in tikz_lines:
+                if index.line_in(ContextKind.TIKZ_ENV, line_num):
                     continue
                 line = lines[line_num - 1]
-                fixed_line = self._fix_line(line, issues_by_line[line_num])
+                line_start = index.offset(line_num)
+                fixed_line = self._fix_line(line, issues_by_line[line_num], index, line_start)
                 lines[line_num - 1] = fixed_line
 
         return "\n".join(lines)
 
-    def _get_tikz_lines(self, lines: List[str]) -> set:
-        """Return set of line numbers (1-based) that are inside TikZ environments."""
-        tikz_lines = set()
-        depth = 0
-        for line_num, line in enumerate(lines, start=1):
-            # Check for environment opens/closes
-            for env in SKIP_ENVIRONMENTS:
-                opens = len(re.findall(rf"\\begin\{{{env}\}}", line))
-                closes = len(re.findall(rf"\\end\{{{env}\}}", line))
-                depth += opens - closes
-            depth = max(0, depth)
-            if depth > 0:
-                tikz_lines.add(line_num)
-        return tikz_lines
-
-    def _fix_line(self, line: str, issues: List[Issue]) -> str:
-        """Apply fixes to a single line."""
+    def _fix_line(
+        self, line: str, issues: List[Issue], index: LatexContextIndex, line_start: int,
+    ) -> str:
+        """Apply fixes to a single line starting at line_start in the indexed document."""
         # Sort by position (right to left to preserve positions)
         sorted_issues = sorted(
             issues,
@@ -123,7 +106,7 @@ class BiDiFixer(FixerInterface):
                 continue
 
             # Skip if inside color context (colback=purple!5, \textcolor{green})
-            if self._is_inside_color_context(line, pos):
+            if index.contains(ContextKind.COLOR, line_start + pos):
                 continue
 
             # Apply appropriate fix based on rule
@@ -185,62 +168,6 @@ class BiDiFixer(FixerInterface):
                 return True
         return False
 
-    def _is_inside_color_context(self, line: str, pos: int) -> bool:
-        """Check if position is inside a color specification context.
-
-        Detects color contexts like:
-        - colback=purple!5 (tcolorbox options)
-        - colframe=green!60!black
-        - \\textcolor{red!50}
-        - \\color{blue}
-        """
-        # Pattern 1: tcolorbox color options (colback=, colframe=, coltitle=, etc.)
-        tcolorbox_color_opts = [
-            r"colback\s*=",
-            r"colframe\s*=",
-            r"coltitle\s*=",
-            r"colbacktitle\s*=",
-            r"coltext\s*=",
-        ]
-        for opt_pattern in tcolorbox_color_opts:
-            for match in re.finditer(opt_pattern, line):
-                opt_end = match.end()
-                if opt_end <= pos:
-                    # Find end of color spec (next , or ] or } or end of line)
-                    rest = line[opt_end:]
-                    spec_end = len(rest)
-                    for i, char in enumerate(rest):
-                        if char in ",]}\n":
-                            spec_end = i
-                            break
-                    if pos < opt_end + spec_end:
-                        return True
-
-        # Pattern 2: LaTeX color commands (\textcolor{...}, \color{...})
-        color_commands = [
-            r"\\textcolor\{",
-            r"\\color\{",
-            r"\\definecolor\{",
-            r"\\colorlet\{",
-        ]
-        for cmd_pattern in color_commands:
-            for match in re.finditer(cmd_pattern, line):
-                cmd_start = match.start()
-                if cmd_start < pos:
-                    # Find matching closing brace
-                    depth = 1
-                    i = match.end()
-                    while i < len(line) and depth > 0:
-                        if line[i] == "{":
-                            depth += 1
-                        elif line[i] == "}":
-                            depth -= 1
-                        i += 1
-                    if pos < i:
-                        return True
-
-        return False
-
     def _get_fix(self, rule: str, content: str) -> str:
         """Get the appropriate fix for a rule."""
         if rule == "bidi-numbers":
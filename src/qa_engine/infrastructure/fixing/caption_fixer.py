@@ -13,6 +13,7 @@ from typing import Dict, List
 
 from ...domain.interfaces import FixerInterface
 from ...domain.models.issue import Issue
+from ..indexing import FloatInventory
 from .caption_patterns import CAPTION_PATTERNS
 
 
@@ -117,24 +118,29 @@ class CaptionFixer(FixerInterface):
     def _fix_flushleft_captions(self, content: str, file_path: str) -> tuple:
         """Fix flushleft-wrapped captions."""
         fixes = []
-        pattern = r"\\begin\{flushleft\}\s*(\\caption\{[^}]*\})\s*\\end\{flushleft\}"
-
-        def replacer(match):
-            old = match.group(0)
-            caption = match.group(1)
-            new = f"\\centering\n{caption}"
-            # Find approximate line number
-            pos = match.start()
-            line_num = content[:pos].count("\n") + 1
+        inventory = FloatInventory(content)
+        edits = []
+
+        # flushleft environments holding nothing but a caption
+        for caption in inventory.captions:
+            if caption.parent_env != "flushleft":
+                continue
+            wrapper = inventory.tree.innermost(caption.start)
+            inner = content[wrapper.body_start:wrapper.body_end]
+            if not wrapper.closed or inner.strip() != content[caption.source]:
+                continue
+            old = content[wrapper.start:wrapper.end]
+            new = f"\\centering\n{content[caption.source]}"
             fixes.append(CaptionFix(
-                file=file_path, line=line_num,
+                file=file_path, line=inventory.tree.line_of(wrapper.start),
                 old=old[:50] + "..." if len(old) > 50 else old,
                 new=new[:50] + "..." if len(new) > 50 else new,
                 pattern="fix-flushleft-caption"
             ))
-            return new
+            edits.append((wrapper.start, wrapper.end, new))
 
-        content = re.sub(pattern, replacer, content, flags=re.DOTALL)
+        for start, end, new in reversed(edits):
+            content = content[:start] + new + content[end:]
         return content, fixes
 
     def get_patterns(self) -> Dict[str, Dict[str, str]]:
@@ -13,6 +13,7 @@ from typing import Dict, List, Tuple
 
 from ...domain.interfaces import FixerInterface
 from ...domain.models.issue import Issue
+from ..indexing import FloatInventory
 
 
 @dataclass
@@ -102,41 +103,38 @@ class CaptionLengthFixer(FixerInterface):
         """Fix all long caption issues in content (auto-detect mode)."""
         result = CaptionLengthFixResult()
         lines = content.split("\n")
+        inventory = FloatInventory(content)
+        edits = []
 
-        # Pattern for caption without optional argument
-        caption_pattern = re.compile(
-            r"(\\caption)\{([^}]{80,})\}"
-        )
-
-        for i, line in enumerate(lines):
-            # Skip comments
-            if line.strip().startswith("%"):
+        # Captions without a short title; commented-out ones are not indexed
+        for caption in inventory.captions:
+            if caption.short is not None or len(caption.text) < 80:
                 continue
 
-            # Skip lines with existing short title
-            if re.search(r"\\caption\[[^\]]+\]", line):
+            short_title = self._extract_short_title(caption.text)
+            # A title cut inside \en{...} would unbalance the braces
+            if short_title.count("{") != short_title.count("}"):
                 continue
 
-            match = caption_pattern.search(line)
-            if match:
-                caption_text = match.group(2)
-                short_title = self._extract_short_title(caption_text)
-
-                new_line = self._fix_caption_line(line, caption_text, short_title)
-
-                if new_line != line:
-                    result.changes.append(CaptionLengthFix(
-                        file=file_path,
-                        line=i + 1,
-                        old_caption=line.strip()[:60] + "...",
-                        new_caption=new_line.strip()[:60] + "...",
-                        short_title=short_title,
-                        pattern="add-short-title",
-                    ))
-                    lines[i] = new_line
-                    result.fixes_applied += 1
-
-        return "\n".join(lines), result
+            insert_at = caption.start + len("\\caption")
+            line = lines[caption.line - 1]
+            column = insert_at - inventory.tree.offset(caption.line)
+            new_line = f"{line[:column]}[{short_title}]{line[column:]}"
+            result.changes.append(CaptionLengthFix(
+                file=file_path,
+                line=caption.line,
+                old_caption=line.strip()[:60] + "...",
+                new_caption=new_line.strip()[:60] + "...",
+                short_title=short_title,
+                pattern="add-short-title",
+            ))
+            edits.append((insert_at, f"[{short_title}]"))
+            result.fixes_applied += 1
+
+        for insert_at, text in reversed(edits):
+            content = content[:insert_at] + text + content[insert_at:]
+
+        return content, result
 
     def _fix_caption_line(
         self, line: str, caption_text: str, short_title: str
@@ -17,6 +17,7 @@ from typing import Dict, List, Tuple
 
 from ...domain.interfaces import FixerInterface
 from ...domain.models.issue import Issue
+from ..indexing import FloatInventory
 
 
 @dataclass
@@ -82,40 +83,45 @@ class CaptionToBodyFixer(FixerInterface):
         """Fix all long captions in content (auto-detect mode)."""
         result = CaptionToBodyResult()
 
-        # Find all figure environments with long captions
-        figure_pattern = re.compile(
-            r"(\\begin\{figure\}.*?)(\\caption\{)(.*?)(\})\s*"
-            r"(\\label\{([^}]+)\})?\s*(\\end\{figure\})",
-            re.DOTALL
-        )
-
-        def replace_figure(match: re.Match) -> str:
-            prefix = match.group(1)
-            caption_cmd = match.group(2)
-            caption_text = match.group(3)
-            label_full = match.group(5) or ""
-            label_name = match.group(6) or ""
-            suffix = match.group(7)
+        # Figures whose caption, optionally followed by a label, ends the body
+        pieces, cursor = [], 0
+        for figure in FloatInventory(content, ("figure",)).floats():
+            caption = figure.captions[-1] if figure.captions else None
+            if caption is None or caption.short is not None or not figure.closed:
+                continue
+            if figure.start < cursor:
+                continue
+            labels = [lbl for lbl in figure.labels if lbl.start >= caption.end]
+            label = labels[0] if labels else None
+            rest = content[caption.end:figure.body_end]
+            if label is not None:
+                rest = content[caption.end:label.start] + content[label.end:figure.body_end]
+            if rest.strip():
+                continue
 
             # Skip short captions
+            caption_text = caption.text
             if len(caption_text) < 100:
-                return match.group(0)
+                continue
 
             # Extract short title and description
             short_title, description = self._split_caption(caption_text)
 
             if not description:
-                return match.group(0)
+                continue
 
             # Build reference text
+            label_full = content[label.start:label.end] if label else ""
+            label_name = label.name if label else ""
             if label_name:
                 ref_text = f"כפי שמוצג בתמונה~\\ref{{{label_name}}}"
             else:
                 ref_text = ""
 
             # Build new figure
-            new_caption = f"{caption_cmd}{short_title}}}"
-            new_figure = f"{prefix}{new_caption}\n{label_full}\n{suffix}"
+            new_caption = f"\\caption{{{short_title}}}"
+            prefix = content[figure.start:caption.start]
+            new_figure = f"{prefix}{new_caption}\n{label_full}\n\\end{{figure}}"
 
             # Add description after figure
             if ref_text:
@@ -126,16 +132,17 @@ class CaptionToBodyFixer(FixerInterface):
             result.fixes_applied += 1
             result.changes.append(CaptionToBodyFix(
                 file=file_path,
-                line=content[:match.start()].count("\n") + 1,
+                line=figure.line,
                 short_title=short_title[:50],
                 description=description[:50] + "...",
                 label=label_name,
             ))
 
-            return new_figure + body_text
+            pieces.extend([content[cursor:figure.start], new_figure, body_text])
+            cursor = figure.end
 
-        content = figure_pattern.sub(replace_figure, content)
-        return content, result
+        pieces.append(content[cursor:])
+        return "".join(pieces), result
 
     def _split_caption(self, caption_text: str) -> Tuple[str, str]:
         """Split caption into short title and description."""
@@ -175,27 +182,16 @@ class CaptionToBodyFixer(FixerInterface):
             return content
 
         # Find the figure environment containing this caption
-        caption_line_idx = line_num - 1
-
-        # Find start of figure
-        start_idx = caption_line_idx
-        while start_idx > 0 and "\\begin{figure}" not in lines[start_idx]:
-            start_idx -= 1
-
-        # Find end of figure
-        end_idx = caption_line_idx
-        while end_idx < len(lines) and "\\end{figure}" not in lines[end_idx]:
-            end_idx += 1
-
-        if "\\begin{figure}" not in lines[start_idx]:
+        figure = FloatInventory(content, ("figure",)).float_at_line(line_num, "figure")
+        if figure is None:
             return content
+        start_idx, end_idx = figure.line - 1, figure.end_line - 1
 
         # Extract figure block
         figure_block = "\n".join(lines[start_idx:end_idx + 1])
 
         # Get label if present
-        label_match = re.search(r"\\label\{([^}]+)\}", figure_block)
-        label_name = label_match.group(1) if label_match else ""
+        label_name = figure.label
 
         # Split caption
         short_title, description = self._split_caption(caption_text)
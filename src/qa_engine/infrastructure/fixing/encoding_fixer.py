@@ -3,18 +3,38 @@ Encoding fixer for code blocks.
 
 Fixes character encoding issues that cause missing character warnings.
 Aligned with qa-code-fix-encoding skill.md patterns.
+
+Every pattern character is non-ASCII, so fix_file() first scans the raw
+bytes (ByteScanner) for them and for invalid UTF-8, and only decodes and
+rewrites files with hits.
 """
 from __future__ import annotations
 import re
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
 from ...domain.interfaces import FixerInterface
 from ...domain.models.issue import Issue
+from ..indexing.byte_scan import INVALID, ByteHit, ByteScanner
+from ..indexing.code_blocks import code_line_envs, find_code_blocks
 from .encoding_patterns import TEXT_PATTERNS, CODE_PATTERNS
 
+_ESCAPE_RE = re.compile(r"\\u([0-9A-Fa-f]{4})|\\U([0-9A-Fa-f]{8})")
+
+
+def _pattern_chars(*pattern_sets: Dict[str, Dict[str, str]]) -> Iterable[str]:
+    """The characters named by \\uXXXX / \\UXXXXXXXX escapes in the patterns."""
+    for patterns in pattern_sets:
+        for pattern_def in patterns.values():
+            for short, long in _ESCAPE_RE.findall(pattern_def["pattern"]):
+                yield chr(int(short or long, 16))
+
 
 class EncodingFixer(FixerInterface):
     """Fixes character encoding issues in LaTeX documents."""
 
+    CODE_ENVIRONMENTS = ("lstlisting", "minted", "verbatim")
+    SCANNER = ByteScanner(_pattern_chars(TEXT_PATTERNS, CODE_PATTERNS))
+
     def fix(self, content: str, issues: List[Issue]) -> str:
         """Apply fixes based on issues (interface compliance)."""
         fixed, _ = self.fix_content(content, "auto")
@@ -23,6 +43,8 @@ class EncodingFixer(FixerInterface):
     def fix_content(self, content: str, context: str = "auto") -> Tuple[str, List[Dict]]:
         """Fix encoding issues in content."""
         changes: List[Dict] = []
+        if content.isascii():
+            return content, changes
         if context == "auto":
             return self._fix_auto_context(content)
         patterns = CODE_PATTERNS if context == "code" else TEXT_PATTERNS
@@ -45,13 +67,10 @@ class EncodingFixer(FixerInterface):
         """Fix with automatic context detection."""
         changes: List[Dict] = []
         lines = content.split("\n")
-        in_code = False
+        code_lines = code_line_envs(find_code_blocks(content, self.CODE_ENVIRONMENTS))
         result_lines = []
-        for line in lines:
-            if re.search(r"\\begin\{(lstlisting|minted|verbatim)", line):
-                in_code = True
-            if re.search(r"\\end\{(lstlisting|minted|verbatim)", line):
-                in_code = False
+        for line_num, line in enumerate(lines, start=1):
+            in_code = line_num in code_lines
             patterns = CODE_PATTERNS if in_code else TEXT_PATTERNS
             fixed_line = line
             for name, pattern_def in patterns.items():
@@ -63,6 +82,29 @@ class EncodingFixer(FixerInterface):
             result_lines.append(fixed_line)
         return "\n".join(result_lines), changes
 
+    def scan_file(self, path: Union[str, Path]) -> List[ByteHit]:
+        """Byte-level hits: pattern characters, emoji, invisible characters, invalid UTF-8."""
+        return self.SCANNER.scan_file(path)
+
+    def fix_file(self, path: Union[str, Path], dry_run: bool = False) -> List[Dict]:
+        """Fix a file in auto context; files without hits are never decoded.
+
+        Files with invalid UTF-8 are left untouched and reported instead.
+        """
+        hits = self.scan_file(path)
+        invalid = [h for h in hits if h.kind == INVALID]
+        if invalid:
+            return [{"pattern": "invalid-utf8", "line": h.line, "column": h.column,
+                     "original": h.label, "fixed": False} for h in invalid]
+        if not hits:
+            return []
+        path = Path(path)
+        content = path.read_text(encoding="utf-8")
+        fixed, changes = self.fix_content(content, "auto")
+        if changes and not dry_run:
+            path.write_text(fixed, encoding="utf-8")
+        return changes
+
     def get_patterns(self) -> Dict[str, Dict[str, str]]:
         """Return all available patterns."""
         return {"text": TEXT_PATTERNS, "code": CODE_PATTERNS}
@@ -18,6 +18,7 @@ TEXT_PATTERNS = {
     "user": {"pattern": r"\U0001F464", "replace": "[User]", "description": "User emoji to text"},
     "robot": {"pattern": r"\U0001F916", "replace": "[Bot]", "description": "Robot emoji to text"},
     "chart": {"pattern": r"\U0001F4CA", "replace": "[Stats]", "description": "Chart emoji to text"},
+    "byte-order-mark": {"pattern": r"\uFEFF", "replace": "", "description": "Remove byte order mark"},
 }
 
 # Code context patterns (for code blocks)
@@ -33,4 +34,6 @@ CODE_PATTERNS = {
     "right-arrow": {"pattern": r"\u2192", "replace": "->", "description": "Right arrow to ASCII"},
     "check-mark": {"pattern": r"[\u2713\u2705]", "replace": "[+]", "description": "Check mark to text"},
     "ballot-x": {"pattern": r"\u2717", "replace": "[-]", "description": "Ballot X to text"},
+    "byte-order-mark": {"pattern": r"\uFEFF", "replace": "", "description": "Remove byte order mark"},
+    "zero-width-space": {"pattern": r"\u200B", "replace": "", "description": "Remove zero-width space"},
 }
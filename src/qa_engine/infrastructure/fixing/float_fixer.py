@@ -13,6 +13,7 @@ from typing import Dict, List, Optional
 
 from ...domain.interfaces import FixerInterface
 from ...domain.models.issue import Issue
+from ..indexing import FloatInventory
 from .float_patterns import (
     FLOAT_PATTERNS,
     OVERFLOW_THRESHOLDS,
@@ -118,6 +119,17 @@ class FloatFixer(FixerInterface):
     def _apply_float_fixes(self, content: str, issue: Issue) -> str:
         """Apply float-specific fixes around issue location."""
         lines = content.split("\n")
+        if 0 < issue.line <= len(lines):
+            # Confine the fixes to the float holding the issue line
+            flt = FloatInventory(content).float_at_line(issue.line)
+            if flt is not None:
+                region = content[flt.start:flt.end]
+                content_type = self._detect_content_type(region)
+                for pattern in self._patterns.values():
+                    if self._should_apply(pattern, content_type, region):
+                        region = re.sub(pattern["find"], pattern["replace"], region)
+                return content[:flt.start] + region + content[flt.end:]
+
         issue_line = issue.line - 1
         context_start = max(0, issue_line - 10)
         context_end = min(len(lines), issue_line + 10)
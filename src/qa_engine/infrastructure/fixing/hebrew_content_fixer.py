@@ -12,6 +12,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Callable
 
+from ..indexing.code_blocks import code_line_envs, find_code_blocks
+from .translation_memory import BatchCallback, BatchTranslator, TranslationMemory
+
 
 @dataclass
 class HebrewContentFix:
@@ -75,77 +78,111 @@ COMMON_TRANSLATIONS = {
 }
 
 
-class HebrewContentFixer:
-    """Translates Hebrew content in code blocks to English."""
+def _one_by_one(translator: Callable[[str], str]) -> BatchCallback:
+    """Adapt a single-phrase translator to the batch interface."""
+    return lambda phrases: {phrase: translator(phrase) for phrase in phrases}
 
-    CODE_ENVS = r"(pythonbox\*?|lstlisting|minted|verbatim|tcolorbox)"
-    HEBREW_PATTERN = r"[א-ת]+"
 
-    def __init__(self, translator: Optional[Callable[[str], str]] = None):
+class HebrewContentFixer:
+    """Translates Hebrew content in code blocks to English.
+
+    Hebrew phrases (runs of Hebrew words on one line) are collected and
+    deduplicated first, then translated together: translation memory,
+    then the COMMON_TRANSLATIONS trie, then one batched request for the
+    rest. fix_project() does this across many files at once.
+    """
+
+    CODE_ENVIRONMENTS = ("pythonbox", "pythonbox*", "lstlisting", "minted", "verbatim", "tcolorbox")
+    HEBREW_PATTERN = r"[א-ת]+(?:[ \t]+[א-ת]+)*"
+
+    def __init__(
+        self,
+        translator: Optional[Callable[[str], str]] = None,
+        batch_translator: Optional[BatchCallback] = None,
+        memory_path: Optional[Path] = None,
+    ):
         """
         Initialize fixer.
 
         Args:
-            translator: Optional function for LLM translation.
-                       If None, uses basic dictionary translation.
+            translator: Optional function for LLM translation of one phrase.
+            batch_translator: Optional function translating a list of
+                       phrases in one request; preferred over translator.
+                       If neither is given, uses dictionary translation only.
+            memory_path: Optional JSON translation memory kept across runs.
         """
-        self._translator = translator or self._basic_translate
+        if batch_translator is None and translator is not None:
+            batch_translator = _one_by_one(translator)
+        self._batch = BatchTranslator(
+            COMMON_TRANSLATIONS, TranslationMemory(memory_path), batch_translator
+        )
         self._hebrew_re = re.compile(self.HEBREW_PATTERN)
 
-    def _basic_translate(self, hebrew_text: str) -> str:
-        """Basic translation using common dictionary."""
-        result = hebrew_text
-        for heb, eng in COMMON_TRANSLATIONS.items():
-            result = result.replace(heb, eng)
-        # If still has Hebrew, mark as untranslated
-        if self._hebrew_re.search(result):
-            return f"[TRANSLATE: {hebrew_text}]"
-        return result
-
     def fix_content(self, content: str, file_path: str = "") -> tuple[str, HebrewContentResult]:
         """Fix Hebrew content in code blocks."""
+        lines = self._code_lines(content)
+        translations = self._batch.translate_all(
+            m.group(0) for line in lines.values() for m in self._hebrew_re.finditer(line)
+        )
+        return self._apply(content, lines, translations, file_path)
+
+    def fix_project(self, files: List[Path], dry_run: bool = False) -> HebrewContentResult:
+        """Fix many files with one batched translation of all their phrases."""
+        result = HebrewContentResult()
+        contents: Dict[Path, str] = {}
+        for path in files:
+            if not path.exists():
+                result.errors.append(f"File not found: {path}")
+                continue
+            contents[path] = path.read_text(encoding="utf-8")
+        code_lines = {path: self._code_lines(text) for path, text in contents.items()}
+        translations = self._batch.translate_all(
+            m.group(0) for lines in code_lines.values()
+            for line in lines.values() for m in self._hebrew_re.finditer(line)
+        )
+        for path, text in contents.items():
+            fixed, file_result = self._apply(text, code_lines[path], translations, str(path))
+            result.fixes_applied += file_result.fixes_applied
+            result.changes.extend(file_result.changes)
+            if not dry_run and file_result.fixes_applied > 0:
+                path.write_text(fixed, encoding="utf-8")
+        return result
+
+    def _code_lines(self, content: str) -> Dict[int, str]:
+        """Code lines holding Hebrew, by 1-based number; LaTeX command lines are skipped."""
+        lines = content.split("\n")
+        code_lines = code_line_envs(find_code_blocks(content, self.CODE_ENVIRONMENTS))
+        return {
+            num: lines[num - 1] for num in code_lines
+            if num <= len(lines) and self._hebrew_re.search(lines[num - 1])
+            # Skip LaTeX commands like \hebtitle{}, \en{}, etc.
+            and not lines[num - 1].strip().startswith("\\")
+        }
+
+    def _apply(
+        self, content: str, code_lines: Dict[int, str], translations: Dict[str, str], file_path: str
+    ) -> tuple[str, HebrewContentResult]:
+        """Replace translated phrases on the collected lines."""
         result = HebrewContentResult()
         lines = content.split("\n")
-        fixed_lines = []
-        in_code = False
-
-        for line_num, line in enumerate(lines, start=1):
-            # Track code environment
-            if re.search(rf"\\begin\{{{self.CODE_ENVS}\}}", line):
-                in_code = True
-            elif re.search(rf"\\end\{{{self.CODE_ENVS}\}}", line):
-                in_code = False
-
-            if in_code and self._hebrew_re.search(line):
-                fixed_line = self._translate_line(line, line_num, file_path, result)
-                fixed_lines.append(fixed_line)
-            else:
-                fixed_lines.append(line)
-
-        return "\n".join(fixed_lines), result
-
-    def _translate_line(self, line: str, line_num: int,
-                        file_path: str, result: HebrewContentResult) -> str:
-        """Translate Hebrew text in a single line."""
-        # Skip LaTeX commands like \hebtitle{}, \en{}, etc.
-        if line.strip().startswith("\\"):
-            return line
-
-        def replace_hebrew(match: re.Match) -> str:
-            hebrew = match.group(0)
-            translated = self._translator(hebrew)
-            if translated != hebrew:
-                result.changes.append(HebrewContentFix(
-                    file=file_path,
-                    line=line_num,
-                    original=hebrew,
-                    translated=translated,
-                ))
-                result.fixes_applied += 1
+
+        for line_num, line in code_lines.items():
+            def replace_hebrew(match: re.Match, line_num: int = line_num) -> str:
+                hebrew = match.group(0)
+                translated = translations.get(hebrew, hebrew)
+                if translated != hebrew:
+                    result.changes.append(HebrewContentFix(
+                        file=file_path,
+                        line=line_num,
+                        original=hebrew,
+                        translated=translated,
+                    ))
+                    result.fixes_applied += 1
                 return translated
-            return hebrew
 
-        return self._hebrew_re.sub(replace_hebrew, line)
+            lines[line_num - 1] = self._hebrew_re.sub(replace_hebrew, line)
+
+        return "\n".join(lines), result
 
     def fix_file(self, file_path: Path, dry_run: bool = False) -> HebrewContentResult:
         """Fix a single file."""
@@ -0,0 +1,158 @@
+"""
+Batched phrase translation with a persistent translation memory.
+
+BatchTranslator translates a set of Hebrew phrases at once:
+1. phrases already in the TranslationMemory are reused;
+2. phrases fully covered by the dictionary are translated with a
+   word-level trie (longest match first);
+3. only the remaining, deduplicated phrases go to the batch callback in
+   one request, and its answers are stored in the memory;
+4. phrases nobody translated keep the dictionary's words, and only the
+   runs of unknown words are marked [TRANSLATE: ...].
+
+The memory is a JSON file keyed by phrase, so a comment repeated across
+hundreds of listings - or across runs - is translated once.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+HEBREW_RE = re.compile(r"[א-ת]")
+UNTRANSLATED = "[TRANSLATE: {}]"
+
+# Receives unseen phrases, returns phrase -> translation (missing = untranslated)
+BatchCallback = Callable[[List[str]], Dict[str, str]]
+
+
+class PhraseTrie:
+    """Word-level trie over dictionary phrases."""
+
+    def __init__(self, dictionary: Dict[str, str]) -> None:
+        self._root: Dict = {}
+        for phrase, translation in dictionary.items():
+            node = self._root
+            for word in phrase.split():
+                node = node.setdefault(word, {})
+            node[None] = translation  # Terminal marker
+
+    def translate(self, phrase: str, mark_unknown: bool = False) -> Tuple[str, bool]:
+        """Translate known words/phrases, longest match first.
+
+        Returns the text and whether every word was translated. With
+        mark_unknown, each run of untranslated Hebrew words is wrapped in
+        an UNTRANSLATED marker.
+        """
+        words, out, i, complete = phrase.split(), [], 0, True
+        unknown: List[str] = []
+
+        def flush() -> None:
+            if unknown:
+                out.append(UNTRANSLATED.format(" ".join(unknown)))
+                unknown.clear()
+
+        while i < len(words):
+            node, match, j = self._root, None, i
+            while j < len(words) and words[j] in node:
+                node = node[words[j]]
+                j += 1
+                if None in node:
+                    match = (node[None], j)
+            if match:
+                flush()
+                out.append(match[0])
+                i = match[1]
+                continue
+            hebrew = bool(HEBREW_RE.search(words[i]))
+            complete = complete and not hebrew
+            if hebrew and mark_unknown:
+                unknown.append(words[i])
+            else:
+                flush()
+                out.append(words[i])
+            i += 1
+        flush()
+        return " ".join(out), complete
+
+
+class TranslationMemory:
+    """Phrase -> translation store backed by a JSON file."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, str] = {}
+        self._dirty = False
+        if self.path and self.path.exists():
+            try:
+                self._entries = dict(json.loads(self.path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, phrase: str) -> Optional[str]:
+        return self._entries.get(phrase)
+
+    def put(self, phrase: str, translation: str) -> None:
+        if self._entries.get(phrase) != translation:
+            self._entries[phrase] = translation
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the memory if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(self._entries, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8"
+        )
+        self._dirty = False
+
+
+class BatchTranslator:
+    """Translates phrases via memory, dictionary trie, then one batched callback."""
+
+    def __init__(
+        self,
+        dictionary: Dict[str, str],
+        memory: Optional[TranslationMemory] = None,
+        batch_callback: Optional[BatchCallback] = None,
+    ) -> None:
+        self._trie = PhraseTrie(dictionary)
+        self.memory = memory if memory is not None else TranslationMemory()
+        self._batch_callback = batch_callback
+        self.requests = 0  # Batched callback calls made
+        self.requested = 0  # Phrases sent to the callback
+
+    def translate_all(self, phrases: Iterable[str]) -> Dict[str, str]:
+        """Translate unique phrases; words nobody translated are marked [TRANSLATE: ...]."""
+        results: Dict[str, str] = {}
+        partial: Dict[str, str] = {}
+        for phrase in dict.fromkeys(phrases):
+            remembered = self.memory.get(phrase)
+            if remembered is not None:
+                results[phrase] = remembered
+                continue
+            text, complete = self._trie.translate(phrase, mark_unknown=True)
+            if complete:
+                results[phrase] = text
+            else:
+                partial[phrase] = text
+
+        if partial and self._batch_callback:
+            unseen = list(partial)
+            self.requests += 1
+            self.requested += len(unseen)
+            for phrase, text in (self._batch_callback(unseen) or {}).items():
+                if phrase in partial and text and not HEBREW_RE.search(text):
+                    self.memory.put(phrase, text)
+                    results[phrase] = text
+                    del partial[phrase]
+            self.memory.save()
+
+        results.update(partial)  # Dictionary words kept, unknown runs marked
+        return results
@@ -6,6 +6,7 @@ Matches qa-img skill.md workflow:
 Phase 1: Detection (ImageDetector)
 Phase 2: Fixing (ImageFixer) + Creation (ImageCreator)
 Phase 3: Validation (ImageValidator)
+Phase 4: Build copy optimization (ImageOptimizer), when a build_dir is given
 """
 from __future__ import annotations
 
@@ -19,6 +20,7 @@ from .detection.caption_length_detector import CaptionLengthDetector
 from .fixing.image_fixer import ImageFixer
 from .fixing.caption_length_fixer import CaptionLengthFixer
 from .creation.image_creator import ImageCreator
+from .creation.image_optimizer import ImageOptimizer, OptimizationResult
 from .validation.image_validator import ImageValidator, ValidationResult
 
 
@@ -56,6 +58,8 @@ class ImageOrchestratorResult:
     detect_result: Optional[ImageDetectResult] = None
     fix_result: Optional[ImageFixResult] = None
     validate_result: Optional[ValidationResult] = None
+    optimize_result: Optional[OptimizationResult] = None
+    build_content: str = ""  # Content with \includegraphics pointing at optimized copies
     skills_executed: Dict[str, str] = field(default_factory=dict)
 
     @property
@@ -86,10 +90,13 @@ class ImageOrchestrator:
         self.caption_fixer = CaptionLengthFixer()
         self.creator = ImageCreator(project_root=self.project_root)
         self.validator = ImageValidator(project_root=self.project_root)
+        # Recompress only re-encodes PNGs, losslessly; JPEGs are touched only when downsampled
+        self.optimizer = ImageOptimizer(project_root=project_root, recompress=True)
 
     def run(self, content: str, file_path: str = "", apply_fixes: bool = True,
-            create_missing: bool = True, validate: bool = True) -> ImageOrchestratorResult:
-        """Run full Image QA pipeline."""
+            create_missing: bool = True, validate: bool = True,
+            build_dir: Optional[Path] = None) -> ImageOrchestratorResult:
+        """Run full Image QA pipeline; with build_dir, also optimize images for its build copy."""
         result = ImageOrchestratorResult()
         result.skills_executed = {}
         # Phase 1: Detection
@@ -114,6 +121,16 @@ class ImageOrchestrator:
             result.skills_executed["qa-img-validate"] = "DONE"
         else:
             result.skills_executed["qa-img-validate"] = "SKIP"
+        # Phase 4: Optimization of the build copy (if a build dir is given)
+        if build_dir is not None:
+            fixed_content = result.fix_result.content if result.fix_result else content
+            source_dir = (Path(self.project_root) / file_path).parent if file_path else None
+            optimized = self.optimizer.optimize(fixed_content, source_dir)
+            result.optimize_result = optimized
+            result.build_content = self.optimizer.rewrite(fixed_content, optimized, build_dir, source_dir)
+            result.skills_executed["qa-img-optimize"] = "DONE" if optimized.optimized else "SKIP"
+        else:
+            result.skills_executed["qa-img-optimize"] = "SKIP"
         return result
 
     def _run_detection(self, content: str, file_path: str) -> ImageDetectResult:
@@ -168,6 +185,7 @@ class ImageOrchestrator:
         detect = result.detect_result or ImageDetectResult()
         fix = result.fix_result
         validate = result.validate_result
+        optimize = result.optimize_result
         return {
             "family": "img", "status": result.status, "verdict": result.verdict,
             "phases": {
@@ -189,6 +207,11 @@ class ImageOrchestrator:
                     "all_rendered": validate.all_rendered if validate else False,
                     "verdict": validate.verdict if validate else "SKIP",
                 },
+                "build_optimization": {
+                    "tool": "ImageOptimizer",
+                    "images_optimized": len(optimize.optimized) if optimize else 0,
+                    "bytes_saved": optimize.bytes_saved if optimize else 0,
+                },
             },
             "skills_executed": [
                 {"skill": k, "status": v} for k, v in result.skills_executed.items()
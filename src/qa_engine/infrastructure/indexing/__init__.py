@@ -0,0 +1,81 @@
+"""Indexing infrastructure - per-document and per-project indexes shared by detectors and fixers."""
+
+from .build_artifacts import BuildArtifactAnalyzer, BuildArtifacts, build_artifact_analyzer
+from .byte_scan import ByteHit, ByteScanner, scan_bytes, scan_file, scan_text
+from .code_blocks import CodeBlock, CodeBlockStore, find_code_blocks
+from .context_index import ContextKind, LatexContextIndex
+from .direction_runs import Direction, DirectionRun, LineSegmentation, segment_line
+from .env_depth import EnvironmentDepthTable
+from .env_tree import EnvironmentTree, EnvNode
+from .float_inventory import Caption, Float, FloatInventory, Graphic, Label
+from .image_metadata import ImageInfo, ImageMetadataCache, image_metadata_cache, read_image_info
+from .pdf_objects import PdfDocument, PdfName, PdfRef, PdfStream
+from .pdf_structure import PdfFont, PdfImage, PdfPage, PdfStructure, pdf_structure_cache, scan_pdf
+from .project_files import FileLookup, ProjectFileIndex, file_lookup, parse_graphicspath, project_file_index
+from .span_set import SpanSet
+from .synctex import SyncBox, SyncTexCache, SyncTexIndex, read_synctex, synctex_cache
+from .table_index import TableIndex
+from .table_parser import ParsedTable, TableCell, TableParser, TableRow
+from .xref_graph import XrefGraph, XrefOccurrence, document_files, extract_xrefs
+
+__all__ = [
+    "BuildArtifactAnalyzer",
+    "BuildArtifacts",
+    "ByteHit",
+    "ByteScanner",
+    "Caption",
+    "CodeBlock",
+    "CodeBlockStore",
+    "ContextKind",
+    "Direction",
+    "DirectionRun",
+    "EnvNode",
+    "EnvironmentDepthTable",
+    "EnvironmentTree",
+    "FileLookup",
+    "Float",
+    "FloatInventory",
+    "Graphic",
+    "ImageInfo",
+    "ImageMetadataCache",
+    "Label",
+    "LatexContextIndex",
+    "LineSegmentation",
+    "ParsedTable",
+    "PdfDocument",
+    "PdfFont",
+    "PdfImage",
+    "PdfName",
+    "PdfPage",
+    "PdfRef",
+    "PdfStream",
+    "PdfStructure",
+    "ProjectFileIndex",
+    "SpanSet",
+    "SyncBox",
+    "SyncTexCache",
+    "SyncTexIndex",
+    "TableCell",
+    "TableIndex",
+    "TableParser",
+    "TableRow",
+    "XrefGraph",
+    "XrefOccurrence",
+    "extract_xrefs",
+    "build_artifact_analyzer",
+    "document_files",
+    "file_lookup",
+    "find_code_blocks",
+    "image_metadata_cache",
+    "parse_graphicspath",
+    "pdf_structure_cache",
+    "project_file_index",
+    "read_image_info",
+    "read_synctex",
+    "scan_bytes",
+    "scan_file",
+    "scan_pdf",
+    "scan_text",
+    "segment_line",
+    "synctex_cache",
+]
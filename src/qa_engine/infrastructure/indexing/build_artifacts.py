@@ -0,0 +1,298 @@
+r"""
+Build artifact analyzer.
+
+Reads the files a LaTeX run leaves next to a root document into one typed
+model: .aux (labels, citations, included chapter .aux files), .toc, .lof
+and .lot (contents entries), .out (hyperref bookmarks), .bbl (rendered
+bibliography), .blg (BibTeX/Biber warnings) and .bcf (Biber cite keys).
+Artifacts that changed are parsed concurrently, and every parse is cached
+by the file's mtime and size, so all post-compile checks share one pass.
+BibDetector and the TOC detectors (via TOCEntryParser.parse_file) use it.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+ARTIFACT_SUFFIXES = (".aux", ".toc", ".lof", ".lot", ".out", ".bbl", ".blg", ".bcf")
+
+_CONTENTSLINE_RE = re.compile(r"\\contentsline\s*")
+_BOOKMARK_RE = re.compile(r"\\BOOKMARK\s*\[(\d+)\]\[[^\]]*\]")
+_AUX_RE = re.compile(
+    r"\\(newlabel|bibcite|citation|@input)\{([^}]*)\}|\\abx@aux@cite(?:\{\d+\})?\{([^}]*)\}"
+)
+_BBL_RE = re.compile(r"\\entry\{([^}]*)\}|\\bibitem\s*(?:\[[^\]]*\])?\s*\{([^}]*)\}")
+_BCF_RE = re.compile(r"<bcf:citekey[^>]*>([^<]+)</bcf:citekey>")
+_BLG_RE = re.compile(r"(WARN|ERROR) - (.*)|^Warning--(.*)|^(I couldn't open .*|I found no .*|Repeated entry.*)", re.M)
+_OCTAL_RE = re.compile(rb"\\([0-7]{3}|.)")
+
+
+@dataclass
+class ContentsEntry:
+    """A .toc/.lof/.lot line or an .out bookmark."""
+
+    kind: str  # chapter, section, figure, table, ... ("bookmark" for .out)
+    number: str
+    title: str
+    page: str
+    anchor: str
+    file: str
+    line: int
+    level: int = 0  # Bookmark nesting level
+    raw: str = ""  # Source line of a .toc/.lof/.lot entry
+
+
+@dataclass
+class LabelInfo:
+    """A \\newlabel of an .aux file."""
+
+    key: str
+    number: str
+    page: str
+    title: str
+    anchor: str
+    file: str
+    line: int
+
+
+@dataclass
+class ArtifactWarning:
+    """A BibTeX or Biber message from the .blg file."""
+
+    severity: str  # warning or error
+    message: str
+    file: str
+    line: int
+
+
+@dataclass
+class BuildArtifacts:
+    """Everything the artifacts of one root document say."""
+
+    root: str
+    files: Dict[str, str] = field(default_factory=dict)  # suffix -> path of the main artifact
+    toc: List[ContentsEntry] = field(default_factory=list)
+    lof: List[ContentsEntry] = field(default_factory=list)
+    lot: List[ContentsEntry] = field(default_factory=list)
+    bookmarks: List[ContentsEntry] = field(default_factory=list)
+    labels: Dict[str, LabelInfo] = field(default_factory=dict)
+    cited: List[str] = field(default_factory=list)  # Unique, in citation order
+    bib_entries: List[str] = field(default_factory=list)  # Rendered (.bbl/\bibcite)
+    warnings: List[ArtifactWarning] = field(default_factory=list)
+
+    @property
+    def missing_citations(self) -> List[str]:
+        """Cited keys the rendered bibliography lacks (empty without one)."""
+        if not self.bib_entries:
+            return []
+        rendered = set(self.bib_entries)
+        return [key for key in self.cited if key not in rendered]
+
+
+@dataclass
+class _Parsed:
+    """What one artifact file contributes."""
+
+    entries: List[ContentsEntry] = field(default_factory=list)
+    labels: List[LabelInfo] = field(default_factory=list)
+    cited: List[str] = field(default_factory=list)
+    bib_entries: List[str] = field(default_factory=list)
+    warnings: List[ArtifactWarning] = field(default_factory=list)
+    includes: List[str] = field(default_factory=list)
+
+
+def parse_artifact(content: str, path: str) -> _Parsed:
+    """Parse one artifact according to its suffix."""
+    suffix = os.path.splitext(path)[1].lower()
+    parsed = _Parsed()
+    if suffix in (".toc", ".lof", ".lot"):
+        for match in _CONTENTSLINE_RE.finditer(content):
+            args, _ = _groups(content, match.end(), 4)
+            if len(args) >= 3:
+                number, title = _split_number(args[1])
+                start, end = content.rfind("\n", 0, match.start()) + 1, content.find("\n", match.end())
+                parsed.entries.append(ContentsEntry(
+                    args[0], number, title, args[2], args[3] if len(args) > 3 else "",
+                    path, _line(content, match.start()), raw=content[start:end if end >= 0 else len(content)],
+                ))
+    elif suffix == ".out":
+        for match in _BOOKMARK_RE.finditer(content):
+            args, _ = _groups(content, match.end(), 3)
+            if len(args) >= 2:
+                parsed.entries.append(ContentsEntry(
+                    "bookmark", "", _pdf_string(args[1]), "", args[0], path,
+                    _line(content, match.start()), int(match.group(1)),
+                ))
+    elif suffix == ".aux":
+        for match in _AUX_RE.finditer(content):
+            command, value = match.group(1), match.group(2)
+            if command == "newlabel":
+                fields, _ = _groups(content, match.end(), 1)
+                parts = _groups(fields[0], 0, 5)[0] if fields else []
+                parts += [""] * (4 - len(parts))
+                parsed.labels.append(LabelInfo(
+                    value, _plain_number(parts[0]), parts[1], parts[2], parts[3], path, _line(content, match.start()),
+                ))
+            elif command == "bibcite":
+                parsed.bib_entries.append(value)
+            elif command == "@input":
+                parsed.includes.append(value)
+            else:
+                parsed.cited.extend(k.strip() for k in (value if command else match.group(3)).split(","))
+    elif suffix == ".bbl":
+        parsed.bib_entries = [m.group(1) or m.group(2) for m in _BBL_RE.finditer(content)]
+    elif suffix == ".bcf":
+        parsed.cited = [m.group(1).strip() for m in _BCF_RE.finditer(content)]
+    elif suffix == ".blg":
+        for match in _BLG_RE.finditer(content):
+            error = match.group(1) == "ERROR" or match.group(4) is not None
+            message = match.group(2) or match.group(3) or match.group(4)
+            parsed.warnings.append(ArtifactWarning(
+                "error" if error else "warning", message.strip(), path, _line(content, match.start()),
+            ))
+    return parsed
+
+
+class BuildArtifactAnalyzer:
+    """Parses the build artifacts of root documents, cached by mtime."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._max_workers = max_workers
+        self._cache: Dict[str, Tuple[Tuple[int, int], _Parsed]] = {}
+        self._lock = threading.Lock()
+
+    def analyze(self, root: Union[str, Path], build_dir: Optional[Union[str, Path]] = None) -> BuildArtifacts:
+        """Artifacts of a root document (main.tex or its stem); build_dir defaults to its folder."""
+        root = Path(root)
+        base = Path(build_dir) if build_dir else root.parent
+        stem = root.stem if root.suffix.lower() in (".tex", *ARTIFACT_SUFFIXES) else root.name
+        result = BuildArtifacts(root=str(root))
+        wave = [str(base / (stem + suffix)) for suffix in ARTIFACT_SUFFIXES]
+        seen = set(wave)
+        parsed_files: List[Tuple[str, _Parsed]] = []
+        while wave:
+            parsed = self._parse_all(wave)
+            parsed_files += parsed
+            # Chapter .aux files named by \@input, read in the next wave
+            wave = list(dict.fromkeys(
+                str(base / name) for _, p in parsed for name in p.includes if str(base / name) not in seen
+            ))
+            seen.update(wave)
+        for path, parsed in parsed_files:
+            self._merge(result, path, parsed)
+        return result
+
+    def _parse_all(self, paths: List[str]) -> List[Tuple[str, _Parsed]]:
+        """Parse existing paths, changed ones concurrently; keeps order."""
+        stamps = {}
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            stale = [p for p in stamps if self._cache.get(p, (None,))[0] != stamps[p]]
+        if len(stale) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                fresh = list(executor.map(_parse_path, stale))
+        else:
+            fresh = [_parse_path(p) for p in stale]
+        with self._lock:
+            for path, parsed in zip(stale, fresh):
+                self._cache[path] = (stamps[path], parsed)
+            return [(p, self._cache[p][1]) for p in stamps]
+
+    @staticmethod
+    def _merge(result: BuildArtifacts, path: str, parsed: _Parsed) -> None:
+        suffix = os.path.splitext(path)[1].lower()
+        result.files.setdefault(suffix, path)
+        target = {".toc": result.toc, ".lof": result.lof, ".lot": result.lot, ".out": result.bookmarks}
+        target.get(suffix, []).extend(parsed.entries)
+        for label in parsed.labels:
+            result.labels.setdefault(label.key, label)
+        seen = set(result.cited)
+        for key in parsed.cited:
+            if key and key not in seen:
+                seen.add(key)
+                result.cited.append(key)
+        rendered = set(result.bib_entries)
+        result.bib_entries.extend(k for k in dict.fromkeys(parsed.bib_entries) if k not in rendered)
+        result.warnings.extend(parsed.warnings)
+
+
+_SHARED = BuildArtifactAnalyzer()
+
+
+def build_artifact_analyzer() -> BuildArtifactAnalyzer:
+    """Return the process-wide analyzer, so all consumers share its cache."""
+    return _SHARED
+
+
+def _parse_path(path: str) -> _Parsed:
+    with open(path, encoding="utf-8", errors="replace") as handle:
+        return parse_artifact(handle.read(), path)
+
+
+def _line(content: str, pos: int) -> int:
+    return content.count("\n", 0, pos) + 1
+
+
+def _groups(text: str, pos: int, limit: int) -> Tuple[List[str], int]:
+    """Up to limit brace-balanced {...} arguments starting at pos."""
+    args: List[str] = []
+    while len(args) < limit:
+        while pos < len(text) and text[pos] in " \t":
+            pos += 1
+        if pos >= len(text) or text[pos] != "{":
+            break
+        depth, start = 0, pos
+        while pos < len(text):
+            char = text[pos]
+            if char == "\\":
+                pos += 2
+                continue
+            depth += 1 if char == "{" else -1 if char == "}" else 0
+            pos += 1
+            if depth == 0:
+                break
+        args.append(text[start + 1:pos - 1])
+    return args, pos
+
+
+def _split_number(title: str) -> Tuple[str, str]:
+    r"""Split '\numberline {1.2}Title' into ('1.2', 'Title')."""
+    match = re.search(r"\\numberline\s*", title)
+    if not match:
+        return "", _clean(title)
+    number, end = _groups(title, match.end(), 1)
+    return _plain_number(number[0]) if number else "", _clean(title[:match.start()] + title[end:])
+
+
+def _plain_number(number: str) -> str:
+    r"""Drop macros and braces from a number: '\textenglish {1}' -> '1'."""
+    return re.sub(r"\\[A-Za-z@]+\s*|[{}]", "", number).strip()
+
+
+def _clean(title: str) -> str:
+    title = re.sub(r"\\ignorespaces\s*", "", title).strip()
+    while title.startswith("{") and _groups(title, 0, 1)[1] == len(title):
+        title = title[1:-1].strip()
+    return title
+
+
+def _pdf_string(value: str) -> str:
+    r"""Decode a hyperref PDF string: \376\377-prefixed octal UTF-16, or plain text."""
+    if not value.startswith("\\376\\377"):
+        return re.sub(r"\\(.)", r"\1", value)
+    raw = _OCTAL_RE.sub(
+        lambda m: bytes([int(m.group(1), 8)]) if len(m.group(1)) == 3 else m.group(1),
+        value.encode("latin-1", errors="replace"),
+    )
+    return raw[2:].decode("utf-16-be", errors="replace")
@@ -0,0 +1,150 @@
+"""
+Byte-level scanner for encoding issues.
+
+Finds, in raw UTF-8 bytes, the characters that break typesetting or hide
+in source: 4-byte sequences (emoji and other non-BMP characters), byte
+order marks, zero-width and bidi-control characters, and invalid UTF-8.
+Each class is recognised by its lead byte and continuation pattern, so
+one bytes regex pass plus a chunked C-level UTF-8 validation confirm a
+clean file without building a str. Files are read through mmap; hits are
+mapped to line and column only when something is found.
+"""
+
+from __future__ import annotations
+
+import codecs
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Union
+
+BytesLike = Union[bytes, bytearray, mmap.mmap]
+
+NON_BMP = "non_bmp"
+INVALID = "invalid_utf8"
+BOM = "bom"
+ZERO_WIDTH = "zero_width"
+BIDI_CONTROL = "bidi_control"
+CHAR = "char"  # One of the scanner's extra characters
+
+_CLASSES = (
+    (BOM, rb"\xef\xbb\xbf"),  # U+FEFF; a BOM at offset 0, a zero-width no-break space elsewhere
+    (ZERO_WIDTH, rb"\xe2\x80[\x8b-\x8d]|\xe2\x81\xa0"),  # U+200B-200D, U+2060
+    (BIDI_CONTROL, rb"\xe2\x80[\x8e\x8f\xaa-\xae]|\xe2\x81[\xa6-\xa9]|\xd8\x9c"),  # LRM/RLM, embeddings, isolates, ALM
+    (NON_BMP, rb"\xf0[\x90-\xbf][\x80-\xbf]{2}|[\xf1-\xf3][\x80-\xbf]{3}|\xf4[\x80-\x8f][\x80-\xbf]{2}"),
+)
+_UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+_CHUNK = 1 << 20
+
+
+@dataclass
+class ByteHit:
+    """One suspicious byte sequence."""
+
+    kind: str
+    offset: int  # Byte offset
+    raw: bytes
+    line: int = 0  # 1-based
+    column: int = 0  # 1-based, in characters
+
+    @property
+    def char(self) -> str:
+        return self.raw.decode("utf-8", errors="replace")
+
+    @property
+    def label(self) -> str:
+        """U+XXXX for a valid character, the bytes in hex otherwise."""
+        char = self.char
+        if self.kind == INVALID or len(char) != 1:
+            return "0x" + self.raw.hex().upper()
+        return "U+%04X" % ord(char)
+
+
+class ByteScanner:
+    """Scans UTF-8 bytes for the byte classes, plus optional extra characters."""
+
+    def __init__(self, chars: Iterable[str] = ()) -> None:
+        alternatives = [f"(?P<{kind}>{pattern.decode('latin-1')})" for kind, pattern in _CLASSES]
+        extra = sorted({c.encode("utf-8") for c in chars if not c.isascii()}, key=len, reverse=True)
+        if extra:
+            alternatives.append(f"(?P<{CHAR}>" + "|".join(re.escape(e.decode("latin-1")) for e in extra) + ")")
+        self._pattern = re.compile("|".join(alternatives).encode("latin-1"))
+
+    def scan(self, data: BytesLike) -> List[ByteHit]:
+        """All hits in a buffer, in offset order, with line and column."""
+        hits = [ByteHit(m.lastgroup, m.start(), m.group(0)) for m in self._pattern.finditer(data)]
+        hits.extend(_invalid_sequences(data))
+        if data[:2] in _UTF16_BOMS:
+            hits.append(ByteHit(BOM, 0, bytes(data[:2])))
+        if not hits:
+            return hits
+        for hit in hits:
+            if hit.kind == BOM and hit.offset:
+                hit.kind = ZERO_WIDTH
+        hits.sort(key=lambda h: h.offset)
+        _locate(data, hits)
+        return hits
+
+    def scan_file(self, path: Union[str, Path]) -> List[ByteHit]:
+        """Scan a file through mmap; empty files are clean."""
+        with open(path, "rb") as handle:
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                return []
+            with mapped:
+                return self.scan(mapped)
+
+    def scan_text(self, text: str) -> List[ByteHit]:
+        """Scan decoded text; offsets refer to its UTF-8 encoding."""
+        return self.scan(text.encode("utf-8", errors="surrogatepass"))
+
+
+_DEFAULT = ByteScanner()
+
+
+def scan_bytes(data: BytesLike) -> List[ByteHit]:
+    """Hits of the byte classes in a buffer."""
+    return _DEFAULT.scan(data)
+
+
+def scan_file(path: Union[str, Path]) -> List[ByteHit]:
+    """Hits of the byte classes in a file."""
+    return _DEFAULT.scan_file(path)
+
+
+def scan_text(text: str) -> List[ByteHit]:
+    """Hits of the byte classes in decoded text."""
+    return _DEFAULT.scan_text(text)
+
+
+def _invalid_sequences(data: BytesLike) -> List[ByteHit]:
+    """Invalid UTF-8, validated by the C decoder in newline-aligned chunks."""
+    hits: List[ByteHit] = []
+    size, pos = len(data), 0
+    with memoryview(data) as view:
+        while pos < size:
+            end = data.find(b"\n", min(pos + _CHUNK, size))
+            end = size if end < 0 else end + 1  # A newline always ends a character
+            try:
+                codecs.utf_8_decode(view[pos:end], "strict", True)
+                pos = end
+            except UnicodeDecodeError as exc:
+                hits.append(ByteHit(INVALID, pos + exc.start, bytes(view[pos + exc.start:pos + exc.end])))
+                pos += exc.end
+    return hits
+
+
+def _locate(data: BytesLike, hits: List[ByteHit]) -> None:
+    """Fill line and column of sorted hits, counting newlines once."""
+    line, line_start, pos = 1, 0, 0
+    for hit in hits:
+        span = bytes(data[pos:hit.offset])
+        newlines = span.count(b"\n")
+        if newlines:
+            line += newlines
+            line_start = pos + span.rindex(b"\n") + 1
+        pos = hit.offset
+        hit.line = line
+        hit.column = len(bytes(data[line_start:hit.offset]).decode("utf-8", errors="replace")) + 1
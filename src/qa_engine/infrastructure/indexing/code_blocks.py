@@ -0,0 +1,212 @@
+r"""
+Code block extraction and project-wide store.
+
+find_code_blocks() lists every code environment of a document in one
+scan. Verbatim-like environments (lstlisting, minted, verbatim,
+pythonbox, tcblisting) end at the first literal \end{...}, exactly as
+LaTeX reads them, so % and \begin inside code are never mistaken for
+LaTeX; other environments count nesting. Each block records its spans,
+1-based lines, language, a content hash and its lead - the text from the
+line before \begin up to the body, where listing annotations live.
+
+CodeBlockStore keeps the blocks of every file of a project, re-extracting
+a file only when its mtime or size changes, and reports which blocks are
+new since they were last reported (optionally persisted across runs) so
+code-aware checks can skip unchanged listings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .project_files import project_file_index
+
+CODE_ENVIRONMENTS = (
+    "lstlisting", "minted", "verbatim", "pythonbox", "pythonbox*", "tcolorbox", "tcblisting",
+)
+VERBATIM_ENVIRONMENTS = frozenset({
+    "lstlisting", "minted", "verbatim", "verbatim*", "pythonbox", "pythonbox*", "tcblisting",
+})
+# Environments whose contents are always Python
+PYTHON_ENVIRONMENTS = frozenset({"pythonbox", "pythonbox*"})
+
+_LANGUAGE_RE = re.compile(r"language\s*=\s*\{?\s*(?:\[[^\]]*\])?\s*([\w+#-]+)", re.IGNORECASE)
+
+
+@dataclass
+class CodeBlock:
+    """One code environment with its source spans."""
+
+    env: str
+    start: int
+    end: int
+    body_start: int
+    body_end: int
+    line: int
+    end_line: int
+    header: str  # Rest of the \begin line: [options], {args}
+    language: str
+    content: str
+    digest: str
+    file: str = ""
+    closed: bool = True
+    lead: str = ""  # Line before \begin through the \begin line
+
+    @property
+    def body_line(self) -> int:
+        """1-based line of the first body line."""
+        return self.line + 1
+
+
+def find_code_blocks(
+    content: str, environments: Iterable[str] = CODE_ENVIRONMENTS, file_path: str = ""
+) -> List[CodeBlock]:
+    """Return the code blocks of a document in order, skipping commented ones."""
+    names = sorted(set(environments), key=len, reverse=True)
+    if not names:
+        return []
+    begin_re = re.compile(r"(?<!\\)%[^\n]*|\\begin\{(" + "|".join(map(re.escape, names)) + r")\}")
+    line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+    blocks: List[CodeBlock] = []
+    pos = 0
+    while True:
+        match = begin_re.search(content, pos)
+        if match is None:
+            return blocks
+        env = match.group(1)
+        if env is None:
+            pos = match.end()
+            continue
+        end_tok, closed = _find_end(content, env, match.end())
+        block = _make_block(content, env, match.start(), match.end(), end_tok, closed, line_starts)
+        block.file = file_path
+        blocks.append(block)
+        pos = block.end
+
+
+def _find_end(content: str, env: str, pos: int) -> Tuple[int, bool]:
+    """Offset of the closing \\end{env}; len(content) if never closed."""
+    end_tok = "\\end{%s}" % env
+    if env in VERBATIM_ENVIRONMENTS:
+        found = content.find(end_tok, pos)
+        return (found, True) if found >= 0 else (len(content), False)
+    begin_tok, depth = "\\begin{%s}" % env, 1
+    while True:
+        found = content.find(end_tok, pos)
+        if found < 0:
+            return len(content), False
+        depth += content.count(begin_tok, pos, found) - 1
+        if depth == 0:
+            return found, True
+        pos = found + len(end_tok)
+
+
+def _make_block(
+    content: str, env: str, start: int, after_begin: int, end_tok: int, closed: bool,
+    line_starts: List[int],
+) -> CodeBlock:
+    """Build a block: the body runs from the line after \\begin to the \\end line."""
+    eol = content.find("\n", after_begin, end_tok)
+    header = content[after_begin:end_tok if eol < 0 else eol]
+    body_start = end_tok if eol < 0 else eol + 1
+    body_end = content.rfind("\n", body_start, end_tok) + 1 or body_start
+    if content[body_end:end_tok].strip():
+        body_end = end_tok  # Code and \end share a line
+    body = content[body_start:body_end]
+    language = _language(env, header)
+    digest = hashlib.sha256(f"{env}\0{language}\0{body}".encode("utf-8")).hexdigest()[:16]
+    end = end_tok + len("\\end{%s}" % env) if closed else end_tok
+    lead_start = content.rfind("\n", 0, max(content.rfind("\n", 0, start), 0)) + 1
+    return CodeBlock(
+        env, start, end, body_start, body_end,
+        bisect_right(line_starts, start), bisect_right(line_starts, max(end_tok, start)),
+        header, language, body, digest, closed=closed, lead=content[lead_start:body_start],
+    )
+
+
+def _language(env: str, header: str) -> str:
+    """Language from the environment or its options."""
+    if env in PYTHON_ENVIRONMENTS:
+        return "python"
+    if env == "minted":
+        match = re.search(r"\{([^}]*)\}", header)
+        return match.group(1).strip().lower() if match else ""
+    match = _LANGUAGE_RE.search(header)
+    return match.group(1).lower() if match else ""
+
+
+class CodeBlockStore:
+    """Code blocks of all project files, refreshed per file on change."""
+
+    def __init__(
+        self,
+        environments: Iterable[str] = CODE_ENVIRONMENTS,
+        state_path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        self._environments = tuple(environments)
+        self._state_path = Path(state_path) if state_path else None
+        self._files: Dict[str, Tuple[Tuple[int, int], List[CodeBlock]]] = {}
+        self._previous: Dict[str, Set[str]] = {}
+        if self._state_path and self._state_path.exists():
+            try:
+                state = json.loads(self._state_path.read_text(encoding="utf-8"))
+                self._previous = {path: set(digests) for path, digests in state.items()}
+            except (OSError, ValueError):
+                self._previous = {}
+
+    def blocks(self, path: Union[str, Path]) -> List[CodeBlock]:
+        """Blocks of one file, re-extracted only if the file changed."""
+        full = os.path.abspath(path)
+        try:
+            st = os.stat(full)
+        except OSError:
+            self._files.pop(full, None)
+            return []
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._files.get(full)
+        if cached is None or cached[0] != stamp:
+            with open(full, encoding="utf-8", errors="ignore") as handle:
+                found = find_code_blocks(handle.read(), self._environments, full)
+            self._files[full] = cached = (stamp, found)
+        return cached[1]
+
+    def scan_project(self, root: Union[str, Path], suffixes: Tuple[str, ...] = (".tex",)) -> int:
+        """Extract the blocks of every project file; returns the block count."""
+        return sum(len(self.blocks(path)) for path in project_file_index(root).files(*suffixes))
+
+    def all_blocks(self) -> Iterator[CodeBlock]:
+        """All blocks of the scanned files."""
+        for _, blocks in self._files.values():
+            yield from blocks
+
+    def changed(self, path: Union[str, Path]) -> List[CodeBlock]:
+        """Blocks of a file not reported by the previous changed() call (or run)."""
+        full = os.path.abspath(path)
+        blocks = self.blocks(full)
+        previous = self._previous.get(full, set())
+        self._previous[full] = {block.digest for block in blocks}
+        return [block for block in blocks if block.digest not in previous]
+
+    def save(self) -> None:
+        """Persist the reported digests so the next run's changed() skips them."""
+        if self._state_path is None:
+            return
+        state = {path: sorted(digests) for path, digests in self._previous.items()}
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._state_path.write_text(json.dumps(state, indent=1), encoding="utf-8")
+
+
+def code_line_envs(blocks: Iterable[CodeBlock]) -> Dict[int, str]:
+    """Map each 1-based line from a block's \\begin up to (not including) its \\end to its env."""
+    lines: Dict[int, str] = {}
+    for block in blocks:
+        for line in range(block.line, block.end_line if block.closed else block.end_line + 1):
+            lines[line] = block.env
+    return lines
@@ -0,0 +1,187 @@
+r"""
+LaTeX context span index.
+
+Builds a per-document interval index of the LaTeX contexts that BiDi, math
+and code checks care about (inline math, \cite{}, color specs, TikZ
+statements and environments, code listings, and \cmd{...} wrappers such as
+\en{} and \hebrew{}) in a single lexer pass. Detectors and fixers query it
+by character offset instead of re-scanning the line for every match.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from enum import Enum
+from typing import Dict, Iterable, List, Set
+
+from .span_set import SpanSet
+
+# Environments whose lines are treated as TikZ drawing code
+TIKZ_ENVIRONMENTS = ("tikzpicture", "pgfpicture", "axis", "semilogyaxis", "loglogaxis")
+
+# Environments holding verbatim code listings
+CODE_ENVIRONMENTS = ("lstlisting", "minted", "verbatim", "pythonbox", "pythonbox*", "tcblisting")
+
+# TikZ statements that run until the next ';' on the line
+TIKZ_BRACKET_COMMANDS = ("draw", "fill", "node", "path")
+TIKZ_PREFIX_COMMANDS = ("coordinate", "tikzset", "foreach", "addplot")
+
+COLOR_COMMANDS = ("textcolor", "color", "definecolor", "colorlet")
+
+_TOKEN_RE = re.compile(
+    r"(?P<opt>colbacktitle|colback|colframe|coltitle|coltext)\s*="
+    r"|\\(?P<cmd>[A-Za-z]+)"
+    r"|(?<!\\)(?P<display>\\[\[\]])"
+    r"|(?<!\\)(?P<dollar>\$)"
+)
+_DOLLAR_PAIR_RE = re.compile(r"\$[^$]+\$")
+_ENV_RE = re.compile(r"\\(begin|end)\{([A-Za-z]+\*?)\}")
+
+
+class ContextKind(Enum):
+    """LaTeX contexts tracked by the index."""
+
+    MATH = "math"
+    CITE = "cite"
+    COLOR = "color"
+    TIKZ = "tikz"
+    TIKZ_ENV = "tikz_env"
+    CODE = "code"
+    DOLLAR_PAIR = "dollar_pair"  # raw $...$ pairs, escaped \$ not honoured
+
+
+def _brace_end(line: str, start: int) -> int:
+    """Return index just after the brace closing a group opened before start."""
+    depth, i = 1, start
+    while i < len(line) and depth > 0:
+        if line[i] == "{":
+            depth += 1
+        elif line[i] == "}":
+            depth -= 1
+        i += 1
+    return i
+
+
+class LatexContextIndex:
+    """Interval index of LaTeX contexts over one document."""
+
+    def __init__(self, content: str) -> None:
+        self._content = content
+        self._lines = content.split("\n")
+        self._line_starts: List[int] = [0]
+        for line in self._lines[:-1]:
+            self._line_starts.append(self._line_starts[-1] + len(line) + 1)
+        self._spans: Dict[ContextKind, SpanSet] = {k: SpanSet() for k in ContextKind}
+        self._wrappers: Dict[str, SpanSet] = {}
+        self._build()
+
+    def offset(self, line_num: int, col: int = 0) -> int:
+        """Convert a 1-based line number and column to a document offset."""
+        return self._line_starts[line_num - 1] + col
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number containing offset."""
+        return bisect_right(self._line_starts, offset)
+
+    def contains(self, kind: ContextKind, offset: int) -> bool:
+        """Return True if offset lies inside a context of the given kind."""
+        return self._spans[kind].contains(offset)
+
+    def kinds_at(self, offset: int) -> Set[ContextKind]:
+        """Return every context kind containing offset."""
+        return {kind for kind, spans in self._spans.items() if spans.contains(offset)}
+
+    def in_wrapper(self, offset: int, commands: Iterable[str]) -> bool:
+        r"""Return True if offset lies after the backslash of \cmd{...} for any command."""
+        return any(
+            name in self._wrappers and self._wrappers[name].contains(offset)
+            for name in commands
+        )
+
+    def line_in(self, kind: ContextKind, line_num: int) -> bool:
+        """Return True if the start of a line lies inside a context."""
+        return self.contains(kind, self.offset(line_num))
+
+    def lines_in(self, kind: ContextKind) -> Set[int]:
+        """Return 1-based line numbers whose start lies inside a context."""
+        return {n for n in range(1, len(self._line_starts) + 1) if self.line_in(kind, n)}
+
+    def spans(self, kind: ContextKind) -> List[tuple]:
+        """Return merged (start, end) spans for a context kind."""
+        return self._spans[kind].spans()
+
+    def _build(self) -> None:
+        """Single lexer pass over all lines."""
+        tikz_depth = 0
+        code_env, code_start = "", 0
+        for line, base in zip(self._lines, self._line_starts):
+            self._lex_line(line, base)
+            for match in _ENV_RE.finditer(line):
+                kind, env = match.groups()
+                if env in TIKZ_ENVIRONMENTS:
+                    tikz_depth += 1 if kind == "begin" else -1
+                if env in CODE_ENVIRONMENTS:
+                    if kind == "begin" and not code_env:
+                        code_env, code_start = env, base + match.start()
+                    elif kind == "end" and env == code_env:
+                        self._add(ContextKind.CODE, code_start, base + match.end())
+                        code_env = ""
+            tikz_depth = max(0, tikz_depth)
+            if tikz_depth > 0:
+                self._add(ContextKind.TIKZ_ENV, base, base + len(line) + 1)
+        if code_env:
+            self._add(ContextKind.CODE, code_start, len(self._content))
+        for spans in list(self._spans.values()) + list(self._wrappers.values()):
+            spans.freeze()
+
+    def _add(self, kind: ContextKind, start: int, end: int) -> None:
+        """Record an absolute span for a context kind."""
+        self._spans[kind].add(start, end)
+
+    def _lex_line(self, line: str, base: int) -> None:
+        """Record context spans found on a single line."""
+        math_open = display_open = -1
+        for match in _TOKEN_RE.finditer(line):
+            start, end = match.start(), match.end()
+            if match.group("dollar"):
+                if math_open < 0:
+                    math_open = start
+                else:
+                    self._add(ContextKind.MATH, base + math_open, base + start)
+                    math_open = -1
+            elif match.group("display"):
+                if line[start + 1] == "[" and display_open < 0:
+                    display_open = end
+                elif line[start + 1] == "]" and display_open >= 0:
+                    self._add(ContextKind.MATH, base + display_open, base + end)
+                    display_open = -1
+            elif match.group("opt"):
+                stops = [i for i in (line.find(c, end) for c in ",]}") if i != -1]
+                self._add(ContextKind.COLOR, base + end, base + min(stops, default=len(line)))
+            else:
+                self._lex_command(line, base, match.group("cmd"), start, end)
+        for match in _DOLLAR_PAIR_RE.finditer(line):
+            self._add(ContextKind.DOLLAR_PAIR, base + match.start() + 1, base + match.end())
+        if math_open >= 0:
+            self._add(ContextKind.MATH, base + math_open, base + len(line))
+        if display_open >= 0:
+            self._add(ContextKind.MATH, base + display_open, base + len(line) + 1)
+
+    def _lex_command(self, line: str, base: int, name: str, start: int, end: int) -> None:
+        """Record spans opened by a \\command token."""
+        follow = line[end:end + 1]
+        if name == "cite" and follow in ("{", "["):
+            self._add(ContextKind.CITE, base + end + 1, base + _brace_end(line, end + 1))
+        if (name in TIKZ_BRACKET_COMMANDS and follow == "[") or name.startswith(TIKZ_PREFIX_COMMANDS):
+            semi = line.find(";", start)
+            stop = semi + 1 if semi != -1 else len(line) + 1
+            self._add(ContextKind.TIKZ, base + start + 1, base + stop)
+        if follow != "{":
+            return
+        if name in COLOR_COMMANDS:
+            self._add(ContextKind.COLOR, base + start + 1, base + _brace_end(line, end + 1))
+        close = line.find("}", end + 1)
+        if close != -1:
+            spans = self._wrappers.setdefault(name, SpanSet())
+            spans.add(base + start + 1, base + close + 1)
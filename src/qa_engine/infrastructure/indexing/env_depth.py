@@ -0,0 +1,57 @@
+r"""
+Cumulative environment-depth table.
+
+Records the \begin/\end nesting depth of selected environments at every
+line start in one pass, so "is a wrapper environment active here" is a
+table lookup plus the few begin/end tokens on the queried line, instead of
+counting over the whole document prefix for every match.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+
+class EnvironmentDepthTable:
+    """Depth of selected LaTeX environments at any (line, column)."""
+
+    def __init__(self, content: str, environments: Iterable[str]) -> None:
+        self._envs = tuple(sorted(set(environments)))
+        self._line_depth: Dict[str, List[int]] = {env: [0] for env in self._envs}
+        self._events: Dict[int, List[Tuple[int, str, int]]] = {}
+        if self._envs:
+            self._build(content)
+
+    def depth(self, env: str, line_num: int, col: int) -> int:
+        """Return open-minus-close count of env before (line_num, col).
+
+        A token counts once it ends at or before col. Depth is not clamped,
+        so stray \\end tokens can make it negative.
+        """
+        depth = self._line_depth[env][line_num - 1]
+        for end, name, delta in self._events.get(line_num, ()):
+            if name == env and end <= col:
+                depth += delta
+        return depth
+
+    def is_active(self, env: str, line_num: int, col: int) -> bool:
+        """Return True if env has more opens than closes before (line_num, col)."""
+        return env in self._line_depth and self.depth(env, line_num, col) > 0
+
+    def _build(self, content: str) -> None:
+        """Accumulate per-line depth for every tracked environment."""
+        names = "|".join(re.escape(env) for env in self._envs)
+        pattern = re.compile(r"\\(begin|end)\{(" + names + r")\}")
+        current = {env: 0 for env in self._envs}
+        for line_num, line in enumerate(content.split("\n"), start=1):
+            events = [
+                (m.end(), m.group(2), 1 if m.group(1) == "begin" else -1)
+                for m in pattern.finditer(line)
+            ]
+            if events:
+                self._events[line_num] = events
+                for _, env, delta in events:
+                    current[env] += delta
+            for env in self._envs:
+                self._line_depth[env].append(current[env])
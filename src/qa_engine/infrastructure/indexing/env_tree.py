@@ -0,0 +1,123 @@
+r"""
+LaTeX environment tree.
+
+Pairs every \begin{...}/\end{...} in a document in one pass and records
+nesting and character offsets, so "is this offset inside a hebrewtable /
+english / table environment" becomes an ancestor lookup instead of a
+backwards line scan per query. Tokens after an unescaped % are comments
+and ignored. An \end without a matching open \begin is skipped; one that
+closes an outer environment also closes everything opened inside it;
+environments still open at the end run to the end of the document.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+_TOKEN_RE = re.compile(r"(?<!\\)%[^\n]*|\\(begin|end)\{([^}]+)\}")
+
+
+@dataclass(eq=False)
+class EnvNode:
+    """One environment occurrence with its source offsets."""
+
+    name: str
+    start: int
+    body_start: int
+    body_end: int = -1
+    end: int = -1
+    parent: Optional[EnvNode] = None
+    children: List[EnvNode] = field(default_factory=list, repr=False)
+    closed: bool = False
+
+    @property
+    def depth(self) -> int:
+        """Number of enclosing environments."""
+        depth, node = 0, self.parent
+        while node is not None:
+            depth, node = depth + 1, node.parent
+        return depth
+
+    @property
+    def body(self) -> slice:
+        """Slice of the content between \\begin{} and \\end{}."""
+        return slice(self.body_start, self.body_end)
+
+    def contains(self, offset: int) -> bool:
+        """Return True if offset lies within the environment tokens."""
+        return self.start <= offset < self.end
+
+
+class EnvironmentTree:
+    """Begin/end pairs of all environments in a document."""
+
+    def __init__(self, content: str) -> None:
+        self._length = len(content)
+        self.roots: List[EnvNode] = []
+        self._all: List[EnvNode] = []
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+        self._build(content)
+        self._starts = {id(None): [node.start for node in self.roots]}
+        for node in self._all:
+            self._starts[id(node)] = [child.start for child in node.children]
+
+    def nodes(self, *names: str) -> List[EnvNode]:
+        """Return environments in document order, optionally filtered by name."""
+        if not names:
+            return list(self._all)
+        return [node for node in self._all if node.name in names]
+
+    def innermost(self, offset: int) -> Optional[EnvNode]:
+        """Return the deepest environment containing offset."""
+        found, level = None, self.roots
+        while level:
+            i = bisect_right(self._starts[id(found)], offset) - 1
+            if i < 0 or not level[i].contains(offset):
+                break
+            found = level[i]
+            level = found.children
+        return found
+
+    def ancestors(self, offset: int) -> List[EnvNode]:
+        """Return environments containing offset, innermost first."""
+        chain, node = [], self.innermost(offset)
+        while node is not None:
+            chain.append(node)
+            node = node.parent
+        return chain
+
+    def is_inside(self, offset: int, *names: str) -> bool:
+        """Return True if any enclosing environment has one of the names."""
+        return any(node.name in names for node in self.ancestors(offset))
+
+    def offset(self, line_num: int, col: int = 0) -> int:
+        """Convert a 1-based line number and column to a character offset."""
+        return self._line_starts[line_num - 1] + col
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number of a character offset."""
+        return bisect_right(self._line_starts, offset)
+
+    def _build(self, content: str) -> None:
+        """Pair begin/end tokens with a stack."""
+        stack: List[EnvNode] = []
+        for match in _TOKEN_RE.finditer(content):
+            kind, name = match.group(1), match.group(2)
+            if kind == "begin":
+                parent = stack[-1] if stack else None
+                node = EnvNode(name, match.start(), match.end(), parent=parent)
+                (parent.children if parent else self.roots).append(node)
+                self._all.append(node)
+                stack.append(node)
+            elif kind == "end" and any(node.name == name for node in stack):
+                while stack:
+                    node = stack.pop()
+                    node.body_end, node.end = match.start(), match.end()
+                    node.closed = node.name == name
+                    if node.closed:
+                        break
+        for node in stack:
+            node.body_end = node.end = self._length
@@ -0,0 +1,208 @@
+r"""
+Float and caption inventory.
+
+Lists every figure/table float of a document in one pass over the
+EnvironmentTree plus one token scan for \caption, \label and
+\includegraphics. Each float records its spans, placement option,
+captions (with optional short title), labels and graphics targets;
+arguments are read brace-balanced, so captions holding \en{...} or math
+are captured whole. Commented-out commands are ignored.
+
+Caption, float and image checks query the inventory instead of running
+their own whole-document DOTALL scans, and fixers get exact spans to
+splice.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .env_tree import EnvironmentTree, EnvNode
+
+FLOAT_ENVIRONMENTS = (
+    "figure", "figure*", "table", "table*", "hebrewtable",
+    "wrapfigure", "wraptable", "sidewaysfigure", "sidewaystable", "subfigure",
+)
+
+_TOKEN_RE = re.compile(r"(?<!\\)%[^\n]*|\\(caption|label|includegraphics)(?![A-Za-z*])")
+
+
+@dataclass
+class Caption:
+    """One \\caption with its source spans."""
+
+    text: str
+    short: Optional[str]
+    start: int
+    end: int
+    text_start: int
+    line: int
+    parent_env: str = ""
+
+    @property
+    def source(self) -> slice:
+        """Slice of the whole \\caption[...]{...} command."""
+        return slice(self.start, self.end)
+
+
+@dataclass
+class Label:
+    """One \\label with its span."""
+
+    name: str
+    start: int
+    end: int
+    line: int
+
+
+@dataclass
+class Graphic:
+    r"""One \includegraphics with its target and options."""
+
+    path: str
+    options: str
+    start: int
+    end: int
+    line: int
+
+
+@dataclass
+class Float:
+    """One float environment and what it holds."""
+
+    env: str
+    start: int
+    end: int
+    body_start: int
+    body_end: int
+    line: int
+    end_line: int
+    placement: str = ""
+    closed: bool = True
+    captions: List[Caption] = field(default_factory=list)
+    labels: List[Label] = field(default_factory=list)
+    graphics: List[Graphic] = field(default_factory=list)
+
+    @property
+    def caption(self) -> Optional[Caption]:
+        """First caption, if any."""
+        return self.captions[0] if self.captions else None
+
+    @property
+    def label(self) -> str:
+        """First label name, or an empty string."""
+        return self.labels[0].name if self.labels else ""
+
+
+class FloatInventory:
+    """All floats, captions, labels and graphics of one document."""
+
+    def __init__(self, content: str, environments: Tuple[str, ...] = FLOAT_ENVIRONMENTS) -> None:
+        self.tree = EnvironmentTree(content)
+        self._floats: List[Float] = []
+        self._by_node: Dict[int, Float] = {}
+        for node in self.tree.nodes(*environments):
+            flt = self._make_float(content, node)
+            self._floats.append(flt)
+            self._by_node[id(node)] = flt
+        self.captions: List[Caption] = []
+        self.labels: List[Label] = []
+        self.graphics: List[Graphic] = []
+        self._scan(content)
+
+    def floats(self, *environments: str) -> List[Float]:
+        """Return floats in document order, optionally filtered by environment."""
+        if not environments:
+            return list(self._floats)
+        return [flt for flt in self._floats if flt.env in environments]
+
+    def float_at(self, offset: int, *environments: str) -> Optional[Float]:
+        """Return the innermost float (of the given environments) containing offset."""
+        for node in self.tree.ancestors(offset):
+            flt = self._by_node.get(id(node))
+            if flt is not None and (not environments or flt.env in environments):
+                return flt
+        return None
+
+    def float_at_line(self, line: int, *environments: str) -> Optional[Float]:
+        """Return the innermost float containing the start of a 1-based line."""
+        return self.float_at(self.tree.offset(line), *environments)
+
+    def _make_float(self, content: str, node: EnvNode) -> Float:
+        """Create a float with its placement option."""
+        placement, body_start = "", node.body_start
+        if content.startswith("[", body_start) and "]" in content[body_start:node.body_end]:
+            close = content.index("]", body_start)
+            placement, body_start = content[body_start + 1:close], close + 1
+        return Float(
+            node.name, node.start, node.end, body_start, node.body_end,
+            self.tree.line_of(node.start), self.tree.line_of(max(node.end - 1, node.start)),
+            placement, node.closed,
+        )
+
+    def _scan(self, content: str) -> None:
+        """Collect captions, labels and graphics and attach them to floats."""
+        for match in _TOKEN_RE.finditer(content):
+            cmd = match.group(1)
+            if cmd is None:
+                continue
+            pos, short = match.end(), None
+            if cmd != "label":
+                opt = _read_optional(content, pos)
+                if opt is not None:
+                    short, pos = opt
+            group = _read_group(content, pos)
+            if group is None:
+                continue
+            arg, arg_start, end = group
+            start, line = match.start(), self.tree.line_of(match.start())
+            owner = self.float_at(start)
+            if cmd == "caption":
+                parent = self.tree.innermost(start)
+                caption = Caption(arg, short, start, end, arg_start, line, parent.name if parent else "")
+                self.captions.append(caption)
+                if owner is not None:
+                    owner.captions.append(caption)
+            elif cmd == "label":
+                label = Label(arg, start, end, line)
+                self.labels.append(label)
+                if owner is not None:
+                    owner.labels.append(label)
+            else:
+                graphic = Graphic(arg.strip(), short or "", start, end, line)
+                self.graphics.append(graphic)
+                if owner is not None:
+                    owner.graphics.append(graphic)
+
+
+def _read_optional(content: str, pos: int) -> Optional[Tuple[str, int]]:
+    """Read a bracket-balanced [...] argument at pos."""
+    if not content.startswith("[", pos):
+        return None
+    depth = 0
+    for end in range(pos, len(content)):
+        depth += {"[": 1, "]": -1}.get(content[end], 0)
+        if depth == 0:
+            return content[pos + 1:end], end + 1
+    return None
+
+
+def _read_group(content: str, pos: int) -> Optional[Tuple[str, int, int]]:
+    """Read a brace-balanced {...} argument at pos, skipping spaces."""
+    while pos < len(content) and content[pos] in " \t":
+        pos += 1
+    if not content.startswith("{", pos):
+        return None
+    depth, end = 0, pos
+    while end < len(content):
+        char = content[end]
+        if char == "\\":
+            end += 2
+            continue
+        depth += {"{": 1, "}": -1}.get(char, 0)
+        if depth == 0:
+            return content[pos + 1:end], pos + 1, end + 1
+        end += 1
+    return None
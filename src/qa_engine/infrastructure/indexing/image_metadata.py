@@ -0,0 +1,231 @@
+"""
+Header-only image metadata.
+
+Reads pixel dimensions, resolution and page boxes from the first bytes of
+PNG, JPEG, PDF and SVG files - no pixel decoding, no PIL, no LaTeX run.
+The format is taken from the file's magic bytes, not its extension.
+
+ImageMetadataCache keeps results per path, keyed by mtime and size, and
+reads stale entries in parallel, so checking every image of a project
+costs a stat per file once the cache is warm.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple
+
+from .project_files import ProjectFileIndex
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".pdf", ".svg")
+
+PT_PER_INCH = 72.27  # TeX points
+BP_PER_INCH = 72.0  # PostScript points, used by PDF
+DEFAULT_DPI = 72.0  # pdfTeX's assumption for rasters without resolution
+SVG_PX_PER_INCH = 96.0
+
+PDF_HEAD_BYTES = 64 * 1024
+SVG_HEAD_BYTES = 8 * 1024
+
+_PDF_BOX_RE = re.compile(rb"/(CropBox|MediaBox)\s*\[\s*([-\d.\s]+?)\s*\]")
+_SVG_TAG_RE = re.compile(r"<svg\b[^>]*>", re.IGNORECASE)
+_SVG_ATTR_RE = re.compile(r"""\b(width|height|viewBox)\s*=\s*["']([^"']*)["']""")
+_SVG_LENGTH_RE = re.compile(r"^\s*([\d.]+)\s*(px|pt|pc|mm|cm|in)?\s*$")
+_SVG_UNITS_PER_INCH = {"px": 96.0, "pt": 72.0, "pc": 6.0, "mm": 25.4, "cm": 2.54, "in": 1.0}
+
+# JPEG start-of-frame markers carrying the image size (not DHT/JPG/DAC)
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """Header metadata of one image file."""
+
+    path: str
+    format: str
+    file_size: int
+    width_px: int = 0
+    height_px: int = 0
+    dpi: Tuple[float, float] = (0.0, 0.0)  # 0 when the file records none
+    box_bp: Optional[Tuple[float, float]] = None  # Vector page size in bp
+
+    @property
+    def is_raster(self) -> bool:
+        return self.format in ("png", "jpeg")
+
+    @property
+    def natural_size_pt(self) -> Optional[Tuple[float, float]]:
+        """Size at scale 1 as \\includegraphics places it, in TeX points."""
+        if self.box_bp is not None:
+            return tuple(v * PT_PER_INCH / BP_PER_INCH for v in self.box_bp)
+        if not self.width_px or not self.height_px:
+            return None
+        dpi_x, dpi_y = (d or DEFAULT_DPI for d in self.dpi)
+        return self.width_px / dpi_x * PT_PER_INCH, self.height_px / dpi_y * PT_PER_INCH
+
+
+def read_image_info(path: str) -> Optional[ImageInfo]:
+    """Read an image's header; None if unreadable or not a known format."""
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as handle:
+            magic = handle.read(8)
+            handle.seek(0)
+            if magic.startswith(b"\x89PNG\r\n\x1a\n"):
+                fields = _read_png(handle)
+            elif magic.startswith(b"\xff\xd8"):
+                fields = _read_jpeg(handle)
+            elif magic.startswith(b"%PDF"):
+                fields = _read_pdf(handle, size)
+            elif b"<" in magic:
+                fields = _read_svg(handle)
+            else:
+                return None
+    except (OSError, struct.error, ValueError):
+        return None
+    return ImageInfo(path, file_size=size, **fields) if fields else None
+
+
+def _read_png(handle: BinaryIO) -> Optional[Dict]:
+    """IHDR size and pHYs resolution; stops at the first IDAT chunk."""
+    handle.seek(8)
+    fields: Dict = {"format": "png"}
+    while True:
+        header = handle.read(8)
+        if len(header) < 8:
+            break
+        length, kind = struct.unpack(">I4s", header)
+        if kind == b"IHDR":
+            fields["width_px"], fields["height_px"] = struct.unpack(">II", handle.read(8))
+            length -= 8
+        elif kind == b"pHYs":
+            ppu_x, ppu_y, unit = struct.unpack(">IIB", handle.read(9))
+            if unit == 1:  # Pixels per metre
+                fields["dpi"] = (ppu_x * 0.0254, ppu_y * 0.0254)
+            length -= 9
+        elif kind in (b"IDAT", b"IEND"):
+            break
+        handle.seek(length + 4, os.SEEK_CUR)  # Data rest plus CRC
+    return fields if "width_px" in fields else None
+
+
+def _read_jpeg(handle: BinaryIO) -> Optional[Dict]:
+    """SOFn size and JFIF density; stops at the start of scan."""
+    handle.seek(2)
+    fields: Dict = {"format": "jpeg"}
+    while True:
+        byte = handle.read(1)
+        if not byte:
+            break
+        if byte != b"\xff":
+            continue
+        marker = handle.read(1)
+        while marker == b"\xff":  # Fill bytes
+            marker = handle.read(1)
+        if not marker or marker[0] == 0xDA:
+            break
+        if marker[0] in (0x01, 0x00) or 0xD0 <= marker[0] <= 0xD7:
+            continue  # Standalone markers
+        length = struct.unpack(">H", handle.read(2))[0]
+        segment = handle.read(length - 2)
+        if marker[0] in _JPEG_SOF:
+            fields["height_px"], fields["width_px"] = struct.unpack(">HH", segment[1:5])
+            break
+        if marker[0] == 0xE0 and segment.startswith(b"JFIF\x00") and len(segment) >= 12:
+            unit, dens_x, dens_y = struct.unpack(">BHH", segment[7:12])
+            scale = {1: 1.0, 2: 2.54}.get(unit)
+            if scale and dens_x and dens_y:
+                fields["dpi"] = (dens_x * scale, dens_y * scale)
+    return fields if "width_px" in fields else None
+
+
+def _read_pdf(handle: BinaryIO, size: int) -> Optional[Dict]:
+    """First page box from the head of the file, else from its tail."""
+    chunks = [handle.read(PDF_HEAD_BYTES)]
+    if size > PDF_HEAD_BYTES:
+        handle.seek(max(PDF_HEAD_BYTES, size - PDF_HEAD_BYTES))
+        chunks.append(handle.read())
+    for chunk in chunks:
+        boxes = {kind: values for kind, values in _PDF_BOX_RE.findall(chunk)}
+        values = boxes.get(b"CropBox") or boxes.get(b"MediaBox")  # pdfTeX default
+        if values:
+            x0, y0, x1, y1 = (float(v) for v in values.split()[:4])
+            return {"format": "pdf", "box_bp": (abs(x1 - x0), abs(y1 - y0))}
+    return {"format": "pdf"}
+
+
+def _read_svg(handle: BinaryIO) -> Optional[Dict]:
+    """Size from the root element's width/height, else its viewBox."""
+    head = handle.read(SVG_HEAD_BYTES).decode("utf-8", errors="ignore")
+    tag = _SVG_TAG_RE.search(head)
+    if not tag:
+        return None
+    attrs = dict(_SVG_ATTR_RE.findall(tag.group(0)))
+    width, height = _svg_length(attrs.get("width", "")), _svg_length(attrs.get("height", ""))
+    view = attrs.get("viewBox", "").replace(",", " ").split()
+    if (width is None or height is None) and len(view) == 4:
+        width, height = (float(v) / SVG_PX_PER_INCH * BP_PER_INCH for v in view[2:])
+    if width is None or height is None:
+        return {"format": "svg"}
+    return {"format": "svg", "box_bp": (width, height)}
+
+
+def _svg_length(value: str) -> Optional[float]:
+    """An SVG length in bp; unitless values are CSS pixels."""
+    match = _SVG_LENGTH_RE.match(value)
+    if not match:
+        return None
+    return float(match.group(1)) / _SVG_UNITS_PER_INCH[match.group(2) or "px"] * BP_PER_INCH
+
+
+class ImageMetadataCache:
+    """Image headers cached by path, revalidated by mtime and size."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._max_workers = max_workers
+        self._entries: Dict[str, Tuple[Tuple[int, int], Optional[ImageInfo]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[ImageInfo]:
+        """Return metadata for one file, reading its header if stale."""
+        return self.scan([path]).get(os.path.abspath(path))
+
+    def scan(self, paths: Iterable[str]) -> Dict[str, ImageInfo]:
+        """Return metadata for readable images, reading stale headers in parallel."""
+        stamps: Dict[str, Tuple[int, int]] = {}
+        for path in paths:
+            full = os.path.abspath(path)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            stamps[full] = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            stale = [p for p, stamp in stamps.items() if self._entries.get(p, (None,))[0] != stamp]
+        if len(stale) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                infos = list(executor.map(read_image_info, stale))
+        else:
+            infos = [read_image_info(p) for p in stale]
+        with self._lock:
+            for path, info in zip(stale, infos):
+                self._entries[path] = (stamps[path], info)
+            found = {p: self._entries[p][1] for p in stamps if p in self._entries}
+        return {p: info for p, info in found.items() if info is not None}
+
+    def scan_index(self, index: ProjectFileIndex) -> Dict[str, ImageInfo]:
+        """Return metadata for every image in a project file index."""
+        return self.scan(index.files(*IMAGE_EXTENSIONS))
+
+
+_SHARED = ImageMetadataCache()
+
+
+def image_metadata_cache() -> ImageMetadataCache:
+    """Return the process-wide metadata cache."""
+    return _SHARED
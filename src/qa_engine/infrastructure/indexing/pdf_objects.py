@@ -0,0 +1,282 @@
+"""
+Minimal PDF object reader.
+
+Collects the indirect objects of a PDF: those in the file body and those
+packed into object streams (/Type /ObjStm, which pdfTeX and LuaTeX use
+by default). Object headers are found by scanning the body from object
+to object, so files whose cross-reference section is a compressed
+stream, or damaged, read the same as clean ones; a later definition of
+an object replaces an earlier one, as with incremental updates.
+
+PDF syntax becomes Python values: dicts, lists, PdfName (a str), strings
+as bytes, int/float, bool, None and PdfRef. Streams are PdfStream, whose
+data is decoded when FlateDecode is the only filter.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+_OBJ_RE = re.compile(rb"(?<![0-9])(\d+)\s+(\d+)\s+obj\b")
+_TRAILER_RE = re.compile(rb"trailer\s*<<")
+_WHITESPACE = b" \t\r\n\f\x00"
+_DELIMITERS = b"()<>[]{}/%"
+_ESCAPES = {ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b", ord("f"): b"\f"}
+
+
+class PdfName(str):
+    """A /Name, without its slash."""
+
+
+class PdfRef(NamedTuple):
+    """An indirect reference 'num gen R'."""
+
+    num: int
+    gen: int
+
+
+@dataclass
+class PdfStream:
+    """A stream object: its dictionary and raw bytes."""
+
+    dict: Dict[str, Any]
+    raw: bytes
+
+    @property
+    def data(self) -> bytes:
+        """Decoded data (FlateDecode); raw bytes for other filters."""
+        filters = self.dict.get("Filter")
+        if isinstance(filters, list) and len(filters) == 1:
+            filters = filters[0]
+        if filters != "FlateDecode":
+            return self.raw if filters is None else b""
+        try:
+            return zlib.decompressobj().decompress(self.raw)
+        except zlib.error:
+            return b""
+
+
+class PdfParser:
+    """Parses PDF values from a byte buffer."""
+
+    def __init__(self, data: bytes, pos: int = 0) -> None:
+        self.data = data
+        self.pos = pos
+
+    def skip(self) -> None:
+        """Skip whitespace and comments."""
+        data, size = self.data, len(self.data)
+        while self.pos < size:
+            char = data[self.pos]
+            if char in _WHITESPACE:
+                self.pos += 1
+            elif char == 0x25:  # %
+                end = data.find(b"\n", self.pos)
+                self.pos = size if end < 0 else end + 1
+            else:
+                return
+
+    def token(self) -> bytes:
+        """The next regular-character run (number or keyword)."""
+        self.skip()
+        start = self.pos
+        while self.pos < len(self.data) and self.data[self.pos] not in _WHITESPACE + _DELIMITERS:
+            self.pos += 1
+        return self.data[start:self.pos]
+
+    def value(self) -> Any:
+        self.skip()
+        data, pos = self.data, self.pos
+        if pos >= len(data):
+            raise ValueError("unexpected end of data")
+        head = data[pos:pos + 2]
+        if head == b"<<":
+            self.pos += 2
+            result: Dict[str, Any] = {}
+            while True:
+                self.skip()
+                if data[self.pos:self.pos + 2] == b">>":
+                    self.pos += 2
+                    return result
+                key = self.value()
+                if not isinstance(key, PdfName):
+                    raise ValueError("dictionary key is not a name")
+                result[key] = self.value()
+        char = data[pos]
+        if char == 0x5B:  # [
+            self.pos += 1
+            items: List[Any] = []
+            while True:
+                self.skip()
+                if data[self.pos:self.pos + 1] == b"]":
+                    self.pos += 1
+                    return items
+                items.append(self.value())
+        if char == 0x2F:  # /
+            self.pos += 1
+            raw = self.token()
+            return PdfName(re.sub(rb"#([0-9A-Fa-f]{2})", lambda m: bytes([int(m.group(1), 16)]), raw)
+                           .decode("latin-1"))
+        if char == 0x28:  # (
+            return self._literal()
+        if char == 0x3C:  # <
+            end = data.index(b">", pos)
+            self.pos = end + 1
+            digits = re.sub(rb"[^0-9A-Fa-f]", b"", data[pos + 1:end])
+            return bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode("ascii"))
+        word = self.token()
+        if not word:
+            raise ValueError(f"unexpected byte {data[pos:pos + 1]!r} at {pos}")
+        if word in (b"true", b"false"):
+            return word == b"true"
+        if word == b"null":
+            return None
+        number = float(word) if b"." in word else int(word)
+        if isinstance(number, int):
+            # 'num gen R' is a reference
+            mark = self.pos
+            gen = self.token()
+            if gen.isdigit() and self.token() == b"R":
+                return PdfRef(number, int(gen))
+            self.pos = mark
+        return number
+
+    def _literal(self) -> bytes:
+        data, out, depth = self.data, bytearray(), 0
+        self.pos += 1
+        while self.pos < len(data):
+            char = data[self.pos]
+            self.pos += 1
+            if char == 0x5C:  # backslash
+                escaped = data[self.pos]
+                octal = re.match(rb"[0-7]{1,3}", data[self.pos:self.pos + 3])
+                if octal:
+                    out.append(int(octal.group(0), 8) & 0xFF)
+                    self.pos += len(octal.group(0))
+                    continue
+                self.pos += 1
+                if escaped not in b"\r\n":
+                    out += _ESCAPES.get(escaped, bytes([escaped]))
+                continue
+            if char == 0x28:
+                depth += 1
+            elif char == 0x29:
+                if depth == 0:
+                    return bytes(out)
+                depth -= 1
+            out.append(char)
+        return bytes(out)
+
+
+class PdfDocument:
+    """The objects and trailer of a PDF file."""
+
+    def __init__(self, data: bytes) -> None:
+        self.objects: Dict[int, Any] = {}
+        self.trailer: Dict[str, Any] = {}
+        packed: List[PdfStream] = []
+        pos = 0
+        while True:
+            match = _OBJ_RE.search(data, pos)
+            if match is None:
+                break
+            try:
+                value, pos = self._read_object(data, match.end())
+            except (ValueError, IndexError):
+                pos = match.end()
+                continue
+            self.objects[int(match.group(1))] = value
+            if isinstance(value, PdfStream):
+                kind = value.dict.get("Type")
+                if kind == "ObjStm":
+                    packed.append(value)
+                elif kind == "XRef":
+                    self.trailer.update(value.dict)
+        for match in _TRAILER_RE.finditer(data):
+            try:
+                self.trailer.update(PdfParser(data, match.end() - 2).value())
+            except (ValueError, IndexError):
+                continue
+        for stream in packed:
+            for num, value in _unpack(stream):
+                self.objects.setdefault(num, value)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "PdfDocument":
+        return cls(Path(path).read_bytes())
+
+    def resolve(self, value: Any) -> Any:
+        """Follow references to the value they name (None if undefined)."""
+        for _ in range(32):
+            if not isinstance(value, PdfRef):
+                return value
+            value = self.objects.get(value.num)
+        return None
+
+    def get(self, container: Any, key: str, default: Any = None) -> Any:
+        """Resolved container[key] of a dict or a stream's dict."""
+        if isinstance(container, PdfStream):
+            container = container.dict
+        if not isinstance(container, dict):
+            return default
+        value = self.resolve(container.get(key))
+        return default if value is None else value
+
+    @property
+    def catalog(self) -> Dict[str, Any]:
+        root = self.resolve(self.trailer.get("Root"))
+        if isinstance(root, dict):
+            return root
+        return next((o for o in self.objects.values() if isinstance(o, dict) and o.get("Type") == "Catalog"), {})
+
+    @staticmethod
+    def _read_object(data: bytes, pos: int) -> Tuple[Any, int]:
+        parser = PdfParser(data, pos)
+        value = parser.value()
+        parser.skip()
+        if not (isinstance(value, dict) and data.startswith(b"stream", parser.pos)):
+            return value, parser.pos
+        start = parser.pos + 6
+        start += 2 if data.startswith(b"\r\n", start) else 1 if data[start:start + 1] in (b"\n", b"\r") else 0
+        length = value.get("Length")
+        if isinstance(length, int) and data.startswith(b"endstream", _skip_eol(data, start + length)):
+            end = start + length
+        else:
+            end = data.index(b"endstream", start)
+            while end > start and data[end - 1:end] in (b"\n", b"\r"):
+                end -= 1
+        return PdfStream(value, data[start:end]), data.index(b"endstream", end) + 9
+
+
+def _skip_eol(data: bytes, pos: int) -> int:
+    while data[pos:pos + 1] in (b"\r", b"\n", b" "):
+        pos += 1
+    return pos
+
+
+def _unpack(stream: PdfStream) -> List[Tuple[int, Any]]:
+    """Objects of an object stream."""
+    data, first, count = stream.data, stream.dict.get("First"), stream.dict.get("N")
+    if not isinstance(first, int) or not isinstance(count, int):
+        return []
+    header = PdfParser(data[:first])
+    pairs = [(int(header.token() or 0), int(header.token() or 0)) for _ in range(count)]
+    found: List[Tuple[int, Any]] = []
+    for num, offset in pairs:
+        try:
+            found.append((num, PdfParser(data, first + offset).value()))
+        except (ValueError, IndexError):
+            continue
+    return found
+
+
+def open_pdf(path: Union[str, Path]) -> Optional[PdfDocument]:
+    """Read a PDF, or None if it cannot be read."""
+    try:
+        return PdfDocument.open(path)
+    except OSError:
+        return None
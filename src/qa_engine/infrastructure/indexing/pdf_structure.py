@@ -0,0 +1,214 @@
+"""
+PDF page structure.
+
+Walks the page tree of a PDF (pdf_objects) and reports, per page, what
+its content streams actually draw: image XObjects with their pixel size
+and byte length, form XObjects of included PDF files (pdfTeX and LuaTeX
+name them in /PTEX.FileName), and the fonts selected with Tf. Forms are
+followed into their own resources. Signs of missing glyphs - fonts that
+are not embedded, and font names used without a resource - are listed
+as glyph issues. Scans are cached by the PDF's mtime and size.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .pdf_objects import PdfDocument, PdfRef, PdfStream, open_pdf
+
+_DRAW_RE = re.compile(rb"/([^\s/\[\]()<>{}%]+)\s+(?:Do\b|[-+\d.]+\s+Tf\b)")
+_FONT_FILES = ("FontFile", "FontFile2", "FontFile3")
+
+
+@dataclass
+class PdfImage:
+    """An image XObject drawn on a page."""
+
+    name: str
+    width: int
+    height: int
+    bits: int
+    color_space: str
+    filter: str
+    length: int  # Bytes of the stored stream
+    included_file: str = ""  # Set when drawn inside an included PDF
+    object: int = 0  # Object number; 0 for an image that is not an indirect object
+
+
+@dataclass
+class PdfFont:
+    """A font selected on a page."""
+
+    name: str  # Resource name, e.g. F12
+    base_font: str
+    subtype: str
+    embedded: bool
+
+
+@dataclass
+class PdfPage:
+    """What one page draws."""
+
+    number: int
+    width: float
+    height: float
+    images: List[PdfImage] = field(default_factory=list)
+    included_files: List[str] = field(default_factory=list)
+    fonts: List[PdfFont] = field(default_factory=list)
+    glyph_issues: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PdfStructure:
+    """Pages of one PDF."""
+
+    path: str
+    pages: List[PdfPage] = field(default_factory=list)
+
+    @property
+    def included_files(self) -> List[str]:
+        return [name for page in self.pages for name in page.included_files]
+
+    @property
+    def images(self) -> List[PdfImage]:
+        return [image for page in self.pages for image in page.images]
+
+    @property
+    def fonts(self) -> Dict[str, PdfFont]:
+        """Fonts of all pages by base font name."""
+        return {font.base_font: font for page in self.pages for font in page.fonts}
+
+
+def scan_pdf(path: Union[str, Path]) -> Optional[PdfStructure]:
+    """Page structure of a PDF, or None if it cannot be read."""
+    document = open_pdf(path)
+    if document is None:
+        return None
+    structure = PdfStructure(path=str(path))
+    for number, (page, resources, box) in enumerate(_pages(document), start=1):
+        box = box if isinstance(box, list) and len(box) == 4 else [0, 0, 0, 0]
+        entry = PdfPage(number, float(box[2]) - float(box[0]), float(box[3]) - float(box[1]))
+        _walk(document, document.get(page, "Contents"), resources, entry, "", set())
+        structure.pages.append(entry)
+    return structure
+
+
+def _pages(document: PdfDocument) -> List[Tuple[Dict[str, Any], Any, Any]]:
+    """Page dicts in order, with their (inherited) resources and media box."""
+    found: List[Tuple[Dict[str, Any], Any, Any]] = []
+    stack: List[Tuple[Any, Any, Any]] = [(document.get(document.catalog, "Pages"), None, None)]
+    seen: Set[int] = set()
+    while stack:
+        node, resources, box = stack.pop()
+        if not isinstance(node, dict) or id(node) in seen:
+            continue
+        seen.add(id(node))
+        resources = document.get(node, "Resources", resources)
+        box = document.get(node, "MediaBox", box)
+        if node.get("Type") == "Page" or "Kids" not in node:
+            found.append((node, resources, box))
+            continue
+        kids = document.get(node, "Kids", [])
+        stack.extend((document.resolve(kid), resources, box) for kid in reversed(kids))
+    return found
+
+
+def _walk(document: PdfDocument, contents: Any, resources: Any, page: PdfPage,
+          included: str, active: Set[int]) -> None:
+    """Record what a content stream draws; forms are walked recursively."""
+    streams = contents if isinstance(contents, list) else [contents]
+    data = b"\n".join(s.data for s in map(document.resolve, streams) if isinstance(s, PdfStream))
+    xobjects = document.get(resources, "XObject", {})
+    fonts = document.get(resources, "Font", {})
+    for match in _DRAW_RE.finditer(data):
+        name = match.group(1).decode("latin-1")
+        if match.group(0).endswith(b"Tf"):
+            _add_font(document, name, fonts, page)
+            continue
+        ref = xobjects.get(name) if isinstance(xobjects, dict) else None
+        target = document.resolve(ref)
+        if not isinstance(target, PdfStream) or (isinstance(ref, PdfRef) and ref.num in active):
+            continue
+        subtype = target.dict.get("Subtype")
+        if subtype == "Image":
+            number = ref.num if isinstance(ref, PdfRef) else 0
+            page.images.append(_image(document, name, target, included, number))
+        elif subtype == "Form":
+            source = document.get(target, "PTEX.FileName", b"")
+            inner_file = source.decode("utf-8", errors="replace") if isinstance(source, bytes) else ""
+            if inner_file:
+                page.included_files.append(inner_file)
+            inner = active | ({ref.num} if isinstance(ref, PdfRef) else set())
+            _walk(document, target, document.get(target, "Resources", resources), page,
+                  inner_file or included, inner)
+
+
+def _image(document: PdfDocument, name: str, stream: PdfStream, included: str, number: int) -> PdfImage:
+    color = document.get(stream, "ColorSpace", "")
+    filters = document.get(stream, "Filter", "")
+    return PdfImage(
+        name, int(document.get(stream, "Width", 0)), int(document.get(stream, "Height", 0)),
+        int(document.get(stream, "BitsPerComponent", 0)),
+        str(color[0] if isinstance(color, list) and color else color),
+        "+".join(filters) if isinstance(filters, list) else str(filters),
+        len(stream.raw), included, number,
+    )
+
+
+def _add_font(document: PdfDocument, name: str, fonts: Any, page: PdfPage) -> None:
+    font = document.resolve(fonts.get(name)) if isinstance(fonts, dict) else None
+    if not isinstance(font, dict):
+        issue = f"font /{name} is used but not defined"
+        if issue not in page.glyph_issues:
+            page.glyph_issues.append(issue)
+        return
+    base = str(document.get(font, "BaseFont", name))
+    if any(f.name == name and f.base_font == base for f in page.fonts):
+        return
+    subtype = str(font.get("Subtype", ""))
+    descriptor_owner = font
+    if subtype == "Type0":
+        descendants = document.get(font, "DescendantFonts", [])
+        descriptor_owner = document.resolve(descendants[0]) if descendants else {}
+    descriptor = document.get(descriptor_owner, "FontDescriptor", {})
+    embedded = subtype == "Type3" or any(key in descriptor for key in _FONT_FILES)
+    page.fonts.append(PdfFont(name, base, subtype, embedded))
+    if not embedded:
+        page.glyph_issues.append(f"font {base} is not embedded")
+
+
+class PdfStructureCache:
+    """PDF scans, redone only when the file changes."""
+
+    def __init__(self) -> None:
+        self._scans: Dict[str, Tuple[Tuple[int, int], Optional[PdfStructure]]] = {}
+        self._lock = threading.Lock()
+
+    def scan(self, path: Union[str, Path]) -> Optional[PdfStructure]:
+        full = os.path.abspath(path)
+        try:
+            st = os.stat(full)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._scans.get(full)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+        structure = scan_pdf(full)
+        with self._lock:
+            self._scans[full] = (stamp, structure)
+        return structure
+
+
+_SHARED = PdfStructureCache()
+
+
+def pdf_structure_cache() -> PdfStructureCache:
+    """Return the process-wide cache, so all consumers share scans."""
+    return _SHARED
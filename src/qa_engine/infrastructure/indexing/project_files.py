@@ -0,0 +1,269 @@
+r"""
+Project file index.
+
+Walks the project tree once with os.scandir and keeps, per directory, its
+mtime and file names. Existence checks for \includegraphics targets become
+dictionary lookups instead of one stat per candidate path, which matters on
+network-mounted projects. refresh() stats only the directories and rescans
+those whose mtime changed. Symlinked directories are followed, except where
+they lead back into a directory of their own path. Paths outside the
+project root fall back to os.path.exists.
+
+The index needs an explicit project root; file_lookup() gives tools
+without one a stat-based lookup instead of walking the working directory.
+
+Lookups can be case-insensitive (as on Windows/macOS file systems), and
+graphics resolution honours \graphicspath directories.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+GRAPHICS_EXTENSIONS = (".png", ".jpg", ".jpeg", ".pdf")
+
+# Directories never holding document assets
+SKIP_DIRS = frozenset({".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv", ".tox"})
+
+# Fallback image directories tried next to the source file and at the root
+DEFAULT_IMAGE_DIRS = ("images", "figures")
+
+_GRAPHICSPATH_RE = re.compile(r"\\graphicspath\s*\{((?:\s*\{[^{}]*\})+)\s*\}")
+_GROUP_RE = re.compile(r"\{([^{}]*)\}")
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class _Dir:
+    """Snapshot of one directory."""
+
+    path: str
+    mtime_ns: int
+    files: Dict[str, str] = field(default_factory=dict)  # key -> name on disk
+    subdirs: List[str] = field(default_factory=list)
+
+
+def graphic_candidates(
+    name: str, source_dir: str, root: str, graphicspath: Iterable[str] = ()
+) -> Iterator[str]:
+    """Candidate paths of an \\includegraphics target in LaTeX-like search order."""
+    bases = [source_dir]
+    bases += [os.path.join(source_dir, d) for d in DEFAULT_IMAGE_DIRS]
+    bases += [root, os.path.join(root, DEFAULT_IMAGE_DIRS[0])]
+    for directory in graphicspath:
+        bases += [os.path.join(source_dir, directory), os.path.join(root, directory)]
+    paths = [os.path.join(base, name) for base in bases]
+    yield from paths
+    if not os.path.splitext(name)[1]:
+        for ext in GRAPHICS_EXTENSIONS:
+            for path in paths:
+                yield path + ext
+
+
+def parse_graphicspath(content: str) -> List[str]:
+    r"""Return the directories listed in \graphicspath{{a/}{b/}}."""
+    dirs: List[str] = []
+    for match in _GRAPHICSPATH_RE.finditer(content):
+        dirs.extend(d.strip() for d in _GROUP_RE.findall(match.group(1)) if d.strip())
+    return dirs
+
+
+class ProjectFileIndex:
+    """File names of a project tree, refreshed per directory on mtime change."""
+
+    def __init__(self, root: PathLike, case_insensitive: bool = False) -> None:
+        self.root = os.path.abspath(root)
+        self.case_insensitive = case_insensitive
+        self._dirs: Dict[str, _Dir] = {}
+        self._root_key = self._key(self.root)
+        self._walk(self.root)
+
+    def __len__(self) -> int:
+        return sum(len(d.files) for d in self._dirs.values())
+
+    def exists(self, path: PathLike) -> bool:
+        """Return True if path names a file."""
+        full = os.path.abspath(path)
+        if not self._under_root(full):
+            return os.path.isfile(full)
+        parent, name = os.path.split(full)
+        entry = self._dirs.get(self._key(parent))
+        return entry is not None and self._key(name) in entry.files
+
+    def files(self, *extensions: str) -> Iterator[str]:
+        """Yield full paths of indexed files, optionally filtered by extension."""
+        suffixes = tuple(ext.lower() for ext in extensions)
+        for entry in list(self._dirs.values()):
+            for name in entry.files.values():
+                if not suffixes or name.lower().endswith(suffixes):
+                    yield os.path.join(entry.path, name)
+
+    def find_graphic(
+        self, name: str, source_dir: PathLike, graphicspath: Iterable[str] = ()
+    ) -> Optional[str]:
+        """Resolve an \\includegraphics target as LaTeX would, or return None.
+
+        Tries the source directory, its images/figures subdirectories, the
+        project root and the \\graphicspath directories, each with the
+        standard extensions when the name has none.
+        """
+        for candidate in graphic_candidates(name, os.path.abspath(source_dir), self.root, graphicspath):
+            if self.exists(candidate):
+                return candidate
+        return None
+
+    def add(self, path: PathLike) -> None:
+        """Record a file the caller just created."""
+        full = os.path.abspath(path)
+        if not self._under_root(full):
+            return
+        parent, name = os.path.split(full)
+        entry = self._dirs.get(self._key(parent))
+        if entry is None:
+            self._walk(parent)
+        else:
+            entry.files[self._key(name)] = name
+
+    def refresh(self) -> int:
+        """Rescan directories whose mtime changed; return how many were rescanned."""
+        rescanned = 0
+        for key, entry in list(self._dirs.items()):
+            if key not in self._dirs:
+                continue  # Dropped with a removed parent
+            try:
+                mtime_ns = os.stat(entry.path).st_mtime_ns
+            except OSError:
+                self._drop(key)
+                continue
+            if mtime_ns == entry.mtime_ns:
+                continue
+            rescanned += 1
+            old_subdirs = set(entry.subdirs)
+            fresh = self._scan(entry.path)
+            if fresh is None:
+                self._drop(key)
+                continue
+            for gone in old_subdirs - set(fresh.subdirs):
+                self._drop(self._key(gone))
+            for new in set(fresh.subdirs) - old_subdirs:
+                self._walk(new)
+        return rescanned
+
+    def _walk(self, top: str) -> None:
+        """Scan a directory tree, following symlinked directories but not loops.
+
+        Each branch carries the (device, inode) of the directories above
+        it; a directory already among them is a symlink loop.
+        """
+        stack = [(top, self._ancestors(top))]
+        while stack:
+            path, seen = stack.pop()
+            ident = _identity(path)
+            if ident is None or ident in seen:
+                continue
+            entry = self._scan(path)
+            if entry is not None:
+                inner = seen | {ident}
+                stack.extend((sub, inner) for sub in entry.subdirs)
+
+    def _ancestors(self, path: str) -> FrozenSet[Tuple[int, int]]:
+        """Identities of the indexed directories above path."""
+        found = set()
+        parent = os.path.dirname(path)
+        while parent != path and self._under_root(parent):
+            ident = _identity(parent)
+            if ident is not None:
+                found.add(ident)
+            path, parent = parent, os.path.dirname(parent)
+        return frozenset(found)
+
+    def _scan(self, path: str) -> Optional[_Dir]:
+        """Read one directory with a single scandir call."""
+        try:
+            entry = _Dir(path, os.stat(path).st_mtime_ns)
+            with os.scandir(path) as it:
+                for item in it:
+                    if item.is_dir():
+                        if item.name not in SKIP_DIRS:
+                            entry.subdirs.append(item.path)
+                    elif item.is_file():
+                        entry.files[self._key(item.name)] = item.name
+        except OSError:
+            return None
+        self._dirs[self._key(path)] = entry
+        return entry
+
+    def _drop(self, key: str) -> None:
+        """Forget a directory and everything below it."""
+        prefix = key + os.sep
+        for other in [k for k in self._dirs if k == key or k.startswith(prefix)]:
+            del self._dirs[other]
+
+    def _under_root(self, full: str) -> bool:
+        key = self._key(full)
+        return key == self._root_key or key.startswith(self._root_key + os.sep)
+
+    def _key(self, path: str) -> str:
+        return path.lower() if self.case_insensitive else path
+
+
+def _identity(path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of the directory a path leads to."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+class FileLookup:
+    """Stat-based graphics lookup for tools given no project root.
+
+    Offers the lookups of ProjectFileIndex without walking a tree, with
+    the working directory standing in for the root.
+    """
+
+    def __init__(self, root: Optional[PathLike] = None) -> None:
+        self.root = os.path.abspath(root if root is not None else os.getcwd())
+
+    def exists(self, path: PathLike) -> bool:
+        return os.path.isfile(path)
+
+    def find_graphic(
+        self, name: str, source_dir: PathLike, graphicspath: Iterable[str] = ()
+    ) -> Optional[str]:
+        for candidate in graphic_candidates(name, os.path.abspath(source_dir), self.root, graphicspath):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    def add(self, path: PathLike) -> None:
+        """Nothing to record; lookups always stat."""
+
+
+_INDEXES: Dict[Tuple[str, bool], ProjectFileIndex] = {}
+
+
+def project_file_index(root: PathLike, case_insensitive: bool = False) -> ProjectFileIndex:
+    """Return the shared index for a project root, refreshed for changes."""
+    key = (os.path.abspath(root), case_insensitive)
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = ProjectFileIndex(root, case_insensitive)
+    else:
+        index.refresh()
+    return index
+
+
+def file_lookup(
+    root: Optional[PathLike], case_insensitive: bool = False
+) -> Union[ProjectFileIndex, FileLookup]:
+    """The shared index of an explicit project root, else a stat-based lookup."""
+    if root is None:
+        return FileLookup()
+    return project_file_index(root, case_insensitive)
@@ -0,0 +1,55 @@
+"""
+Sorted interval set with O(log n) containment queries.
+
+Spans are half-open ``[start, end)`` character offsets. Overlapping and
+nested spans are merged when the set is frozen, so a query is a single
+binary search over disjoint intervals.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import List, Tuple
+
+
+class SpanSet:
+    """Collects half-open spans and answers containment queries."""
+
+    def __init__(self) -> None:
+        self._pending: List[Tuple[int, int]] = []
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+    def add(self, start: int, end: int) -> None:
+        """Add a span; empty spans are ignored."""
+        if end > start:
+            self._pending.append((start, end))
+
+    def freeze(self) -> SpanSet:
+        """Merge pending spans into the sorted disjoint representation."""
+        if not self._pending:
+            return self
+        spans = sorted(self._pending + list(zip(self._starts, self._ends)))
+        self._pending = []
+        starts: List[int] = []
+        ends: List[int] = []
+        for start, end in spans:
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts, self._ends = starts, ends
+        return self
+
+    def contains(self, offset: int) -> bool:
+        """Return True if offset falls inside any span."""
+        i = bisect_right(self._starts, offset) - 1
+        return i >= 0 and offset < self._ends[i]
+
+    def spans(self) -> List[Tuple[int, int]]:
+        """Return the merged spans in document order."""
+        return list(zip(self._starts, self._ends))
+
+    def __len__(self) -> int:
+        return len(self._starts)
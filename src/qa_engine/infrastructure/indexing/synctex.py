@@ -0,0 +1,219 @@
+"""
+SyncTeX index reader.
+
+Reads the .synctex.gz (or plain .synctex) file a compile writes next to
+the PDF into an index queryable both ways: a page position to the source
+file and line that produced it, and a source line to the pages and
+boxes it was typeset into. Positions are PDF big points measured from
+the top-left corner of the page, y at the baseline, as in synctex's own
+command-line output. Indexes are cached by the file's mtime and size.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+SP_PER_BP = 65781.76
+SYNCTEX_SUFFIXES = (".synctex.gz", ".synctex")
+
+# Record type -> box kind; "[" and "(" open boxes whose "]" / ")" we skip
+RECORD_KINDS = {
+    "[": "vbox", "(": "hbox", "v": "void_vbox", "h": "void_hbox",
+    "x": "current", "k": "kern", "g": "glue", "$": "math",
+}
+_RECORD_RE = re.compile(
+    r"([\[(vhxkg$])(\d+),(\d+)(?:,(-?\d+))?:(-?\d+),(-?\d+)(?::(-?\d+)(?:,(-?\d+),(-?\d+))?)?"
+)
+_BOXES = frozenset({"vbox", "hbox", "void_vbox", "void_hbox"})
+
+
+@dataclass(frozen=True, slots=True)
+class SyncBox:
+    """One SyncTeX record: where a source line was typeset."""
+
+    page: int
+    file: str
+    line: int
+    column: int
+    kind: str
+    x: float
+    y: float  # Baseline
+    width: float = 0.0
+    height: float = 0.0
+    depth: float = 0.0
+
+    @property
+    def top(self) -> float:
+        return self.y - self.height
+
+    @property
+    def bottom(self) -> float:
+        return self.y + self.depth
+
+    def contains(self, x: float, y: float) -> bool:
+        return self.x <= x <= self.x + self.width and self.top <= y <= self.bottom
+
+
+class SyncTexIndex:
+    """Page -> records and (file, line) -> records of one synctex file."""
+
+    def __init__(self, inputs: Dict[int, str], boxes: Iterable[SyncBox]) -> None:
+        self.inputs = inputs  # Input tag -> file name as recorded
+        self._pages: Dict[int, List[SyncBox]] = {}
+        self._lines: Dict[Tuple[str, int], List[SyncBox]] = {}
+        for box in boxes:
+            self._pages.setdefault(box.page, []).append(box)
+            self._lines.setdefault((box.file, box.line), []).append(box)
+        self._files = {os.path.normpath(name): name for name in inputs.values()}
+
+    @property
+    def pages(self) -> List[int]:
+        return sorted(self._pages)
+
+    def boxes(self, page: int) -> List[SyncBox]:
+        return list(self._pages.get(page, []))
+
+    def source_at(self, page: int, x: float, y: float) -> Optional[SyncBox]:
+        """Reverse search: the record for a page position.
+
+        The smallest box containing the point wins; if none does, the
+        record nearest to it on that page.
+        """
+        records = self._pages.get(page)
+        if not records:
+            return None
+        inside = [b for b in records if b.kind in _BOXES and b.contains(x, y)]
+        if inside:
+            return min(inside, key=lambda b: b.width * (b.height + b.depth))
+        return min(records, key=lambda b: (b.x - x) ** 2 + (b.y - y) ** 2)
+
+    def source_range(self, page: int) -> Dict[str, Tuple[int, int]]:
+        """First and last source line typeset on a page, per file."""
+        ranges: Dict[str, Tuple[int, int]] = {}
+        for box in self._pages.get(page, []):
+            if box.line > 0:
+                low, high = ranges.get(box.file, (box.line, box.line))
+                ranges[box.file] = (min(low, box.line), max(high, box.line))
+        return ranges
+
+    def locations(self, file: Union[str, Path], line: int) -> List[SyncBox]:
+        """Forward search: records of a source line, in page order."""
+        name = self.resolve(file)
+        if name is None:
+            return []
+        return sorted(self._lines.get((name, line), []), key=lambda b: (b.page, b.y, b.x))
+
+    def pages_of(self, file: Union[str, Path], line: int) -> List[int]:
+        return sorted({box.page for box in self.locations(file, line)})
+
+    def resolve(self, file: Union[str, Path]) -> Optional[str]:
+        """The recorded input name for a path (exact, or matching its tail)."""
+        norm = os.path.normpath(str(file))
+        if norm in self._files:
+            return self._files[norm]
+        matches = [name for path, name in self._files.items()
+                   if path.endswith(os.sep + norm) or norm.endswith(os.sep + path)]
+        return matches[0] if len(matches) == 1 else None
+
+
+def read_synctex(path: Union[str, Path]) -> SyncTexIndex:
+    """Parse a .synctex.gz or .synctex file."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", errors="replace") as handle:
+        return parse_synctex(handle)
+
+
+def parse_synctex(lines: Iterable[str]) -> SyncTexIndex:
+    """Build an index from the lines of a synctex file."""
+    inputs: Dict[int, str] = {}
+    boxes: List[SyncBox] = []
+    unit, magnification, x_offset, y_offset = 1.0, 1000.0, 0.0, 0.0
+    scale = unit * magnification / 1000 / SP_PER_BP
+    page = 0
+    for line in lines:
+        first = line[:1]
+        if first in RECORD_KINDS and page:
+            m = _RECORD_RE.match(line)
+            if m is None:
+                continue
+            tag = int(m.group(2))
+            w, h, d = (float(m.group(i) or 0) * scale for i in (7, 8, 9))
+            boxes.append(SyncBox(
+                page, inputs.get(tag, str(tag)), int(m.group(3)), int(m.group(4) or 0),
+                RECORD_KINDS[first], float(m.group(5)) * scale + x_offset,
+                float(m.group(6)) * scale + y_offset, w, h, d,
+            ))
+        elif first == "{":
+            page = int(line[1:] or 0)
+        elif first == "}":
+            page = 0
+        elif line.startswith("Input:"):
+            tag, _, name = line[6:].rstrip("\n").partition(":")
+            inputs[int(tag)] = name
+        elif ":" in line and not page:
+            key, _, value = line.partition(":")
+            try:
+                number = float(value)
+            except ValueError:
+                continue
+            if key == "Unit":
+                unit = number
+            elif key == "Magnification":
+                magnification = number or 1000.0
+            elif key == "X Offset":
+                x_offset = number * unit / SP_PER_BP
+            elif key == "Y Offset":
+                y_offset = number * unit / SP_PER_BP
+            scale = unit * magnification / 1000 / SP_PER_BP
+    return SyncTexIndex(inputs, boxes)
+
+
+def find_synctex(path: Union[str, Path]) -> Optional[Path]:
+    """The synctex file of a .synctex(.gz), .pdf or .tex path, if it exists."""
+    path = Path(path)
+    if path.name.endswith(SYNCTEX_SUFFIXES):
+        return path if path.exists() else None
+    for suffix in SYNCTEX_SUFFIXES:
+        candidate = path.with_name(path.stem + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+class SyncTexCache:
+    """SyncTeX indexes, re-read only when the file changes."""
+
+    def __init__(self) -> None:
+        self._indexes: Dict[str, Tuple[Tuple[int, int], SyncTexIndex]] = {}
+        self._lock = threading.Lock()
+
+    def index(self, path: Union[str, Path]) -> Optional[SyncTexIndex]:
+        """Index for a synctex, PDF or root .tex path; None without a synctex file."""
+        found = find_synctex(path)
+        if found is None:
+            return None
+        full = os.path.abspath(found)
+        st = os.stat(full)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._indexes.get(full)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+        index = read_synctex(full)
+        with self._lock:
+            self._indexes[full] = (stamp, index)
+        return index
+
+
+_SHARED = SyncTexCache()
+
+
+def synctex_cache() -> SyncTexCache:
+    """Return the process-wide cache, so all consumers share parsed indexes."""
+    return _SHARED
@@ -0,0 +1,182 @@
+r"""
+Parse-once table index.
+
+Locates every tabular-family environment of a document with one
+EnvironmentTree pass and parses each table at most once, on first access,
+into ParsedTable/TableRow/TableCell with source spans. A table's
+raw_content runs from its \begin line through its \end line, however long
+the table is.
+
+Fixers that rewrite a table call replace(): the new text is spliced in,
+only that table is re-located and re-parsed, and the spans of the tables
+after it are shifted instead of re-parsed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .env_tree import EnvironmentTree
+from .table_parser import TABLE_ENVIRONMENTS, ParsedTable, TableParser
+
+
+@dataclass
+class _Entry:
+    """Located table; parsed lazily."""
+
+    name: str
+    start: int
+    end: int
+    start_line: int
+    end_line: int
+    block: Tuple[int, int]
+    parsed: Optional[ParsedTable] = None
+
+
+class TableIndex:
+    """All tables of one document, parsed once and updated per table."""
+
+    def __init__(
+        self,
+        content: str,
+        environments: Tuple[str, ...] = TABLE_ENVIRONMENTS,
+        parser: Optional[TableParser] = None,
+    ) -> None:
+        self._content = content
+        self._environments = environments
+        self._parser = parser or TableParser()
+        self._tree: Optional[EnvironmentTree] = EnvironmentTree(content)
+        self._entries = self._locate(content, self._tree, 0, 0)
+        self._by_table: Dict[int, _Entry] = {}
+
+    @property
+    def tree(self) -> EnvironmentTree:
+        """Environment tree of the current content, rebuilt after edits on demand."""
+        if self._tree is None:
+            self._tree = EnvironmentTree(self._content)
+        return self._tree
+
+    @property
+    def content(self) -> str:
+        """Current document text, including replacements."""
+        return self._content
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ParsedTable]:
+        return iter(self.tables())
+
+    def tables(self, *environments: str) -> List[ParsedTable]:
+        """Return tables in document order, optionally filtered by environment."""
+        return [self._parse(e) for e in self._entries if not environments or e.name in environments]
+
+    def table_at(self, offset: int) -> Optional[ParsedTable]:
+        """Return the innermost table whose environment contains offset."""
+        found = None
+        for entry in self._entries:
+            if entry.start > offset:
+                break
+            if offset < entry.end:
+                found = entry
+        return self._parse(found) if found else None
+
+    def table_at_line(self, line: int, *environments: str) -> Optional[ParsedTable]:
+        """Return the first table beginning on a 0-based line."""
+        for entry in self._entries:
+            if entry.start_line == line and (not environments or entry.name in environments):
+                return self._parse(entry)
+        return None
+
+    def replace(self, table: ParsedTable, new_text: str) -> List[ParsedTable]:
+        """Replace a table's lines with new_text and re-index only that region.
+
+        Returns the tables found in the new text (usually the rewritten
+        table itself). A table whose parse an earlier edit inside it
+        dropped is found again by its start. Tables nested in the replaced
+        lines are dropped; tables enclosing them are re-parsed on next
+        access; later tables are shifted without re-parsing.
+        """
+        entry = self._by_table.get(id(table)) or self._entry_at(table)
+        block_start, block_end = entry.block
+        delta = len(new_text) - (block_end - block_start)
+        line_delta = new_text.count("\n") - (entry.end_line - entry.start_line)
+        self._content = self._content[:block_start] + new_text + self._content[block_end:]
+        self._tree = None
+
+        before = [e for e in self._entries if e.start < block_start]
+        after = [e for e in self._entries if e.start >= block_end]
+        for enclosing in before:
+            if enclosing.end >= block_end:
+                enclosing.end += delta
+                enclosing.end_line += line_delta
+                enclosing.block = (enclosing.block[0], enclosing.block[1] + delta)
+                self._forget(enclosing)
+        for other in after:
+            self._shift(other, delta, line_delta)
+        for dropped in self._entries[len(before):len(self._entries) - len(after)]:
+            self._forget(dropped)
+        added = self._locate(new_text, EnvironmentTree(new_text), block_start, entry.start_line)
+        self._entries = before + added + after
+        return [self._parse(e) for e in added]
+
+    def _entry_at(self, table: ParsedTable) -> _Entry:
+        """Entry of a table whose parse was dropped by an edit inside it."""
+        for entry in self._entries:
+            if entry.start == table.start and entry.name == table.environment:
+                return entry
+        raise KeyError(f"table at offset {table.start} is no longer in the index")
+
+    def _locate(self, text: str, tree: EnvironmentTree, base: int, base_line: int) -> List[_Entry]:
+        """Find table environments in text whose offsets start at base."""
+        entries = []
+        for node in tree.nodes(*self._environments):
+            start_line, end_line = tree.line_of(node.start) - 1, tree.line_of(max(node.end - 1, node.start)) - 1
+            block_start = tree.offset(start_line + 1)
+            line_end = text.find("\n", node.end)
+            block_end = len(text) if line_end == -1 else line_end
+            entries.append(_Entry(
+                node.name, base + node.start, base + node.end,
+                base_line + start_line, base_line + end_line,
+                (base + block_start, base + block_end),
+            ))
+        return entries
+
+    def _parse(self, entry: _Entry) -> ParsedTable:
+        """Parse an entry on first access."""
+        if entry.parsed is None:
+            block_start, block_end = entry.block
+            raw = self._content[block_start:block_end]
+            parsed = self._parser.parse(raw, entry.start_line, block_start)
+            if parsed is None or parsed.environment != entry.name:
+                parsed = ParsedTable(environment=entry.name, raw_content=raw)
+            parsed.start_line, parsed.end_line = entry.start_line, entry.end_line
+            parsed.start, parsed.end = entry.start, entry.end
+            entry.parsed = parsed
+            self._by_table[id(parsed)] = entry
+        return entry.parsed
+
+    def _forget(self, entry: _Entry) -> None:
+        """Drop an entry's parse so it is re-parsed on next access."""
+        if entry.parsed is not None:
+            self._by_table.pop(id(entry.parsed), None)
+            entry.parsed = None
+
+    @staticmethod
+    def _shift(entry: _Entry, delta: int, line_delta: int) -> None:
+        """Move an entry and its parsed spans after an earlier edit."""
+        entry.start, entry.end = entry.start + delta, entry.end + delta
+        entry.start_line, entry.end_line = entry.start_line + line_delta, entry.end_line + line_delta
+        entry.block = (entry.block[0] + delta, entry.block[1] + delta)
+        table = entry.parsed
+        if table is None:
+            return
+        table.start, table.end = entry.start, entry.end
+        table.start_line, table.end_line = entry.start_line, entry.end_line
+        for row in table.rows:
+            row.line += line_delta
+            row.start, row.end = row.start + delta, row.end + delta
+            for cell in row.cells:
+                if cell.start >= 0:
+                    cell.start, cell.end = cell.start + delta, cell.end + delta
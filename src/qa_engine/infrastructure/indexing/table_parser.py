@@ -0,0 +1,266 @@
+"""
+Table parser for LaTeX tables.
+
+Parses table structure for transformation.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+
+@dataclass
+class TableCell:
+    """Represents a single table cell."""
+    content: str
+    is_hebrew: bool = False
+    is_header: bool = False
+    original: str = ""
+    start: int = -1
+    end: int = -1
+
+
+@dataclass
+class TableRow:
+    """Represents a table row."""
+    cells: List[TableCell] = field(default_factory=list)
+    is_header: bool = False
+    has_hline_before: bool = False
+    has_hline_after: bool = False
+    raw_line: str = ""
+    line: int = 0
+    start: int = -1
+    end: int = -1
+
+
+@dataclass
+class ParsedTable:
+    """Parsed table structure."""
+    environment: str = "tabular"
+    column_spec: str = ""
+    rows: List[TableRow] = field(default_factory=list)
+    start_line: int = 0
+    end_line: int = 0
+    raw_content: str = ""
+    width: str = ""
+    start: int = -1
+    end: int = -1
+    columns: List[Tuple[str, str]] = field(default_factory=list)
+
+
+TABLE_ENVIRONMENTS = ("tabular", "rtltabular", "tabularx", "longtable")
+BEGIN_PATTERN = re.compile(r"\\begin\{(%s)\}" % "|".join(TABLE_ENVIRONMENTS))
+HEBREW_PATTERN = re.compile(r"[א-ת]")
+CELL_CMD_PATTERN = re.compile(r"\\(hebcell|hebheader|encell|enheader)\{([^}]*)\}")
+ENV_TOKEN_PATTERN = re.compile(r"\\(begin|end)\{([^}]*)\}")
+COLUMN_PATTERN = re.compile(r"([clrCLR])|p\{([^}]+)\}")
+# A line holding only a horizontal rule: \hline or a booktabs rule
+RULE_LINE_PATTERN = re.compile(
+    r"\\(?:hline|toprule|midrule|bottomrule)(?:\[[^\]]*\])?"
+    r"|\\cline\{[^}]*\}"
+    r"|\\cmidrule(?:\[[^\]]*\])?(?:\([^)]*\))?\{[^}]*\}"
+)
+
+
+class TableParser:
+    """Parses LaTeX tables into structured format."""
+
+    def parse(
+        self, content: str, start_line: int = 0, start_offset: int = 0
+    ) -> Optional[ParsedTable]:
+        """Parse table content into structured format.
+
+        start_line and start_offset locate content in its document; row and
+        cell spans are reported relative to them.
+        """
+        lines = content.split("\n")
+        table = ParsedTable(start_line=start_line, raw_content=content)
+
+        # Find environment and column spec
+        env_match = self._find_begin(content)
+        if not env_match:
+            return None
+        begin, args = env_match
+
+        table.environment = begin.group(1)
+        table.width, table.column_spec = args if len(args) == 2 else ("", args[0])
+        table.columns = self.column_types(table.column_spec)
+        table.start = start_offset + begin.start()
+
+        # Parse rows
+        env = table.environment
+        in_table = False
+        current_row_lines: List[str] = []
+        row_start = row_line = 0
+        hline_before = False
+        first_row_parsed = False  # Track if we've seen the first data row
+        pos = start_offset
+
+        def close_row(end: int, is_header: bool) -> TableRow:
+            row = self._parse_row("\n".join(current_row_lines), is_header, row_start)
+            row.line, row.start, row.end = row_line, row_start, end
+            return row
+
+        depth = 0  # Open table environments, counting nested ones
+        for i, line in enumerate(lines):
+            line_start, pos = pos, pos + len(line) + 1
+            tokens = [t for t in ENV_TOKEN_PATTERN.finditer(line)
+                      if "tabular" in t.group(2) or t.group(2) == env]
+            if not in_table:
+                if any(t.group(1) == "begin" for t in tokens):
+                    in_table = True
+                    depth = sum(1 if t.group(1) == "begin" else -1 for t in tokens)
+                continue
+            nested = depth > 1 or bool(tokens)
+            for token in tokens:
+                depth += 1 if token.group(1) == "begin" else -1
+                if depth == 0:
+                    table.end_line = start_line + i
+                    table.end = line_start + token.start()
+                    break
+            if depth == 0:
+                break
+            if nested:
+                # A nested table stays inside the cell that holds it; the
+                # row ends at a \\ after the nested \end
+                if not current_row_lines:
+                    row_start, row_line = line_start, start_line + i
+                current_row_lines.append(line)
+                tail = line[tokens[-1].end():] if tokens else ""
+                if depth == 1 and r"\\" in tail:
+                    is_header = hline_before and not first_row_parsed
+                    table.rows.append(close_row(line_start + len(line), is_header))
+                    current_row_lines = []
+                    hline_before = False
+                    first_row_parsed = True
+                continue
+
+            stripped = line.strip()
+            if RULE_LINE_PATTERN.fullmatch(stripped):
+                if current_row_lines:
+                    is_header = hline_before and not first_row_parsed
+                    row = close_row(line_start - 1, is_header)
+                    row.has_hline_after = True
+                    table.rows.append(row)
+                    current_row_lines = []
+                    first_row_parsed = True
+                hline_before = True
+                continue
+
+            if stripped:
+                if not current_row_lines:
+                    row_start, row_line = line_start, start_line + i
+                current_row_lines.append(line)
+                if r"\\" in line:
+                    is_header = hline_before and not first_row_parsed
+                    row = close_row(line_start + len(line), is_header)
+                    table.rows.append(row)
+                    current_row_lines = []
+                    hline_before = False
+                    first_row_parsed = True
+
+        return table
+
+    @classmethod
+    def _find_begin(cls, content: str) -> Optional[Tuple[re.Match, List[str]]]:
+        """Find the first table \\begin with its brace-balanced arguments.
+
+        An optional [pos] argument is skipped; tabularx takes a width
+        before the column spec.
+        """
+        for begin in BEGIN_PATTERN.finditer(content):
+            pos, args = begin.end(), []
+            if content.startswith("[", pos) and "]" in content[pos:]:
+                pos = content.index("]", pos) + 1
+            for _ in range(2 if begin.group(1) == "tabularx" else 1):
+                group = cls._read_group(content, pos)
+                if group is None:
+                    break
+                arg, pos = group
+                args.append(arg)
+            if args and args[-1] and len(args) == (2 if begin.group(1) == "tabularx" else 1):
+                return begin, args
+        return None
+
+    @staticmethod
+    def _read_group(content: str, pos: int) -> Optional[Tuple[str, int]]:
+        """Read a {...} group at pos, skipping whitespace; return inner text and end."""
+        while pos < len(content) and content[pos].isspace():
+            pos += 1
+        if not content.startswith("{", pos):
+            return None
+        depth = 0
+        for end in range(pos, len(content)):
+            depth += {"{": 1, "}": -1}.get(content[end], 0)
+            if depth == 0:
+                return content[pos + 1:end], end + 1
+        return None
+
+    def _parse_row(self, line: str, hline_before: bool, start: int = -1) -> TableRow:
+        """Parse a single row into cells."""
+        row = TableRow(raw_line=line, has_hline_before=hline_before)
+
+        # Remove trailing \\ and split by &
+        clean_line = re.sub(r"\\\\.*$", "", line).strip()
+        # Handle rowcolor
+        clean_line = re.sub(r"\\rowcolor\{[^}]+\}\s*", "", clean_line)
+
+        parts = clean_line.split("&")
+        is_first_row = hline_before  # First row after hline is likely header
+
+        for part in parts:
+            cell = self._parse_cell(part.strip(), is_first_row)
+            row.cells.append(cell)
+        if start >= 0:
+            for cell, (cell_start, cell_end) in zip(row.cells, self._cell_spans(line)):
+                cell.start, cell.end = start + cell_start, start + cell_end
+
+        # Check if this is a header row (has hebheader/enheader or is bold)
+        if r"\hebheader" in line or r"\enheader" in line or r"\textbf" in line:
+            row.is_header = True
+            for cell in row.cells:
+                cell.is_header = True
+
+        return row
+
+    @staticmethod
+    def _cell_spans(line: str) -> List[Tuple[int, int]]:
+        """Offsets of the &-separated cells in a row, whitespace trimmed."""
+        body_end = line.find("\\\\")
+        body_end = len(line) if body_end == -1 else body_end
+        spans, seg_start = [], 0
+        for seg_end in [i for i in range(body_end) if line[i] == "&"] + [body_end]:
+            seg = line[seg_start:seg_end]
+            lead = len(seg) - len(seg.lstrip())
+            spans.append((seg_start + lead, seg_start + len(seg.rstrip())))
+            seg_start = seg_end + 1
+        return spans
+
+    def _parse_cell(self, content: str, is_header: bool) -> TableCell:
+        """Parse cell content."""
+        cell = TableCell(content=content, original=content, is_header=is_header)
+
+        # Check for Hebrew
+        cell.is_hebrew = bool(HEBREW_PATTERN.search(content))
+
+        # Extract actual content from cell commands
+        cmd_match = CELL_CMD_PATTERN.search(content)
+        if cmd_match:
+            cell.content = cmd_match.group(2)
+            cell.is_hebrew = cmd_match.group(1) in ("hebcell", "hebheader")
+
+        return cell
+
+    @staticmethod
+    def column_types(column_spec: str) -> List[Tuple[str, str]]:
+        """Split a column spec into (type, width) pairs; width is set for p{...}."""
+        return [
+            (m.group(1).lower(), "") if m.group(1) else ("p", m.group(2))
+            for m in COLUMN_PATTERN.finditer(column_spec)
+        ]
+
+    def count_columns(self, column_spec: str) -> int:
+        """Count number of columns from spec."""
+        return len(self.column_types(column_spec)) or 1
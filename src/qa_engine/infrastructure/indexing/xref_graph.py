@@ -0,0 +1,292 @@
+r"""
+Cross-reference graph.
+
+Records every \label, \ref-family, \cite-family and \chapterref occurrence
+of a project's sources, plus the labels, citations and chapter numbers
+defined by .aux/.bbl files and the entry keys of .bib files. Each file's
+contribution is kept separately and replaced when the file changes, so an
+edit re-parses only that file, and the undefined / unused / duplicate
+queries are dictionary lookups per key instead of scans over all keys.
+
+Files are keyed by absolute path, so relative and absolute spellings of
+one file are one entry. The queries span all indexed files, so the graph
+is one namespace: scan_document() indexes only the files one root
+document is built from (its \input/\include/\subfile tree, .aux/.bbl and
+.bib files), while scan_project() merges every file under a directory,
+including standalone copies of chapters that the root document includes
+too. covers() tells whether a file was indexed by either scan, where the
+answers do not depend on which files were seen first.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .project_files import project_file_index
+
+LABEL = "label"
+CITE = "cite"
+CHAPTER = "chapter"
+
+REF_COMMANDS = frozenset({
+    "ref", "eqref", "pageref", "autoref", "nameref", "vref", "cref", "Cref", "labelcref",
+})
+CITE_COMMANDS = frozenset({
+    "cite", "citep", "citet", "parencite", "textcite", "autocite", "footcite", "fullcite", "nocite",
+})
+CHAPTER_COMMANDS = frozenset({"chapterref", "chapterrefforward", "chapterrefrange", "chapterreflist"})
+XREF_SUFFIXES = (".tex", ".aux", ".bbl", ".bib")
+
+_SOURCE_RE = re.compile(
+    r"(?<!\\)%[^\n]*|\\(label|" + "|".join(sorted(REF_COMMANDS | CITE_COMMANDS | CHAPTER_COMMANDS))
+    + r")\*?(?![A-Za-z])(?:\s*\[[^\]]*\]){0,2}\s*\{([^}]*)\}(?:\{([^}]*)\})?"
+)
+_AUX_RE = re.compile(
+    r"\\(newlabel|bibcite)\{([^}]*)\}"
+    r"|\\contentsline\s*\{chapter\}\s*\{\\numberline\s*\{(\d+)\}"
+    r"|\\entry\{([^}]*)\}"  # biblatex .bbl
+)
+_BIB_RE = re.compile(r"@(\w+)\s*[{(]\s*([^,\s{}()]+)\s*,")
+_BIB_NON_ENTRIES = frozenset({"comment", "string", "preamble"})
+_INCLUDE_RE = re.compile(
+    r"(?<!\\)%[^\n]*|\\(input|include|subfile|subfileinclude|addbibresource|bibliography)\s*\{([^}]*)\}"
+)
+
+
+@dataclass(frozen=True)
+class XrefOccurrence:
+    """One definition or use of a key."""
+
+    kind: str  # label, cite or chapter
+    key: str
+    file: str
+    line: int
+    command: str
+    defines: bool
+
+    @property
+    def in_source(self) -> bool:
+        """Written by the author (.tex/.bib) rather than generated (.aux/.bbl)."""
+        return self.file.endswith((".tex", ".bib"))
+
+
+def extract_xrefs(content: str, file_path: str = "") -> List[XrefOccurrence]:
+    """Occurrences of one file, parsed according to its suffix."""
+    suffix = os.path.splitext(file_path)[1].lower()
+    line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+    found: List[XrefOccurrence] = []
+
+    def add(kind: str, key: str, pos: int, command: str, defines: bool) -> None:
+        key = key.strip()
+        if key and key != "*":
+            found.append(XrefOccurrence(kind, key, file_path, bisect_right(line_starts, pos), command, defines))
+
+    if suffix == ".bib":
+        for match in _BIB_RE.finditer(content):
+            if match.group(1).lower() not in _BIB_NON_ENTRIES:
+                add(CITE, match.group(2), match.start(), "@" + match.group(1).lower(), True)
+    elif suffix in (".aux", ".bbl"):
+        for match in _AUX_RE.finditer(content):
+            if match.group(1):
+                add(LABEL if match.group(1) == "newlabel" else CITE, match.group(2), match.start(), match.group(1), True)
+            elif match.group(3):
+                add(CHAPTER, match.group(3), match.start(), "contentsline", True)
+            else:
+                add(CITE, match.group(4), match.start(), "entry", True)
+    else:
+        for match in _SOURCE_RE.finditer(content):
+            command = match.group(1)
+            if command is None:
+                continue
+            if command in CHAPTER_COMMANDS:
+                args = match.group(2) + ("," + match.group(3) if command == "chapterrefrange" and match.group(3) else "")
+                for number in re.findall(r"\d+", args):
+                    add(CHAPTER, number, match.start(), command, False)
+                continue
+            kind = CITE if command in CITE_COMMANDS else LABEL
+            keys = [match.group(2)] if command == "label" else match.group(2).split(",")
+            for key in keys:
+                add(kind, key, match.start(), command, command == "label")
+    return found
+
+
+def document_files(main: Union[str, Path]) -> List[str]:
+    """Existing files a root document is built from, as absolute paths.
+
+    Follows \\input, \\include and \\subfile from main, resolving names
+    against main's directory as TeX does when compiling there, and adds the
+    .bib files it names and the .aux/.bbl files of main and its included
+    parts.
+    """
+    main = os.path.abspath(main)
+    base, stem = os.path.dirname(main), os.path.splitext(main)[0]
+    found: Dict[str, None] = {}
+    pending, extra = [main], [stem + ".aux", stem + ".bbl"]
+    while pending:
+        name = pending.pop(0)
+        if name in found or not os.path.isfile(name):
+            continue
+        found[name] = None
+        with open(name, encoding="utf-8", errors="ignore") as handle:
+            matches = [m.groups() for m in _INCLUDE_RE.finditer(handle.read()) if m.group(1)]
+        for command, args in matches:
+            for arg in args.split(","):  # \bibliography takes a list
+                path = os.path.normpath(os.path.join(base, arg.strip()))
+                if command in ("addbibresource", "bibliography"):
+                    extra.append(path if path.endswith(".bib") else path + ".bib")
+                    continue
+                pending.append(path if os.path.splitext(path)[1] else path + ".tex")
+                if command == "include":
+                    extra.append(os.path.splitext(path)[0] + ".aux")
+    found.update((name, None) for name in extra if os.path.isfile(name))
+    return list(found)
+
+
+class XrefGraph:
+    """Definitions and uses of labels, citations and chapters, per file."""
+
+    def __init__(self) -> None:
+        self._files: Dict[str, Tuple[Optional[Tuple[int, int]], List[XrefOccurrence]]] = {}
+        # (kind, key) -> file -> occurrences
+        self._defs: Dict[Tuple[str, str], Dict[str, List[XrefOccurrence]]] = {}
+        self._uses: Dict[Tuple[str, str], Dict[str, List[XrefOccurrence]]] = {}
+        self._roots: Set[str] = set()  # Projects indexed by scan_project()
+        self._document: Set[str] = set()  # Files indexed by scan_files()
+
+    def update(self, path: Union[str, Path], content: Optional[str] = None) -> bool:
+        """(Re)index one file; returns False if it was unchanged.
+
+        With content, the given text replaces the file's entry regardless
+        of what is on disk.
+        """
+        name = os.path.abspath(path)
+        stamp = None
+        if content is None:
+            try:
+                st = os.stat(name)
+            except OSError:
+                self.remove(name)
+                return True
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._files.get(name)
+            if cached is not None and cached[0] == stamp:
+                return False
+            with open(name, encoding="utf-8", errors="ignore") as handle:
+                content = handle.read()
+        self.remove(name)
+        occurrences = extract_xrefs(content, name)
+        self._files[name] = (stamp, occurrences)
+        for occ in occurrences:
+            index = self._defs if occ.defines else self._uses
+            index.setdefault((occ.kind, occ.key), {}).setdefault(name, []).append(occ)
+        return True
+
+    def remove(self, path: Union[str, Path]) -> None:
+        """Drop a file's occurrences."""
+        entry = self._files.pop(os.path.abspath(path), None)
+        if entry is None:
+            return
+        for occ in entry[1]:
+            index = self._defs if occ.defines else self._uses
+            per_file = index.get((occ.kind, occ.key))
+            if per_file is not None:
+                per_file.pop(occ.file, None)
+                if not per_file:
+                    del index[(occ.kind, occ.key)]
+
+    def scan_project(self, root: Union[str, Path], suffixes: Iterable[str] = XREF_SUFFIXES) -> int:
+        """Index every cross-reference file under root; returns how many changed.
+
+        All files share one namespace, so a project holding several root
+        documents (e.g. chapter-NN-standalone.tex next to main.tex) reports
+        their common labels as duplicates; use scan_document() there.
+        """
+        present = {str(p) for p in project_file_index(root).files(*suffixes)}
+        root_prefix = os.path.join(os.path.abspath(root), "")
+        gone = [name for name in self._files if name.startswith(root_prefix) and name not in present]
+        for name in gone:
+            self.remove(name)
+        changed = sum(self.update(name) for name in sorted(present)) + len(gone)
+        self._roots.add(os.path.abspath(root))
+        return changed
+
+    def scan_files(self, files: Iterable[Union[str, Path]]) -> int:
+        """Index exactly these files, dropping all others; returns how many changed."""
+        present = {os.path.abspath(name) for name in files}
+        gone = [name for name in self._files if name not in present]
+        for name in gone:
+            self.remove(name)
+        changed = sum(self.update(name) for name in sorted(present)) + len(gone)
+        self._roots, self._document = set(), present
+        return changed
+
+    def scan_document(self, main: Union[str, Path]) -> int:
+        """Index only the files of one root document, so the queries answer for it alone."""
+        return self.scan_files(document_files(main))
+
+    def covers(self, path: Union[str, Path]) -> bool:
+        """True if path was indexed by scan_files() or lies under a scan_project() root."""
+        name = os.path.abspath(path)
+        return name in self._document or any(name.startswith(os.path.join(root, "")) for root in self._roots)
+
+    def files(self) -> List[str]:
+        return list(self._files)
+
+    def occurrences(self, path: Union[str, Path]) -> List[XrefOccurrence]:
+        entry = self._files.get(os.path.abspath(path))
+        return list(entry[1]) if entry else []
+
+    def keys(self, kind: str, path: Union[str, Path]) -> Set[str]:
+        """Keys of one kind defined by one file."""
+        return {o.key for o in self.occurrences(path) if o.defines and o.kind == kind}
+
+    def definitions(self, kind: str, key: str) -> List[XrefOccurrence]:
+        return [o for occs in self._defs.get((kind, key), {}).values() for o in occs]
+
+    def uses(self, kind: str, key: str) -> List[XrefOccurrence]:
+        return [o for occs in self._uses.get((kind, key), {}).values() for o in occs]
+
+    def is_defined(self, kind: str, key: str) -> bool:
+        return (kind, key) in self._defs
+
+    def undefined(self, kind: str = LABEL) -> List[XrefOccurrence]:
+        """Uses whose key is defined nowhere.
+
+        Chapters are only checked once some chapter numbers are known
+        (from an .aux file).
+        """
+        if kind == CHAPTER and not any(k == CHAPTER for k, _ in self._defs):
+            return []
+        return self._sorted(
+            o for (k, key), per_file in self._uses.items()
+            if k == kind and (k, key) not in self._defs
+            for occs in per_file.values() for o in occs
+        )
+
+    def unused(self, kind: str = LABEL) -> List[XrefOccurrence]:
+        """Source definitions (\\label, .bib entries) that are never used."""
+        return self._sorted(
+            o for (k, key), per_file in self._defs.items()
+            if k == kind and (k, key) not in self._uses
+            for occs in per_file.values() for o in occs if o.in_source
+        )
+
+    def duplicates(self, kind: str = LABEL) -> Dict[str, List[XrefOccurrence]]:
+        """Keys defined more than once in sources."""
+        result = {}
+        for (k, key), per_file in self._defs.items():
+            if k != kind:
+                continue
+            sources = [o for occs in per_file.values() for o in occs if o.in_source]
+            if len(sources) > 1:
+                result[key] = self._sorted(sources)
+        return result
+
+    @staticmethod
+    def _sorted(occurrences: Iterable[XrefOccurrence]) -> List[XrefOccurrence]:
+        return sorted(occurrences, key=lambda o: (o.file, o.line, o.key))
@@ -0,0 +1,63 @@
+"""Regex matching infrastructure - pluggable backends, runtime guard and audit."""
+
+from .backend_benchmark import BackendTiming, benchmark_backends, load_corpus
+from .regex_auditor import PatternAudit, RegexAuditor
+from .regex_backend import (
+    BACKEND_ENV_VAR,
+    RE2_AVAILABLE,
+    Re2Backend,
+    RegexBackend,
+    available_backends,
+    backend_named,
+    compile_rule,
+    compile_rule_field,
+    compile_with,
+    get_backend,
+    pattern_features,
+    register_backend,
+    set_backend,
+)
+from .regex_guard import (
+    GUARD_ENV_VAR,
+    GuardedPattern,
+    RegexGuard,
+    SlowMatch,
+    disable_guard,
+    enable_guard,
+    get_guard,
+)
+from .regex_lint import LintFinding, lint_pattern
+from .rule_catalog import RulePattern, all_rule_patterns, iter_rule_patterns
+
+__all__ = [
+    "BACKEND_ENV_VAR",
+    "BackendTiming",
+    "GUARD_ENV_VAR",
+    "GuardedPattern",
+    "LintFinding",
+    "PatternAudit",
+    "RE2_AVAILABLE",
+    "Re2Backend",
+    "RegexAuditor",
+    "RegexBackend",
+    "RegexGuard",
+    "RulePattern",
+    "SlowMatch",
+    "all_rule_patterns",
+    "available_backends",
+    "backend_named",
+    "benchmark_backends",
+    "compile_rule",
+    "compile_rule_field",
+    "compile_with",
+    "disable_guard",
+    "enable_guard",
+    "get_backend",
+    "get_guard",
+    "iter_rule_patterns",
+    "lint_pattern",
+    "load_corpus",
+    "pattern_features",
+    "register_backend",
+    "set_backend",
+]
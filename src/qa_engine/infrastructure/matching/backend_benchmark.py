@@ -0,0 +1,71 @@
+"""
+Regex backend benchmark.
+
+Runs every catalogued rule pattern over corpus texts once per available
+backend and reports total time, how many patterns each backend ran
+natively versus through the re fallback, and the slowest patterns.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .regex_backend import RegexBackend, available_backends, compile_with
+from .rule_catalog import RulePattern, all_rule_patterns
+
+
+@dataclass
+class BackendTiming:
+    """Benchmark result for one backend."""
+
+    backend: str
+    total_ms: float = 0.0
+    native: int = 0
+    fallback: int = 0
+    matches: int = 0
+    per_pattern: Dict[str, float] = field(default_factory=dict)
+
+    def slowest(self, count: int = 5) -> List[Tuple[str, float]]:
+        """Return the slowest patterns with their times in milliseconds."""
+        return sorted(self.per_pattern.items(), key=lambda kv: kv[1], reverse=True)[:count]
+
+
+def load_corpus(paths: Iterable[Path], suffixes: Sequence[str] = (".tex",)) -> List[str]:
+    """Read all files with the given suffixes under paths."""
+    texts = []
+    for path in paths:
+        files = [path] if path.is_file() else sorted(
+            p for p in path.rglob("*") if p.suffix in suffixes
+        )
+        for file in files:
+            texts.append(file.read_text(encoding="utf-8", errors="replace"))
+    return texts
+
+
+def benchmark_backends(
+    texts: Sequence[str],
+    patterns: Optional[Sequence[RulePattern]] = None,
+    backends: Optional[Dict[str, RegexBackend]] = None,
+) -> List[BackendTiming]:
+    """Time every pattern over every text for each backend."""
+    patterns = patterns if patterns is not None else all_rule_patterns()
+    results = []
+    for name, backend in (backends or available_backends()).items():
+        timing = BackendTiming(name)
+        for rp in patterns:
+            if backend.name == "re" or backend.supports(rp.pattern, rp.flags):
+                timing.native += 1
+            else:
+                timing.fallback += 1
+            compiled = compile_with(backend, rp.pattern, rp.flags)
+            start = time.perf_counter()
+            for text in texts:
+                timing.matches += sum(1 for _ in compiled.finditer(text))
+            elapsed = (time.perf_counter() - start) * 1000
+            timing.per_pattern[rp.label] = elapsed
+            timing.total_ms += elapsed
+        results.append(timing)
+    return results
@@ -0,0 +1,152 @@
+"""
+Regex performance auditor.
+
+Combines the static lint with adversarial fuzzing: every pattern is
+searched against inputs built from Hebrew/LaTeX seed units and the
+pattern's own literals, repeated to growing lengths and ended with a
+character that forces the match to fail. The worst time per length gives
+a growth curve; its log-log slope estimates the complexity.
+
+Growth stops as soon as one probe exceeds the time budget, so an
+exponential pattern costs at most a few budgets instead of hanging.
+Passing a linear-time backend audits the patterns as they would run
+under that engine.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional, Tuple
+
+from ...domain.models.issue import Severity
+from .regex_backend import STDLIB_BACKEND, RegexBackend, compile_with
+from .regex_lint import LintFinding, lint_pattern
+from .rule_catalog import RulePattern, iter_rule_patterns
+from .sre_compat import C, PARSER_AVAILABLE, _parser
+
+DEFAULT_LENGTHS = (8, 12, 16, 20, 24, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+SEED_UNITS = ("א", "a", "A", "1", " ", "\\", "{", "}", "$", "\\en{", "א a ", "a.")
+FAIL_SUFFIX = "\x00"
+
+# Growth slope above which a pattern counts as superlinear
+SUPERLINEAR_SLOPE = 1.5
+# Timings below this are too noisy to fit a slope
+MIN_FIT_MS = 0.05
+
+
+@dataclass
+class PatternAudit:
+    """Audit result for one pattern."""
+
+    label: str
+    pattern: str
+    findings: List[LintFinding] = field(default_factory=list)
+    curve: List[Tuple[int, float]] = field(default_factory=list)
+    worst_input: str = ""  # Input of the slowest probe overall
+    budget_exceeded: bool = False
+
+    @property
+    def worst_ms(self) -> float:
+        return max((ms for _, ms in self.curve), default=0.0)
+
+    @property
+    def slope(self) -> float:
+        """Least-squares slope of log(time) over log(length)."""
+        points = [(math.log(n), math.log(ms)) for n, ms in self.curve if ms >= MIN_FIT_MS]
+        if len(points) < 2:
+            return 0.0
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        var = sum((x - mean_x) ** 2 for x, _ in points)
+        if var == 0:
+            return 0.0
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+    @property
+    def severity(self) -> Optional[Severity]:
+        """Worst severity among measured growth and lint findings."""
+        if self.budget_exceeded:
+            return Severity.CRITICAL
+        levels = [f.severity for f in self.findings]
+        if self.slope > SUPERLINEAR_SLOPE:
+            levels.append(Severity.WARNING)
+        order = [Severity.CRITICAL, Severity.WARNING, Severity.INFO]
+        return next((s for s in order if s in levels), None)
+
+
+class RegexAuditor:
+    """Statically lints and fuzzes rule regexes."""
+
+    def __init__(
+        self,
+        lengths: Iterable[int] = DEFAULT_LENGTHS,
+        budget_ms: float = 250.0,
+        repeats: int = 3,
+        backend: RegexBackend = STDLIB_BACKEND,
+    ) -> None:
+        self._lengths = tuple(sorted(lengths))
+        self._budget_ms = budget_ms
+        self._repeats = repeats
+        self._backend = backend
+
+    def audit(self, pattern: str, flags: int = 0, label: str = "") -> PatternAudit:
+        """Lint and fuzz a single pattern."""
+        result = PatternAudit(label or pattern, pattern, lint_pattern(pattern, flags))
+        try:
+            compiled = compile_with(self._backend, pattern, flags)
+        except re.error:
+            return result
+        units = SEED_UNITS + self._literal_units(pattern, flags)
+        overall_ms = -1.0
+        for length in self._lengths:
+            worst_ms, worst_input = 0.0, ""
+            for unit in units:
+                text = (unit * (length // len(unit) + 1))[:length] + FAIL_SUFFIX
+                ms = self._time(compiled, text)
+                if ms > worst_ms:
+                    worst_ms, worst_input = ms, text
+            result.curve.append((length, worst_ms))
+            if worst_ms > overall_ms:  # The input behind worst_ms, over all lengths
+                overall_ms, result.worst_input = worst_ms, worst_input
+            if worst_ms > self._budget_ms:
+                result.budget_exceeded = True
+                break
+        return result
+
+    def audit_rules(self, patterns: Optional[Iterable[RulePattern]] = None) -> List[PatternAudit]:
+        """Audit every rule-table pattern, riskiest first."""
+        audits = [
+            self.audit(rp.pattern, rp.flags, rp.label)
+            for rp in (patterns if patterns is not None else iter_rule_patterns())
+        ]
+        rank = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2, None: 3}
+        return sorted(audits, key=lambda a: (rank[a.severity], -a.worst_ms))
+
+    def _time(self, compiled: Any, text: str) -> float:
+        """Best-of-N search time in milliseconds."""
+        best = math.inf
+        for _ in range(self._repeats):
+            start = time.perf_counter()
+            compiled.search(text)
+            best = min(best, time.perf_counter() - start)
+            if best * 1000 > self._budget_ms:
+                break
+        return best * 1000
+
+    @staticmethod
+    def _literal_units(pattern: str, flags: int) -> Tuple[str, ...]:
+        """Leading literal of the pattern, alone and followed by Hebrew text."""
+        if not PARSER_AVAILABLE:
+            return ()
+        prefix = []
+        for op, av in _parser.parse(pattern, flags):
+            if op != C.LITERAL:
+                break
+            prefix.append(chr(av))
+        if not prefix:
+            return ()
+        literal = "".join(prefix)
+        return (literal, literal + "א", literal + "a ")
@@ -0,0 +1,212 @@
+"""
+Pluggable regex backends for rule patterns.
+
+The stdlib re engine backtracks, so a bad pattern on adversarial input can
+take exponential time. A linear-time engine (RE2, via the optional
+google-re2 package) bounds matching time by input length, but it lacks
+some features. Each pattern's features are read from its parse tree; a
+pattern that needs anything the selected backend cannot do is compiled
+with re instead, so the choice of backend does not change which text
+matches. The bound covers what goes through compile_rule() and
+compile_rule_field(); patterns compiled with re directly keep backtracking.
+
+RE2's \\d, \\s, \\w and \\b are ASCII-only, while re's match Hebrew
+letters, Unicode digits and spaces such as NBSP; patterns using them are
+treated as unsupported.
+
+Select with set_backend("re2") or QA_REGEX_BACKEND=re2. If the engine is
+not installed, re is used.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from .regex_guard import get_guard
+from .sre_compat import ATOMIC_GROUP, C, PARSER_AVAILABLE, POSSESSIVE_REPEAT, _parser
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+BACKEND_ENV_VAR = "QA_REGEX_BACKEND"
+
+# Pattern features that only a backtracking engine provides
+LOOKAHEAD = "lookahead"
+LOOKBEHIND = "lookbehind"
+BACKREFERENCE = "backreference"
+CONDITIONAL = "conditional"
+ATOMIC = "atomic"
+UNICODE_WORD = "unicode-word"
+UNICODE_CLASS = "unicode-class"  # \\d, \\s and their negations
+VERBOSE = "verbose"
+UNPARSED = "unparsed"  # No stdlib parser to read features with
+
+_WORD_CATEGORIES = (C.CATEGORY_WORD, C.CATEGORY_NOT_WORD) if PARSER_AVAILABLE else ()
+_WORD_ANCHORS = (C.AT_BOUNDARY, C.AT_NON_BOUNDARY) if PARSER_AVAILABLE else ()
+_CLASS_CATEGORIES = (
+    C.CATEGORY_DIGIT, C.CATEGORY_NOT_DIGIT, C.CATEGORY_SPACE, C.CATEGORY_NOT_SPACE,
+) if PARSER_AVAILABLE else ()
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+@lru_cache(maxsize=1024)
+def pattern_features(pattern: str, flags: int = 0) -> FrozenSet[str]:
+    """Return the backtracking-only features a pattern uses."""
+    features = set()
+    if flags & re.VERBOSE or "(?x" in pattern:
+        features.add(VERBOSE)
+    if not PARSER_AVAILABLE:
+        return frozenset(features | {UNPARSED})
+    try:
+        tree = _parser.parse(pattern, flags)
+    except re.error:
+        return frozenset(features)
+    _collect(tree, features)
+    if tree.state.flags & re.ASCII:
+        features -= {UNICODE_WORD, UNICODE_CLASS}  # ASCII classes in both engines
+    return frozenset(features)
+
+
+def _collect(seq: _parser.SubPattern, features: set) -> None:
+    """Add the features used anywhere in seq."""
+    for op, av in seq:
+        if op in (C.ASSERT, C.ASSERT_NOT):
+            features.add(LOOKBEHIND if av[0] < 0 else LOOKAHEAD)
+            _collect(av[1], features)
+        elif op == C.GROUPREF:
+            features.add(BACKREFERENCE)
+        elif op == C.GROUPREF_EXISTS:
+            features.add(CONDITIONAL)
+            for branch in av[1:]:
+                if branch is not None:
+                    _collect(branch, features)
+        elif op is not None and op in (ATOMIC_GROUP, POSSESSIVE_REPEAT):
+            features.add(ATOMIC)
+            _collect(av if op == ATOMIC_GROUP else av[2], features)
+        elif op == C.CATEGORY and av in _WORD_CATEGORIES:
+            features.add(UNICODE_WORD)
+        elif op == C.CATEGORY and av in _CLASS_CATEGORIES:
+            features.add(UNICODE_CLASS)
+        elif op == C.AT and av in _WORD_ANCHORS:
+            features.add(UNICODE_WORD)
+        elif op == C.IN:
+            _collect(av, features)
+        elif op == C.SUBPATTERN:
+            _collect(av[-1], features)
+        elif op in (C.MAX_REPEAT, C.MIN_REPEAT):
+            _collect(av[2], features)
+        elif op == C.BRANCH:
+            for branch in av[1]:
+                _collect(branch, features)
+
+
+class RegexBackend:
+    """A regex engine that compiles patterns it supports."""
+
+    name = "re"
+    unsupported: FrozenSet[str] = frozenset()
+
+    def supports(self, pattern: str, flags: int = 0) -> bool:
+        """Return True if this engine can run the pattern unchanged."""
+        return not (pattern_features(pattern, flags) & self.unsupported)
+
+    def compile(self, pattern: str, flags: int = 0) -> Any:
+        """Compile a pattern; the result must offer the re.Pattern API."""
+        return re.compile(pattern, flags)
+
+
+class Re2Backend(RegexBackend):
+    """Linear-time RE2 engine (google-re2)."""
+
+    name = "re2"
+    unsupported = frozenset({
+        LOOKAHEAD, LOOKBEHIND, BACKREFERENCE, CONDITIONAL, ATOMIC, UNICODE_WORD, UNICODE_CLASS,
+        VERBOSE, UNPARSED,
+    })
+
+    def compile(self, pattern: str, flags: int = 0) -> Any:
+        inline = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+
+
+STDLIB_BACKEND = RegexBackend()
+
+_BACKENDS: Dict[str, Callable[[], Optional[RegexBackend]]] = {
+    "re": lambda: STDLIB_BACKEND,
+    "re2": lambda: Re2Backend() if RE2_AVAILABLE else None,
+}
+_active_backend: RegexBackend = STDLIB_BACKEND
+
+
+def register_backend(name: str, factory: Callable[[], Optional[RegexBackend]]) -> None:
+    """Register a backend factory; it returns None when the engine is missing."""
+    _BACKENDS[name] = factory
+
+
+def available_backends() -> Dict[str, RegexBackend]:
+    """Return the registered backends whose engines are installed."""
+    backends = {name: factory() for name, factory in _BACKENDS.items()}
+    return {name: backend for name, backend in backends.items() if backend is not None}
+
+
+def backend_named(name: str) -> RegexBackend:
+    """Return a registered backend without selecting it; re if unavailable."""
+    factory = _BACKENDS.get(name)
+    return (factory() if factory else None) or STDLIB_BACKEND
+
+
+def set_backend(name: str) -> RegexBackend:
+    """Select the backend for compile_rule(); falls back to re if unavailable."""
+    global _active_backend
+    _active_backend = backend_named(name)
+    return _active_backend
+
+
+def get_backend() -> RegexBackend:
+    """Return the backend used by compile_rule()."""
+    return _active_backend
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(backend: RegexBackend, pattern: str, flags: int) -> Any:
+    return compile_with(backend, pattern, flags)
+
+
+def compile_with(backend: RegexBackend, pattern: str, flags: int = 0) -> Any:
+    """Compile with backend when it supports the pattern, else with re."""
+    if backend is not STDLIB_BACKEND and backend.supports(pattern, flags):
+        try:
+            return backend.compile(pattern, flags)
+        except Exception:
+            pass  # Syntax the engine rejects (e.g. \\Z): use re
+    return re.compile(pattern, flags)
+
+
+def compile_rule(pattern: str, flags: int = 0, label: str = "") -> Any:
+    """Compile a rule pattern with the active backend and guard.
+
+    Compiled patterns are cached per backend, so detectors may call this
+    for every rule field of every document.
+    """
+    compiled = _compile_cached(_active_backend, pattern, flags)
+    guard = get_guard()
+    if guard is None:
+        return compiled
+    return guard.wrap(compiled, label)
+
+
+def compile_rule_field(rule_def: Dict[str, Any], field: str, rule_name: str, flags: int = 0) -> Any:
+    """compile_rule() for an optional pattern field of a rule; None if unset."""
+    pattern = rule_def.get(field)
+    return compile_rule(pattern, flags, f"{rule_name}.{field}") if pattern else None
+
+
+if os.environ.get(BACKEND_ENV_VAR):
+    set_backend(os.environ[BACKEND_ENV_VAR])
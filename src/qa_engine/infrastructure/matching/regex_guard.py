@@ -0,0 +1,153 @@
+"""
+Runtime regex guard.
+
+When enabled, rule patterns compiled through compile_rule() are wrapped so
+every invocation is timed; calls slower than the threshold are recorded
+with the rule label and the input line. When disabled (the default),
+patterns are not wrapped and cost nothing extra.
+
+Enable with enable_guard() or the QA_REGEX_GUARD_MS environment variable.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Iterator, List, Optional
+
+GUARD_ENV_VAR = "QA_REGEX_GUARD_MS"
+
+
+@dataclass(frozen=True)
+class SlowMatch:
+    """One pattern invocation that exceeded the guard threshold."""
+
+    label: str
+    pattern: str
+    method: str
+    elapsed_ms: float
+    line: str
+
+
+class RegexGuard:
+    """Collects slow pattern invocations above a time threshold."""
+
+    def __init__(self, threshold_ms: float = 50.0, max_line: int = 200) -> None:
+        self.threshold_ms = threshold_ms
+        self._max_line = max_line
+        self._records: List[SlowMatch] = []
+        self._lock = Lock()
+
+    def wrap(self, compiled: Any, label: str = "") -> GuardedPattern:
+        """Wrap a compiled pattern so its calls are timed."""
+        return GuardedPattern(compiled, self, label)
+
+    def record(self, pattern: GuardedPattern, method: str, elapsed: float, text: str) -> None:
+        """Record a call if it ran longer than the threshold."""
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms < self.threshold_ms:
+            return
+        slow = SlowMatch(
+            pattern.label, pattern.pattern, method, elapsed_ms, text[:self._max_line]
+        )
+        with self._lock:
+            self._records.append(slow)
+
+    @property
+    def records(self) -> List[SlowMatch]:
+        """Slow invocations recorded so far, slowest first."""
+        with self._lock:
+            return sorted(self._records, key=lambda r: r.elapsed_ms, reverse=True)
+
+    def clear(self) -> None:
+        """Drop all recorded invocations."""
+        with self._lock:
+            self._records.clear()
+
+
+class GuardedPattern:
+    """Compiled-pattern proxy that reports slow calls to a RegexGuard."""
+
+    def __init__(self, compiled: Any, guard: RegexGuard, label: str) -> None:
+        self._compiled = compiled
+        self._guard = guard
+        self.label = label or compiled.pattern
+
+    @property
+    def pattern(self) -> str:
+        return self._compiled.pattern
+
+    @property
+    def flags(self) -> int:
+        return self._compiled.flags
+
+    def _timed(self, method: str, text: str, *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return getattr(self._compiled, method)(text, *args, **kwargs)
+        finally:
+            self._guard.record(self, method, time.perf_counter() - start, text)
+
+    def search(self, text: str, *args: Any) -> Optional[re.Match]:
+        return self._timed("search", text, *args)
+
+    def match(self, text: str, *args: Any) -> Optional[re.Match]:
+        return self._timed("match", text, *args)
+
+    def fullmatch(self, text: str, *args: Any) -> Optional[re.Match]:
+        return self._timed("fullmatch", text, *args)
+
+    def findall(self, text: str, *args: Any) -> list:
+        return self._timed("findall", text, *args)
+
+    def sub(self, repl: Any, text: str, count: int = 0) -> str:
+        start = time.perf_counter()
+        try:
+            return self._compiled.sub(repl, text, count)
+        finally:
+            self._guard.record(self, "sub", time.perf_counter() - start, text)
+
+    def finditer(self, text: str, *args: Any) -> Iterator[re.Match]:
+        """Yield matches; time spent inside the regex engine is summed."""
+        iterator = self._compiled.finditer(text, *args)
+        elapsed = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    match = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                yield match
+        finally:
+            self._guard.record(self, "finditer", elapsed, text)
+
+
+_active_guard: Optional[RegexGuard] = None
+
+
+def enable_guard(threshold_ms: float = 50.0) -> RegexGuard:
+    """Turn on guard mode for patterns compiled from now on."""
+    global _active_guard
+    _active_guard = RegexGuard(threshold_ms)
+    return _active_guard
+
+
+def disable_guard() -> None:
+    """Turn off guard mode."""
+    global _active_guard
+    _active_guard = None
+
+
+def get_guard() -> Optional[RegexGuard]:
+    """Return the active guard, if guard mode is on."""
+    return _active_guard
+
+
+if os.environ.get(GUARD_ENV_VAR):
+    enable_guard(float(os.environ[GUARD_ENV_VAR]))
@@ -0,0 +1,191 @@
+"""
+Static backtracking lint for rule regexes.
+
+Parses a pattern with the stdlib regex parser and flags constructs that
+let the backtracking engine try exponentially or polynomially many paths:
+
+- nested-quantifier:       (a+)+, (\\s*\\w+)*
+- overlapping-alternation: (\\w|\\d)+
+- adjacent-wildcards:      .*.*, [^}]*[a-z]+ (overlapping unbounded neighbours)
+- dotall-lazy-span:        .*? under DOTALL (rescans to end of input per start)
+
+Character overlap is decided on a probe alphabet of printable ASCII,
+whitespace and Hebrew letters, which covers everything the rules match.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional
+
+from ...domain.models.issue import Severity
+from .sre_compat import C, PARSER_AVAILABLE, _parser
+
+_REPEATS = (C.MAX_REPEAT, C.MIN_REPEAT) if PARSER_AVAILABLE else ()
+PROBE_ALPHABET = "".join(chr(c) for c in range(32, 127)) + "\t\nאבגדהוזחטיכלמנסעפצקרשת"
+_ALL = frozenset(PROBE_ALPHABET)
+_CATEGORIES = {} if not PARSER_AVAILABLE else {
+    C.CATEGORY_DIGIT: str.isdigit,
+    C.CATEGORY_SPACE: str.isspace,
+    C.CATEGORY_WORD: lambda ch: ch.isalnum() or ch == "_",
+    C.CATEGORY_NOT_DIGIT: lambda ch: not ch.isdigit(),
+    C.CATEGORY_NOT_SPACE: lambda ch: not ch.isspace(),
+    C.CATEGORY_NOT_WORD: lambda ch: not (ch.isalnum() or ch == "_"),
+}
+
+
+@dataclass(frozen=True)
+class LintFinding:
+    """One risky construct found in a pattern."""
+
+    code: str
+    message: str
+    severity: Severity
+
+
+def lint_pattern(pattern: str, flags: int = 0) -> List[LintFinding]:
+    """Return risky constructs in pattern (none without the stdlib parser)."""
+    if not PARSER_AVAILABLE:
+        return []
+    try:
+        tree = _parser.parse(pattern, flags)
+    except Exception:
+        return [LintFinding("invalid-pattern", "pattern does not compile", Severity.CRITICAL)]
+    findings: List[LintFinding] = []
+    _walk(tree, findings, bool(tree.state.flags & C.SRE_FLAG_DOTALL))
+    return list(dict.fromkeys(findings))
+
+
+def _walk(seq: _parser.SubPattern, findings: List[LintFinding], dotall: bool) -> None:
+    """Visit a sequence, checking each repeat and recursing into groups."""
+    items = list(seq)
+    for i, (op, av) in enumerate(items):
+        if op in _REPEATS:
+            _, high, body = av
+            if high == C.MAXREPEAT:
+                _check_repeat(op, body, items[i + 1:i + 2], findings, dotall)
+            _walk(body, findings, dotall)
+        elif op == C.SUBPATTERN:
+            _walk(av[-1], findings, dotall)
+        elif op in (C.ASSERT, C.ASSERT_NOT):
+            _walk(av[1], findings, dotall)
+        elif op == C.BRANCH:
+            for branch in av[1]:
+                _walk(branch, findings, dotall)
+
+
+def _check_repeat(op, body, after: list, findings: List[LintFinding], dotall: bool) -> None:
+    """Run all checks that apply to one unbounded repeat."""
+    node = _unwrap(body)
+    if dotall and op == C.MIN_REPEAT and node is not None and node[0] == C.ANY:
+        findings.append(LintFinding(
+            "dotall-lazy-span", "lazy .*? under DOTALL rescans the input for every start",
+            Severity.INFO,
+        ))
+    if node is not None and node[0] == C.BRANCH:
+        alternatives = node[1][1]
+        if any(_is_bare_repeat(alt) for alt in alternatives) or _branches_overlap(alternatives):
+            findings.append(LintFinding(
+                "overlapping-alternation", "repeated alternation with overlapping branches",
+                Severity.WARNING,
+            ))
+    elif _has_ambiguous_inner_repeat(_sequence(body)):
+        findings.append(LintFinding(
+            "nested-quantifier", "quantifier nested inside an unbounded quantifier",
+            Severity.CRITICAL,
+        ))
+    if after and after[0][0] in _REPEATS and after[0][1][1] == C.MAXREPEAT:
+        if _first_set(body) & _first_set(after[0][1][2]):
+            findings.append(LintFinding(
+                "adjacent-wildcards", "adjacent unbounded quantifiers match the same characters",
+                Severity.WARNING,
+            ))
+
+
+def _has_ambiguous_inner_repeat(items: list) -> bool:
+    """True if a repeated item is not fenced off by a disjoint mandatory item."""
+    for i, (op, av) in enumerate(items):
+        if op not in _REPEATS or av[1] <= 1:
+            continue
+        inner = _first_set(av[2])
+        fences = [
+            _first_set(_parser.SubPattern(None, [item]))
+            for j, item in enumerate(items)
+            if j != i and _is_mandatory(item)
+        ]
+        if not any(not (fence & inner) for fence in fences):
+            return True
+    return False
+
+
+def _branches_overlap(alternatives: list) -> bool:
+    """True if two alternatives can start with the same character."""
+    firsts = [_first_set(alt) for alt in alternatives]
+    return any(a & b for i, a in enumerate(firsts) for b in firsts[i + 1:])
+
+
+def _is_bare_repeat(seq: _parser.SubPattern) -> bool:
+    """True for an alternative that is just X+ or X*."""
+    items = _sequence(seq)
+    return len(items) == 1 and items[0][0] in _REPEATS and items[0][1][1] > 1
+
+
+def _is_mandatory(item: tuple) -> bool:
+    """True for an item that always consumes at least one character."""
+    op, av = item
+    if op in _REPEATS:
+        return av[0] > 0
+    return op in (C.LITERAL, C.NOT_LITERAL, C.IN, C.ANY)
+
+
+def _sequence(seq: _parser.SubPattern) -> list:
+    """Return the items of seq with a single wrapping group removed."""
+    items = list(seq)
+    while len(items) == 1 and items[0][0] == C.SUBPATTERN:
+        items = list(items[0][1][-1])
+    return items
+
+
+def _unwrap(seq: _parser.SubPattern) -> Optional[tuple]:
+    """Return the single (op, av) node inside seq, or None."""
+    items = _sequence(seq)
+    return items[0] if len(items) == 1 else None
+
+
+def _first_set(seq: _parser.SubPattern) -> FrozenSet[str]:
+    """Approximate the probe characters a sequence can start with."""
+    for op, av in seq:
+        if op == C.LITERAL:
+            return frozenset({chr(av)})
+        if op == C.NOT_LITERAL:
+            return _ALL - {chr(av)}
+        if op == C.ANY:
+            return _ALL
+        if op == C.IN:
+            return frozenset(ch for ch in PROBE_ALPHABET if _in_class(av, ch))
+        if op == C.SUBPATTERN:
+            return _first_set(av[-1])
+        if op in _REPEATS:
+            return _first_set(av[2]) if av[0] > 0 else _ALL
+        if op == C.BRANCH:
+            return frozenset().union(*(_first_set(alt) for alt in av[1]))
+        if op in (C.AT, C.ASSERT, C.ASSERT_NOT):
+            continue
+        return _ALL
+    return _ALL
+
+
+def _in_class(items: list, ch: str) -> bool:
+    """Evaluate a parsed character class against one character."""
+    negate = False
+    hit = False
+    for op, av in items:
+        if op == C.NEGATE:
+            negate = True
+        elif op == C.LITERAL:
+            hit = hit or ch == chr(av)
+        elif op == C.RANGE:
+            hit = hit or av[0] <= ord(ch) <= av[1]
+        elif op == C.CATEGORY:
+            hit = hit or _CATEGORIES.get(av, lambda _: True)(ch)
+    return hit != negate
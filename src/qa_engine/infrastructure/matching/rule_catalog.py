@@ -0,0 +1,103 @@
+"""
+Catalog of every regex used by the rule tables.
+
+Walks each *_RULES dict and yields one entry per pattern field
+("pattern", "context_pattern", "exclude_pattern", ...), each plain
+name -> regex table, and the class-level patterns of validators that
+scan whole documents.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterator, List
+
+from .regex_backend import pattern_features
+
+# Rule fields compiled with DOTALL by their detector
+DOTALL_FIELDS = {("CAPTION_LENGTH_RULES", "pattern")}
+
+
+@dataclass(frozen=True)
+class RulePattern:
+    """One regex from a rule table."""
+
+    table: str
+    rule: str
+    field: str
+    pattern: str
+    flags: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.table}.{self.rule}.{self.field}"
+
+    @property
+    def features(self) -> FrozenSet[str]:
+        """Backtracking-only features that pin this pattern to re."""
+        return pattern_features(self.pattern, self.flags)
+
+
+def load_rule_tables() -> Dict[str, Dict]:
+    """Import all rule tables (lazily, to keep import order free of cycles)."""
+    from ..detection.bib_rules import BIB_RULES
+    from ..detection.bidi_rules import BIDI_RULES
+    from ..detection.caption_length_rules import CAPTION_LENGTH_RULES
+    from ..detection.cls_sync_rules import CLS_SYNC_RULES
+    from ..detection.code_rules import CODE_RULES
+    from ..detection.coverpage_rules import COVERPAGE_RULES
+    from ..detection.heb_math_rules import HEB_MATH_RULES
+    from ..detection.image_rules import IMAGE_RULES
+    from ..detection.subfiles_rules import SUBFILES_RULES
+    from ..detection.table_rules import TABLE_RULES
+    from ..detection.toc_rules import L_AT_BLOCK_RULES, TOC_RULES
+    from ...typeset.detection.mdframed_rules import LOG_PATTERNS, SOURCE_PATTERNS
+    from ...typeset.detection.orphan_rules import SECTION_PATTERNS
+
+    return {
+        "BIB_RULES": BIB_RULES,
+        "BIDI_RULES": BIDI_RULES,
+        "CAPTION_LENGTH_RULES": CAPTION_LENGTH_RULES,
+        "CLS_SYNC_RULES": CLS_SYNC_RULES,
+        "CODE_RULES": CODE_RULES,
+        "COVERPAGE_RULES": COVERPAGE_RULES,
+        "HEB_MATH_RULES": HEB_MATH_RULES,
+        "IMAGE_RULES": IMAGE_RULES,
+        "L_AT_BLOCK_RULES": L_AT_BLOCK_RULES,
+        "MDFRAMED_LOG_PATTERNS": LOG_PATTERNS,
+        "MDFRAMED_SOURCE_PATTERNS": SOURCE_PATTERNS,
+        "ORPHAN_SECTION_PATTERNS": SECTION_PATTERNS,
+        "SUBFILES_RULES": SUBFILES_RULES,
+        "TABLE_RULES": TABLE_RULES,
+        "TOC_RULES": TOC_RULES,
+    }
+
+
+def _validator_patterns() -> Iterator[RulePattern]:
+    """Yield compiled class-level patterns of document validators."""
+    from ..validation.image_validator import ImageValidator
+
+    for name, value in vars(ImageValidator).items():
+        if isinstance(value, re.Pattern):
+            yield RulePattern("ImageValidator", name, "pattern", value.pattern, value.flags)
+
+
+def iter_rule_patterns() -> Iterator[RulePattern]:
+    """Yield every string pattern field of every rule table."""
+    for table, rules in load_rule_tables().items():
+        for rule, rule_def in rules.items():
+            if isinstance(rule_def, str):
+                # Plain name -> regex pattern tables
+                yield RulePattern(table, rule, "pattern", rule_def)
+                continue
+            for field, value in rule_def.items():
+                if field.endswith("pattern") and isinstance(value, str) and value:
+                    flags = re.DOTALL if (table, field) in DOTALL_FIELDS else 0
+                    yield RulePattern(table, rule, field, value, flags)
+    yield from _validator_patterns()
+
+
+def all_rule_patterns() -> List[RulePattern]:
+    """Return the full pattern catalog as a list."""
+    return list(iter_rule_patterns())
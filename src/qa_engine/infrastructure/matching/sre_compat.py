@@ -0,0 +1,33 @@
+"""
+Access to the stdlib regex parser.
+
+Pattern features, the lint and the auditor read parse trees from the
+stdlib parser, which Python 3.11 moved to the private re._parser and
+re._constants; older versions have sre_parse and sre_constants. When
+neither can be imported, PARSER_AVAILABLE is False and the tools degrade
+instead of failing: every pattern runs on re and nothing is linted.
+Opcodes newer than the running Python are None, so they never match.
+"""
+
+from __future__ import annotations
+
+import warnings
+
+try:
+    from re import _constants as C
+    from re import _parser
+except ImportError:  # Python < 3.11
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            import sre_constants as C  # type: ignore[no-redef]
+            import sre_parse as _parser  # type: ignore[no-redef]
+    except ImportError:
+        C = _parser = None  # type: ignore[assignment]
+
+PARSER_AVAILABLE = _parser is not None
+
+ATOMIC_GROUP = getattr(C, "ATOMIC_GROUP", None)
+POSSESSIVE_REPEAT = getattr(C, "POSSESSIVE_REPEAT", None)
+
+__all__ = ["ATOMIC_GROUP", "C", "PARSER_AVAILABLE", "POSSESSIVE_REPEAT", "_parser"]
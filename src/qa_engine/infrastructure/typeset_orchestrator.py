@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from ..typeset.detection import FullTypesetDetector, TypesetDetectResult
+from ..typeset.detection import FullTypesetDetector, TypesetDetectResult, is_source_file
 from ..typeset.fixing import HboxFixer, HboxFixResult, VboxFixer, VboxFixResult
 from ..infrastructure.fixing.float_fixer import FloatFixer, FloatFixResult
 
@@ -77,6 +77,8 @@ class TypesetOrchestrator:
     def __init__(self, project_root: Optional[Path] = None) -> None:
         self.project_root = project_root or Path.cwd()
         self.detector = FullTypesetDetector(project_root=self.project_root)
+        from ..infrastructure.detection.typeset_detector import TypesetDetector
+        self.basic_detector = TypesetDetector()
         self.hbox_fixer = HboxFixer()
         self.vbox_fixer = VboxFixer()
         self.float_fixer = FloatFixer()
@@ -94,6 +96,16 @@ class TypesetOrchestrator:
         result = self._apply_fixes(tex_content, file_path, result)
         return result
 
+    def run_log(self, log_path: Path, tex_content: str = "", file_path: str = "",
+                apply_fixes: bool = True) -> TypesetOrchestratorResult:
+        """Run with detection from a log file, parsed once per change (detector.log_cache)."""
+        result = TypesetOrchestratorResult(fixed_content=tex_content)
+        result.detect_result = self.detector.log_cache.detect(log_path)
+        result.verdict = result.detect_result.verdict
+        if not apply_fixes or result.total_detected == 0:
+            return result
+        return self._apply_fixes(tex_content, file_path, result, Path(log_path).parent)
+
     def run_from_files(self, log_path: Path, tex_path: Path, apply_fixes: bool = True,
                        preamble_path: Optional[Path] = None) -> TypesetOrchestratorResult:
         """Run from file paths."""
@@ -108,16 +120,14 @@ class TypesetOrchestrator:
         result.verdict = result.detect_result.verdict if result.detect_result else "PASS"
         if not apply_fixes or result.total_detected == 0:
             return result
-        result = self._apply_fixes(tex_content, str(tex_path), result)
+        result = self._apply_fixes(tex_content, str(tex_path), result, log_path.parent)
         if result.fixed_content != tex_content:
             tex_path.write_text(result.fixed_content, encoding="utf-8")
         return result
 
     def _detect(self, log_content: str, file_path: str) -> TypesetDetectResult:
         """Run detection phase."""
-        from ..infrastructure.detection.typeset_detector import TypesetDetector
-        basic_detector = TypesetDetector()
-        issues = basic_detector.detect(log_content, file_path)
+        issues = self.basic_detector.detect(log_content, file_path)
         # Convert to TypesetDetectResult
         result = TypesetDetectResult(log_file=file_path)
         for issue in issues:
@@ -174,15 +184,19 @@ class TypesetOrchestrator:
         m = re.search(r"badness (\d+)", content)
         return int(m.group(1)) if m else 0
 
-    def _apply_fixes(self, content: str, file_path: str,
-                     result: TypesetOrchestratorResult) -> TypesetOrchestratorResult:
-        """Apply all fixes."""
+    def _apply_fixes(self, content: str, file_path: str, result: TypesetOrchestratorResult,
+                     compile_dir: Optional[Path] = None) -> TypesetOrchestratorResult:
+        """Apply all fixes; log file names are resolved against compile_dir (the log's directory)."""
         fixed = content
         dr = result.detect_result
+
+        def is_source(name: str) -> bool:
+            return is_source_file(name, file_path, compile_dir, self.project_root)
+
         # Hbox fixes
         if dr and (dr.overfull_hbox or dr.underfull_hbox):
-            issues = [{"line": w.lines[0] if w.lines else 0, "type": w.type}
-                      for w in dr.overfull_hbox + dr.underfull_hbox if w.lines]
+            issues = [issue for name, grouped in dr.hbox_issues_by_file().items()
+                      if is_source(name) for issue in grouped]
             fixed, result.hbox_result = self.hbox_fixer.fix_content(fixed, file_path, issues)
             for r in result.hbox_result.manual_review:
                 result.llm_prompts.append(self.hbox_fixer.generate_llm_prompt(r))
@@ -190,7 +204,8 @@ class TypesetOrchestrator:
         if dr and (dr.overfull_vbox or dr.underfull_vbox):
             fixed, result.vbox_result = self.vbox_fixer.fix_preamble(fixed, file_path)
             for vb in dr.underfull_vbox:
-                review = self.vbox_fixer.create_review(file_path, 0, "underfull", vb.badness)
+                line = vb.lines[0] if vb.lines and vb.file and is_source(vb.file) else 0
+                review = self.vbox_fixer.create_review(file_path, line, "underfull", vb.badness)
                 if result.vbox_result:
                     result.vbox_result.manual_review.append(review)
                     result.llm_prompts.append(self.vbox_fixer.generate_llm_prompt(review))
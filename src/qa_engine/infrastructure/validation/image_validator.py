@@ -3,7 +3,14 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..indexing import FloatInventory
+from ..indexing.pdf_structure import PdfStructure, pdf_structure_cache
+from ..indexing.project_files import file_lookup, parse_graphicspath
+from ..indexing.synctex import synctex_cache
+
+EPS_CONVERTED = "-eps-converted-to"  # epstopdf's suffix for converted EPS figures
 
 @dataclass
 class FigureComparison:
@@ -37,17 +44,16 @@ class ImageValidator:
     - Verify includegraphics paths resolve
     - Compare before/after issue counts
 
-    PDF-level validation (LLM required):
-    - Visual verification of rendered images
-    - Empty box detection in PDF
+    PDF-level validation (validate_pdf):
+    - Figures drawn in the compiled PDF, from its page structure
+    - Visual verification of rendered images still needs an LLM
     """
     INCLUDEGRAPHICS = re.compile(r'\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}')
-    FIGURE_ENV = re.compile(r'\\begin\{figure\}.*?\\end\{figure\}', re.DOTALL)
-    CAPTION = re.compile(r'\\caption\{([^}]+)\}')
 
     def __init__(self, project_root: Optional[Path] = None):
         """Initialize validator with project root."""
         self.project_root = Path(project_root) if project_root else Path.cwd()
+        self._index_root = project_root
         self._before_state: Dict[int, str] = {}
 
     def record_before_state(self, issues: List[Dict]) -> None:
@@ -65,11 +71,14 @@ class ImageValidator:
         # Find all includegraphics commands
         figures = self._find_figures(content)
         result.figures_verified = len(figures)
+        files = file_lookup(self._index_root)
+        graphicspath = parse_graphicspath(content)
 
         # Check each figure
         for fig_num, (img_path, caption) in enumerate(figures, 1):
             before = self._before_state.get(fig_num, "UNKNOWN")
-            after = "RENDERED" if self._image_exists(img_path, dir_path) else "MISSING"
+            found = files.find_graphic(img_path, dir_path, graphicspath)
+            after = "RENDERED" if found else "MISSING"
 
             result.comparison.append(FigureComparison(figure=fig_num, before=before, after=after))
             if after == "MISSING":
@@ -78,6 +87,46 @@ class ImageValidator:
 
         return result
 
+    def validate_pdf(self, content: str, pdf_path: Path, source_dir: Optional[Path] = None,
+                     source_path: Optional[Path] = None) -> ValidationResult:
+        """Check the figures of content against what the compiled PDF draws.
+
+        PDF figures are matched by file name (/PTEX.FileName, EPS ones by
+        their converted name), raster ones by the count of distinct image
+        objects since their images carry no name; an image drawn on
+        several pages, like a logo, is not a figure. With source_path and
+        a SyncTeX file next to the PDF, only pages typeset from that
+        source count. A shortfall that cannot be pinned to figures is
+        UNVERIFIED. Without a readable PDF every figure is MISSING.
+        """
+        result = ValidationResult()
+        figures = self._find_figures(content)
+        result.figures_verified = len(figures)
+        structure = pdf_structure_cache().scan(pdf_path)
+        pages = _source_pages(pdf_path, source_path) if source_path else None
+        included, drawn = _drawn(structure, pages) if structure else (set(), 0)
+        files, graphicspath = file_lookup(self._index_root), parse_graphicspath(content)
+        status: Dict[int, str] = {}
+        rasters = []
+        for fig_num, (img_path, _) in enumerate(figures, 1):
+            found = files.find_graphic(img_path, source_dir or self.project_root, graphicspath)
+            if _graphic_stem(img_path) in included:
+                status[fig_num] = "RENDERED"
+            elif Path(found or img_path).suffix.lower() in (".pdf", ".eps"):
+                status[fig_num] = "MISSING"
+            else:
+                rasters.append(fig_num)
+        raster_status = "RENDERED" if drawn >= len(rasters) else "MISSING" if drawn == 0 else "UNVERIFIED"
+        status.update((fig_num, raster_status) for fig_num in rasters)
+        for fig_num in sorted(status):
+            after = status[fig_num]
+            result.comparison.append(FigureComparison(fig_num, self._before_state.get(fig_num, "UNKNOWN"), after))
+            if after != "RENDERED":
+                result.all_rendered = False
+            if after == "MISSING":
+                result.still_missing.append(fig_num)
+        return result
+
     def validate_content(self, content: str, before_issues: List[Dict] = None,
                         source_dir: Optional[Path] = None) -> ValidationResult:
         """Full validation: record before state and validate after."""
@@ -88,32 +137,21 @@ class ImageValidator:
     def _find_figures(self, content: str) -> List[Tuple[str, str]]:
         """Find all figures with their image paths and captions."""
         figures = []
-        for match in self.FIGURE_ENV.finditer(content):
-            fig_content = match.group(0)
-            img_match = self.INCLUDEGRAPHICS.search(fig_content)
-            cap_match = self.CAPTION.search(fig_content)
-            if img_match:
-                img_path = img_match.group(1)
-                caption = cap_match.group(1)[:50] if cap_match else ""
+        inventory = FloatInventory(content, ("figure",))
+        for figure in inventory.floats():
+            if figure.graphics:
+                img_path = figure.graphics[0].path
+                caption = figure.caption.text[:50] if figure.caption else ""
                 figures.append((img_path, caption))
         # Also find standalone includegraphics
-        for match in self.INCLUDEGRAPHICS.finditer(content):
-            img_path = match.group(1)
-            if not any(img_path == f[0] for f in figures):
-                figures.append((img_path, ""))
+        for graphic in inventory.graphics:
+            if not any(graphic.path == f[0] for f in figures):
+                figures.append((graphic.path, ""))
         return figures
 
     def _image_exists(self, img_path: str, source_dir: Path) -> bool:
         """Check if image file exists in common locations."""
-        search_paths = [
-            source_dir / img_path, source_dir / "images" / img_path,
-            source_dir / "figures" / img_path, self.project_root / img_path,
-            self.project_root / "images" / img_path,
-        ]
-        if not Path(img_path).suffix:
-            for ext in [".png", ".jpg", ".jpeg", ".pdf"]:
-                search_paths.extend([p.with_suffix(ext) for p in search_paths[:5]])
-        return any(p.exists() for p in search_paths)
+        return file_lookup(self._index_root).find_graphic(img_path, source_dir) is not None
 
     def to_dict(self, result: ValidationResult) -> Dict:
         """Convert result to dictionary matching skill.md output format."""
@@ -123,3 +161,36 @@ class ImageValidator:
             "comparison": [{"figure": c.figure, "before": c.before, "after": c.after} for c in result.comparison],
             "still_missing": result.still_missing
         }
+
+
+def _graphic_stem(name: str) -> str:
+    """File stem as figures and the PDF name it, without the EPS conversion suffix."""
+    return Path(name).stem.lower().removesuffix(EPS_CONVERTED)
+
+
+def _source_pages(pdf_path: Path, source_path: Path) -> Optional[Set[int]]:
+    """Pages typeset from source_path per the PDF's SyncTeX file; None if unknown."""
+    index = synctex_cache().index(pdf_path)
+    name = index.resolve(source_path) if index else None
+    if name is None:
+        return None
+    return {page for page in index.pages if name in index.source_range(page)}
+
+
+def _drawn(structure: PdfStructure, pages: Optional[Set[int]]) -> Tuple[Set[str], int]:
+    """Stems of included files and the number of raster figures on pages (all if None).
+
+    Raster images are counted once per image object; objects drawn on
+    more than one page, or also outside pages, are decoration.
+    """
+    included: Set[str] = set()
+    drawn_on: Dict[Any, Set[int]] = {}
+    for page in structure.pages:
+        if pages is None or page.number in pages:
+            included.update(_graphic_stem(name) for name in page.included_files)
+        for image in page.images:
+            if not image.included_file:
+                key = image.object or (image.name, image.width, image.height, image.length)
+                drawn_on.setdefault(key, set()).add(page.number)
+    count = sum(1 for on in drawn_on.values() if len(on) == 1 and (pages is None or on <= pages))
+    return included, count
@@ -11,13 +11,13 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ...infrastructure.indexing import TableIndex
 from .table_models import TableAnalysis, FancyDetectResult
 
 
 class FancyTableDetector:
     """Detects plain/broken tables without proper RTL styling."""
 
-    TABULAR_START, RTLTABULAR_START = r"\\begin\{tabular\}", r"\\begin\{rtltabular\}"
     TABLE_ENV_START, HEBREWTABLE_ENV_START = r"\\begin\{table\}", r"\\begin\{hebrewtable\}"
     TABLE_LABEL = r"\\label\{([^}]+)\}"
     COLUMN_SPEC_SIMPLE = r"\\begin\{(?:tabular|rtltabular)\}\{[|lcrLCR]+\}"
@@ -50,7 +50,7 @@ class FancyTableDetector:
         result, tables = FancyDetectResult(), self._find_tables(content)
         result.tables_scanned = len(tables)
         for table in tables:
-            analysis = self._analyze_table(table, content, file_path)
+            analysis = self._analyze_table(table, file_path)
             if analysis.classification == "PLAIN":
                 result.plain_tables_found += 1
                 result.issues.append(analysis)
@@ -62,36 +62,26 @@ class FancyTableDetector:
         return result
 
     def _find_tables(self, content: str) -> List[Dict]:
-        tables, lines = [], content.split("\n")
-        for line_num, line in enumerate(lines, 1):
-            if re.search(self.TABULAR_START, line) or re.search(self.RTLTABULAR_START, line):
-                tc = self._extract_table_content(lines, line_num - 1)
-                lbl = (m := re.search(self.TABLE_LABEL, tc)) and m.group(1) or ""
-                in_hebrewtable = self._in_hebrewtable(line_num, content)
-                in_table = self._in_table_env(line_num, content)
-                in_english = self._in_english_env(line_num, content)
-                tables.append({"line": line_num, "content": tc, "label": lbl,
-                               "is_rtltabular": bool(re.search(self.RTLTABULAR_START, line)),
-                               "in_hebrewtable": in_hebrewtable, "in_table": in_table,
-                               "in_english": in_english})
+        tables, index = [], TableIndex(content, ("tabular", "rtltabular"))
+        hebrew_doc = self._is_hebrew_document(content)
+        for table in index.tables():
+            tc = table.raw_content
+            lbl = (m := re.search(self.TABLE_LABEL, tc)) and m.group(1) or ""
+            envs = {node.name for node in index.tree.ancestors(table.start)}
+            tables.append({"line": table.start_line + 1, "content": tc, "label": lbl,
+                           "is_rtltabular": table.environment == "rtltabular",
+                           "in_hebrewtable": "hebrewtable" in envs, "in_table": "table" in envs,
+                           "in_english": "english" in envs, "hebrew_document": hebrew_doc})
         return tables
 
-    def _extract_table_content(self, lines: List[str], start_idx: int) -> str:
-        result = []
-        for i in range(start_idx, min(start_idx + 50, len(lines))):
-            result.append(lines[i])
-            if r"\end{tabular}" in lines[i] or r"\end{rtltabular}" in lines[i]:
-                break
-        return "\n".join(result)
-
-    def _analyze_table(self, table: Dict, full_content: str, file_path: str) -> TableAnalysis:
+    def _analyze_table(self, table: Dict, file_path: str) -> TableAnalysis:
         """Analyze a single table for issues."""
-        problems = self._find_problems(table, full_content)
+        problems = self._find_problems(table)
         return TableAnalysis(file=file_path, line=table["line"], table_label=table["label"],
                              classification=self._classify(problems), problems=problems,
                              severity=self._determine_severity(problems))
 
-    def _find_problems(self, table: Dict, full_content: str) -> List[str]:
+    def _find_problems(self, table: Dict) -> List[str]:
         """Find all problems in a table."""
         problems, content, is_rtl = [], table["content"], table["is_rtltabular"]
         in_hebrewtable = table.get("in_hebrewtable", False)
@@ -104,7 +94,7 @@ class FancyTableDetector:
             if not is_rtl:
                 problems.append("uses_tabular_not_rtltabular")
             # Check for wrong table environment (table instead of hebrewtable in Hebrew doc)
-            if in_table and not in_hebrewtable and self._is_hebrew_document(full_content):
+            if in_table and not in_hebrewtable and table.get("hebrew_document", False):
                 problems.append("uses_table_not_hebrewtable")
             if re.search(self.COLUMN_SPEC_SIMPLE, content) and not re.search(self.COLUMN_SPEC_P, content):
                 problems.append("uses_c_columns_not_p")
@@ -132,36 +122,6 @@ class FancyTableDetector:
                 break
         return False
 
-    def _in_hebrewtable(self, line_num: int, content: str) -> bool:
-        """Check if inside hebrewtable environment."""
-        lines = content.split("\n")
-        for i in range(line_num - 1, max(0, line_num - 20), -1):
-            if r"\begin{hebrewtable}" in lines[i]:
-                return True
-            if r"\end{hebrewtable}" in lines[i]:
-                return False
-        return False
-
-    def _in_table_env(self, line_num: int, content: str) -> bool:
-        """Check if inside table environment (not hebrewtable)."""
-        lines = content.split("\n")
-        for i in range(line_num - 1, max(0, line_num - 20), -1):
-            if r"\begin{table}" in lines[i]:
-                return True
-            if r"\end{table}" in lines[i]:
-                return False
-        return False
-
-    def _in_english_env(self, line_num: int, content: str) -> bool:
-        """Check if inside english environment."""
-        lines = content.split("\n")
-        for i in range(line_num - 1, max(0, line_num - 30), -1):
-            if r"\begin{english}" in lines[i]:
-                return True
-            if r"\end{english}" in lines[i]:
-                return False
-        return False
-
     def _has_header_color(self, content: str) -> bool:
         """Check if table has header row with blue background color."""
         return bool(re.search(self.ROWCOLOR_HEADER, content))
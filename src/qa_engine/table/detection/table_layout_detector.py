@@ -11,6 +11,7 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ...infrastructure.indexing import TableIndex
 from .table_models import TableIssue, TableDetectResult
 
 
@@ -54,7 +55,7 @@ class TableLayoutDetector:
     def detect_content(self, content: str, file_path: str) -> TableDetectResult:
         """Detect table issues in content string."""
         result = TableDetectResult()
-        tables = self._discover_tables(content)
+        tables = self._discover_tables(content, TableIndex(content, ("tabular", "rtltabular")))
         result.tables_found = len(tables)
 
         for table_num, table_info in enumerate(tables, 1):
@@ -84,9 +85,13 @@ class TableLayoutDetector:
             result.cell_alignment_issues += cell_count
         return issues
 
-    def _discover_tables(self, content: str) -> List[Dict]:
+    def _discover_tables(self, content: str, index: TableIndex) -> List[Dict]:
         """Phase 1: Discover all tables in content."""
         tables, lines = [], content.split("\n")
+        hebrew_doc = bool(re.search(r"[א-ת]", content))
+        first_env: Dict[int, int] = {}
+        for node in index.tree.nodes("table", "tabular", "rtltabular"):
+            first_env.setdefault(index.tree.line_of(node.start), index.tree.line_of(node.end))
         for line_num, line in enumerate(lines, 1):
             if re.search(self.TABLE_ENV, line):
                 caption = ""
@@ -95,28 +100,30 @@ class TableLayoutDetector:
                     if cap_match:
                         caption = cap_match.group(1)
                         break
-                tables.append({"line": line_num, "caption": caption, "env_line": line})
+                end_line = first_env.get(line_num, line_num)
+                tables.append({"line": line_num, "caption": caption, "env_line": line,
+                               "offset": index.tree.offset(line_num),
+                               "body": lines[line_num:end_line], "hebrew_document": hebrew_doc})
         return tables
 
     def _check_caption_alignment(self, table_info: Dict, content: str) -> bool:
         """Phase 2: Check caption alignment (left is wrong for Hebrew)."""
-        ctx_start = max(0, content.find(table_info.get("env_line", "")) - 200)
+        ctx_start = max(0, table_info.get("offset", 0) - 200)
         return bool(re.search(self.CAPTION_LEFT, content[ctx_start:ctx_start + 500]))
 
     def _check_column_order(self, table_info: Dict, content: str) -> bool:
         """Phase 3: Check if table uses LTR tabular in Hebrew context."""
         if re.search(self.LTR_TABULAR, table_info.get("env_line", "")):
-            return bool(re.search(r"[א-ת]", content))
+            return table_info.get("hebrew_document", False)
         return False
 
     def _check_cell_alignment(self, table_info: Dict, content: str) -> int:
         """Phase 4: Check cell content alignment issues."""
-        lines = content.split("\n")
-        line_num, issues = table_info.get("line", 0), 0
-        for i in range(line_num, min(line_num + 30, len(lines))):
-            if re.search(self.TABLE_END, lines[i]):
+        issues = 0
+        for line in table_info.get("body", []):
+            if re.search(self.TABLE_END, line):
                 break
-            if re.search(self.HEBREW_IN_CELL, lines[i]):
+            if re.search(self.HEBREW_IN_CELL, line):
                 issues += 1
         return issues
 
@@ -10,6 +10,7 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ...infrastructure.indexing import TableIndex
 from .table_models import TableOverflowIssue, OverflowDetectResult
 
 
@@ -23,15 +24,9 @@ class TableOverflowDetector:
     - Step 3: Count columns
     """
 
-    # Table environment patterns - handle nested braces in column spec (e.g., p{2cm})
-    # Pattern: {(?:[^{}]|{[^{}]*})*} matches column specs with one level of nesting
-    COL_SPEC = r"\{((?:[^{}]|\{[^{}]*\})*)\}"
-    TABLE_ENVS = [
-        (r"\\begin\{rtltabular\}" + COL_SPEC, "rtltabular"),
-        (r"\\begin\{tabular\}" + COL_SPEC, "tabular"),
-        (r"\\begin\{tabularx\}" + COL_SPEC + COL_SPEC, "tabularx"),
-        (r"\\begin\{longtable\}" + COL_SPEC, "longtable"),
-    ]
+    # Table environments; column specs come from the shared TableIndex,
+    # which reads brace-balanced arguments (e.g., p{2cm}, tabularx width)
+    TABLE_ENVIRONMENTS = ("rtltabular", "tabular", "tabularx", "longtable")
 
     # Resizebox check pattern
     RESIZEBOX_PATTERN = r"\\resizebox\{[^}]*\}\{[^}]*\}\s*\{"
@@ -57,50 +52,42 @@ class TableOverflowDetector:
         result = OverflowDetectResult()
         lines = content.split("\n")
 
-        for line_num, line in enumerate(lines, 1):
-            for pattern, env_type in self.TABLE_ENVS:
-                match = re.search(pattern, line)
-                if match:
-                    result.total_tables += 1
-
-                    # Extract column spec
-                    if env_type == "tabularx":
-                        col_spec = match.group(2)  # Second group is column spec
-                        width_spec = match.group(1)
-                    else:
-                        col_spec = match.group(1)
-                        width_spec = ""
-
-                    # Count columns
-                    num_cols = self._count_columns(col_spec)
-
-                    # Check for resizebox wrapper
-                    has_resizebox = self._has_resizebox(content, line_num, lines)
-
-                    # Check for tabularx with textwidth (safe)
-                    is_tabularx_safe = (env_type == "tabularx" and
-                                        r"\textwidth" in width_spec)
-
-                    # Determine severity
-                    severity = self._determine_severity(
-                        num_cols, has_resizebox, is_tabularx_safe
-                    )
-
-                    issue = TableOverflowIssue(
-                        file=file_path,
-                        line=line_num,
-                        table_type=env_type,
-                        columns=num_cols,
-                        has_resizebox=has_resizebox or is_tabularx_safe,
-                        severity=severity,
-                        fix=self._get_fix_suggestion(severity),
-                    )
-                    result.tables.append(issue)
-
-                    if severity in ("CRITICAL", "WARNING"):
-                        result.unsafe += 1
-                    else:
-                        result.safe += 1
+        for table in TableIndex(content, self.TABLE_ENVIRONMENTS).tables():
+            if not table.column_spec:
+                continue
+            result.total_tables += 1
+            line_num, env_type = table.start_line + 1, table.environment
+
+            # Count columns
+            num_cols = self._count_columns(table.column_spec)
+
+            # Check for resizebox wrapper
+            has_resizebox = self._has_resizebox(content, line_num, lines)
+
+            # Check for tabularx with textwidth (safe)
+            is_tabularx_safe = (env_type == "tabularx" and
+                                r"\textwidth" in table.width)
+
+            # Determine severity
+            severity = self._determine_severity(
+                num_cols, has_resizebox, is_tabularx_safe
+            )
+
+            issue = TableOverflowIssue(
+                file=file_path,
+                line=line_num,
+                table_type=env_type,
+                columns=num_cols,
+                has_resizebox=has_resizebox or is_tabularx_safe,
+                severity=severity,
+                fix=self._get_fix_suggestion(severity),
+            )
+            result.tables.append(issue)
+
+            if severity in ("CRITICAL", "WARNING"):
+                result.unsafe += 1
+            else:
+                result.safe += 1
 
         return result
 
@@ -1,5 +1,5 @@
 """Table fixing submodule."""
-from .table_parser import TableParser, ParsedTable, TableRow, TableCell
+from ...infrastructure.indexing import TableParser, ParsedTable, TableRow, TableCell, TableIndex
 from .column_transformer import ColumnTransformer
 from .fancy_table_fixer import FancyTableFixer, FancyFixResult, FixResult
 from .column_fixer import TableColumnFixer, ColumnFixResult, ColumnFixChange
@@ -7,7 +7,7 @@ from .overflow_fixer import TableOverflowFixer, OverflowFixResult, OverflowFix
 from .header_color_fixer import HeaderColorFixer, HeaderColorResult, HeaderColorFix
 
 __all__ = [
-    "TableParser", "ParsedTable", "TableRow", "TableCell",
+    "TableParser", "ParsedTable", "TableRow", "TableCell", "TableIndex",
     "ColumnTransformer",
     "FancyTableFixer", "FancyFixResult", "FixResult",
     "TableColumnFixer", "ColumnFixResult", "ColumnFixChange",
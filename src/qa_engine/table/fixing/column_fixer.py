@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ...infrastructure.indexing import TableIndex
+
 
 @dataclass
 class ColumnFixChange:
@@ -45,45 +47,30 @@ class TableColumnFixer:
     - Styling or cell commands
     """
 
-    # Pattern to match table environments
-    TABLE_BEGIN = re.compile(r'\\begin\{(tabular|rtltabular)\}\{([^}]+)\}')
+    TABLE_ENVIRONMENTS = ("tabular", "rtltabular")
     TABLE_END = re.compile(r'\\end\{(tabular|rtltabular)\}')
 
     def fix_content(self, content: str, file_path: str = "") -> tuple:
         """Fix column order in all tables in content."""
         result = ColumnFixResult()
         lines = content.split('\n')
-        table_num = 0
-        in_table = False
-        table_start = 0
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            # Detect table start
-            if self.TABLE_BEGIN.search(line):
-                in_table = True
-                table_start = i
-                table_num += 1
-                i += 1
-                continue
-
-            # Detect table end
-            if in_table and self.TABLE_END.search(line):
-                in_table = False
+        tables = [t for t in TableIndex(content, self.TABLE_ENVIRONMENTS).tables() if t.column_spec]
+
+        # Innermost tables first so each row is reversed by its own table only
+        claimed = set()
+        for table in reversed(tables):
+            closed = bool(self.TABLE_END.search(lines[table.end_line]))
+            for i in range(table.start_line + 1, table.end_line + (0 if closed else 1)):
+                if i not in claimed and '&' in lines[i]:
+                    lines[i] = self._reverse_row(lines[i])
+                claimed.add(i)
+
+        for table_num, table in enumerate(tables, 1):
+            if self.TABLE_END.search(lines[table.end_line]):
                 result.changes.append(ColumnFixChange(
-                    table=table_num, file=file_path, line=table_start + 1
+                    table=table_num, file=file_path, line=table.start_line + 1
                 ))
                 result.tables_fixed += 1
-                i += 1
-                continue
-
-            # Process table rows
-            if in_table and '&' in line:
-                lines[i] = self._reverse_row(line)
-
-            i += 1
 
         return '\n'.join(lines), result
 
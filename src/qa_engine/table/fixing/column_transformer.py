@@ -6,10 +6,9 @@ Handles column spec conversion and order reversal.
 
 from __future__ import annotations
 
-import re
-from typing import List, Tuple
+from typing import List
 
-from .table_parser import ParsedTable, TableRow, TableCell
+from ...infrastructure.indexing import ParsedTable, TableCell, TableParser, TableRow
 
 
 class ColumnTransformer:
@@ -21,9 +20,16 @@ class ColumnTransformer:
     DEFAULT_WIDTH = "2.5cm"
 
     def convert_column_spec(self, spec: str, table: ParsedTable) -> str:
-        """Convert c/l/r columns to p{width} columns."""
+        """Convert c/l/r columns to p{width} columns.
+
+        The columns come from the parsed table; spec is only split again
+        when it is not the table's own (a table built by hand).
+        """
         # Extract column types
-        columns = self._extract_columns(spec)
+        if table.columns and spec == table.column_spec:
+            columns = table.columns
+        else:
+            columns = TableParser.column_types(spec)
         num_cols = len(columns)
 
         # Analyze content to determine widths
@@ -47,18 +53,6 @@ class ColumnTransformer:
             return "|" + "|".join(new_cols) + "|"
         return "".join(new_cols)
 
-    def _extract_columns(self, spec: str) -> List[Tuple[str, str]]:
-        """Extract column definitions from spec."""
-        columns = []
-        # Match c, l, r, or p{...}
-        pattern = r"([clrCLR])|(p)\{([^}]+)\}"
-        for match in re.finditer(pattern, spec):
-            if match.group(1):
-                columns.append((match.group(1).lower(), ""))
-            else:
-                columns.append(("p", match.group(3)))
-        return columns
-
     def _estimate_widths(self, table: ParsedTable, num_cols: int) -> List[str]:
         """Estimate column widths based on content."""
         widths = [self.DEFAULT_WIDTH] * num_cols
@@ -7,12 +7,11 @@ Aligned with qa-table-fancy-fix skill.md patterns.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .table_parser import TableParser, ParsedTable
+from ...infrastructure.indexing import ParsedTable, TableIndex, TableParser
 from .column_transformer import ColumnTransformer
 
 
@@ -32,6 +31,7 @@ class FancyFixResult:
     tables_fixed: int = 0
     fixes: List[FixResult] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    content: str = ""
 
 
 class FancyTableFixer:
@@ -55,46 +55,34 @@ class FancyTableFixer:
     def fix_content(self, content: str, file_path: str = "") -> FancyFixResult:
         """Fix all plain tables in content."""
         result = FancyFixResult()
-        lines = content.split("\n")
-
-        # Find all tables
-        table_starts = []
-        for i, line in enumerate(lines):
-            if r"\begin{tabular}" in line:
-                table_starts.append(i)
-
-        # Process each table (reverse order to preserve line numbers)
-        for start_idx in reversed(table_starts):
-            # Extract table content
-            table_content = self._extract_table(lines, start_idx)
-            if not table_content:
-                continue
-
-            # Parse and fix
-            parsed = self.parser.parse(table_content, start_idx)
-            if not parsed:
-                result.errors.append(f"Failed to parse table at line {start_idx + 1}")
+        index = TableIndex(content, ("tabular",), self.parser)
+
+        # Process each table (reverse order to preserve line numbers). A
+        # table enclosing one already rewritten is looked up again by its
+        # start, so it is re-parsed with the nested rewrite in place.
+        for original in reversed(index.tables()):
+            parsed = index.table_at(original.start) or original
+            if not parsed.column_spec:
+                result.errors.append(f"Failed to parse table at line {parsed.start_line + 1}")
                 continue
 
             fix = self._fix_table(parsed, file_path)
             if fix:
-                # Replace in content
-                end_idx = parsed.end_line - parsed.start_line + start_idx
-                lines[start_idx:end_idx + 1] = fix.fixed.split("\n")
+                # Keep text sharing the table's first and last lines, such
+                # as the rest of a cell that holds a nested table
+                content = index.content
+                line_start = content.rfind("\n", 0, parsed.start) + 1
+                line_end = content.find("\n", parsed.end)
+                line_end = len(content) if line_end == -1 else line_end
+                fix.fixed = content[line_start:parsed.start] + fix.fixed + content[parsed.end:line_end]
+                # Replace in content; only this table is re-indexed
+                index.replace(parsed, fix.fixed)
                 result.fixes.append(fix)
                 result.tables_fixed += 1
 
+        result.content = index.content
         return result
 
-    def _extract_table(self, lines: List[str], start_idx: int) -> str:
-        """Extract table content from lines."""
-        content_lines = []
-        for i in range(start_idx, min(start_idx + 50, len(lines))):
-            content_lines.append(lines[i])
-            if r"\end{tabular}" in lines[i] or r"\end{rtltabular}" in lines[i]:
-                break
-        return "\n".join(content_lines)
-
     def _fix_table(self, table: ParsedTable, file_path: str) -> Optional[FixResult]:
         """Apply all fixes to a parsed table."""
         fix = FixResult(file=file_path, line=table.start_line + 1)
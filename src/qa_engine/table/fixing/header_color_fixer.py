@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ...infrastructure.indexing import TableIndex
+
 
 @dataclass
 class HeaderColorFix:
@@ -37,8 +39,7 @@ class HeaderColorResult:
 class HeaderColorFixer:
     """Adds rowcolor{blue!15} to table header rows."""
 
-    # Pattern to find rtltabular or tabular start with optional hline
-    TABLE_START = r"\\begin\{(?:rtltabular|tabular)\}\{[^}]+\}"
+    TABLE_ENVIRONMENTS = ("rtltabular", "tabular")
     HLINE = r"\\hline"
     ROWCOLOR_HEADER = r"\\rowcolor\{blue!15\}"
 
@@ -46,37 +47,28 @@ class HeaderColorFixer:
         """Add header color to tables missing it."""
         result = HeaderColorResult()
         lines = content.split("\n")
-        modified = False
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            # Check for table start
-            if re.search(self.TABLE_START, line):
-                # Check if header color is already present in next few lines
-                has_color = False
-                header_row_idx = None
-                for j in range(i + 1, min(i + 5, len(lines))):
-                    if re.search(self.ROWCOLOR_HEADER, lines[j]):
-                        has_color = True
-                        break
-                    # Find first content row (after optional \hline)
-                    if header_row_idx is None and r"\\" in lines[j] and not lines[j].strip() == r"\hline":
-                        header_row_idx = j
-
-                if not has_color and header_row_idx is not None:
-                    # Add rowcolor to beginning of header row
-                    original = lines[header_row_idx]
-                    lines[header_row_idx] = r"\rowcolor{blue!15}" + lines[header_row_idx]
-                    result.changes.append(HeaderColorFix(
-                        file=file_path,
-                        line=header_row_idx + 1,
-                        original_line=original,
-                        fixed_line=lines[header_row_idx]
-                    ))
-                    result.fixes_applied += 1
-                    modified = True
-            i += 1
+
+        for table in TableIndex(content, self.TABLE_ENVIRONMENTS).tables():
+            if not table.column_spec or not table.rows:
+                continue
+            # Header row is the first parsed row; color may precede it
+            header = table.rows[0]
+            if re.search(self.ROWCOLOR_HEADER, content[table.start:header.end]):
+                continue
+
+            # Add rowcolor to beginning of header row, past leading comments
+            idx = header.line
+            while lines[idx].lstrip().startswith("%") and idx < table.end_line:
+                idx += 1
+            original = lines[idx]
+            lines[idx] = r"\rowcolor{blue!15}" + original
+            result.changes.append(HeaderColorFix(
+                file=file_path,
+                line=idx + 1,
+                original_line=original,
+                fixed_line=lines[idx]
+            ))
+            result.fixes_applied += 1
 
         return "\n".join(lines), result
 
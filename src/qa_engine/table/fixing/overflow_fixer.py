@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from ...infrastructure.indexing import TableIndex
+
 
 @dataclass
 class OverflowFix:
@@ -39,10 +41,7 @@ class TableOverflowFixer:
     - Add % after \\end{...} and closing }
     """
 
-    TABLE_BEGIN = re.compile(
-        r'(\\begin\{(rtltabular|tabular|longtable)\}\{[^}]+\})'
-    )
-    TABLE_END = re.compile(r'(\\end\{(rtltabular|tabular|longtable)\})')
+    TABLE_ENVIRONMENTS = ("rtltabular", "tabular", "longtable")
     RESIZEBOX_CHECK = re.compile(r'\\resizebox\{')
 
     def fix_file(self, file_path: Path) -> OverflowFixResult:
@@ -65,22 +64,23 @@ class TableOverflowFixer:
         """Fix overflow issues in content."""
         result = OverflowFixResult()
         lines = content.split("\n")
+        index = TableIndex(content, self.TABLE_ENVIRONMENTS)
 
         # Find tables needing fixes
-        tables_to_fix = self._find_tables_to_fix(lines, issues)
+        tables_to_fix = self._find_tables_to_fix(lines, issues, index)
 
         if not tables_to_fix:
             return content, result
 
         # Apply fixes from bottom to top to preserve line numbers
         for table_info in reversed(tables_to_fix):
-            lines = self._wrap_table(lines, table_info, result, file_path)
+            lines = self._wrap_table(lines, table_info, result, file_path, index)
 
         result.status = "DONE" if result.tables_fixed > 0 else "NO_CHANGES"
         return "\n".join(lines), result
 
     def _find_tables_to_fix(
-        self, lines: List[str], issues: Optional[List[Dict]]
+        self, lines: List[str], issues: Optional[List[Dict]], index: TableIndex
     ) -> List[Dict]:
         """Find tables that need wrapping."""
         tables = []
@@ -95,26 +95,27 @@ class TableOverflowFixer:
                     })
         else:
             # Detect tables without resizebox
-            for i, line in enumerate(lines):
-                match = self.TABLE_BEGIN.search(line)
-                if match:
-                    # Check previous lines for resizebox
-                    prefix = "\n".join(lines[max(0, i - 3):i + 1])
-                    if not self.RESIZEBOX_CHECK.search(prefix):
-                        tables.append({"line": i + 1, "type": match.group(2)})
+            for table in index.tables():
+                if not table.column_spec:
+                    continue
+                # Check previous lines for resizebox
+                i = table.start_line
+                prefix = "\n".join(lines[max(0, i - 3):i + 1])
+                if not self.RESIZEBOX_CHECK.search(prefix):
+                    tables.append({"line": i + 1, "type": table.environment})
 
         return tables
 
     def _wrap_table(
         self, lines: List[str], table_info: Dict,
-        result: OverflowFixResult, file_path: str
+        result: OverflowFixResult, file_path: str, index: TableIndex
     ) -> List[str]:
         """Wrap a single table with resizebox."""
         start_idx = table_info["line"] - 1
         table_type = table_info["type"]
 
         # Find table end
-        end_idx = self._find_table_end(lines, start_idx, table_type)
+        end_idx = self._find_table_end(lines, start_idx, table_type, index)
         if end_idx is None:
             return lines
 
@@ -141,10 +142,13 @@ class TableOverflowFixer:
         return lines
 
     def _find_table_end(
-        self, lines: List[str], start: int, table_type: str
+        self, lines: List[str], start: int, table_type: str, index: TableIndex
     ) -> Optional[int]:
-        """Find the end line of a table."""
+        """Find the end line of a table, preferring its indexed span."""
         pattern = re.compile(rf'\\end\{{{table_type}\}}')
+        table = index.table_at_line(start, table_type)
+        if table is not None:
+            return table.end_line if pattern.search(lines[table.end_line]) else None
         for i in range(start, len(lines)):
             if pattern.search(lines[i]):
                 return i
@@ -2,8 +2,13 @@
 BiDi helper functions for TOC detection.
 
 Provides reusable pattern matching for bidirectional text.
-All patterns loaded from JSON configuration.
+All patterns loaded from JSON configuration. Mixed-text patterns are
+matched against each chain of Hebrew/Latin runs (runs separated only by
+whitespace), so lines without a direction switch are never scanned.
 
+Version: 2.1.1 - Mixed-text patterns and the Hebrew range are evaluated
+                from the configuration, not used as on/off switches
+Version: 2.1.0 - Hebrew/English checks use the shared direction-run segmenter
 Version: 2.0.0 - Added naked English detection
 """
 
@@ -12,6 +17,7 @@ from __future__ import annotations
 import re
 from typing import List, Tuple, Iterator, Optional
 
+from ...infrastructure.indexing import Direction, segment_line
 from ..config.config_loader import TOCConfigLoader
 
 
@@ -44,7 +50,8 @@ class BiDiHelpers:
     def __init__(self, config: TOCConfigLoader) -> None:
         """Initialize with config."""
         self._config = config
-        self._hebrew_range = config.get_unicode_range("hebrew")
+        hebrew_range = config.get_unicode_range("hebrew")
+        self._hebrew_re = re.compile(hebrew_range) if hebrew_range else None
 
     def has_ltr_wrapper(self, text: str) -> bool:
         """Check if text has any LTR wrapper."""
@@ -57,9 +64,7 @@ class BiDiHelpers:
 
     def has_hebrew(self, text: str) -> bool:
         """Check if text contains Hebrew characters."""
-        if not self._hebrew_range:
-            return False
-        return bool(re.search(self._hebrew_range, text))
+        return bool(self._hebrew_re and self._hebrew_re.search(text))
 
     def has_unwrapped_percentage(self, text: str) -> bool:
         """Check for unwrapped percentage."""
@@ -73,12 +78,13 @@ class BiDiHelpers:
     def find_unwrapped_english(self, text: str) -> Iterator[Tuple[str, int]]:
         """Find unwrapped English words (3+ chars)."""
         skip_words = {"chapter", "section", "quad", "hskip", "relax"}
-        pattern = r"(?<!\\textenglish\{)(?<!\\en\{)[A-Za-z]{3,}"
+        segmentation = segment_line(text)
 
-        for match in re.finditer(pattern, text):
-            word = match.group(0)
-            if word.lower() not in skip_words:
-                yield word, match.start()
+        for run in segmentation.of(Direction.LATIN, min_length=3):
+            if segmentation.preceded_by(run, "\\", "\\textenglish{", "\\en{"):
+                continue
+            if run.text.lower() not in skip_words:
+                yield run.text, run.start
 
     def find_unwrapped_acronyms(self, text: str) -> Iterator[str]:
         """Find unwrapped acronyms (2-6 uppercase letters)."""
@@ -106,24 +112,26 @@ class BiDiHelpers:
 
     def has_heb_eng_heb_pattern(self, text: str) -> bool:
         """Check for Hebrew→English→Hebrew pattern."""
-        pattern = self._config.get_raw_pattern(
-            "mixed_text_patterns", "hebrew_english_hebrew"
-        )
-        return bool(pattern and re.search(pattern, text))
+        return self._mixed_pattern_matches("hebrew_english_hebrew", text)
 
     def has_eng_heb_eng_pattern(self, text: str) -> bool:
         """Check for English→Hebrew→English pattern."""
-        pattern = self._config.get_raw_pattern(
-            "mixed_text_patterns", "english_hebrew_english"
-        )
-        return bool(pattern and re.search(pattern, text))
+        return self._mixed_pattern_matches("english_hebrew_english", text)
 
     def has_complex_alternating(self, text: str) -> bool:
         """Check for 3+ language switches."""
-        pattern = self._config.get_raw_pattern(
-            "mixed_text_patterns", "alternating_3plus"
+        return self._mixed_pattern_matches("alternating_3plus", text)
+
+    def _mixed_pattern_matches(self, name: str, text: str) -> bool:
+        """Match a configured mixed-text pattern on each multi-run chain."""
+        pattern = self._config.get_raw_pattern("mixed_text_patterns", name)
+        if not pattern:
+            return False
+        return any(
+            re.search(pattern, text[chain[0].start:chain[-1].end])
+            for chain in segment_line(text).strong_chains()
+            if len(chain) > 1
         )
-        return bool(pattern and re.search(pattern, text))
 
     def find_naked_english(
         self, raw_content: str, title: str
@@ -139,14 +147,11 @@ class BiDiHelpers:
         """
         naked_english = []
 
-        # Skip LaTeX commands and check for naked English words
-        # Pattern: 3+ consecutive English letters not inside a wrapper
-        english_word_pattern = r'[A-Za-z]{3,}'
-
-        # Find all English words in title
-        for match in re.finditer(english_word_pattern, title):
-            word = match.group(0)
-            pos = match.start()
+        # Skip LaTeX commands and check for naked English words:
+        # Latin runs of 3+ letters not inside a wrapper
+        for run in segment_line(title).of(Direction.LATIN, min_length=3):
+            word = run.text
+            pos = run.start
 
             # Skip LaTeX command names
             if self._is_latex_command(title, pos):
@@ -2,7 +2,9 @@
 TOC file entry parser.
 
 Parses LaTeX .toc files into structured entry objects.
-All patterns loaded from JSON configuration.
+All patterns loaded from JSON configuration. Files are read through the
+shared build artifact analyzer, so a .toc is parsed once per change for
+all post-compile checks.
 """
 
 from __future__ import annotations
@@ -12,6 +14,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+from ...infrastructure.indexing.build_artifacts import build_artifact_analyzer
 from ..config.config_loader import TOCConfigLoader
 
 
@@ -61,8 +64,13 @@ class TOCEntryParser:
         if not path.exists():
             return []
 
-        content = path.read_text(encoding="utf-8", errors="replace")
-        return self.parse_content(content, toc_path)
+        # Source lines of the analyzer's cached entries, one per line
+        lines = {e.line: e.raw for e in build_artifact_analyzer().analyze(path).toc
+                 if not e.raw.lstrip().startswith("%")}
+        entries = [self._parse_line(raw, line_num, toc_path) for line_num, raw in lines.items()]
+        entries = [entry for entry in entries if entry]
+        self._assign_parent_numbers(entries)
+        return entries
 
     def parse_content(self, content: str, file_path: str = "") -> List[TOCEntry]:
         """Parse TOC content string into entries."""
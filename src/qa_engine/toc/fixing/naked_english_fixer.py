@@ -4,6 +4,7 @@ Naked English fixer for TOC entries.
 Fixes English text that renders RTL by wrapping in LTR commands.
 Modifies source .tex files, not .toc files.
 
+Version: 1.1.0 - English words and acronyms come from the shared direction-run segmenter
 Version: 1.0.0
 """
 
@@ -15,6 +16,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from ...infrastructure.indexing import Direction, segment_line
+
 
 @dataclass
 class FixResult:
@@ -183,15 +186,13 @@ class NakedEnglishFixer:
             message=f"Wrapped: {naked_words}"
         )
 
-    def _find_naked_english(
-        self, raw_line: str, title: str
-    ) -> List[str]:
+    def _find_naked_english(self, raw_line: str, title: str) -> List[str]:
         """Find English words not wrapped in LTR commands."""
         naked = []
 
-        # Find all English words (3+ chars)
-        for match in re.finditer(r'[A-Za-z]{3,}', title):
-            word = match.group(0)
+        # Find all English words (Latin runs of 3+ chars)
+        for run in segment_line(title).of(Direction.LATIN, min_length=3):
+            word = run.text
 
             # Skip LaTeX commands
             if word.lower() in self.LATEX_COMMANDS:
@@ -203,10 +204,10 @@ class NakedEnglishFixer:
 
             naked.append(word)
 
-        # Also find short acronyms (2-3 uppercase)
+        # Also find short standalone acronyms (2-5 uppercase)
         if self.config.always_wrap_acronyms:
-            for match in re.finditer(r'\b[A-Z]{2,5}\b', title):
-                word = match.group(0)
+            for run in segment_line(title).acronyms(2, 5):
+                word = run.text
                 if word not in naked and not self._is_wrapped(raw_line, word):
                     naked.append(word)
 
@@ -4,9 +4,12 @@ from .orphan_detector import SectionOrphanDetector, OrphanDetectResult, OrphanIs
 from .typeset_models import (
     TypesetDetectResult, HboxWarning, VboxWarning, UndefinedReference,
     UndefinedCitation, FloatTooLarge, KnownIssue, TikzOverflowRisk,
-    LatexError, PackageError, ItemsepIssue, WarningSeverity,
+    LatexError, PackageError, ItemsepIssue, WarningSeverity, is_source_file,
 )
+from .log_reader import LogFileStack, LogTail, iter_log_file, iter_log_content
 from .log_warning_detector import LogWarningDetector
+from .log_tail import LogWarningTail
+from .log_cache import ParsedLogCache, parsed_log_cache
 from .tikz_detector import TikzDetector
 from .itemsep_detector import ItemsepDetector
 from .full_typeset_detector import FullTypesetDetector
@@ -30,7 +33,15 @@ __all__ = [
     "PackageError",
     "ItemsepIssue",
     "WarningSeverity",
+    "is_source_file",
+    "LogFileStack",
+    "LogTail",
+    "iter_log_file",
+    "iter_log_content",
     "LogWarningDetector",
+    "LogWarningTail",
+    "ParsedLogCache",
+    "parsed_log_cache",
     "TikzDetector",
     "ItemsepDetector",
     "FullTypesetDetector",
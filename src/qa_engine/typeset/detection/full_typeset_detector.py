@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 from .typeset_models import TypesetDetectResult
 from .log_warning_detector import LogWarningDetector
+from .log_cache import ParsedLogCache, parsed_log_cache
 from .tikz_detector import TikzDetector
 from .itemsep_detector import ItemsepDetector
 
@@ -25,10 +26,11 @@ class FullTypesetDetector:
     - Excessive vertical spacing detection (v1.5)
     """
 
-    def __init__(self, project_root: Optional[Path] = None):
-        """Initialize detector."""
+    def __init__(self, project_root: Optional[Path] = None, log_cache: Optional[ParsedLogCache] = None):
+        """Initialize detector; logs are parsed through log_cache (shared by default)."""
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.log_detector = LogWarningDetector()
+        self.log_cache = log_cache if log_cache is not None else parsed_log_cache()
         self.tikz_detector = TikzDetector()
         self.itemsep_detector = ItemsepDetector()
 
@@ -53,7 +55,7 @@ class FullTypesetDetector:
 
         # Step 2: Parse log file
         if log_path and log_path.exists():
-            result = self.log_detector.detect_log(log_path)
+            result = self.log_cache.detect(log_path)
 
         # Check for raggedbottom in preamble
         if preamble_path and preamble_path.exists():
@@ -86,36 +88,38 @@ class FullTypesetDetector:
             "log_file": result.log_file,
             "warnings": {
                 "overfull_hbox": [
-                    {"amount_pt": w.amount_pt, "lines": w.lines,
+                    {"amount_pt": w.amount_pt, "lines": w.lines, "file": w.file,
                      "context": w.context, "severity": w.severity}
                     for w in result.overfull_hbox
                 ],
                 "underfull_hbox": [
-                    {"badness": w.badness, "lines": w.lines,
+                    {"badness": w.badness, "lines": w.lines, "file": w.file,
                      "context": w.context, "severity": w.severity}
                     for w in result.underfull_hbox
                 ],
                 "overfull_vbox": [
-                    {"amount_pt": w.amount_pt, "context": w.context, "severity": w.severity}
+                    {"amount_pt": w.amount_pt, "lines": w.lines, "file": w.file,
+                     "context": w.context, "severity": w.severity}
                     for w in result.overfull_vbox
                 ],
                 "underfull_vbox": [
-                    {"badness": w.badness, "context": w.context, "severity": w.severity}
+                    {"badness": w.badness, "lines": w.lines, "file": w.file,
+                     "context": w.context, "severity": w.severity}
                     for w in result.underfull_vbox
                 ],
                 "undefined_references": [
                     {"reference": r.reference, "page": r.page,
-                     "input_line": r.input_line, "severity": r.severity}
+                     "input_line": r.input_line, "file": r.file, "severity": r.severity}
                     for r in result.undefined_references
                 ],
                 "undefined_citations": [
                     {"citation": c.citation, "page": c.page,
-                     "input_line": c.input_line, "severity": c.severity}
+                     "input_line": c.input_line, "file": c.file, "severity": c.severity}
                     for c in result.undefined_citations
                 ],
                 "float_too_large": [
                     {"overflow_pt": f.overflow_pt, "input_line": f.input_line,
-                     "severity": f.severity}
+                     "file": f.file, "severity": f.severity}
                     for f in result.float_too_large
                 ],
                 "known_issues": [
@@ -0,0 +1,115 @@
+"""
+Parsed log cache.
+
+Typeset detection for every .tex file of a project, and every family that
+asks, usually comes down to the same few .log files. ParsedLogCache parses
+each log once per change - keyed by path, mtime and size - and hands out
+copies of the result. With a cache_dir, results also persist across runs
+as one JSON file per log.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .log_warning_detector import LogWarningDetector
+from .typeset_models import (
+    TypesetDetectResult, HboxWarning, VboxWarning, UndefinedReference,
+    UndefinedCitation, FloatTooLarge, KnownIssue, TikzOverflowRisk,
+    LatexError, PackageError, ItemsepIssue,
+)
+
+CACHE_VERSION = 2  # Bumped when parsing changes its results
+
+# Result list field -> model of its items
+_ITEM_MODELS = {
+    "overfull_hbox": HboxWarning, "underfull_hbox": HboxWarning,
+    "overfull_vbox": VboxWarning, "underfull_vbox": VboxWarning,
+    "undefined_references": UndefinedReference, "undefined_citations": UndefinedCitation,
+    "float_too_large": FloatTooLarge, "known_issues": KnownIssue,
+    "tikz_overflow_risk": TikzOverflowRisk, "latex_errors": LatexError,
+    "package_errors": PackageError, "itemsep_issues": ItemsepIssue,
+}
+
+
+class ParsedLogCache:
+    """LogWarningDetector results per log file, re-parsed only on change."""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None,
+                 detector: Optional[LogWarningDetector] = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._detector = detector if detector is not None else LogWarningDetector()
+        self._results: Dict[str, Tuple[Tuple[int, int], TypesetDetectResult]] = {}
+        self._lock = threading.Lock()
+        self.parses = 0  # Logs actually parsed, for diagnostics
+
+    def detect(self, log_path: Union[str, Path]) -> TypesetDetectResult:
+        """Warnings of a log; a copy, so callers may extend it."""
+        full = os.path.abspath(log_path)
+        try:
+            st = os.stat(full)
+        except OSError:
+            return TypesetDetectResult()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._results.get(full)
+            if cached is None or cached[0] != stamp:
+                result = self._load(full, stamp)
+                if result is None:
+                    result = self._detector.detect_log(Path(log_path))
+                    self.parses += 1
+                    self._store(full, stamp, result)
+                self._results[full] = cached = (stamp, result)
+            return copy.deepcopy(cached[1])
+
+    def clear(self) -> None:
+        """Forget the in-memory results (persisted ones stay)."""
+        with self._lock:
+            self._results.clear()
+
+    def _entry_path(self, full: str) -> Path:
+        return self.cache_dir / (hashlib.sha1(full.encode("utf-8")).hexdigest()[:16] + ".json")
+
+    def _load(self, full: str, stamp: Tuple[int, int]) -> Optional[TypesetDetectResult]:
+        if self.cache_dir is None:
+            return None
+        try:
+            entry = json.loads(self._entry_path(full).read_text(encoding="utf-8"))
+            if entry["version"] != CACHE_VERSION or entry["path"] != full or tuple(entry["stamp"]) != stamp:
+                return None
+            return _from_dict(entry["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store(self, full: str, stamp: Tuple[int, int], result: TypesetDetectResult) -> None:
+        if self.cache_dir is None:
+            return
+        entry = {"version": CACHE_VERSION, "path": full, "stamp": list(stamp), "result": asdict(result)}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._entry_path(full).write_text(json.dumps(entry), encoding="utf-8")
+        except OSError:
+            pass  # The cache is an optimization only
+
+
+def _from_dict(data: Dict[str, Any]) -> TypesetDetectResult:
+    values = {
+        name: [_ITEM_MODELS[name](**item) for item in value] if name in _ITEM_MODELS else value
+        for name, value in data.items()
+    }
+    return TypesetDetectResult(**values)
+
+
+_SHARED = ParsedLogCache()
+
+
+def parsed_log_cache() -> ParsedLogCache:
+    """Return the process-wide cache, so all typeset consumers share it."""
+    return _SHARED
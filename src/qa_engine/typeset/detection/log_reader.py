@@ -0,0 +1,184 @@
+"""
+Streaming LaTeX log reader.
+
+TeX hard-wraps everything it writes to the log at max_print_line (79)
+columns, so a long warning continues on the next physical line. The
+reader yields logical lines - wrapped pieces rejoined - together with the
+number of their first physical line. Log files are read as a buffered
+binary stream, one line at a time, so memory stays constant however large
+the log is.
+
+pdfTeX and LuaTeX count bytes when wrapping, XeTeX counts characters;
+a line that is exactly max_print_line long in either unit is treated as
+wrapped. Since a byte-counting engine may cut a multibyte character in
+two, the pieces of a logical line are joined as bytes and decoded once.
+
+TeX also writes "(file" when it opens an input file and ")" when it
+closes it; LogFileStack follows these while streaming, so a message can
+be attributed to the file that was being read. LogTail reads a log that
+is still growing, a few appended bytes at a time.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import AnyStr, Generic, Iterable, Iterator, List, Optional, Tuple, Union
+
+MAX_PRINT_LINE = 79
+# A run of full-width lines (e.g. a box dump) is flushed at this size
+MAX_LOGICAL_LINE = 1 << 16
+
+# "(name.ext" opens a file, any other "(" a group that its ")" closes
+_PAREN_RE = re.compile(r'\((?:"([^"]+)"|([^\s()"]+\.[A-Za-z]\w*))?|\)')
+
+
+def iter_log_file(path: Union[str, Path], width: int = MAX_PRINT_LINE) -> Iterator[Tuple[int, str]]:
+    """Logical lines of a log file as (first physical line, text)."""
+    with open(path, "rb") as handle:
+        yield from _join((_physical(raw, width) for raw in handle))
+
+
+def iter_log_content(content: str, width: int = MAX_PRINT_LINE) -> Iterator[Tuple[int, str]]:
+    """Logical lines of log text already in memory."""
+    lines = (line.rstrip("\r") for line in content.split("\n"))
+    return _join((line, _is_full_text(line, width)) for line in lines)
+
+
+def _physical(raw: bytes, width: int) -> Tuple[bytes, bool]:
+    """A physical line without its line end, and whether it was wrapped."""
+    raw = raw.rstrip(b"\r\n")
+    return raw, _is_full(raw, width)
+
+
+def _is_full(raw: bytes, width: int) -> bool:
+    """Whether a physical line was cut at max_print_line bytes or characters."""
+    if len(raw) == width:
+        return True
+    # Characters never outnumber bytes
+    return len(raw) > width and len(raw.decode("utf-8", errors="replace")) == width
+
+
+def _is_full_text(text: str, width: int) -> bool:
+    """_is_full() for a line that is already text."""
+    if len(text) == width:
+        return True
+    return not text.isascii() and len(text) < width and len(text.encode("utf-8")) == width
+
+
+def _join(physical: Iterable[Tuple[AnyStr, bool]]) -> Iterator[Tuple[int, str]]:
+    joiner: _Joiner = _Joiner()
+    for text, wrapped in physical:
+        line = joiner.push(text, wrapped)
+        if line is not None:
+            yield line
+    line = joiner.flush()
+    if line is not None:
+        yield line
+
+
+class _Joiner(Generic[AnyStr]):
+    """Rejoins wrapped physical lines; state survives between pushes.
+
+    Pieces are bytes (decoded once per logical line) or text.
+    """
+
+    def __init__(self) -> None:
+        self.number = 0
+        self._parts: List[AnyStr] = []
+        self._size = 0
+        self._start = 0
+
+    def push(self, text: AnyStr, wrapped: bool) -> Optional[Tuple[int, str]]:
+        self.number += 1
+        if not self._parts:
+            self._start = self.number
+        self._parts.append(text)
+        self._size += len(text)
+        if wrapped and self._size < MAX_LOGICAL_LINE:
+            return None
+        return self.flush()
+
+    def flush(self) -> Optional[Tuple[int, str]]:
+        if not self._parts:
+            return None
+        joined = self._parts[0][:0].join(self._parts)
+        text = joined.decode("utf-8", errors="replace") if isinstance(joined, bytes) else joined
+        self._parts, self._size = [], 0
+        return self._start, text
+
+
+class LogTail:
+    """Follows a log that is still being written.
+
+    Each read parses only the bytes appended since the previous one; an
+    unterminated last line, or a wrapped line whose continuation has not
+    arrived yet, is held back until it is complete. A log that shrinks
+    (a new run truncated it) is followed from its start again.
+    """
+
+    def __init__(self, path: Union[str, Path], width: int = MAX_PRINT_LINE) -> None:
+        self.path = Path(path)
+        self._width = width
+        self.reset()
+
+    def reset(self) -> None:
+        self._offset = 0
+        self._pending = b""
+        self._joiner: _Joiner[bytes] = _Joiner()
+
+    def read(self, final: bool = False) -> List[Tuple[int, str]]:
+        """Logical lines completed since the last read; final flushes the rest."""
+        try:
+            with open(self.path, "rb") as handle:
+                handle.seek(0, 2)
+                if handle.tell() < self._offset:
+                    self.reset()
+                handle.seek(self._offset)
+                data = handle.read()
+        except FileNotFoundError:  # Not created yet
+            data = b""
+        self._offset += len(data)
+        chunks = (self._pending + data).split(b"\n")
+        self._pending = chunks.pop()
+        if final and self._pending:
+            chunks.append(self._pending)
+            self._pending = b""
+        lines = []
+        for raw in chunks:
+            line = self._joiner.push(*_physical(raw, self._width))
+            if line is not None:
+                lines.append(line)
+        if final:
+            line = self._joiner.flush()
+            if line is not None:
+                lines.append(line)
+        return lines
+
+
+class LogFileStack:
+    """The input files TeX has open, followed through the log's parentheses."""
+
+    def __init__(self) -> None:
+        # Files and None for plain parenthesized groups
+        self._stack: List[Optional[str]] = []
+
+    @property
+    def current(self) -> str:
+        """Innermost open file, "" outside any file."""
+        for name in reversed(self._stack):
+            if name is not None:
+                return name
+        return ""
+
+    def feed(self, line: str) -> None:
+        """Apply the opens and closes of one logical line."""
+        # Box dumps print material, whose parentheses are text
+        if line.startswith(("[]", "\\")):
+            return
+        for match in _PAREN_RE.finditer(line):
+            if match.group(0) == ")":
+                if self._stack:
+                    self._stack.pop()
+            else:
+                self._stack.append(match.group(1) or match.group(2))
@@ -0,0 +1,82 @@
+"""
+Live typeset detection on a log that is still being written.
+
+LogWarningTail follows a compile's .log with LogTail and feeds each batch
+of new lines to LogWarningDetector, keeping the file stack and the
+accumulated result between polls. Warnings are available as they are
+written, and the first TeX error ("! ..." other than a whitelisted known
+issue) is reported at once, so a failing compile can be stopped early.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+from .log_reader import LogFileStack, LogTail
+from .log_warning_detector import LogWarningDetector
+from .typeset_models import TypesetDetectResult
+
+_LIST_FIELDS = [f.name for f in fields(TypesetDetectResult) if f.default_factory is list]
+
+
+class LogWarningTail:
+    """Incremental LogWarningDetector over a growing log file."""
+
+    def __init__(self, log_path: Union[str, Path], detector: Optional[LogWarningDetector] = None) -> None:
+        self._tail = LogTail(log_path)
+        self._detector = detector if detector is not None else LogWarningDetector()
+        self._files = LogFileStack()
+        self.result = TypesetDetectResult(log_file=str(log_path))
+        # (first physical line, text) of the first error
+        self.fatal_error: Optional[Tuple[int, str]] = None
+
+    def poll(self, final: bool = False) -> TypesetDetectResult:
+        """Warnings from the lines appended since the last poll.
+
+        They are also added to self.result; final reads the unterminated
+        rest of the log once the compile has ended.
+        """
+        new = TypesetDetectResult(log_file=self.result.log_file)
+        for number, line in self._tail.read(final):
+            known = len(new.known_issues)
+            self._detector.feed([(number, line)], self._files, new)
+            if line.startswith("! ") and self.fatal_error is None and len(new.known_issues) == known:
+                self.fatal_error = (number, line)
+        for name in _LIST_FIELDS:
+            getattr(self.result, name).extend(getattr(new, name))
+        self.result.underfull_vbox_count = len(self.result.underfull_vbox)
+        new.underfull_vbox_count = len(new.underfull_vbox)
+        return new
+
+    def follow(self, running: Callable[[], bool], interval: float = 0.2,
+               stop_on_error: bool = True) -> Iterator[TypesetDetectResult]:
+        """Poll while running() is true and yield every non-empty batch.
+
+        After running() turns false the log is read to its end. With
+        stop_on_error the generator returns at the first fatal error,
+        while the compile may still be running.
+        """
+        while True:
+            done = not running()
+            new = self.poll(final=done)
+            if any(getattr(new, name) for name in _LIST_FIELDS):
+                yield new
+            if done or (stop_on_error and self.fatal_error is not None):
+                return
+            time.sleep(interval)
+
+    def watch(self, process, interval: float = 0.2, stop_on_error: bool = True) -> TypesetDetectResult:
+        """Follow a compile subprocess (Popen) to its end.
+
+        With stop_on_error the process is terminated at the first fatal
+        error instead of running to completion. Returns self.result.
+        """
+        for _ in self.follow(lambda: process.poll() is None, interval, stop_on_error):
+            pass
+        if self.fatal_error is not None and process.poll() is None:
+            process.terminate()
+            process.wait()
+        return self.result
@@ -2,14 +2,22 @@
 Log warning detector for LaTeX log files.
 
 Implements qa-typeset-detect skill.md v1.5 - parses .log files for typeset warnings.
+
+The log is streamed (log_reader) as logical lines with TeX's 79-column
+wrapping undone, and read in one pass: a single precompiled token regex
+finds the leading token of a message (Overfull, Underfull, LaTeX/Package
+Warning, !) and dispatches to that message's matcher; other lines cost
+one failed search. A LogFileStack follows the files TeX opens and closes,
+and every warning records the innermost one as its file.
 """
 
 from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
+from .log_reader import LogFileStack, iter_log_content, iter_log_file
 from .typeset_models import (
     TypesetDetectResult, HboxWarning, VboxWarning, UndefinedReference,
     UndefinedCitation, FloatTooLarge, KnownIssue, LatexError, PackageError,
@@ -27,6 +35,20 @@ KNOWN_ISSUE_PATTERNS = [
      "tcolorbox footnote counter"),
     (r"Extra \\endgroup", "subfiles_cleanup", "subfiles hook cleanup"),
 ]
+_KNOWN_ISSUES = [(re.compile(p), t, c) for p, t, c in KNOWN_ISSUE_PATTERNS]
+
+_TOKEN_RE = re.compile(r"Overfull \\[hv]box|Underfull \\[hv]box|LaTeX Warning|Package \w+ Warning|^! ")
+_OVERFULL_RE = re.compile(
+    r"Overfull \\(h|v)box \(([0-9.]+)pt too (?:wide|high)\)"
+    r"(?:.*?lines (\d+)--(\d+)|.*?detected at line (\d+))?"
+)
+_UNDERFULL_RE = re.compile(
+    r"Underfull \\(h|v)box \(badness (\d+)\)(?:.*?lines (\d+)--(\d+)|.*?detected at line (\d+))?"
+)
+_UNDEFINED_RE = re.compile(r"(Reference|Citation) `([^']+)'.*page.*?(\d+).*undefined.*line (\d+)")
+_FLOAT_RE = re.compile(r"Float too large for page by ([0-9.]+)pt on input line (\d+)")
+_LATEX_ERROR_RE = re.compile(r"! LaTeX Error: (.+)\.")
+_PACKAGE_ERROR_RE = re.compile(r"! Package (\w+) Error: (.+)\.")
 
 
 class LogWarningDetector:
@@ -38,123 +60,129 @@ class LogWarningDetector:
     - Step 4: Categorize warnings with severity thresholds
     """
 
+    def __init__(self) -> None:
+        # Leading character of a token -> matcher
+        self._dispatch: Dict[str, Callable[[str, str, TypesetDetectResult], None]] = {
+            "O": self._check_overfull,
+            "U": self._check_underfull,
+            "L": self._check_warning,
+            "P": self._check_warning,
+            "!": self._check_error,
+        }
+
     def detect_log(self, log_path: Path) -> TypesetDetectResult:
-        """Detect warnings in a log file."""
+        """Detect warnings in a log file, streaming it line by line."""
         if not log_path.exists():
             return TypesetDetectResult()
-        content = log_path.read_text(encoding="utf-8", errors="ignore")
-        return self.detect_log_content(content, str(log_path))
+        return self.detect_lines(iter_log_file(log_path), str(log_path))
 
     def detect_log_content(self, content: str, log_file: str) -> TypesetDetectResult:
         """Detect warnings in log content."""
-        result = TypesetDetectResult(log_file=log_file)
-        lines = content.split("\n")
+        return self.detect_lines(iter_log_content(content), log_file)
 
-        for line in lines:
-            self._check_hbox(line, result)
-            self._check_vbox(line, result)
-            self._check_undefined_ref(line, result)
-            self._check_undefined_citation(line, result)
-            self._check_float_too_large(line, result)
-            self._check_latex_error(line, result)
-            self._check_package_error(line, result)
+    def detect_lines(self, lines: Iterable[Tuple[int, str]], log_file: str) -> TypesetDetectResult:
+        """Detect warnings in logical (line number, text) log lines."""
+        result = TypesetDetectResult(log_file=log_file)
+        self.feed(lines, LogFileStack(), result)
 
         # Count underfull vbox for v1.5 itemsep detection
         result.underfull_vbox_count = len(result.underfull_vbox)
         return result
 
-    def _check_hbox(self, line: str, result: TypesetDetectResult) -> None:
-        """Check for overfull/underfull hbox warnings."""
-        # Overfull hbox
-        m = re.search(r"Overfull \\hbox \(([0-9.]+)pt too wide\).*lines (\d+)--(\d+)", line)
-        if m:
-            amount = float(m.group(1))
+    def feed(self, lines: Iterable[Tuple[int, str]], files: LogFileStack,
+             result: TypesetDetectResult) -> None:
+        """Add the warnings of more logical lines to result; files carries over."""
+        search, dispatch = _TOKEN_RE.search, self._dispatch
+        for _, line in lines:
+            token = search(line)
+            if token is not None:
+                dispatch[token.group(0)[0]](line, files.current, result)
+            files.feed(line)
+
+    def _check_overfull(self, line: str, file: str, result: TypesetDetectResult) -> None:
+        """Overfull hbox (severity by amount) or vbox (always CRITICAL)."""
+        m = _OVERFULL_RE.search(line)
+        if not m:
+            return
+        amount, lines = float(m.group(2)), _source_lines(m)
+        if m.group(1) == "v":
+            result.overfull_vbox.append(VboxWarning(
+                type="overfull", amount_pt=amount, context=line[:100], severity="CRITICAL",
+                file=file, lines=lines
+            ))
+        elif lines:
             severity = "CRITICAL" if amount > 10 else ("WARNING" if amount >= 1 else "INFO")
             result.overfull_hbox.append(HboxWarning(
-                type="overfull", amount_pt=amount,
-                lines=[int(m.group(2)), int(m.group(3))],
-                context=line[:100], severity=severity
-            ))
-            return
-
-        # Underfull hbox
-        m = re.search(r"Underfull \\hbox \(badness (\d+)\).*lines (\d+)--(\d+)", line)
-        if m:
-            badness = int(m.group(1))
-            severity = "WARNING" if badness >= 10000 else "INFO"
-            result.underfull_hbox.append(HboxWarning(
-                type="underfull", badness=badness,
-                lines=[int(m.group(2)), int(m.group(3))],
-                context=line[:100], severity=severity
+                type="overfull", amount_pt=amount, lines=lines,
+                context=line[:100], severity=severity, file=file
             ))
 
-    def _check_vbox(self, line: str, result: TypesetDetectResult) -> None:
-        """Check for overfull/underfull vbox warnings."""
-        # Overfull vbox - always CRITICAL
-        m = re.search(r"Overfull \\vbox \(([0-9.]+)pt too high\)", line)
-        if m:
-            result.overfull_vbox.append(VboxWarning(
-                type="overfull", amount_pt=float(m.group(1)),
-                context=line[:100], severity="CRITICAL"
-            ))
+    def _check_underfull(self, line: str, file: str, result: TypesetDetectResult) -> None:
+        """Underfull hbox/vbox, WARNING from badness 10000."""
+        m = _UNDERFULL_RE.search(line)
+        if not m:
             return
-
-        # Underfull vbox
-        m = re.search(r"Underfull \\vbox \(badness (\d+)\)", line)
-        if m:
-            badness = int(m.group(1))
-            severity = "WARNING" if badness >= 10000 else "INFO"
+        badness, lines = int(m.group(2)), _source_lines(m)
+        severity = "WARNING" if badness >= 10000 else "INFO"
+        if m.group(1) == "v":
             context = "output active (page break)" if "output is active" in line else line[:100]
             result.underfull_vbox.append(VboxWarning(
-                type="underfull", badness=badness, context=context, severity=severity
+                type="underfull", badness=badness, context=context, severity=severity,
+                file=file, lines=lines
             ))
-
-    def _check_undefined_ref(self, line: str, result: TypesetDetectResult) -> None:
-        """Check for undefined reference warnings."""
-        m = re.search(r"Reference `([^']+)'.*page.*?(\d+).*undefined.*line (\d+)", line)
-        if m:
-            result.undefined_references.append(UndefinedReference(
-                reference=m.group(1), page=int(m.group(2)), input_line=int(m.group(3))
+        elif lines:
+            result.underfull_hbox.append(HboxWarning(
+                type="underfull", badness=badness, lines=lines,
+                context=line[:100], severity=severity, file=file
             ))
 
-    def _check_undefined_citation(self, line: str, result: TypesetDetectResult) -> None:
-        """Check for undefined citation warnings."""
-        m = re.search(r"Citation `([^']+)'.*page.*?(\d+).*undefined.*line (\d+)", line)
+    def _check_warning(self, line: str, file: str, result: TypesetDetectResult) -> None:
+        """Undefined references/citations and floats too large."""
+        m = _UNDEFINED_RE.search(line)
         if m:
-            result.undefined_citations.append(UndefinedCitation(
-                citation=m.group(1), page=int(m.group(2)), input_line=int(m.group(3))
-            ))
-
-    def _check_float_too_large(self, line: str, result: TypesetDetectResult) -> None:
-        """Check for float too large warnings."""
-        m = re.search(r"Float too large for page by ([0-9.]+)pt on input line (\d+)", line)
+            key, page, input_line = m.group(2), int(m.group(3)), int(m.group(4))
+            if m.group(1) == "Reference":
+                result.undefined_references.append(UndefinedReference(
+                    reference=key, page=page, input_line=input_line, file=file
+                ))
+            else:
+                result.undefined_citations.append(UndefinedCitation(
+                    citation=key, page=page, input_line=input_line, file=file
+                ))
+            return
+        m = _FLOAT_RE.search(line)
         if m:
             overflow = float(m.group(1))
             severity = "CRITICAL" if overflow > 50 else "WARNING"
             result.float_too_large.append(FloatTooLarge(
-                overflow_pt=overflow, input_line=int(m.group(2)), severity=severity
+                overflow_pt=overflow, input_line=int(m.group(2)), severity=severity, file=file
             ))
 
-    def _check_latex_error(self, line: str, result: TypesetDetectResult) -> None:
-        """Check for LaTeX errors, filtering known issues."""
-        if not line.startswith("! LaTeX Error:"):
+    def _check_error(self, line: str, file: str, result: TypesetDetectResult) -> None:
+        """LaTeX errors (known issues whitelisted) and package errors."""
+        if line.startswith("! LaTeX Error:"):
+            # Check against known issues whitelist
+            for pattern, issue_type, cause in _KNOWN_ISSUES:
+                if pattern.search(line):
+                    result.known_issues.append(KnownIssue(
+                        type=issue_type, message=line, cause=cause
+                    ))
+                    return
+            # Unknown error - CRITICAL
+            m = _LATEX_ERROR_RE.search(line)
+            result.latex_errors.append(LatexError(message=m.group(1) if m else line, file=file))
             return
-        # Check against known issues whitelist
-        for pattern, issue_type, cause in KNOWN_ISSUE_PATTERNS:
-            if re.search(pattern, line):
-                result.known_issues.append(KnownIssue(
-                    type=issue_type, message=line, cause=cause
-                ))
-                return
-        # Unknown error - CRITICAL
-        m = re.search(r"! LaTeX Error: (.+)\.", line)
-        msg = m.group(1) if m else line
-        result.latex_errors.append(LatexError(message=msg))
-
-    def _check_package_error(self, line: str, result: TypesetDetectResult) -> None:
-        """Check for package errors."""
-        m = re.search(r"! Package (\w+) Error: (.+)\.", line)
+        m = _PACKAGE_ERROR_RE.search(line)
         if m:
             result.package_errors.append(PackageError(
-                package=m.group(1), message=m.group(2)
+                package=m.group(1), message=m.group(2), file=file
             ))
+
+
+def _source_lines(match: re.Match) -> List[int]:
+    """Line range of a box warning: "lines A--B" or "detected at line N"."""
+    if match.group(3):
+        return [int(match.group(3)), int(match.group(4))]
+    if match.group(5):
+        return [int(match.group(5))] * 2
+    return []
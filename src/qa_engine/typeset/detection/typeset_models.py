@@ -6,8 +6,10 @@ Contains dataclasses used by LogWarningDetector matching qa-typeset-detect skill
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
@@ -18,6 +20,31 @@ class WarningSeverity(Enum):
     CRITICAL = "CRITICAL"
 
 
+def is_source_file(
+    log_name: str, path: str,
+    compile_dir: Optional[Path] = None, project_root: Optional[Path] = None,
+) -> bool:
+    """Whether a file name from the log denotes path; unattributed ("") matches any.
+
+    A relative log name is resolved against compile_dir, where TeX ran, and
+    a relative path against project_root; each defaults to the other, then
+    to the working directory. The resolved files are compared, so a bare
+    "ch1.tex" only denotes the ch1.tex of the compile directory.
+    """
+    if not log_name or not path:
+        return True
+    compile_dir = compile_dir or project_root or Path.cwd()
+    project_root = project_root or compile_dir
+    name = os.path.abspath(os.path.join(compile_dir, log_name.replace("\\", "/")))
+    target = os.path.abspath(os.path.join(project_root, path))
+    if os.path.normcase(name) == os.path.normcase(target):
+        return True
+    try:
+        return os.path.samefile(name, target)
+    except OSError:
+        return False
+
+
 @dataclass
 class HboxWarning:
     """Overfull/Underfull hbox warning."""
@@ -27,6 +54,7 @@ class HboxWarning:
     lines: List[int] = field(default_factory=list)
     context: str = ""
     severity: str = "WARNING"
+    file: str = ""  # Source file open in the log when reported
 
 
 @dataclass
@@ -37,6 +65,8 @@ class VboxWarning:
     badness: Optional[int] = None  # For underfull
     context: str = ""
     severity: str = "WARNING"
+    file: str = ""
+    lines: List[int] = field(default_factory=list)  # "detected at line N"
 
 
 @dataclass
@@ -46,6 +76,7 @@ class UndefinedReference:
     page: int
     input_line: int
     severity: str = "CRITICAL"
+    file: str = ""
 
 
 @dataclass
@@ -55,6 +86,7 @@ class UndefinedCitation:
     page: int
     input_line: int
     severity: str = "CRITICAL"
+    file: str = ""
 
 
 @dataclass
@@ -63,6 +95,7 @@ class FloatTooLarge:
     overflow_pt: float
     input_line: int
     severity: str = "CRITICAL"
+    file: str = ""
 
 
 @dataclass
@@ -92,6 +125,7 @@ class LatexError:
     message: str
     line: Optional[int] = None
     severity: str = "CRITICAL"
+    file: str = ""
 
 
 @dataclass
@@ -100,6 +134,7 @@ class PackageError:
     package: str
     message: str
     severity: str = "WARNING"
+    file: str = ""
 
 
 @dataclass
@@ -166,3 +201,11 @@ class TypesetDetectResult:
         if self.overfull_vbox or self.underfull_vbox:
             t.append("qa-typeset-fix-vbox")
         return t
+
+    def hbox_issues_by_file(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Hbox warnings as HboxFixer issues, grouped by attributed source file."""
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for w in self.overfull_hbox + self.underfull_hbox:
+            if w.lines:
+                grouped.setdefault(w.file, []).append({"line": w.lines[0], "type": w.type})
+        return grouped
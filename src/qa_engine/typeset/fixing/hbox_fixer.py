@@ -3,7 +3,10 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..detection.typeset_models import TypesetDetectResult
 
 @dataclass
 class HboxFix:
@@ -52,6 +55,11 @@ class HboxFixer:
         if result.fixes_applied: file_path.write_text(fixed, encoding="utf-8")
         return result
 
+    def fix_from_log(self, detect_result: TypesetDetectResult, root: Path) -> Dict[str, HboxFixResult]:
+        """Fix log warnings in the source files they are attributed to, each opened once."""
+        return {name: self.fix_file(root / name, issues)
+                for name, issues in detect_result.hbox_issues_by_file().items() if name}
+
     def fix_content(self, content: str, file_path: str = "", issues: Optional[List[Dict]] = None) -> Tuple[str, HboxFixResult]:
         """Fix hbox issues in content."""
         result, lines = HboxFixResult(), content.split("\n")
@@ -194,6 +194,20 @@ class TestBiDiDetector:
         tcolorbox_issues = [i for i in issues if i.rule == "bidi-tcolorbox"]
         assert len(tcolorbox_issues) > 0
 
+    def test_rule8_tcolorbox_inside_english_wrapper(self):
+        """Test tcolorbox inside an english environment is not flagged."""
+        content = "שלום\n\\begin{english}\n\\begin{tcolorbox}\nx\n\\end{tcolorbox}\n\\end{english}"
+        issues = self.detector.detect(content, "test.tex")
+        assert not [i for i in issues if i.rule == "bidi-tcolorbox"]
+
+    def test_rule8_duplicate_line_located_by_line_number(self):
+        """Test a repeated tcolorbox line after the wrapper closes is still flagged."""
+        box = "\\begin{tcolorbox}\nx\n\\end{tcolorbox}"
+        content = f"שלום\n\\begin{{english}}\n{box}\n\\end{{english}}\n{box}"
+        issues = self.detector.detect(content, "test.tex")
+        tcolorbox_issues = [i for i in issues if i.rule == "bidi-tcolorbox"]
+        assert [i.line for i in tcolorbox_issues] == [7]
+
     # Rule 9: Section Titles with English
     def test_rule9_section_english_in_hebrew(self):
         """Test detection of English in Hebrew section title."""
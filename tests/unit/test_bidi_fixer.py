@@ -6,6 +6,7 @@ import pytest
 
 from qa_engine.domain.models.issue import Issue, Severity
 from qa_engine.infrastructure.fixing.bidi_fixer import BiDiFixer
+from qa_engine.infrastructure.indexing import ContextKind, LatexContextIndex
 
 
 class TestBiDiFixer:
@@ -149,8 +150,8 @@ class TestBiDiFixer:
         assert self.fixer._is_already_wrapped(r"\num{42}") is True
         assert self.fixer._is_already_wrapped("CPU") is False
 
-    def test_get_tikz_lines_simple(self):
-        """Test _get_tikz_lines identifies lines inside tikzpicture."""
+    def test_tikz_lines_simple(self):
+        """Test the fixer's context index puts lines inside tikzpicture in TikZ."""
         lines = [
             "Some text before",
             r"\begin{tikzpicture}",
@@ -159,7 +160,7 @@ class TestBiDiFixer:
             r"\end{tikzpicture}",
             "Some text after",
         ]
-        tikz_lines = self.fixer._get_tikz_lines(lines)
+        tikz_lines = LatexContextIndex("\n".join(lines)).lines_in(ContextKind.TIKZ_ENV)
         # Lines 2,3,4 are inside TikZ (depth > 0 after processing)
         assert 2 in tikz_lines
         assert 3 in tikz_lines
@@ -168,8 +169,8 @@ class TestBiDiFixer:
         assert 5 not in tikz_lines  # \end line brings depth to 0
         assert 6 not in tikz_lines
 
-    def test_get_tikz_lines_nested_axis(self):
-        """Test _get_tikz_lines handles nested axis environment."""
+    def test_tikz_lines_nested_axis(self):
+        """Test the fixer's context index handles a nested axis environment."""
         lines = [
             "Text",
             r"\begin{tikzpicture}",
@@ -179,7 +180,7 @@ class TestBiDiFixer:
             r"\end{tikzpicture}",
             "More text",
         ]
-        tikz_lines = self.fixer._get_tikz_lines(lines)
+        tikz_lines = LatexContextIndex("\n".join(lines)).lines_in(ContextKind.TIKZ_ENV)
         # Lines 2-5 are inside TikZ environments (depth > 0 after processing)
         # Line 6 (\end{tikzpicture}) brings depth to 0, so it's excluded
         # (which is fine - no content to wrap on closing tag)
@@ -235,33 +236,33 @@ class TestBiDiFixer:
         # TikZ line should remain unchanged
         assert r"\node[below] at (0,0) {CPU};" in result
 
-    def test_is_inside_color_context_tcolorbox(self):
-        """Test _is_inside_color_context detects tcolorbox color options."""
+    def test_color_context_tcolorbox(self):
+        """Test tcolorbox color options are color contexts."""
         line = r"colback=purple!5, colframe=green!60!black"
         # colback=purple!5, colframe=green!60!black
         # 01234567890123456789...
         # Position 8 is 'p' in purple (first color)
-        assert self.fixer._is_inside_color_context(line, 8) is True
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 8) is True
         # Position 15 is '5' after purple!
-        assert self.fixer._is_inside_color_context(line, 15) is True
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 15) is True
         # Position 27 is 'g' in green (second color)
-        assert self.fixer._is_inside_color_context(line, 27) is True
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 27) is True
 
-    def test_is_inside_color_context_textcolor(self):
-        r"""Test _is_inside_color_context detects \textcolor command."""
+    def test_color_context_textcolor(self):
+        r"""Test the \textcolor color argument is a color context."""
         line = r"\textcolor{green!60!black}{text}"
         # Position 11 is 'g' in green
-        assert self.fixer._is_inside_color_context(line, 11) is True
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 11) is True
         # Position 17 is '6' in 60
-        assert self.fixer._is_inside_color_context(line, 17) is True
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 17) is True
         # Position 27 is 't' in text (outside color spec)
-        assert self.fixer._is_inside_color_context(line, 27) is False
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 27) is False
 
-    def test_is_inside_color_context_no_color(self):
-        """Test _is_inside_color_context returns False for non-color context."""
+    def test_color_context_no_color(self):
+        """Test plain text is not a color context."""
         line = r"טקסט רגיל עם Python ומספר 42"
-        assert self.fixer._is_inside_color_context(line, 15) is False
-        assert self.fixer._is_inside_color_context(line, 25) is False
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 15) is False
+        assert LatexContextIndex(line).contains(ContextKind.COLOR, 25) is False
 
     def test_fix_skips_color_context(self):
         """Test fixer skips issues inside color specifications."""
@@ -0,0 +1,121 @@
+"""
+Tests for the build artifact analyzer.
+
+Covers contents/bookmark/aux/bbl/blg/bcf parsing, included .aux files,
+mtime caching and the bibliography checks that read the artifacts.
+"""
+
+from qa_engine.bibliography.detection.bib_detector import BibDetector
+from qa_engine.bibliography.detection.bib_models import BibIssueType
+from qa_engine.infrastructure.indexing import BuildArtifactAnalyzer
+from qa_engine.infrastructure.indexing import build_artifacts as artifacts_module
+from qa_engine.toc.detection.toc_entry_parser import TOCEntryParser
+
+AUX = r"""\relax
+\citation{knuth84,lamport94}
+\abx@aux@cite{0}{knuth84}
+\newlabel{sec:intro}{{1.1}{3}{Intro {\em here}}{section.1.1}{}}
+\bibcite{knuth84}{1}
+\@input{chapter1.aux}
+"""
+TOC = r"""\babel@toc {hebrew}{}\relax
+\contentsline {chapter}{\numberline {1}מבוא}{1}{chapter.1}%
+\contentsline {section}{\numberline {\LRE{1.1}}Intro}{3}{section.1.1}%
+\contentsline {chapter}{References}{9}{chapter*.4}%
+"""
+LOF = r"\contentsline {figure}{\numberline {1.1}{\ignorespaces A {\bf bold} figure}}{5}{figure.caption.3}%"
+OUT = r"\BOOKMARK [1][-]{section.1.1}{\376\377\000I\000n\000t\000r\000o}{chapter.1}% 2"
+BLG = "[12] Biber version: 2.19\n[40] Utils.pm:410> WARN - Duplicate entry 'x'\n" \
+      "[41] Utils.pm:411> ERROR - Cannot find 'refs.bib'!\n"
+
+
+def write_build(tmp_path):
+    files = {
+        "main.aux": AUX, "chapter1.aux": "\\newlabel{fig:a}{{1.1}{5}{}{figure.1}{}}\n\\citation{new}\n",
+        "main.toc": TOC, "main.lof": LOF, "main.out": OUT, "main.blg": BLG,
+        "main.bbl": "\\entry{knuth84}{book}{}\n\\endentry\n",
+        "main.bcf": '<bcf:citekey order="1" intorder="1">knuth84</bcf:citekey>',
+    }
+    for name, text in files.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+
+
+class TestBuildArtifactAnalyzer:
+    """Tests for BuildArtifactAnalyzer."""
+
+    def test_typed_model(self, tmp_path):
+        """Every artifact kind lands in its part of the model."""
+        write_build(tmp_path)
+        art = BuildArtifactAnalyzer().analyze(tmp_path / "main.tex")
+        assert [(e.kind, e.number, e.title, e.page) for e in art.toc] == [
+            ("chapter", "1", "מבוא", "1"), ("section", "1.1", "Intro", "3"),
+            ("chapter", "", "References", "9"),
+        ]
+        assert [(e.number, e.title, e.anchor) for e in art.lof] == [
+            ("1.1", "A {\\bf bold} figure", "figure.caption.3"),
+        ]
+        assert [(b.level, b.title, b.anchor) for b in art.bookmarks] == [(1, "Intro", "section.1.1")]
+        intro = art.labels["sec:intro"]
+        assert (intro.number, intro.page, intro.title, intro.anchor) == ("1.1", "3", "Intro {\\em here}", "section.1.1")
+        assert "fig:a" in art.labels  # From the included chapter .aux
+        assert art.cited == ["knuth84", "lamport94", "new"]
+        assert art.bib_entries == ["knuth84"]
+        assert art.missing_citations == ["lamport94", "new"]
+        assert [(w.severity, w.message) for w in art.warnings] == [
+            ("warning", "Duplicate entry 'x'"), ("error", "Cannot find 'refs.bib'!"),
+        ]
+
+    def test_cached_by_mtime(self, tmp_path, monkeypatch):
+        """Unchanged artifacts are not parsed again."""
+        write_build(tmp_path)
+        analyzer = BuildArtifactAnalyzer()
+        analyzer.analyze(tmp_path / "main.tex")
+        parsed = []
+        original = artifacts_module._parse_path
+        monkeypatch.setattr(artifacts_module, "_parse_path", lambda p: parsed.append(p) or original(p))
+        analyzer.analyze(tmp_path / "main.tex")
+        assert parsed == []
+        (tmp_path / "main.bbl").write_text("\\entry{knuth84}{book}{}\n\\entry{new}{book}{}\n", encoding="utf-8")
+        art = analyzer.analyze(tmp_path / "main.tex")
+        assert parsed == [str(tmp_path / "main.bbl")]
+        assert art.missing_citations == ["lamport94"]
+
+    def test_label_numbers_are_plain(self, tmp_path):
+        """Label numbers are cleaned like contents numbers."""
+        (tmp_path / "main.aux").write_text(
+            "\\newlabel{ch:a}{{\\textenglish {1}}{3}{A}{chapter.1}{}}\n", encoding="utf-8")
+        art = BuildArtifactAnalyzer().analyze(tmp_path / "main.tex")
+        assert art.labels["ch:a"].number == "1"
+
+    def test_missing_artifacts(self, tmp_path):
+        """A document that was never compiled has an empty model."""
+        art = BuildArtifactAnalyzer().analyze(tmp_path / "main.tex")
+        assert art.files == {} and art.toc == [] and art.cited == []
+
+
+class TestBibDetectorArtifacts:
+    """Tests for the bibliography checks that read the artifacts."""
+
+    def test_toc_entry_and_empty_bbl(self, tmp_path):
+        """References in the .toc counts; an empty .bbl is reported."""
+        (tmp_path / "main.tex").write_text(
+            "\\cite{knuth84}\n\\begin{english}\\printbibliography\\end{english}\n", encoding="utf-8")
+        (tmp_path / "main.toc").write_text(TOC, encoding="utf-8")
+        (tmp_path / "main.bbl").write_text("% no entries\n", encoding="utf-8")
+        result = BibDetector().detect_in_project(tmp_path)
+        assert result.bib_in_toc
+        assert not result.bib_rendered
+        assert any(i.type == BibIssueType.EMPTY_BIBLIOGRAPHY for i in result.issues)
+
+
+class TestTocParserArtifacts:
+    """Tests for the TOC parser reading through the shared analyzer."""
+
+    def test_parse_file_matches_content(self, tmp_path):
+        """Entries read from the analyzer's cache equal a direct parse of the file."""
+        path = tmp_path / "main.toc"
+        path.write_text(TOC, encoding="utf-8")
+        parser = TOCEntryParser()
+        entries = parser.parse_file(str(path))
+        assert entries == parser.parse_content(TOC, str(path))
+        assert [(e.entry_type, e.line_number) for e in entries] == [("chapter", 2), ("section", 3), ("chapter", 4)]
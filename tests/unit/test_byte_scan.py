@@ -0,0 +1,105 @@
+"""
+Tests for the byte-level encoding scanner.
+
+Covers byte classes, line/column mapping, mmap file scans and the
+scanner-driven paths of EncodingFixer and CodeDetector.
+"""
+
+from qa_engine.infrastructure.detection.code_detector import CodeDetector
+from qa_engine.infrastructure.fixing import EncodingFixer
+from qa_engine.infrastructure.indexing import ByteScanner, scan_bytes, scan_file, scan_text
+
+
+class TestByteClasses:
+    """Tests for the byte classes."""
+
+    def test_clean_file_has_no_hits(self):
+        """ASCII and Hebrew text are clean."""
+        assert scan_text("\\section{מבוא}\nplain text\n" * 1000) == []
+
+    def test_classes_with_positions(self):
+        """Each class is reported with its 1-based line and character column."""
+        text = "\ufeffabc\nשלום \U0001F60A x\u200by\n\u202eevil\n"
+        hits = [(h.kind, h.line, h.column, h.label) for h in scan_text(text)]
+        assert hits == [
+            ("bom", 1, 1, "U+FEFF"),
+            ("non_bmp", 2, 6, "U+1F60A"),
+            ("zero_width", 2, 9, "U+200B"),
+            ("bidi_control", 3, 1, "U+202E"),
+        ]
+
+    def test_mid_file_feff_is_zero_width(self):
+        """U+FEFF after the first byte is a zero-width no-break space."""
+        assert [h.kind for h in scan_text("a\ufeffb")] == ["zero_width"]
+
+    def test_invalid_utf8(self):
+        """Stray and truncated bytes are reported once each."""
+        hits = scan_bytes("ok\nשלום".encode("utf-8") + b"\xff x \xd7\n")
+        assert [(h.kind, h.line, h.label) for h in hits] == [
+            ("invalid_utf8", 2, "0xFF"), ("invalid_utf8", 2, "0xD7"),
+        ]
+
+    def test_extra_characters(self):
+        """Extra characters are reported as kind 'char'."""
+        hits = ByteScanner(["\u2013"]).scan_text("a \u2013 b")
+        assert [(h.kind, h.column) for h in hits] == [("char", 3)]
+
+
+class TestFileScan:
+    """Tests for mmap-backed file scans."""
+
+    def test_scan_file(self, tmp_path):
+        """File hits match buffer hits."""
+        path = tmp_path / "a.tex"
+        path.write_bytes("x\n\U0001F916\n".encode("utf-8"))
+        assert [(h.kind, h.line) for h in scan_file(path)] == [("non_bmp", 2)]
+
+    def test_empty_file(self, tmp_path):
+        """Empty files cannot be mapped and are clean."""
+        path = tmp_path / "empty.tex"
+        path.write_bytes(b"")
+        assert scan_file(path) == []
+
+
+class TestScannerConsumers:
+    """Tests for EncodingFixer and CodeDetector on scanner hits."""
+
+    def test_fix_file_skips_clean_files(self, tmp_path):
+        """A file without hits is not rewritten."""
+        path = tmp_path / "clean.tex"
+        path.write_text("טקסט - text\n", encoding="utf-8")
+        mtime = path.stat().st_mtime_ns
+        assert EncodingFixer().fix_file(path) == []
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_fix_file_applies_patterns(self, tmp_path):
+        """Pattern characters are found by bytes and fixed."""
+        path = tmp_path / "dash.tex"
+        path.write_text("\ufeffa \u2013 b \U0001F4DD\n", encoding="utf-8")
+        changes = EncodingFixer().fix_file(path)
+        assert {c["pattern"] for c in changes} == {"byte-order-mark", "en-dash", "note"}
+        assert path.read_text(encoding="utf-8") == "a - b [Note]\n"
+
+    def test_fix_file_reports_invalid_utf8(self, tmp_path):
+        """Files with invalid UTF-8 are reported, not rewritten."""
+        path = tmp_path / "latin1.tex"
+        path.write_bytes(b"caf\xe9 \xe2\x80\x93\n")
+        changes = EncodingFixer().fix_file(path)
+        assert changes == [{"pattern": "invalid-utf8", "line": 1, "column": 4,
+                            "original": "0xE9", "fixed": False}]
+        assert path.read_bytes() == b"caf\xe9 \xe2\x80\x93\n"
+
+    def test_detector_emoji_and_invisible(self):
+        """Emoji are found anywhere, invisible characters inside code."""
+        content = (
+            "Text \U0001F680 here x\u200by\n"
+            "\\begin{lstlisting}\n"
+            "total = a\u200b + b\n"
+            "\\end{lstlisting}\n"
+        )
+        issues = CodeDetector().detect(content, "doc.tex")
+        found = [(i.rule, i.line, i.content) for i in issues if i.rule.startswith("code-encoding")]
+        assert found == [
+            ("code-encoding-emoji", 1, "\U0001F680"),
+            ("code-encoding-invisible", 3, "U+200B"),
+        ]
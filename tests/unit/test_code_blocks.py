@@ -0,0 +1,109 @@
+"""
+Tests for code block extraction and the project code block store.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+from bc_engine.dedup.chunker import ChapterChunker
+from bc_engine.dedup.config import DedupConfig
+from qa_engine.infrastructure.detection import ListingSyntaxDetector
+from qa_engine.infrastructure.detection.code_detector import CodeDetector
+from qa_engine.infrastructure.indexing import CodeBlockStore, find_code_blocks
+
+DOC = r"""Intro
+\begin{pythonbox}[Title]
+x = "%d" % 3  # \end{english}
+\end{pythonbox}
+% \begin{lstlisting}
+\begin{lstlisting}[language=Bash]
+echo \begin{verbatim}
+\end{lstlisting}
+\begin{minted}{Ruby}
+puts 1
+\end{minted}
+"""
+
+
+class TestFindCodeBlocks:
+    """Tests for one-pass extraction."""
+
+    def test_blocks_spans_and_languages(self):
+        """Test blocks, bodies and languages, ignoring LaTeX-looking code."""
+        blocks = find_code_blocks(DOC)
+        assert [(b.env, b.line, b.end_line, b.language) for b in blocks] == [
+            ("pythonbox", 2, 4, "python"), ("lstlisting", 6, 8, "bash"), ("minted", 9, 11, "ruby"),
+        ]
+        assert blocks[0].header == "[Title]"
+        assert blocks[0].content == 'x = "%d" % 3  # \\end{english}\n'
+        assert DOC[blocks[1].start:blocks[1].end].endswith("\\end{lstlisting}")
+
+    def test_digest_tracks_content(self):
+        """Test the digest changes with the body only."""
+        first = find_code_blocks(DOC)[2]
+        moved = find_code_blocks("\n\n" + DOC)[2]
+        edited = find_code_blocks(DOC.replace("puts 1", "puts 2"))[2]
+        assert first.digest == moved.digest != edited.digest
+
+    def test_nested_non_verbatim_environment(self):
+        """Test non-verbatim environments count nesting."""
+        content = "\\begin{tcolorbox}a\\begin{tcolorbox}b\\end{tcolorbox}c\\end{tcolorbox}d"
+        (block,) = find_code_blocks(content, ("tcolorbox",))
+        assert content[block.end:] == "d"
+
+
+class TestCodeBlockStore:
+    """Tests for the project-wide store."""
+
+    def test_changed_blocks_persist_across_runs(self, tmp_path):
+        """Test only new or edited blocks are reported, also after a restart."""
+        tex, state = tmp_path / "ch1.tex", tmp_path / "state.json"
+        tex.write_text(DOC)
+        store = CodeBlockStore(state_path=state)
+        assert store.scan_project(tmp_path) == 3
+        assert len(store.changed(tex)) == 3
+        assert store.changed(tex) == []
+        store.save()
+
+        tex.write_text(DOC.replace("puts 1", "puts 2"))
+        os.utime(tex, ns=(1, 1))
+        changed = CodeBlockStore(state_path=state).changed(tex)
+        assert [b.env for b in changed] == ["minted"]
+
+
+class TestStoreConsumers:
+    """Tests for components that consume extracted blocks."""
+
+    def test_detector_code_lines(self):
+        """Test lines inside a block are in code, the end line is not."""
+        content = "\\begin{lstlisting}\nשלום = 1\n\\end{lstlisting}\nשלום"
+        issues = [i for i in CodeDetector().detect(content, "a.tex") if i.rule == "code-direction-hebrew"]
+        assert {(i.line, i.context["code_env"]) for i in issues} == {(2, "lstlisting")}
+
+    def test_chunker_strips_excluded(self):
+        """Test excluded environments are removed with nesting respected."""
+        config = MagicMock(spec=DedupConfig)
+        config.excluded_environments = ["figure"]
+        chunker = ChapterChunker(config)
+        text = "a \\begin{figure}x\\begin{figure}y\\end{figure}z\\end{figure} b"
+        assert chunker._strip_excluded_environments(text) == "a  b"
+
+    def test_chunker_keeps_unclosed_environment(self):
+        """Test an unclosed environment is not stripped to the end of the chapter."""
+        config = MagicMock(spec=DedupConfig)
+        config.excluded_environments = ["figure"]
+        text = "a \\begin{figure}x\\end{figure} b \\begin{figure} rest of chapter"
+        stripped = ChapterChunker(config)._strip_excluded_environments(text)
+        assert stripped == "a  b \\begin{figure} rest of chapter"
+
+    def test_syntax_detector_uses_store(self, tmp_path):
+        """Test project detection reads blocks through the store and skips reported ones."""
+        tex = tmp_path / "ch1.tex"
+        tex.write_text("% qa-code: fragment\n\\begin{pythonbox}\nreturn 1\n\\end{pythonbox}\n"
+                       "\\begin{pythonbox}\ndef f(:\n\\end{pythonbox}\n")
+        store = CodeBlockStore(state_path=tmp_path / "state.json")
+        detector = ListingSyntaxDetector(store=store)
+        assert [i.line for i in detector.detect_project(tmp_path)] == [6]
+        assert [i.line for i in detector.detect_project(tmp_path, changed_only=True)] == [6]
+        assert detector.detect_project(tmp_path, changed_only=True) == []
+        assert len(store.blocks(tex)) == 2
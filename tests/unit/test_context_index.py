@@ -0,0 +1,181 @@
+"""
+Tests for the LaTeX context span index.
+"""
+
+import pytest
+
+from qa_engine.infrastructure.indexing import (
+    ContextKind,
+    EnvironmentDepthTable,
+    EnvironmentTree,
+    LatexContextIndex,
+    SpanSet,
+)
+
+
+class TestSpanSet:
+    """Tests for SpanSet interval merging and lookup."""
+
+    def test_contains_half_open(self):
+        """Test start is inside and end is outside."""
+        spans = SpanSet()
+        spans.add(5, 10)
+        spans.freeze()
+        assert spans.contains(5)
+        assert spans.contains(9)
+        assert not spans.contains(10)
+        assert not spans.contains(4)
+
+    def test_overlapping_spans_merged(self):
+        """Test nested and overlapping spans collapse into one."""
+        spans = SpanSet()
+        spans.add(10, 20)
+        spans.add(0, 12)
+        spans.add(14, 16)
+        spans.freeze()
+        assert spans.spans() == [(0, 20)]
+
+    def test_empty_span_ignored(self):
+        """Test zero-length spans are dropped."""
+        spans = SpanSet()
+        spans.add(3, 3)
+        assert len(spans.freeze()) == 0
+
+
+class TestLatexContextIndex:
+    """Tests for LatexContextIndex context queries."""
+
+    def test_offset_and_line_of(self):
+        """Test line/column to offset conversion round-trips."""
+        index = LatexContextIndex("ab\ncde\nf")
+        assert index.offset(2, 1) == 4
+        assert index.line_of(4) == 2
+        assert index.line_of(7) == 3
+
+    def test_inline_math(self):
+        """Test $...$ spans cover the math body."""
+        line = "טקסט $x + 5$ ועוד 7"
+        index = LatexContextIndex(line)
+        assert index.contains(ContextKind.MATH, line.index("5"))
+        assert not index.contains(ContextKind.MATH, line.index("7"))
+
+    def test_escaped_dollar_is_not_math(self):
+        r"""Test \$ does not open math mode."""
+        line = r"מחיר \$5 לחודש"
+        index = LatexContextIndex(line)
+        assert not index.contains(ContextKind.MATH, line.index("5"))
+
+    def test_display_math_on_line(self):
+        r"""Test \[...\] spans are math."""
+        line = r"\[ a = 3 \] ואז 4"
+        index = LatexContextIndex(line)
+        assert index.contains(ContextKind.MATH, line.index("3"))
+        assert not index.contains(ContextKind.MATH, line.index("4"))
+
+    def test_cite_with_nested_braces(self):
+        """Test cite span follows nested braces."""
+        line = r"ראו \cite{key{x}2024} בשנת 2025"
+        index = LatexContextIndex(line)
+        assert index.contains(ContextKind.CITE, line.index("2024"))
+        assert not index.contains(ContextKind.CITE, line.index("2025"))
+
+    def test_color_option_and_command(self):
+        """Test tcolorbox options and color commands are color contexts."""
+        line = r"[colback=purple!5, title=x] \textcolor{green!60}{טקסט}"
+        index = LatexContextIndex(line)
+        assert index.contains(ContextKind.COLOR, line.index("5"))
+        assert not index.contains(ContextKind.COLOR, line.index("title"))
+        assert index.contains(ContextKind.COLOR, line.index("60"))
+
+    def test_tikz_statement_until_semicolon(self):
+        """Test inline TikZ statements end at the semicolon."""
+        line = r"\draw[thick] (0,0) -- (1,2); 3"
+        index = LatexContextIndex(line)
+        assert index.contains(ContextKind.TIKZ, line.index("1,2"))
+        assert not index.contains(ContextKind.TIKZ, line.index(" 3") + 1)
+
+    def test_tikz_environment_lines(self):
+        """Test lines inside tikzpicture are TikZ environment lines."""
+        content = "a\n\\begin{tikzpicture}\n\\node {x};\n\\end{tikzpicture}\nb"
+        index = LatexContextIndex(content)
+        assert index.lines_in(ContextKind.TIKZ_ENV) == {2, 3}
+
+    def test_code_block_span(self):
+        """Test code environments are indexed across lines."""
+        content = "x\n\\begin{pythonbox}\nprint(1)\n\\end{pythonbox}\ny"
+        index = LatexContextIndex(content)
+        assert index.contains(ContextKind.CODE, content.index("print"))
+        assert not index.contains(ContextKind.CODE, content.rindex("y"))
+
+    def test_wrapper_commands(self):
+        r"""Test \en{} and \hebrew{} wrappers are queryable by name."""
+        line = r"\en{API 2} ו-\hebrew{שלום} 3"
+        index = LatexContextIndex(line)
+        assert index.in_wrapper(line.index("2"), ["en"])
+        assert index.in_wrapper(line.index("שלום"), ["hebrew"])
+        assert not index.in_wrapper(line.index("3"), ["en", "hebrew"])
+
+    @pytest.mark.parametrize("kind", list(ContextKind))
+    def test_kinds_at_empty_content(self, kind):
+        """Test empty content has no contexts."""
+        index = LatexContextIndex("")
+        assert kind not in index.kinds_at(0)
+
+
+class TestEnvironmentDepthTable:
+    """Tests for EnvironmentDepthTable depth lookups."""
+
+    def test_depth_at_line_start(self):
+        """Test depth accumulates across lines."""
+        content = "a\n\\begin{english}\nb\n\\end{english}\nc"
+        table = EnvironmentDepthTable(content, ["english"])
+        assert not table.is_active("english", 1, 0)
+        assert table.is_active("english", 3, 0)
+        assert not table.is_active("english", 5, 0)
+
+    def test_depth_within_line(self):
+        """Test tokens on the queried line count only before the column."""
+        line = r"x \begin{english} y \end{english} z"
+        table = EnvironmentDepthTable(line, ["english"])
+        assert not table.is_active("english", 1, line.index("x"))
+        assert table.is_active("english", 1, line.index("y"))
+        assert not table.is_active("english", 1, line.index("z"))
+
+    def test_untracked_environment_inactive(self):
+        """Test environments not requested are never active."""
+        table = EnvironmentDepthTable("\\begin{english}\nx", ["english"])
+        assert not table.is_active("hebrew", 2, 0)
+
+
+class TestEnvironmentTree:
+    """Tests for EnvironmentTree pairing and ancestor lookups."""
+
+    def test_nesting_and_ancestors(self):
+        """Test nested environments are returned innermost first."""
+        content = "\\begin{english}\n\\begin{table}\n\\begin{tabular}{l}\nx\n\\end{tabular}\n\\end{table}\n\\end{english}"
+        tree = EnvironmentTree(content)
+        names = [node.name for node in tree.ancestors(content.index("x"))]
+        assert names == ["tabular", "table", "english"]
+        assert tree.nodes("tabular")[0].depth == 2
+
+    def test_closed_environment_not_ancestor(self):
+        """Test offsets after an environment closes are outside it."""
+        content = "\\begin{english}X\\end{english} Y"
+        tree = EnvironmentTree(content)
+        assert tree.is_inside(content.index("X"), "english")
+        assert not tree.is_inside(content.index("Y"), "english")
+
+    def test_commented_tokens_ignored(self):
+        """Test begin/end after % are not paired."""
+        content = "\\begin{table}\n% \\end{table}\nx\n\\end{table}"
+        tree = EnvironmentTree(content)
+        assert tree.is_inside(content.index("x"), "table")
+
+    def test_unclosed_environment_runs_to_end(self):
+        """Test an unclosed environment extends to the end of content."""
+        content = "\\begin{hebrewtable}\n\\begin{rtltabular}{l}\nx"
+        tree = EnvironmentTree(content)
+        node = tree.nodes("hebrewtable")[0]
+        assert not node.closed
+        assert node.end == len(content)
+        assert tree.line_of(content.index("x")) == 3
@@ -0,0 +1,101 @@
+"""
+Tests for the Unicode direction-run segmenter.
+"""
+
+from unittest.mock import MagicMock
+
+from qa_engine.infrastructure.indexing import Direction, segment_line
+from qa_engine.toc.config.config_loader import TOCConfigLoader
+from qa_engine.toc.detection.bidi_helpers import BiDiHelpers
+
+
+class TestSegmentLine:
+    """Tests for segment_line run splitting."""
+
+    def test_runs_cover_line(self):
+        """Test runs are contiguous and rebuild the line."""
+        line = "שלום API 2024!"
+        seg = segment_line(line)
+        assert "".join(run.text for run in seg.runs) == line
+        assert [run.direction for run in seg.runs] == [
+            Direction.HEBREW, Direction.NEUTRAL, Direction.LATIN,
+            Direction.NEUTRAL, Direction.DIGIT, Direction.NEUTRAL,
+        ]
+
+    def test_presentation_forms_are_hebrew(self):
+        """Test Hebrew presentation forms count as Hebrew."""
+        assert segment_line("שׁ").has(Direction.HEBREW)
+
+    def test_non_ascii_latin_is_neutral(self):
+        """Test accented letters are not treated as Latin."""
+        assert not segment_line("é").has(Direction.LATIN)
+
+    def test_of_min_length(self):
+        """Test of() filters runs by length."""
+        seg = segment_line("a bc def")
+        assert [run.text for run in seg.of(Direction.LATIN, 2)] == ["bc", "def"]
+
+    def test_cached(self):
+        """Test repeated lines share one segmentation."""
+        assert segment_line("abc שלום") is segment_line("abc שלום")
+
+
+class TestLineSegmentation:
+    """Tests for mixed-direction queries."""
+
+    def test_strong_chains_join_over_spaces(self):
+        """Test Hebrew and Latin runs separated by spaces form one chain."""
+        chains = list(segment_line("שלום Python עולם").strong_chains())
+        assert [[run.text for run in chain] for chain in chains] == [["שלום", "Python", "עולם"]]
+
+    def test_punctuation_breaks_chain(self):
+        """Test non-space neutrals split chains."""
+        chains = list(segment_line("שלום, Python, עולם").strong_chains())
+        assert [len(chain) for chain in chains] == [1, 1, 1]
+
+    def test_acronyms_standalone(self):
+        """Test acronyms must be uppercase and standalone."""
+        seg = segment_line("מודל LLM ו-GPU4 ו-Api ABCDEF")
+        assert [run.text for run in seg.acronyms(2, 5)] == ["LLM"]
+
+    def test_preceded_by(self):
+        """Test prefix check before a run."""
+        seg = segment_line(r"\textbf{bold} \en{word}")
+        runs = {run.text: run for run in seg.of(Direction.LATIN)}
+        assert seg.preceded_by(runs["textbf"], "\\")
+        assert seg.preceded_by(runs["word"], "\\en{")
+        assert not seg.preceded_by(runs["bold"], "\\")
+
+
+class TestBiDiHelpersMixedPatterns:
+    """Tests for the TOC helpers' configured mixed-text patterns."""
+
+    def test_default_patterns(self):
+        """Test the JSON patterns match within a chain, not across punctuation."""
+        helpers = BiDiHelpers(TOCConfigLoader())
+        assert helpers.has_heb_eng_heb_pattern("מבוא ל API של המערכת")
+        assert not helpers.has_heb_eng_heb_pattern("מבוא, API. שלום")
+        assert helpers.has_eng_heb_eng_pattern("Using שלום Python")
+        assert helpers.has_complex_alternating("שלום API עולם Python")
+
+    def test_configured_pattern_is_used(self):
+        """Test a pattern from the configuration decides, and a missing one disables the check."""
+        config = MagicMock(spec=TOCConfigLoader)
+        config.get_unicode_range.return_value = ""
+        config.get_raw_pattern.side_effect = lambda category, name: (
+            r"[֐-׿]+\s+[A-Z]{2,}\s+[֐-׿]+" if name == "hebrew_english_hebrew" else None
+        )
+        helpers = BiDiHelpers(config)
+        assert helpers.has_heb_eng_heb_pattern("מבוא ל API של")
+        assert not helpers.has_heb_eng_heb_pattern("מבוא ל Python של")
+        assert not helpers.has_eng_heb_eng_pattern("Using שלום Python")
+
+    def test_configured_hebrew_range_is_used(self):
+        """Test has_hebrew matches the configured range, and is off without one."""
+        config = MagicMock(spec=TOCConfigLoader)
+        config.get_unicode_range.return_value = "[א-י]"
+        helpers = BiDiHelpers(config)
+        assert helpers.has_hebrew("abc אבג")
+        assert not helpers.has_hebrew("abc נסע")
+        config.get_unicode_range.return_value = ""
+        assert not BiDiHelpers(config).has_hebrew("אבג")
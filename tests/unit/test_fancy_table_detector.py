@@ -234,3 +234,16 @@ Data & Data \\
         result = self.detector.detect_content(content, "test.tex")
         labels = [a.table_label for a in result.issues if a.table_label]
         assert any("tab:test-table" in label for label in labels) or result.tables_scanned > 0
+
+    def test_english_env_far_above_table(self):
+        """Test english environment is found however far above the table it opens."""
+        filler = "\n".join(f"Line {i}" for i in range(40))
+        content = "\\begin{english}\n" + filler + "\n\\begin{tabular}{|c|}\nA \\\\\n\\end{tabular}\n\\end{english}\n"
+        result = self.detector.detect_content(content, "test.tex")
+        assert all("uses_tabular_not_rtltabular" not in a.problems for a in result.issues)
+
+    def test_closed_english_env_does_not_apply(self):
+        """Test a closed english environment before the table is not an ancestor."""
+        content = "\\begin{english}\nx\n\\end{english}\n\\begin{tabular}{|c|}\nA \\\\\n\\end{tabular}\n"
+        result = self.detector.detect_content(content, "test.tex")
+        assert "uses_tabular_not_rtltabular" in result.issues[0].problems
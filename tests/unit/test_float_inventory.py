@@ -0,0 +1,75 @@
+"""
+Tests for the float and caption inventory.
+"""
+
+from qa_engine.domain.models.issue import Issue, Severity
+from qa_engine.infrastructure.detection.caption_length_detector import CaptionLengthDetector
+from qa_engine.infrastructure.fixing.caption_fixer import CaptionFixer
+from qa_engine.infrastructure.fixing.float_fixer import FloatFixer
+from qa_engine.infrastructure.indexing import FloatInventory
+
+DOC = r"""\begin{figure}[htbp]
+\centering
+\includegraphics[width=\textwidth]{img/a.png}
+% \caption{commented out}
+\caption[Short]{Long \en{nested {x}} text}
+\label{fig:a}
+\end{figure}
+\begin{table}
+\begin{flushleft}\caption{T}\end{flushleft}
+\end{table}
+\includegraphics{loose}
+"""
+
+LONG = "A caption that keeps going " * 5
+
+
+class TestFloatInventory:
+    """Tests for float discovery and attached commands."""
+
+    def test_float_contents(self):
+        """Test placement, caption, label and graphics are attached to the float."""
+        figure, table = FloatInventory(DOC).floats()
+        assert (figure.env, figure.placement, figure.line, figure.end_line) == ("figure", "htbp", 1, 7)
+        assert (figure.caption.short, figure.caption.text) == ("Short", r"Long \en{nested {x}} text")
+        assert figure.label == "fig:a"
+        assert [(g.path, g.options) for g in figure.graphics] == [("img/a.png", r"width=\textwidth")]
+        assert table.caption.parent_env == "flushleft"
+
+    def test_commented_and_standalone_commands(self):
+        """Test commented captions are skipped and loose graphics are listed."""
+        inventory = FloatInventory(DOC)
+        assert len(inventory.captions) == 2
+        assert [g.path for g in inventory.graphics] == ["img/a.png", "loose"]
+        assert inventory.float_at(DOC.index("loose")) is None
+
+    def test_float_at_line(self):
+        """Test line lookup finds the enclosing float."""
+        assert FloatInventory(DOC).float_at_line(3).env == "figure"
+
+
+class TestInventoryConsumers:
+    """Tests for checks and fixers that query the inventory."""
+
+    def test_figure_rule_stays_in_its_figure(self):
+        """Test a figure without caption does not borrow a later table caption."""
+        content = "\\begin{figure}\n\\includegraphics{a}\n\\end{figure}\n" \
+                  f"\\begin{{table}}\n\\caption{{{LONG}}}\n\\end{{table}}\n"
+        issues = CaptionLengthDetector().detect(content, "a.tex")
+        assert "figure-caption-too-long" not in {i.rule for i in issues}
+
+    def test_flushleft_caption_replaced_by_span(self):
+        """Test a flushleft wrapper around a caption becomes centering."""
+        fixed, result = CaptionFixer().fix_content(DOC)
+        assert result.fixes_applied == 1
+        assert "\\centering\n\\caption{T}\n\\end{table}" in fixed
+
+    def test_float_fix_confined_to_issue_float(self):
+        """Test float-too-large fixes only touch the float at the issue line."""
+        content = "\\begin{figure}[htbp]\n\\includegraphics{a}\n\\end{figure}\n" \
+                  "\\begin{figure}[htbp]\n\\includegraphics{b}\n\\end{figure}"
+        issue = Issue(rule="typeset-float-too-large", file="a.tex", line=5,
+                      content="", severity=Severity.WARNING)
+        fixed = FloatFixer().fix(content, [issue])
+        assert fixed.startswith("\\begin{figure}[htbp]\n\\includegraphics{a}")
+        assert "\\begin{figure}[p]" in fixed
@@ -113,3 +113,13 @@ class TestHebMathDetector:
         content = r"$x_{מקסימום}$"
         issues = self.detector.detect(content, "test.tex")
         assert "hebsub" in issues[0].fix.lower()
+
+
+class TestHebMathDisplayContext:
+    """Tests for the math spans math-context rules are matched in."""
+
+    def test_display_math_brackets_are_math(self):
+        r"""Rule 2: \textbf{} with Hebrew inside \[...\] is detected, after it is not."""
+        content = r"\[ \textbf{מורכבות} \] \textbf{הערה}"
+        issues = HebMathDetector().detect(content, "test.tex")
+        assert [i.rule for i in issues] == ["heb-math-textbf"]
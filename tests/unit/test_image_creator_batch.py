@@ -0,0 +1,48 @@
+"""
+Tests for batched, deduplicated placeholder creation.
+"""
+
+import os
+
+from qa_engine.infrastructure.creation import image_creator
+from qa_engine.infrastructure.creation.image_creator import ImageCreator
+
+
+def counting_creator(monkeypatch, tmp_path, **kwargs):
+    """ImageCreator whose renderer writes the label instead of drawing with PIL."""
+    rendered = []
+    monkeypatch.setattr(image_creator, "PIL_AVAILABLE", True)
+    creator = ImageCreator(project_root=tmp_path, **kwargs)
+    monkeypatch.setattr(creator, "_create_placeholder_image", lambda config, name: name)
+
+    def save(img, path):
+        rendered.append(path)
+        path.write_text(img)
+        return True
+
+    monkeypatch.setattr(creator, "_save_image", save)
+    return creator, rendered
+
+
+class TestCreateBatch:
+    """Tests for rendering each distinct placeholder once."""
+
+    def test_identical_placeholders_rendered_once(self, monkeypatch, tmp_path):
+        """Test targets with the same label and format share one render."""
+        creator, rendered = counting_creator(monkeypatch, tmp_path)
+        paths = ["ch1/images/fig.png", "ch2/images/fig.png", "ch3/fig.pdf", "ch1/other.png"]
+        results = creator.create_batch(paths)
+        assert all(results.values()) and len(results) == 4
+        assert len(rendered) == 3
+        assert (tmp_path / "ch2/images/fig.png").read_text() == "fig"
+
+    def test_hardlinked_duplicates(self, monkeypatch, tmp_path):
+        """Test link_duplicates hardlinks the extra targets."""
+        creator, _ = counting_creator(monkeypatch, tmp_path, link_duplicates=True)
+        creator.create_batch(["a/x.png", "b/x.png"])
+        assert os.path.samefile(tmp_path / "a/x.png", tmp_path / "b/x.png")
+
+    def test_without_pil(self, tmp_path, monkeypatch):
+        """Test every target reports failure when PIL is missing."""
+        monkeypatch.setattr(image_creator, "PIL_AVAILABLE", False)
+        assert ImageCreator(project_root=tmp_path).create_batch(["a.png", "a.png"]) == {"a.png": False}
@@ -0,0 +1,96 @@
+"""
+Tests for header-only image metadata and the image size rules.
+"""
+
+import os
+import struct
+import zlib
+
+from qa_engine.infrastructure.detection.image_detector import ImageDetector
+from qa_engine.infrastructure.detection.image_size_check import displayed_width_pt
+from qa_engine.infrastructure.indexing import ImageMetadataCache, read_image_info
+
+
+def chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def png(width: int, height: int, dpi: int = 0) -> bytes:
+    data = b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+    if dpi:
+        ppm = round(dpi / 0.0254)
+        data += chunk(b"pHYs", struct.pack(">IIB", ppm, ppm, 1))
+    return data + chunk(b"IDAT", b"\x00" * 16) + chunk(b"IEND", b"")
+
+
+def jpeg(width: int, height: int, dpi: int) -> bytes:
+    app0 = b"JFIF\x00\x01\x01" + struct.pack(">BHH", 1, dpi, dpi) + b"\x00\x00"
+    sof = struct.pack(">BHHB", 8, height, width, 3) + b"\x00" * 9
+    return (b"\xff\xd8\xff\xe0" + struct.pack(">H", len(app0) + 2) + app0
+            + b"\xff\xc0" + struct.pack(">H", len(sof) + 2) + sof + b"\xff\xda")
+
+
+class TestReadImageInfo:
+    """Tests for the per-format header readers."""
+
+    def test_png_size_and_resolution(self, tmp_path):
+        """Test IHDR size and pHYs resolution are read."""
+        path = tmp_path / "a.png"
+        path.write_bytes(png(1200, 600, dpi=300))
+        info = read_image_info(str(path))
+        assert (info.format, info.width_px, info.height_px) == ("png", 1200, 600)
+        assert round(info.dpi[0]) == 300
+        assert round(info.natural_size_pt[0]) == 289  # 4in
+
+    def test_jpeg_with_wrong_extension(self, tmp_path):
+        """Test the format comes from magic bytes and JFIF density is read."""
+        path = tmp_path / "b.png"
+        path.write_bytes(jpeg(640, 480, 96))
+        info = read_image_info(str(path))
+        assert (info.format, info.width_px, info.height_px, info.dpi) == ("jpeg", 640, 480, (96, 96))
+
+    def test_pdf_and_svg_boxes(self, tmp_path):
+        """Test PDF CropBox wins over MediaBox and SVG units are converted."""
+        pdf, svg = tmp_path / "c.pdf", tmp_path / "d.svg"
+        pdf.write_bytes(b"%PDF-1.5\n1 0 obj<</MediaBox[0 0 612 792]/CropBox [0 0 144 72]>>")
+        svg.write_text('<?xml version="1.0"?>\n<svg xmlns="x" width="2in" viewBox="0 0 10 10" height="1in">')
+        assert read_image_info(str(pdf)).box_bp == (144, 72)
+        assert read_image_info(str(svg)).box_bp == (144, 72)
+        assert read_image_info(str(tmp_path)) is None
+
+    def test_cache_revalidates_on_mtime(self, tmp_path):
+        """Test cached entries are reused until the file changes."""
+        path = tmp_path / "a.png"
+        path.write_bytes(png(10, 10))
+        cache = ImageMetadataCache()
+        first = cache.get(str(path))
+        assert cache.get(str(path)) is first
+        path.write_bytes(png(20, 10))
+        os.utime(path, ns=(1, 1))
+        assert cache.get(str(path)).width_px == 20
+
+
+class TestImageSizeRules:
+    """Tests for the size rules in ImageDetector."""
+
+    def test_displayed_width(self, tmp_path):
+        """Test width, height and scale options give the typeset width."""
+        path = tmp_path / "a.png"
+        path.write_bytes(png(720, 360))  # 10in x 5in at 72 dpi
+        info = read_image_info(str(path))
+        assert displayed_width_pt(r"width=0.5\textwidth", info, 400) == 200
+        assert displayed_width_pt("height=1in", info, 400) == 2 * 72.27
+        assert displayed_width_pt("scale=0.1", info, 400) == info.natural_size_pt[0] * 0.1
+        assert displayed_width_pt("angle=90", info, 400) is None
+
+    def test_rules_flag_overflow_and_resolution(self, tmp_path):
+        """Test overflowing, over-resolved and low-resolution images are reported."""
+        (tmp_path / "wide.png").write_bytes(png(1440, 100))
+        (tmp_path / "dense.png").write_bytes(png(6000, 100))
+        content = "\\includegraphics{wide}\n\\includegraphics[width=2cm]{dense}\n" \
+                  "\\includegraphics[width=\\textwidth]{wide.png}\n"
+        issues = ImageDetector(project_root=tmp_path, metadata=ImageMetadataCache()).detect(
+            content, str(tmp_path / "main.tex"))
+        found = {(i.rule, i.line) for i in issues if i.rule.startswith(("img-over", "img-low"))}
+        assert found == {("img-overflows-textwidth", 1), ("img-low-resolution", 1),
+                         ("img-oversized-file", 2)}
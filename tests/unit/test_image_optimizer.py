@@ -0,0 +1,96 @@
+"""
+Tests for the raster image optimizer.
+"""
+
+import struct
+import zlib
+
+import pytest
+
+from qa_engine.infrastructure.creation import ImageOptimizer, OptimizationResult
+from qa_engine.infrastructure.indexing import ImageMetadataCache
+
+
+def png_header(width: int, height: int) -> bytes:
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + ihdr \
+        + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+
+
+CONTENT = "\\includegraphics[width=8cm]{shot}\n" \
+          "\\includegraphics[width=4cm]{images/shot.png}\n" \
+          "\\includegraphics[width=8cm]{small}\n"
+
+
+def optimizer(tmp_path):
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "shot.png").write_bytes(png_header(6000, 3000))
+    (tmp_path / "small.png").write_bytes(png_header(800, 400))
+    return ImageOptimizer(project_root=tmp_path, metadata=ImageMetadataCache())
+
+
+class TestImageOptimizer:
+    """Tests for planning, resampling and source rewriting."""
+
+    def test_plan_uses_widest_reference(self, tmp_path):
+        """Test over-resolved images are planned at the DPI of their widest use."""
+        (candidate,) = optimizer(tmp_path).plan(CONTENT)
+        assert candidate.source.endswith("shot.png")
+        assert candidate.target_px == 945  # 8cm at 300 dpi
+        assert round(candidate.effective_dpi) == 1905
+        assert candidate.references == ["shot", "images/shot.png"]
+
+    def test_rewrite_points_at_cached_copies(self, tmp_path):
+        """Test every reference of an optimized image is redirected."""
+        opt = optimizer(tmp_path)
+        candidates = opt.plan(CONTENT)
+        cached = str(tmp_path / ".qa-cache" / "images" / "abc-945.png")
+        result = OptimizationResult(candidates=candidates, optimized={candidates[0].source: cached})
+        rewritten = opt.rewrite(CONTENT, result, tmp_path)
+        assert rewritten.count("{.qa-cache/images/abc-945.png}") == 2
+        assert "[width=8cm]{small}" in rewritten
+
+    def test_resample_once(self, tmp_path):
+        """Test images are resampled into the cache and reused afterwards."""
+        image = pytest.importorskip("PIL.Image")
+        opt = optimizer(tmp_path)
+        image.new("RGB", (6000, 3000)).save(tmp_path / "images" / "shot.png")
+        first = opt.optimize(CONTENT)
+        output = first.optimized[str(tmp_path / "images" / "shot.png")]
+        assert image.open(output).size == (945, 473)
+        assert opt.optimize(CONTENT).reused == 1
+
+    def test_rewrite_matches_resolved_file(self, tmp_path):
+        """Test a reference resolving to another file of the same name is left alone."""
+        opt = optimizer(tmp_path)
+        candidates = opt.plan(CONTENT)
+        cached = str(tmp_path / ".qa-cache" / "images" / "abc-945.png")
+        result = OptimizationResult(candidates=candidates, optimized={candidates[0].source: cached})
+        (tmp_path / "part").mkdir()
+        (tmp_path / "part" / "shot.png").write_bytes(png_header(100, 50))
+        rewritten = opt.rewrite(CONTENT, result, tmp_path, source_dir=tmp_path / "part")
+        assert "[width=8cm]{shot}" in rewritten
+        assert "[width=4cm]{.qa-cache/images/abc-945.png}" in rewritten
+
+    def test_recompress_within_target_dpi(self, tmp_path):
+        """Test images within the target DPI are re-encoded at their size only when smaller."""
+        image = pytest.importorskip("PIL.Image")
+        opt = ImageOptimizer(project_root=tmp_path, metadata=ImageMetadataCache(), recompress=True)
+        image.new("RGB", (800, 400)).save(tmp_path / "small.png", compress_level=0)
+        result = opt.optimize("\\includegraphics[width=8cm]{small}\n")
+        (candidate,) = result.candidates
+        assert candidate.recompress_only and result.bytes_saved > 0
+        assert image.open(result.optimized[candidate.source]).size == (800, 400)
+
+        image.new("RGB", (800, 400)).save(tmp_path / "small.png", optimize=True)
+        assert opt.optimize("\\includegraphics[width=8cm]{small}\n").optimized == {}
+
+    def test_recompress_skips_jpeg_within_target_dpi(self, tmp_path):
+        """Test recompress never re-encodes a JPEG it does not downsample."""
+        sof = struct.pack(">BHHB", 8, 400, 800, 3) + b"\x00" * 9
+        (tmp_path / "photo.jpg").write_bytes(
+            b"\xff\xd8\xff\xc0" + struct.pack(">H", len(sof) + 2) + sof + b"\xff\xda")
+        (tmp_path / "small.png").write_bytes(png_header(800, 400))
+        opt = ImageOptimizer(project_root=tmp_path, metadata=ImageMetadataCache(), recompress=True)
+        content = "\\includegraphics[width=8cm]{photo}\n\\includegraphics[width=8cm]{small}\n"
+        assert [c.source for c in opt.plan(content)] == [str(tmp_path / "small.png")]
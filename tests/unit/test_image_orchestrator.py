@@ -186,3 +186,19 @@ class TestImageFixResult:
         assert result.paths_fixed == 3
         assert result.images_created == 2
         assert result.content == "fixed"
+
+
+class TestImageOrchestratorOptimization:
+    """Tests for the build copy optimization phase."""
+
+    def test_build_copy_uses_optimized_images(self, tmp_path):
+        """Test a build dir gives a build copy pointing at cached images."""
+        image = pytest.importorskip("PIL.Image")
+        image.new("RGB", (6000, 3000)).save(tmp_path / "shot.png")
+        orchestrator = ImageOrchestrator(project_root=tmp_path)
+        content = "\\includegraphics[width=8cm]{shot.png}\n"
+        result = orchestrator.run(content, "ch.tex", build_dir=tmp_path)
+        assert result.skills_executed["qa-img-optimize"] == "DONE"
+        assert result.build_content.startswith("\\includegraphics[width=8cm]{.qa-cache/images/")
+        assert orchestrator.to_dict(result)["phases"]["build_optimization"]["images_optimized"] == 1
+        assert orchestrator.run(content, validate=False).skills_executed["qa-img-optimize"] == "SKIP"
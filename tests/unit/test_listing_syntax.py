@@ -0,0 +1,69 @@
+"""
+Tests for the Python listing syntax detector.
+"""
+
+from qa_engine.infrastructure.detection import ListingSyntaxDetector
+from qa_engine.infrastructure.detection.listing_syntax_detector import check_python_source
+
+DOC = r"""\begin{pythonbox}[Good]
+    def f(x):
+        return x
+\end{pythonbox}
+\begin{lstlisting}[language=Python]
+def broken(:
+    pass
+\end{lstlisting}
+% qa-code: fragment
+\begin{pythonbox}
+    return total
+\end{pythonbox}
+\begin{pythonbox}
+>>> x = 1
+>>> if x
+...     pass
+\end{pythonbox}
+\begin{lstlisting}[language=Bash]
+not python (
+\end{lstlisting}
+\begin{pythonbox} % qa-code: skip
+print(
+\end{pythonbox}
+"""
+
+
+class TestCheckPythonSource:
+    """Tests for the per-listing check."""
+
+    def test_modes(self):
+        """Test module, fragment and doctest modes."""
+        assert check_python_source("  x = 1\n  y = 2\n") is None
+        assert check_python_source("return 1\n")[1] == "'return' outside function"
+        assert check_python_source("return 1\n", "fragment") is None
+        assert check_python_source(">>> 1 +\n", "doctest")[0] == 1
+        assert check_python_source(">>> print(1)\n1\n", "doctest") is None
+
+
+class TestListingSyntaxDetector:
+    """Tests for detection across a document."""
+
+    def test_detects_broken_python_listings(self):
+        """Test only unannotated broken Python listings are reported at their line."""
+        issues = ListingSyntaxDetector().detect(DOC, "ch.tex")
+        assert [(i.line, i.context["mode"]) for i in issues] == [(6, "module"), (15, "doctest")]
+
+    def test_results_cached_by_digest(self, tmp_path, monkeypatch):
+        """Test warm runs reuse cached results, also from the cache file."""
+        cache = tmp_path / "syntax.json"
+        ListingSyntaxDetector(cache).detect(DOC, "ch.tex")
+        calls = []
+        monkeypatch.setattr(
+            "qa_engine.infrastructure.detection.listing_syntax_detector.check_python_source",
+            lambda *args: calls.append(args),
+        )
+        issues = ListingSyntaxDetector(cache).detect(DOC, "other.tex")
+        assert calls == [] and len(issues) == 2
+
+    def test_process_pool(self):
+        """Test large batches give the same results through the process pool."""
+        detector = ListingSyntaxDetector(min_parallel=2, max_workers=2)
+        assert len(detector.detect(DOC, "ch.tex")) == 2
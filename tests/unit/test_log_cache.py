@@ -0,0 +1,77 @@
+"""
+Tests for the parsed log cache.
+
+Covers parse-once-per-change, copies handed to callers, persistence
+across cache instances and the typeset handler path.
+"""
+
+import os
+
+from qa_engine.infrastructure.typeset_orchestrator import TypesetOrchestrator
+from qa_engine.typeset.detection import FullTypesetDetector, ParsedLogCache
+
+LOG = (
+    "(./main.tex\n"
+    "Overfull \\hbox (12.5pt too wide) in paragraph at lines 3--4\n"
+    "LaTeX Warning: Reference `fig:x' on page 3 undefined on input line 21.\n"
+    ")\n"
+)
+
+
+class TestParsedLogCache:
+    """Tests for ParsedLogCache."""
+
+    def test_parses_once_per_change(self, tmp_path):
+        """Repeated requests reuse the parse until the log changes."""
+        path = tmp_path / "main.log"
+        path.write_text(LOG, encoding="utf-8")
+        cache = ParsedLogCache()
+        first = cache.detect(path)
+        first.overfull_hbox.clear()  # Callers get copies
+        assert len(cache.detect(path).overfull_hbox) == 1
+        assert cache.parses == 1
+        path.write_text(LOG + LOG, encoding="utf-8")
+        assert len(cache.detect(path).overfull_hbox) == 2
+        assert cache.parses == 2
+
+    def test_missing_log(self, tmp_path):
+        """A missing log gives an empty result."""
+        assert ParsedLogCache().detect(tmp_path / "none.log").verdict == "PASS"
+
+    def test_persisted_across_instances(self, tmp_path):
+        """A result on disk is reused by a new cache while the log is unchanged."""
+        path = tmp_path / "main.log"
+        path.write_text(LOG, encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        expected = ParsedLogCache(cache_dir).detect(path)
+        fresh = ParsedLogCache(cache_dir)
+        assert fresh.detect(path) == expected and fresh.parses == 0
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        fresh.detect(path)
+        assert fresh.parses == 1
+
+
+class TestCacheConsumers:
+    """Tests for detectors and orchestrators sharing one cache."""
+
+    def test_detector_and_orchestrator_share_parse(self, tmp_path):
+        """FullTypesetDetector and run_log read the same cached result."""
+        path = tmp_path / "main.log"
+        path.write_text(LOG, encoding="utf-8")
+        orchestrator = TypesetOrchestrator(project_root=tmp_path)
+        orchestrator.detector = FullTypesetDetector(tmp_path, log_cache=ParsedLogCache())
+        result = orchestrator.run_log(path, apply_fixes=False)
+        assert result.total_detected == 2 and result.verdict == "FAIL"
+        orchestrator.detector.detect(log_path=path)
+        assert orchestrator.detector.log_cache.parses == 1
+
+    def test_run_log_attributes_absolute_log_names(self, tmp_path):
+        """Hbox warnings under an absolute log name reach the relative source file."""
+        (tmp_path / "chapters").mkdir()
+        path = tmp_path / "main.log"
+        path.write_text(LOG.replace("./main.tex", str(tmp_path / "chapters" / "ch1.tex")), encoding="utf-8")
+        orchestrator = TypesetOrchestrator(project_root=tmp_path)
+        orchestrator.detector = FullTypesetDetector(tmp_path, log_cache=ParsedLogCache())
+        result = orchestrator.run_log(path, "a\nb\nc\nd\n", "chapters/ch1.tex")
+        assert len(result.hbox_result.fixes_applied) + len(result.hbox_result.manual_review) == 1
@@ -0,0 +1,142 @@
+"""
+Tests for the streaming log reader and the single-pass log parser.
+
+Covers rejoining of 79-column wrapped lines (characters and bytes),
+file streaming, token dispatch in LogWarningDetector and attribution of
+warnings to source files through the log's file stack.
+"""
+
+from qa_engine.typeset.detection import (
+    LogFileStack, LogWarningDetector, is_source_file, iter_log_content, iter_log_file,
+)
+from qa_engine.typeset.detection.log_reader import LogTail
+from qa_engine.typeset.fixing import HboxFixer
+
+WRAPPED_REFERENCE = (
+    "LaTeX Warning: Reference `sec:a-very-long-label-name-that-pushes-the-warning-"
+    "past-the-print-width' on page 4 undefined on input line 120.\n"
+)
+
+
+def _wrap(text: str, width: int = 79) -> str:
+    """Hard-wrap like TeX (by characters)."""
+    return "\n".join(text[i:i + width] for i in range(0, len(text), width))
+
+
+class TestLogReader:
+    """Tests for iter_log_content and iter_log_file."""
+
+    def test_rejoins_wrapped_lines(self):
+        """Full-width lines continue on the next physical line."""
+        log = "first\n" + _wrap(WRAPPED_REFERENCE.rstrip("\n")) + "\nlast"
+        lines = list(iter_log_content(log))
+        assert lines == [(1, "first"), (2, WRAPPED_REFERENCE.rstrip("\n")), (4, "last")]
+
+    def test_byte_width_wrap(self):
+        """A non-ASCII line of exactly 79 bytes is wrapped (pdfTeX)."""
+        head = "א" * 30 + "x" * 19  # 60 + 19 bytes
+        assert [t for _, t in iter_log_content(head + "\ntail\nnext")] == [head + "tail", "next"]
+
+    def test_file_streaming(self, tmp_path):
+        """Files give the same logical lines, CRLF included."""
+        log = "a\r\n" + _wrap("y" * 100).replace("\n", "\r\n") + "\r\nb\r\n"
+        path = tmp_path / "main.log"
+        path.write_bytes(log.encode("utf-8"))
+        assert list(iter_log_file(path)) == [(1, "a"), (2, "y" * 100), (4, "b")]
+
+    def test_character_split_at_byte_width(self, tmp_path):
+        """A Hebrew letter cut at byte 79 is rejoined before decoding."""
+        text = "x" * 78 + "שלום"
+        raw = text.encode("utf-8")
+        path = tmp_path / "main.log"
+        path.write_bytes(raw[:79] + b"\n" + raw[79:] + b"\n")
+        assert list(iter_log_file(path)) == [(1, text)]
+        tail = LogTail(path)
+        assert tail.read(final=True) == [(1, text)]
+
+
+class TestSinglePassParse:
+    """Tests for token dispatch in LogWarningDetector."""
+
+    def test_wrapped_warning_is_parsed(self, tmp_path):
+        """A reference warning split by the wrap is still found."""
+        path = tmp_path / "main.log"
+        path.write_text(_wrap(WRAPPED_REFERENCE), encoding="utf-8")
+        result = LogWarningDetector().detect_log(path)
+        assert [(r.page, r.input_line) for r in result.undefined_references] == [(4, 120)]
+
+    def test_dispatch_by_token(self):
+        """Each leading token reaches its matcher; other lines are skipped."""
+        log = (
+            "(./chapter1.tex\n"
+            "Overfull \\hbox (12.5pt too wide) in paragraph at lines 3--4\n"
+            "Underfull \\vbox (badness 10000) has occurred while \\output is active\n"
+            "Package natbib Warning: Citation `knuth1984' on page 2 undefined on input line 9.\n"
+            "LaTeX Warning: Float too large for page by 60.0pt on input line 30.\n"
+            "! Package babel Error: Unknown language.\n"
+        )
+        result = LogWarningDetector().detect_log_content(log, "main.log")
+        assert [w.severity for w in result.overfull_hbox] == ["CRITICAL"]
+        assert result.underfull_vbox_count == 1
+        assert [c.citation for c in result.undefined_citations] == ["knuth1984"]
+        assert [f.severity for f in result.float_too_large] == ["CRITICAL"]
+        assert [e.package for e in result.package_errors] == ["babel"]
+
+
+PROJECT_LOG = (
+    "(./main.tex LaTeX2e <2023-11-01>\n"
+    "(/usr/share/texlive/texmf-dist/tex/latex/base/book.cls (size10.clo))\n"
+    "(./chapters/ch1.tex [1] (see footnote)\n"
+    "Overfull \\hbox (12.5pt too wide) in paragraph at lines 3--4\n"
+    "[]\\TU/lmr/m/n/10 unbalanced (text\n"
+    ") (./chapters/ch2.tex\n"
+    "Overfull \\vbox (3.0pt too high) detected at line 17\n"
+    "LaTeX Warning: Reference `fig:x' on page 3 undefined on input line 21.\n"
+    ")\n"
+    "Underfull \\hbox (badness 10000) in paragraph at lines 40--41\n"
+    ")\n"
+)
+
+
+class TestFileAttribution:
+    """Tests for LogFileStack and per-file warnings."""
+
+    def test_file_stack(self):
+        """Files open and close with parentheses; groups and box dumps don't count."""
+        stack = LogFileStack()
+        seen = []
+        for _, line in iter_log_content(PROJECT_LOG):
+            stack.feed(line)
+            seen.append(stack.current)
+        assert seen[:4] == ["./main.tex", "./main.tex", "./chapters/ch1.tex", "./chapters/ch1.tex"]
+        assert seen[5:] == ["./chapters/ch2.tex", "./chapters/ch2.tex", "./chapters/ch2.tex",
+                            "./main.tex", "./main.tex", "", ""]
+
+    def test_warnings_carry_source(self):
+        """Each warning records the file open when it was reported."""
+        result = LogWarningDetector().detect_log_content(PROJECT_LOG, "main.log")
+        assert [(w.file, w.lines) for w in result.overfull_hbox] == [("./chapters/ch1.tex", [3, 4])]
+        assert [(w.file, w.lines) for w in result.overfull_vbox] == [("./chapters/ch2.tex", [17, 17])]
+        assert [r.file for r in result.undefined_references] == ["./chapters/ch2.tex"]
+        assert [w.file for w in result.underfull_hbox] == ["./main.tex"]
+        assert is_source_file("./chapters/ch1.tex", "/book/chapters/ch1.tex", "/book")
+        assert not is_source_file("./chapters/ch1.tex", "/book/chapters/xch1.tex", "/book")
+
+    def test_source_file_resolves_both_sides(self):
+        """Log names and file paths are compared as resolved files."""
+        assert is_source_file("/home/u/book/chapters/ch1.tex", "chapters/ch1.tex",
+                              project_root="/home/u/book")
+        assert is_source_file("./chapters/ch1.tex", "chapters/ch1.tex", "/book", "/book")
+        assert not is_source_file("ch1.tex", "chapters/ch1.tex", "/book", "/book")
+        assert is_source_file("ch1.tex", "chapters/ch1.tex", "/book/chapters", "/book")
+
+    def test_fixer_opens_attributed_files(self, tmp_path):
+        """HboxFixer fixes each warning in the file it belongs to."""
+        (tmp_path / "chapters").mkdir()
+        ch1 = tmp_path / "chapters" / "ch1.tex"
+        ch1.write_text("a\nb\n\\encell{numpy.linalg.matrix_power}\nd\n", encoding="utf-8")
+        result = LogWarningDetector().detect_log_content(PROJECT_LOG, "main.log")
+        fixed = HboxFixer().fix_from_log(result, tmp_path)
+        assert sorted(fixed) == ["./chapters/ch1.tex", "./main.tex"]
+        assert [f.line for f in fixed["./chapters/ch1.tex"].fixes_applied] == [3]
+        assert "\\small numpy" in ch1.read_text(encoding="utf-8")
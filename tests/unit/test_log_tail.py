@@ -0,0 +1,85 @@
+"""
+Tests for live log tailing.
+
+Covers appended-byte reads with partial and wrapped lines, truncation,
+incremental warnings with a persistent file stack, and stopping at the
+first fatal error.
+"""
+
+import sys
+import subprocess
+
+from qa_engine.typeset.detection import LogTail, LogWarningTail
+
+
+def _append(path, text):
+    with open(path, "ab") as handle:
+        handle.write(text.encode("utf-8"))
+
+
+class TestLogTail:
+    """Tests for LogTail."""
+
+    def test_reads_only_complete_new_lines(self, tmp_path):
+        """Partial and wrapped lines wait for the rest of their bytes."""
+        path = tmp_path / "main.log"
+        tail = LogTail(path)
+        assert tail.read() == []  # Log not created yet
+        _append(path, "first\nsec")
+        assert tail.read() == [(1, "first")]
+        _append(path, "ond\n" + "w" * 79 + "\n")
+        assert tail.read() == [(2, "second")]
+        _append(path, "rap\nend")
+        assert tail.read() == [(3, "w" * 79 + "rap")]
+        assert tail.read(final=True) == [(5, "end")]
+
+    def test_truncated_log_restarts(self, tmp_path):
+        """A new run that truncates the log is read from its start."""
+        path = tmp_path / "main.log"
+        path.write_text("old run line\nmore\n", encoding="utf-8")
+        tail = LogTail(path)
+        tail.read()
+        path.write_text("new\n", encoding="utf-8")
+        assert tail.read() == [(1, "new")]
+
+
+class TestLogWarningTail:
+    """Tests for LogWarningTail."""
+
+    def test_incremental_warnings_keep_file_stack(self, tmp_path):
+        """Each poll returns only new warnings, attributed across polls."""
+        path = tmp_path / "main.log"
+        tail = LogWarningTail(path)
+        _append(path, "(./main.tex (./ch1.tex\n")
+        assert tail.poll().overfull_hbox == []
+        _append(path, "Overfull \\hbox (2.0pt too wide) in paragraph at lines 5--6\n")
+        new = tail.poll()
+        assert [(w.file, w.lines) for w in new.overfull_hbox] == [("./ch1.tex", [5, 6])]
+        _append(path, ")\nUnderfull \\vbox (badness 10000) has occurred while \\output is active\n")
+        assert [w.file for w in tail.poll().underfull_vbox] == ["./main.tex"]
+        assert len(tail.result.overfull_hbox) == 1 and tail.result.underfull_vbox_count == 1
+        assert tail.fatal_error is None
+
+    def test_known_issue_is_not_fatal(self, tmp_path):
+        """Whitelisted errors are recorded but do not stop the compile."""
+        path = tmp_path / "main.log"
+        path.write_text("! LaTeX Error: Extra \\endgroup.\n! Undefined control sequence.\n",
+                        encoding="utf-8")
+        tail = LogWarningTail(path)
+        tail.poll()
+        assert len(tail.result.known_issues) == 1
+        assert tail.fatal_error == (2, "! Undefined control sequence.")
+
+    def test_watch_stops_compile_at_fatal_error(self, tmp_path):
+        """The process is terminated once the first error is logged."""
+        path = tmp_path / "main.log"
+        script = (
+            "import time\n"
+            f"log = open({str(path)!r}, 'w')\n"
+            "log.write('(./main.tex\\n! Emergency stop.\\n'); log.flush()\n"
+            "time.sleep(30)\n"
+        )
+        process = subprocess.Popen([sys.executable, "-c", script])
+        result = LogWarningTail(path).watch(process, interval=0.05)
+        assert process.returncode is not None and process.returncode != 0
+        assert result.log_file == str(path)
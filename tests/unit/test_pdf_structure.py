@@ -0,0 +1,157 @@
+"""
+Tests for the PDF object reader, page structure scan and the PDF
+figure cross-check of ImageValidator.
+"""
+
+import zlib
+
+from qa_engine.infrastructure.indexing import PdfDocument, PdfName, PdfRef, scan_pdf
+from qa_engine.infrastructure.validation import ImageValidator
+
+
+def _stream(head: str, data: bytes, compress: bool = True) -> bytes:
+    if compress:
+        data = zlib.compress(data)
+        head += " /Filter /FlateDecode"
+    return f"<< {head} /Length {len(data)} >>\nstream\n".encode() + data + b"\nendstream"
+
+
+def _pdf(objects: dict, packed: dict = None) -> bytes:
+    """A PDF with the given body objects and, optionally, an object stream."""
+    if packed:
+        parts, pairs, offset = [], [], 0
+        for num, body in packed.items():
+            pairs.append(f"{num} {offset}")
+            parts.append(body)
+            offset += len(body) + 1
+        header = " ".join(pairs) + " "
+        data = (header + "\n".join(parts)).encode()
+        objects[99] = _stream(f"/Type /ObjStm /N {len(packed)} /First {len(header)}", data)
+    out = bytearray(b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n")
+    for num, body in objects.items():
+        body = body.encode() if isinstance(body, str) else body
+        out += f"{num} 0 obj\n".encode() + body + b"\nendobj\n"
+    out += b"trailer\n<< /Root 1 0 R /Size 100 >>\nstartxref\n0\n%%EOF\n"
+    return bytes(out)
+
+
+BOOK = {
+    1: "<< /Type /Catalog /Pages 2 0 R >>",
+    2: "<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 /MediaBox [0 0 595.276 841.89] >>",
+    3: "<< /Type /Page /Parent 2 0 R /Contents 5 0 R "
+       "/Resources << /Font << /F1 7 0 R >> /XObject << /Im1 9 0 R >> >> >>",
+    4: "<< /Type /Page /Parent 2 0 R /Contents 6 0 R "
+       "/Resources << /Font << /F2 8 0 R >> /XObject << /Fm1 10 0 R >> >> >>",
+    5: _stream("", b"BT /F1 9.96 Tf (Hi) Tj ET q 100 0 0 50 72 600 cm /Im1 Do Q"),
+    6: _stream("", b"BT /F2 12 Tf (x) Tj /F9 10 Tf ET /Fm1 Do"),
+    # 7 and 8 live in the object stream
+    9: _stream("/Type /XObject /Subtype /Image /Width 640 /Height 480 /BitsPerComponent 8 "
+               "/ColorSpace /DeviceRGB", b"\x00" * 64),
+    10: _stream("/Type /XObject /Subtype /Form /BBox [0 0 10 10] "
+                "/PTEX.FileName (./images/plot.pdf) /Resources << /XObject << /Im7 11 0 R >> >>",
+                b"/Im7 Do"),
+    11: _stream("/Type /XObject /Subtype /Image /Width 8 /Height 8 /BitsPerComponent 1 "
+                "/ColorSpace [/Indexed /DeviceRGB 1 <00FF00>]", b"\xff" * 8, compress=False),
+    12: "<< /Type /FontDescriptor /FontName /CMR10 /FontFile 13 0 R >>",
+    13: _stream("", b"font program"),
+}
+PACKED = {
+    7: "<< /Type /Font /Subtype /Type1 /BaseFont /CMR10 /FontDescriptor 12 0 R >>",
+    8: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+}
+
+
+class TestPdfObjects:
+    """Tests for PdfDocument."""
+
+    def test_values_and_object_streams(self):
+        """Body objects, packed objects, references and strings are read."""
+        doc = PdfDocument(_pdf(dict(BOOK), dict(PACKED)))
+        assert doc.catalog["Pages"] == PdfRef(2, 0)
+        assert doc.resolve(PdfRef(8, 0))["BaseFont"] == PdfName("Helvetica")
+        assert doc.get(doc.objects[10], "PTEX.FileName") == b"./images/plot.pdf"
+        assert doc.get(doc.objects[11], "ColorSpace")[3] == b"\x00\xff\x00"
+
+    def test_incremental_update_wins(self):
+        """A later definition of an object replaces the earlier one."""
+        data = _pdf({1: "<< /Type /Catalog /Pages 2 0 R >>", 2: "(old)"})
+        data += b"2 0 obj\n(new \\(1\\) \\101)\nendobj\n"
+        assert PdfDocument(data).objects[2] == b"new (1) A"
+
+
+class TestPdfStructure:
+    """Tests for scan_pdf."""
+
+    def test_pages_images_fonts(self, tmp_path):
+        """Each page lists what it draws, forms followed into their resources."""
+        path = tmp_path / "book.pdf"
+        path.write_bytes(_pdf(dict(BOOK), dict(PACKED)))
+        structure = scan_pdf(path)
+        first, second = structure.pages
+        assert round(first.width) == 595 and round(second.height) == 842  # Inherited MediaBox
+        assert [(i.name, i.width, i.height, i.filter) for i in first.images] == [
+            ("Im1", 640, 480, "FlateDecode"),
+        ]
+        assert [(f.base_font, f.embedded) for f in first.fonts] == [("CMR10", True)]
+        assert first.glyph_issues == []
+        assert second.included_files == ["./images/plot.pdf"]
+        assert [(i.name, i.color_space, i.included_file) for i in second.images] == [
+            ("Im7", "Indexed", "./images/plot.pdf"),
+        ]
+        assert second.glyph_issues == ["font Helvetica is not embedded", "font /F9 is used but not defined"]
+
+    def test_unreadable(self, tmp_path):
+        """A missing file gives None."""
+        assert scan_pdf(tmp_path / "none.pdf") is None
+
+
+class TestPdfFigureCheck:
+    """Tests for ImageValidator.validate_pdf."""
+
+    def test_cross_check(self, tmp_path):
+        """Named PDF figures are matched by file, raster figures by count."""
+        (tmp_path / "book.pdf").write_bytes(_pdf(dict(BOOK), dict(PACKED)))
+        content = (
+            "\\begin{figure}\\includegraphics{images/plot.pdf}\\caption{A}\\end{figure}\n"
+            "\\begin{figure}\\includegraphics{photo.png}\\caption{B}\\end{figure}\n"
+            "\\begin{figure}\\includegraphics{images/lost.pdf}\\caption{C}\\end{figure}\n"
+        )
+        result = ImageValidator(tmp_path).validate_pdf(content, tmp_path / "book.pdf")
+        assert [(c.figure, c.after) for c in result.comparison] == [
+            (1, "RENDERED"), (2, "RENDERED"), (3, "MISSING"),
+        ]
+        assert result.still_missing == [3] and result.verdict == "FAIL"
+
+    def test_raster_shortfall(self, tmp_path):
+        """More raster figures than drawn images cannot be pinned down."""
+        (tmp_path / "book.pdf").write_bytes(_pdf(dict(BOOK), dict(PACKED)))
+        content = "".join(
+            f"\\begin{{figure}}\\includegraphics{{p{i}.png}}\\end{{figure}}\n" for i in range(2)
+        )
+        result = ImageValidator(tmp_path).validate_pdf(content, tmp_path / "book.pdf")
+        assert [c.after for c in result.comparison] == ["UNVERIFIED", "UNVERIFIED"]
+        assert result.still_missing == [] and not result.all_rendered
+
+    def test_logos_other_chapters_and_eps(self, tmp_path):
+        """Images on every page and pages of other sources are not credited; EPS match converted names."""
+        book = dict(BOOK)
+        book[3] = book[3].replace("/Im1 9 0 R", "/Im1 9 0 R /Lg 14 0 R")
+        book[4] = book[4].replace("/Fm1 10 0 R", "/Fm1 10 0 R /Lg 14 0 R")
+        book[5] = _stream("", b"q /Lg Do Q q /Im1 Do Q")
+        book[6] = _stream("", b"q /Lg Do Q /Fm1 Do")
+        book[10] = book[10].replace(b"plot.pdf", b"plot-eps-converted-to.pdf")
+        book[14] = book[9]
+        (tmp_path / "book.pdf").write_bytes(_pdf(book, dict(PACKED)))
+        (tmp_path / "book.synctex").write_text(
+            "SyncTeX Version:1\nInput:1:./ch1.tex\nInput:2:./ch2.tex\nContent:\n"
+            "{1\n(1,3:0,0:100,10,0\n)\n}1\n{2\n(2,3:0,0:100,10,0\n)\n}2\n"
+        )
+        content = (
+            "\\begin{figure}\\includegraphics{images/plot.eps}\\end{figure}\n"
+            "\\begin{figure}\\includegraphics{photo.png}\\end{figure}\n"
+        )
+        validator = ImageValidator(tmp_path)
+        chapter = validator.validate_pdf(content, tmp_path / "book.pdf", source_path=tmp_path / "ch2.tex")
+        assert [c.after for c in chapter.comparison] == ["RENDERED", "MISSING"]
+        whole = validator.validate_pdf(content, tmp_path / "book.pdf")
+        assert [c.after for c in whole.comparison] == ["RENDERED", "RENDERED"]
@@ -0,0 +1,98 @@
+"""
+Tests for the project file index.
+"""
+
+import os
+
+from qa_engine.domain.models.issue import Issue, Severity
+from qa_engine.infrastructure.creation.image_creator import ImageCreator
+from qa_engine.infrastructure.detection.image_detector import ImageDetector
+from qa_engine.infrastructure.indexing import FileLookup, ProjectFileIndex, file_lookup, parse_graphicspath
+
+
+def make_tree(root):
+    (root / "chapters").mkdir()
+    (root / "chapters" / "figures").mkdir()
+    (root / "chapters" / "figures" / "plot.pdf").write_bytes(b"%PDF")
+    (root / "art").mkdir()
+    (root / "art" / "Logo.PNG").write_bytes(b"")
+    (root / ".git").mkdir()
+    (root / ".git" / "hidden.png").write_bytes(b"")
+
+
+class TestProjectFileIndex:
+    """Tests for lookups and incremental refresh."""
+
+    def test_extension_and_subdirectory_resolution(self, tmp_path):
+        """Test names without extension resolve through figures/ next to the source."""
+        make_tree(tmp_path)
+        index = ProjectFileIndex(tmp_path)
+        found = index.find_graphic("plot", tmp_path / "chapters")
+        assert found == str(tmp_path / "chapters" / "figures" / "plot.pdf")
+        assert not index.exists(tmp_path / ".git" / "hidden.png")
+
+    def test_graphicspath_and_case(self, tmp_path):
+        """Test graphicspath directories are searched, case-insensitively if asked."""
+        make_tree(tmp_path)
+        paths = parse_graphicspath(r"\graphicspath{{art/}{other/}}")
+        assert paths == ["art/", "other/"]
+        assert ProjectFileIndex(tmp_path).find_graphic("logo", tmp_path, paths) is None
+        assert ProjectFileIndex(tmp_path, case_insensitive=True).find_graphic("logo", tmp_path, paths)
+
+    def test_refresh_rescans_changed_directories(self, tmp_path):
+        """Test only directories whose mtime changed are rescanned."""
+        make_tree(tmp_path)
+        index = ProjectFileIndex(tmp_path)
+        assert index.refresh() == 0
+        (tmp_path / "art" / "new.png").write_bytes(b"")
+        (tmp_path / "art" / "sub").mkdir()
+        (tmp_path / "art" / "sub" / "deep.jpg").write_bytes(b"")
+        os.utime(tmp_path / "art", ns=(0, 1))
+        assert index.refresh() == 1
+        assert index.exists(tmp_path / "art" / "new.png")
+        assert index.exists(tmp_path / "art" / "sub" / "deep.jpg")
+
+    def test_outside_root_falls_back_to_stat(self, tmp_path):
+        """Test paths outside the root are checked on disk."""
+        (tmp_path / "a.png").write_bytes(b"")
+        (tmp_path / "proj").mkdir()
+        index = ProjectFileIndex(tmp_path / "proj")
+        assert index.find_graphic("a.png", tmp_path)
+
+
+    def test_symlinked_directory_is_followed(self, tmp_path):
+        """Test files behind a directory symlink are indexed and loops end."""
+        (tmp_path / "shared").mkdir()
+        (tmp_path / "shared" / "foo.png").write_bytes(b"")
+        (tmp_path / "proj").mkdir()
+        (tmp_path / "proj" / "images").symlink_to(tmp_path / "shared")
+        (tmp_path / "shared" / "back").symlink_to(tmp_path / "proj")
+        index = ProjectFileIndex(tmp_path / "proj")
+        assert index.find_graphic("foo", tmp_path / "proj")
+        assert not index.exists(tmp_path / "proj" / "images" / "back" / "images" / "foo.png")
+
+    def test_no_root_uses_stat_lookup(self, tmp_path):
+        """Test tools without a project root do not index the working directory."""
+        (tmp_path / "a.png").write_bytes(b"")
+        lookup = file_lookup(None)
+        assert isinstance(lookup, FileLookup)
+        assert lookup.find_graphic("a", tmp_path) == str(tmp_path / "a.png")
+
+
+class TestIndexConsumers:
+    """Tests for image checks that resolve through the index."""
+
+    def test_detector_honours_graphicspath(self, tmp_path):
+        """Test a graphic under a graphicspath directory is not reported missing."""
+        make_tree(tmp_path)
+        content = "\\graphicspath{{art/}}\n\\includegraphics{Logo.PNG}\n\\includegraphics{gone}\n"
+        issues = ImageDetector(project_root=tmp_path).detect(content, str(tmp_path / "main.tex"))
+        missing = [i.content for i in issues if i.rule == "img-file-not-found"]
+        assert len(missing) == 1 and "gone" in missing[0]
+
+    def test_creator_records_created_files(self, tmp_path):
+        """Test duplicate missing-image issues create one placeholder."""
+        issue = Issue(rule="img-file-not-found", file="a.tex", line=1, content="",
+                      severity=Severity.WARNING, context={"image_path": "images/x.png"})
+        results = ImageCreator(project_root=tmp_path).create_from_issues([issue, issue])
+        assert list(results) == ["images/x.png"]
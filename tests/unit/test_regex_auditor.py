@@ -0,0 +1,169 @@
+"""
+Tests for the regex auditor, static lint and runtime guard.
+"""
+
+import argparse
+import re
+
+import pytest
+
+from qa_engine.domain.models.issue import Severity
+from qa_engine.infrastructure.detection.bidi_detector import BiDiDetector
+from qa_engine.infrastructure.matching import regex_backend, regex_lint
+from qa_engine.infrastructure.matching import (
+    RegexAuditor,
+    RegexGuard,
+    all_rule_patterns,
+    compile_rule,
+    compile_rule_field,
+    disable_guard,
+    enable_guard,
+    lint_pattern,
+)
+
+
+def _codes(pattern, flags=0):
+    return [f.code for f in lint_pattern(pattern, flags)]
+
+
+class TestRegexLint:
+    """Tests for static backtracking lint."""
+
+    def test_nested_quantifier(self):
+        """Test (a+)+ style nesting is critical."""
+        assert "nested-quantifier" in _codes(r"(a+)+b")
+        assert "nested-quantifier" in _codes(r"(\s*\w+)*$")
+
+    def test_fenced_repeat_is_safe(self):
+        """Test a mandatory disjoint delimiter makes nesting unambiguous."""
+        assert _codes(r"\d+(?:[.,]\d+)*") == []
+
+    def test_overlapping_alternation(self):
+        """Test repeated alternation with a bare repeat branch."""
+        assert "overlapping-alternation" in _codes(r"(a+|b)+c")
+
+    def test_adjacent_wildcards(self):
+        """Test overlapping neighbours are flagged, disjoint ones are not."""
+        assert "adjacent-wildcards" in _codes(r".*.*x")
+        assert _codes(r"[a-z]+\d+") == []
+
+    def test_dotall_lazy_span(self):
+        """Test lazy dot under DOTALL is reported as info."""
+        findings = lint_pattern(r"\\begin\{x\}.*?\\end\{x\}", re.DOTALL)
+        assert [(f.code, f.severity) for f in findings] == [("dotall-lazy-span", Severity.INFO)]
+
+    def test_invalid_pattern(self):
+        """Test patterns that do not compile are reported."""
+        assert _codes(r"(unclosed") == ["invalid-pattern"]
+
+
+class TestRegexAuditor:
+    """Tests for adversarial fuzzing."""
+
+    def test_exponential_pattern_stops_at_budget(self):
+        """Test growth stops once a probe exceeds the budget."""
+        auditor = RegexAuditor(lengths=(8, 12, 16, 20, 24, 28), budget_ms=20, repeats=1)
+        audit = auditor.audit(r"(a+)+b", label="evil")
+        assert audit.budget_exceeded
+        assert audit.severity == Severity.CRITICAL
+        assert len(audit.curve) < 6
+
+    def test_linear_pattern_is_clean(self):
+        """Test a simple literal pattern has no findings."""
+        audit = RegexAuditor(lengths=(64, 256, 1024)).audit(r"\\label\{x\}")
+        assert not audit.budget_exceeded
+        assert audit.severity is None
+        assert [n for n, _ in audit.curve] == [64, 256, 1024]
+
+    def test_worst_input_is_overall_worst(self, monkeypatch):
+        """Test worst_input belongs to the slowest probe, not the last length."""
+        auditor = RegexAuditor(lengths=(8, 12, 16), repeats=1)
+        timings = {8: 1.0, 12: 5.0, 16: 2.0}
+        monkeypatch.setattr(auditor, "_time", lambda compiled, text: timings[len(text) - 1])
+        audit = auditor.audit(r"a+")
+        assert audit.worst_ms == 5.0 and len(audit.worst_input) == 13
+
+    def test_cli_audit_keeps_process_backend(self, monkeypatch):
+        """Test the audit command passes its backend instead of switching the global one."""
+        pytest.importorskip("yaml")  # The CLI package needs PyYAML
+        from qa_engine.cli import regex_commands
+
+        used = []
+
+        class FakeAuditor:
+            def __init__(self, lengths, budget_ms, backend):
+                used.append(backend)
+
+            def audit_rules(self):
+                return []
+
+        monkeypatch.setattr(regex_commands, "RegexAuditor", FakeAuditor)
+        before = regex_backend.get_backend()
+        args = argparse.Namespace(max_length=8, budget_ms=1.0, backend="re2", json=True, fail_on="critical")
+        assert regex_commands.RegexCommands.audit(args) == 0
+        assert regex_backend.get_backend() is before and len(used) == 1
+
+    def test_catalog_covers_rule_tables(self):
+        """Test rule tables and validator patterns are catalogued."""
+        labels = {p.label for p in all_rule_patterns()}
+        assert "BIDI_RULES.bidi-numbers.pattern" in labels
+        assert "ImageValidator.INCLUDEGRAPHICS.pattern" in labels
+
+
+class TestRegexGuard:
+    """Tests for runtime guard mode."""
+
+    def teardown_method(self):
+        """Leave guard mode off for other tests."""
+        disable_guard()
+
+    def test_disabled_returns_plain_pattern(self):
+        """Test compile_rule has no wrapper when guard is off."""
+        disable_guard()
+        assert isinstance(compile_rule(r"\d+"), re.Pattern)
+
+    def test_records_slow_calls_with_line(self):
+        """Test calls above the threshold are recorded with their input."""
+        guard = enable_guard(threshold_ms=0)
+        pattern = compile_rule(r"\d+", label="numbers")
+        assert [m.group() for m in pattern.finditer("a 12 b 3")] == ["12", "3"]
+        record = guard.records[0]
+        assert record.label == "numbers"
+        assert record.method == "finditer"
+        assert record.line == "a 12 b 3"
+
+    def test_fast_calls_not_recorded(self):
+        """Test calls under the threshold are ignored."""
+        guard = RegexGuard(threshold_ms=10_000)
+        guard.wrap(re.compile("x")).search("xyz")
+        assert guard.records == []
+
+    def test_rule_fields_are_guarded(self):
+        """Test optional pattern fields are compiled and labelled per field."""
+        guard = enable_guard(threshold_ms=0)
+        rule = {"pattern": "x", "negative_pattern": r"\\skip"}
+        assert compile_rule_field(rule, "context_pattern", "r") is None
+        compile_rule_field(rule, "negative_pattern", "r").search("a \\skip")
+        assert guard.records[0].label == "r.negative_pattern"
+
+    def test_detector_context_patterns_are_guarded(self):
+        """Test detectors run context patterns through the guard too."""
+        guard = enable_guard(threshold_ms=0)
+        BiDiDetector().detect("שלום world", "t.tex")
+        assert any(r.label.endswith(".context_pattern") for r in guard.records)
+
+
+class TestWithoutParser:
+    """Tests for running without the private stdlib parser."""
+
+    def test_features_pin_patterns_to_re(self, monkeypatch):
+        """Test unparsed patterns count as unsupported by linear backends."""
+        monkeypatch.setattr(regex_backend, "PARSER_AVAILABLE", False)
+        features = regex_backend.pattern_features.__wrapped__(r"a+b")
+        assert regex_backend.UNPARSED in features
+        assert regex_backend.UNPARSED in regex_backend.Re2Backend.unsupported
+
+    def test_lint_is_skipped(self, monkeypatch):
+        """Test lint reports nothing rather than failing."""
+        monkeypatch.setattr(regex_lint, "PARSER_AVAILABLE", False)
+        assert regex_lint.lint_pattern(r"(a+)+b") == []
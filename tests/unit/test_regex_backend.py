@@ -0,0 +1,119 @@
+"""
+Tests for pluggable regex backends.
+"""
+
+import re
+
+from qa_engine.infrastructure.matching import (
+    RegexBackend,
+    benchmark_backends,
+    compile_rule,
+    compile_with,
+    pattern_features,
+    register_backend,
+    set_backend,
+)
+from qa_engine.infrastructure.matching.regex_backend import (
+    BACKREFERENCE,
+    LOOKAHEAD,
+    LOOKBEHIND,
+    UNICODE_CLASS,
+    UNICODE_WORD,
+    Re2Backend,
+)
+from qa_engine.infrastructure.matching.rule_catalog import RulePattern
+
+
+class FakeLinearBackend(RegexBackend):
+    """Backend without lookaround that records what it compiled."""
+
+    name = "fake"
+    unsupported = frozenset({LOOKAHEAD, LOOKBEHIND, BACKREFERENCE, UNICODE_WORD})
+
+    def __init__(self):
+        self.compiled = []
+
+    def compile(self, pattern, flags=0):
+        self.compiled.append(pattern)
+        return re.compile(pattern, flags)
+
+
+class TestPatternFeatures:
+    """Tests for capability flags read from the parse tree."""
+
+    def test_lookaround(self):
+        """Test lookbehind and lookahead are told apart."""
+        assert pattern_features(r"(?<!\\)[0-9]+") == {LOOKBEHIND}
+        assert pattern_features(r"[0-9]+(?![a-z])") == {LOOKAHEAD}
+
+    def test_backreference_in_group(self):
+        """Test backreferences nested in groups are found."""
+        assert BACKREFERENCE in pattern_features(r"\\begin\{(\w+)\}(.*?)\\end\{\1\}")
+
+    def test_word_classes(self):
+        r"""Test \w and \b are flagged as unicode-word features."""
+        assert UNICODE_WORD in pattern_features(r"\bfoo")
+        assert UNICODE_WORD in pattern_features(r"[\w.]+")
+
+    def test_unicode_classes(self):
+        r"""Test \d and \s are flagged unless the pattern is ASCII-only."""
+        assert UNICODE_CLASS in pattern_features(r"a\sb")
+        assert UNICODE_CLASS in pattern_features(r"[^\d]+")
+        assert UNICODE_CLASS not in pattern_features(r"(?a)a\sb")
+        assert not Re2Backend().supports(r"a\sb")
+
+    def test_plain_pattern(self):
+        """Test a plain pattern needs no backtracking features."""
+        assert pattern_features(r"\\cite\{([^}]+)\}") == frozenset()
+
+
+class TestBackendSelection:
+    """Tests for backend compilation and fallback."""
+
+    def setup_method(self):
+        """Register a fresh fake backend."""
+        self.backend = FakeLinearBackend()
+        register_backend("fake", lambda: self.backend)
+
+    def teardown_method(self):
+        """Restore the stdlib backend."""
+        set_backend("re")
+
+    def test_supported_pattern_uses_backend(self):
+        """Test patterns without unsupported features go to the backend."""
+        compile_with(self.backend, r"\d+")
+        assert self.backend.compiled == [r"\d+"]
+
+    def test_lookbehind_falls_back_to_re(self):
+        """Test unsupported features are compiled with re."""
+        compiled = compile_with(self.backend, r"(?<!\\)\d+")
+        assert self.backend.compiled == []
+        assert compiled.search(r"\1 2").group() == "2"
+
+    def test_compile_rule_follows_selected_backend(self):
+        """Test compile_rule uses the backend chosen by set_backend."""
+        set_backend("fake")
+        compile_rule(r"[א-ת]+", label="hebrew")
+        assert self.backend.compiled == [r"[א-ת]+"]
+
+    def test_unknown_backend_falls_back(self):
+        """Test selecting an unavailable backend keeps re."""
+        assert set_backend("missing").name == "re"
+        register_backend("absent", lambda: None)
+        assert set_backend("absent").name == "re"
+
+
+class TestBenchmark:
+    """Tests for backend benchmarking."""
+
+    def test_counts_native_and_fallback(self):
+        """Test each backend reports native and fallback pattern counts."""
+        patterns = [
+            RulePattern("T", "plain", "pattern", r"\d+"),
+            RulePattern("T", "behind", "pattern", r"(?<!x)\d+"),
+        ]
+        backends = {"re": RegexBackend(), "fake": FakeLinearBackend()}
+        timings = {t.backend: t for t in benchmark_backends(["a 1 b 22"], patterns, backends)}
+        assert (timings["re"].native, timings["re"].fallback) == (2, 0)
+        assert (timings["fake"].native, timings["fake"].fallback) == (1, 1)
+        assert timings["fake"].matches == timings["re"].matches == 4
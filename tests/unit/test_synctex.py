@@ -0,0 +1,97 @@
+"""
+Tests for the SyncTeX index reader.
+
+Covers record parsing and unit conversion, forward and reverse search,
+per-page source ranges and the mtime-keyed cache.
+"""
+
+import gzip
+
+from qa_engine.infrastructure.indexing import SyncTexCache, read_synctex
+
+BP = 65781.76  # sp per PDF point
+
+SYNCTEX = """SyncTeX Version:1
+Input:1:/book/./main.tex
+Input:2:/book/./chapters/ch1.tex
+Output:pdf
+Magnification:1000
+Unit:1
+X Offset:0
+Y Offset:0
+Content:
+!120
+{1
+[2,5:4736286,24736286:30000000,20000000,0
+(2,7:4736286,6578176:30000000,657817,131563
+x2,7:5000000,6578176
+k2,7:6000000,6578176:65536
+)
+(2,9:4736286,9868000:30000000,657817,131563
+g2,9:5500000,9868000
+)
+]
+}1
+{2
+[1,20:4736286,24736286:30000000,20000000,0
+(2,31:4736286,6578176:30000000,657817,131563
+)
+]
+}2
+Postamble:
+Count:9
+"""
+
+
+def _write(tmp_path, text=SYNCTEX):
+    path = tmp_path / "main.synctex.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        handle.write(text)
+    return path
+
+
+class TestSyncTexIndex:
+    """Tests for reading and querying an index."""
+
+    def test_records_in_points(self, tmp_path):
+        """Records are converted from sp to big points with their source."""
+        index = read_synctex(_write(tmp_path))
+        assert index.pages == [1, 2]
+        first = index.boxes(1)[0]
+        assert (first.kind, first.file, first.line) == ("vbox", "/book/./chapters/ch1.tex", 5)
+        assert round(first.x, 2) == 72.0 and round(first.height, 1) == round(20000000 / BP, 1)
+
+    def test_forward_search(self, tmp_path):
+        """Source lines map to their pages; relative paths match by tail."""
+        index = read_synctex(_write(tmp_path))
+        assert [b.kind for b in index.locations("chapters/ch1.tex", 7)] == ["hbox", "current", "kern"]
+        assert index.pages_of("/book/chapters/ch1.tex", 31) == [2]
+        assert index.locations("other.tex", 7) == []
+
+    def test_reverse_search(self, tmp_path):
+        """A point maps to the smallest box around it, else the nearest record."""
+        index = read_synctex(_write(tmp_path))
+        box = index.source_at(1, 80.0, 99.0)
+        assert (box.kind, box.line) == ("hbox", 7)
+        assert index.source_at(1, 80.0, 300.0).line == 5  # Inside the page vbox only
+        assert index.source_at(3, 0, 0) is None
+
+    def test_source_range(self, tmp_path):
+        """Each page reports the source lines it was built from."""
+        index = read_synctex(_write(tmp_path))
+        assert index.source_range(1) == {"/book/./chapters/ch1.tex": (5, 9)}
+        assert index.source_range(2) == {"/book/./main.tex": (20, 20), "/book/./chapters/ch1.tex": (31, 31)}
+
+
+class TestSyncTexCache:
+    """Tests for SyncTexCache."""
+
+    def test_lookup_and_reuse(self, tmp_path):
+        """A PDF or .tex path finds the sibling synctex; unchanged files are reused."""
+        _write(tmp_path)
+        cache = SyncTexCache()
+        index = cache.index(tmp_path / "main.pdf")
+        assert index is cache.index(tmp_path / "main.tex")
+        _write(tmp_path, SYNCTEX.replace("(2,31:", "(2,32:"))
+        assert cache.index(tmp_path / "main.pdf").pages_of("chapters/ch1.tex", 32) == [2]
+        assert cache.index(tmp_path / "missing.pdf") is None
@@ -0,0 +1,186 @@
+"""
+Tests for the parse-once table index.
+"""
+
+import os
+import subprocess
+import sys
+
+from qa_engine.table.detection.fancy_table_detector import FancyTableDetector
+from qa_engine.table.fixing import (
+    ColumnTransformer,
+    FancyTableFixer,
+    HeaderColorFixer,
+    TableIndex,
+    TableParser,
+)
+
+DOC = r"""intro
+\begin{tabular}[t]{|p{2cm}|l|}
+\hline
+א & b \\
+\hline
+c &
+ d \\
+\end{tabular}
+mid
+\begin{tabularx}{\textwidth}{XX}
+e & f \\
+\end{tabularx}
+"""
+
+
+NESTED = r"""\begin{tabular}{|c|c|}
+A & B \\
+\begin{tabular}{c}
+x \\
+y \\
+\end{tabular} & Z \\
+C & D \\
+\end{tabular}"""
+
+
+def long_table(rows: int) -> str:
+    body = "\n".join(f"r{i} & v{i} \\\\" for i in range(rows))
+    return "\\begin{tabular}{ll}\n\\hline\n" + body + "\n\\rowcolor{gray!10} x & y \\\\\n\\end{tabular}"
+
+
+BOOKTABS = r"""\begin{tabular}{lr}
+\toprule
+Name & Value \\
+\midrule
+a & 1 \\
+\cmidrule(lr){1-2}
+b & 2 \\
+\bottomrule
+\end{tabular}"""
+
+
+class TestTableParser:
+    """Tests for argument parsing and spans."""
+
+    def test_nested_column_spec(self):
+        """Test column specs with p{} are read brace-balanced."""
+        table = TableParser().parse(r"\begin{tabular}{|p{2cm}|l|}" + "\n" + r"\end{tabular}")
+        assert table.column_spec == "|p{2cm}|l|"
+
+    def test_tabularx_width(self):
+        """Test tabularx width and spec are both read."""
+        table = TableParser().parse(r"\begin{tabularx}{\textwidth}{XX}" + "\n" + r"\end{tabularx}")
+        assert (table.width, table.column_spec) == (r"\textwidth", "XX")
+
+    def test_nested_table_stays_in_its_cell(self):
+        """Test a nested tabular neither ends the outer table nor splits its row."""
+        table = TableParser().parse(NESTED)
+        assert [len(row.cells) for row in table.rows] == [2, 2, 2]
+        assert table.rows[1].cells[1].content == "Z"
+        assert table.rows[2].cells[0].content == "C"
+        assert NESTED[table.end:] == r"\end{tabular}"
+
+    def test_booktabs_rules_are_rule_lines(self):
+        """Test booktabs rules separate rows instead of joining the next one."""
+        table = TableParser().parse(BOOKTABS)
+        assert [row.cells[0].content for row in table.rows] == ["Name", "a", "b"]
+        assert table.rows[0].line == 2 and table.rows[0].has_hline_before
+
+    def test_columns_parsed_with_table(self):
+        """Test the column spec is split once at parse time."""
+        table = TableParser().parse(r"\begin{tabular}{|p{2cm}|L|}" + "\n" + r"\end{tabular}")
+        assert table.columns == [("p", "2cm"), ("l", "")]
+
+
+class TestTableIndex:
+    """Tests for locating, parsing and updating tables."""
+
+    def test_tables_and_spans(self):
+        """Test tables are found with row and cell spans into the document."""
+        first, second = TableIndex(DOC).tables()
+        assert (first.environment, first.start_line, first.end_line) == ("tabular", 1, 7)
+        assert [(row.line, DOC[row.start:row.end]) for row in first.rows] == [
+            (3, "א & b \\\\"), (5, "c &\n d \\\\")
+        ]
+        assert [DOC[c.start:c.end] for c in first.rows[1].cells] == ["c", "d"]
+        assert second.environment == "tabularx"
+
+    def test_parsed_once(self):
+        """Test repeated lookups return the same parsed table."""
+        index = TableIndex(DOC)
+        assert index.table_at_line(9) is index.tables()[1]
+        assert index.table_at(DOC.index("e &")) is index.tables()[1]
+
+    def test_long_table_not_truncated(self):
+        """Test tables longer than 50 lines are parsed to their end."""
+        table = TableIndex(long_table(80)).tables()[0]
+        assert len(table.rows) == 81
+        assert table.raw_content.endswith(r"\end{tabular}")
+
+    def test_replace_shifts_later_tables(self):
+        """Test replacing one table re-parses it and shifts the rest."""
+        index = TableIndex(DOC)
+        first, second = index.tables()
+        added = index.replace(first, "\\begin{rtltabular}{ll}\nx & y \\\\\n\\end{rtltabular}")
+        assert [t.environment for t in added] == ["rtltabular"]
+        assert index.tables()[1] is second
+        assert second.start_line == 5
+        row = second.rows[0]
+        assert index.content[row.start:row.end] == "e & f \\\\"
+
+    def test_replace_enclosing_after_nested(self):
+        """Test an outer table whose parse a nested replace dropped is found again."""
+        index = TableIndex(NESTED)
+        outer, inner = index.tables()
+        index.replace(inner, "\\begin{rtltabular}{c}\nx \\\\\n\\end{rtltabular} & Z \\\\")
+        added = index.replace(outer, "done")
+        assert added == [] and index.content == "done"
+
+
+class TestBooktabsConsumers:
+    """Tests for fixers on booktabs tables."""
+
+    def test_header_color_on_header_not_toprule(self):
+        """Test the header color goes on the header row, not on \\toprule."""
+        fixed, result = HeaderColorFixer().fix_content(BOOKTABS)
+        assert result.fixes_applied == 1
+        assert fixed.split("\n")[1:3] == [r"\toprule", r"\rowcolor{blue!15}Name & Value \\"]
+
+    def test_transformer_uses_parsed_columns(self):
+        """Test the column transformer reads columns from the parsed table."""
+        table = TableParser().parse(BOOKTABS)
+        table.column_spec = "lr"
+        table.columns = [("l", ""), ("r", ""), ("c", "")]
+        assert ColumnTransformer().convert_column_spec("lr", table).count("p{") == 3
+
+
+class TestImportOrder:
+    """Tests that table packages import cleanly on their own."""
+
+    def test_table_package_imports_first(self):
+        """Test importing the table package before infrastructure has no cycle."""
+        code = "import qa_engine.table, qa_engine.infrastructure.table_orchestrator"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        assert proc.returncode == 0, proc.stderr
+
+
+class TestLongTableConsumers:
+    """Tests for detectors and fixers on long tables."""
+
+    def test_detector_sees_rows_past_fifty_lines(self):
+        """Test gray data rows near the end of a long table are reported."""
+        result = FancyTableDetector().detect_content(long_table(60), "t.tex")
+        assert "gray_rowcolor_on_data" in result.issues[0].problems
+
+    def test_fixer_rewrites_whole_long_table(self):
+        """Test the fixer replaces every line of a long table."""
+        result = FancyTableFixer().fix_content("before\n" + long_table(60) + "\nafter")
+        assert result.tables_fixed == 1
+        assert r"\end{tabular}" not in result.content
+        assert result.content.endswith(r"\end{rtltabular}" + "\nafter")
+
+    def test_fixer_rewrites_nested_tables(self):
+        """Test both tables of a nested pair are rewritten without losing cells."""
+        result = FancyTableFixer().fix_content(NESTED)
+        assert result.tables_fixed == 2
+        assert r"\begin{tabular}" not in result.content
+        for text in ("{A}", "{B}", "{C}", "{D}", "{Z}", "{x}", "{y}"):
+            assert text in result.content
@@ -0,0 +1,88 @@
+"""
+Tests for the TikZ externalization cache.
+"""
+
+from pathlib import Path
+
+from qa_engine.infrastructure.creation import CommandCompiler, TikzExternalizer
+
+DOC = r"""\documentclass{article}
+\usepackage{tikz}
+\usetikzlibrary{arrows}
+\tikzset{
+  box/.style={draw}
+}
+% \usepackage{unused}
+\begin{document}
+Text
+\begin{tikzpicture}
+\node[box] {A};
+\begin{tikzpicture}\end{tikzpicture}
+\end{tikzpicture}
+\begin{tikzpicture}[remember picture]
+\node {B};
+\end{tikzpicture}
+\begin{tikzpicture}
+\draw (0,0) -- (1,1);
+\end{tikzpicture}
+\end{document}
+"""
+
+
+class FakeCompiler:
+    """Writes a PDF stub instead of running LaTeX and records what it compiled."""
+
+    def __init__(self, fail_on: str = "") -> None:
+        self.sources = []
+        self.fail_on = fail_on
+
+    def compile(self, tex_path: Path, out_dir: Path):
+        source = tex_path.read_text()
+        self.sources.append(source)
+        if self.fail_on and self.fail_on in source:
+            return None
+        pdf = out_dir / (tex_path.stem + ".pdf")
+        pdf.write_bytes(b"%PDF-1.5")
+        return pdf
+
+
+class TestTikzExternalizer:
+    """Tests for hashing, compiling and substituting pictures."""
+
+    def test_build_copy_uses_cached_pdfs(self, tmp_path):
+        """Test standalone pictures compile once and are replaced by includegraphics."""
+        compiler = FakeCompiler()
+        externalizer = TikzExternalizer(tmp_path / "cache", compiler)
+        result = externalizer.externalize(DOC, build_dir=tmp_path)
+        assert (result.compiled, result.reused) == (2, 0)
+        assert result.content.count("\\includegraphics{cache/") == 2
+        assert "remember picture" in result.content
+        assert "\\usetikzlibrary{arrows}\n\\tikzset{\n  box/.style={draw}\n}" in compiler.sources[0]
+        assert "unused" not in compiler.sources[0]
+
+        again = externalizer.externalize(DOC, build_dir=tmp_path)
+        assert (again.compiled, again.reused, len(compiler.sources)) == (0, 2, 2)
+        assert again.content == result.content
+
+    def test_only_changed_pictures_recompile(self, tmp_path):
+        """Test editing one picture or the preamble invalidates the right entries."""
+        compiler = FakeCompiler()
+        externalizer = TikzExternalizer(tmp_path, compiler)
+        externalizer.externalize(DOC)
+        assert externalizer.externalize(DOC.replace("(1,1)", "(2,2)")).compiled == 1
+        assert externalizer.externalize(DOC.replace("arrows", "calc")).compiled == 2
+
+    def test_failed_picture_left_in_place(self, tmp_path):
+        """Test a picture that fails to compile stays inline and is reported."""
+        result = TikzExternalizer(tmp_path, FakeCompiler(fail_on="(1,1)")).externalize(DOC)
+        assert list(result.failed) == [17]
+        assert "\\draw (0,0) -- (1,1);" in result.content
+
+    def test_key_is_stable_across_compiler_instances(self, tmp_path):
+        """Test a new compiler instance reuses the cache and another command does not."""
+        TikzExternalizer(tmp_path, FakeCompiler()).externalize(DOC)
+        assert TikzExternalizer(tmp_path, FakeCompiler()).externalize(DOC).compiled == 0
+        lua = TikzExternalizer(tmp_path, CommandCompiler()).pictures(DOC)
+        pdf = TikzExternalizer(tmp_path, CommandCompiler(("pdflatex",))).pictures(DOC)
+        assert lua[0].digest == TikzExternalizer(tmp_path, CommandCompiler()).pictures(DOC)[0].digest
+        assert lua[0].digest != pdf[0].digest
@@ -0,0 +1,77 @@
+"""
+Tests for batched translation with a translation memory.
+"""
+
+from qa_engine.infrastructure.fixing import BatchTranslator, HebrewContentFixer, TranslationMemory
+from qa_engine.infrastructure.fixing.translation_memory import PhraseTrie
+
+LISTING = "\\begin{pythonbox}\n# הדפסת התוצאה\nprint(x)  # הדפסת התוצאה\n# דוגמה\n\\end{pythonbox}\n"
+
+
+class RecordingTranslator:
+    """Batch callback stub that records each request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, phrases):
+        self.requests.append(list(phrases))
+        return {p: "print the result" for p in phrases if p == "הדפסת התוצאה"}
+
+
+class TestPhraseTrie:
+    """Tests for dictionary lookups."""
+
+    def test_longest_match(self):
+        """Test multi-word entries win over single words."""
+        trie = PhraseTrie({"קובץ": "file", "קובץ הגדרות": "config file", "חדש": "new"})
+        assert trie.translate("קובץ הגדרות חדש") == ("config file new", True)
+        assert trie.translate("קובץ ישן") == ("file ישן", False)
+
+
+class TestBatchTranslation:
+    """Tests for deduplicated, batched, remembered translation."""
+
+    def test_repeated_phrase_translated_once(self, tmp_path):
+        """Test a phrase repeated across files costs one batched request."""
+        files = []
+        for i in range(3):
+            files.append(tmp_path / f"ch{i}.tex")
+            files[-1].write_text(LISTING)
+        callback = RecordingTranslator()
+        fixer = HebrewContentFixer(batch_translator=callback, memory_path=tmp_path / "tm.json")
+        result = fixer.fix_project(files)
+        assert callback.requests == [["הדפסת התוצאה"]]
+        assert result.fixes_applied == 9
+        assert "print(x)  # print the result\n# Example" in files[2].read_text()
+
+    def test_memory_reused_across_runs(self, tmp_path):
+        """Test remembered phrases are not requested again."""
+        memory_path = tmp_path / "tm.json"
+        HebrewContentFixer(batch_translator=RecordingTranslator(), memory_path=memory_path) \
+            .fix_content(LISTING)
+        callback = RecordingTranslator()
+        fixed, _ = HebrewContentFixer(batch_translator=callback, memory_path=memory_path) \
+            .fix_content(LISTING)
+        assert callback.requests == []
+        assert TranslationMemory(memory_path).get("הדפסת התוצאה") == "print the result"
+        assert "# print the result" in fixed
+
+    def test_untranslated_marked(self):
+        """Test phrases nobody could translate are marked for review."""
+        translator = BatchTranslator({"דוגמה": "Example"})
+        assert translator.translate_all(["דוגמה", "משהו"]) == {
+            "דוגמה": "Example", "משהו": "[TRANSLATE: משהו]",
+        }
+
+    def test_known_words_kept_in_untranslated_phrase(self):
+        """Test only the unknown words of a partly known phrase are marked."""
+        fixed, _ = HebrewContentFixer().fix_content("\\begin{pythonbox}\n# חישוב ממוצע\n\\end{pythonbox}")
+        assert "# Calculation [TRANSLATE: ממוצע]" in fixed
+
+    def test_unanswered_phrase_keeps_trie_output(self):
+        """Test a phrase the callback leaves out falls back to the dictionary words."""
+        translator = BatchTranslator({"דוגמה": "Example"}, batch_callback=lambda phrases: {})
+        assert translator.translate_all(["דוגמה של משהו חדש"]) == {
+            "דוגמה של משהו חדש": "Example [TRANSLATE: של משהו חדש]",
+        }
@@ -0,0 +1,173 @@
+"""
+Tests for the cross-reference graph and XrefDetector.
+
+Covers source/aux/bib extraction, incremental per-file updates and the
+undefined, unused and duplicate queries.
+"""
+
+import os
+
+from qa_engine.bibliography.detection.bib_detector import BibDetector
+from qa_engine.infrastructure.detection import XrefDetector
+from qa_engine.infrastructure.indexing import XrefGraph, document_files, extract_xrefs
+
+CHAPTER = r"""\chapter{Intro}\label{ch:intro}
+See \ref{sec:a} and \cref{fig:x,sec:a}, \citep[p.~3]{knuth84, lamport94}.
+% \ref{commented}
+\section{A}\label{sec:a}
+\chapterrefrange{2}{5} and \chapterreflist{2, 7 ו-9}
+"""
+
+
+class TestExtraction:
+    """Tests for extract_xrefs."""
+
+    def test_source_occurrences(self):
+        """Labels define, ref/cite/chapterref use; comments are skipped."""
+        found = [(o.kind, o.key, o.line, o.defines) for o in extract_xrefs(CHAPTER, "ch1.tex")]
+        assert found == [
+            ("label", "ch:intro", 1, True),
+            ("label", "sec:a", 2, False),
+            ("label", "fig:x", 2, False),
+            ("label", "sec:a", 2, False),
+            ("cite", "knuth84", 2, False),
+            ("cite", "lamport94", 2, False),
+            ("label", "sec:a", 4, True),
+            ("chapter", "2", 5, False),
+            ("chapter", "5", 5, False),
+            ("chapter", "2", 5, False),
+            ("chapter", "7", 5, False),
+            ("chapter", "9", 5, False),
+        ]
+
+    def test_aux_and_bib(self):
+        """Aux labels, bibcites and chapter numbers; bib entry keys."""
+        aux = "\\newlabel{fig:x}{{1}{2}}\n\\bibcite{knuth84}{1}\n" \
+              "\\@writefile{toc}{\\contentsline {chapter}{\\numberline {2}Intro}{3}}\n"
+        assert [(o.kind, o.key) for o in extract_xrefs(aux, "main.aux")] == [
+            ("label", "fig:x"), ("cite", "knuth84"), ("chapter", "2"),
+        ]
+        bib = "@string{x = y}\n@Book{lamport94,\n title={LaTeX}}\n@article{ key-2 ,}"
+        assert [o.key for o in extract_xrefs(bib, "refs.bib")] == ["lamport94", "key-2"]
+
+
+class TestXrefGraph:
+    """Tests for XrefGraph queries and incremental updates."""
+
+    def test_queries(self):
+        """Undefined uses, orphan labels and duplicates."""
+        graph = XrefGraph()
+        graph.update("ch1.tex", CHAPTER)
+        graph.update("ch2.tex", "\\label{sec:a}\n\\label{orphan}\n")
+        assert [o.key for o in graph.undefined()] == ["fig:x"]
+        assert [o.key for o in graph.unused()] == ["ch:intro", "orphan"]
+        assert list(graph.duplicates()) == ["sec:a"]
+        assert graph.undefined("chapter") == []  # No chapter numbers known yet
+
+    def test_incremental_update(self):
+        """Re-indexing a file replaces only its occurrences."""
+        graph = XrefGraph()
+        graph.update("ch1.tex", CHAPTER)
+        graph.update("ch2.tex", "\\label{fig:x}")
+        assert graph.undefined() == []
+        graph.update("ch2.tex", "no labels")
+        assert [o.key for o in graph.undefined()] == ["fig:x"]
+        graph.remove("ch1.tex")
+        assert graph.undefined() == [] and graph.files() == [os.path.abspath("ch2.tex")]
+
+    def test_paths_are_normalized(self, tmp_path):
+        """Relative and absolute spellings of a file are one entry."""
+        graph = XrefGraph()
+        graph.update(tmp_path / "ch1.tex", "\\label{a}")
+        graph.update(os.path.relpath(tmp_path / "ch1.tex"), "\\label{a}")
+        assert graph.duplicates() == {}
+        assert len(graph.files()) == 1
+
+    def test_scan_project_skips_unchanged(self, tmp_path):
+        """Only changed files are re-parsed; aux files define labels and chapters."""
+        (tmp_path / "ch1.tex").write_text(CHAPTER, encoding="utf-8")
+        (tmp_path / "main.aux").write_text(
+            "\\newlabel{fig:x}{{1}{2}}\n"
+            "\\contentsline {chapter}{\\numberline {2}A}{1}\n"
+            "\\contentsline {chapter}{\\numberline {5}B}{9}\n",
+            encoding="utf-8",
+        )
+        graph = XrefGraph()
+        assert graph.scan_project(tmp_path) == 2
+        assert graph.scan_project(tmp_path) == 0
+        assert graph.undefined() == []
+        assert [o.key for o in graph.undefined("chapter")] == ["7", "9"]
+        (tmp_path / "main.aux").unlink()
+        assert graph.scan_project(tmp_path) == 1
+        assert [o.key for o in graph.undefined()] == ["fig:x"]
+
+
+def book(tmp_path):
+    """A main document with one subfile, its standalone copy and a .bib."""
+    (tmp_path / "chapters").mkdir()
+    (tmp_path / "main.tex").write_text(
+        "\\documentclass{book}\n\\addbibresource{refs.bib}\n"
+        "\\subfile{chapters/ch1}\n% \\input{old}\n\\include{appendix}\n", encoding="utf-8")
+    (tmp_path / "chapters" / "ch1.tex").write_text(CHAPTER, encoding="utf-8")
+    (tmp_path / "chapters" / "ch1-standalone.tex").write_text(CHAPTER, encoding="utf-8")
+    (tmp_path / "appendix.tex").write_text("\\label{fig:x}\n", encoding="utf-8")
+    (tmp_path / "appendix.aux").write_text("\\newlabel{fig:x}{{1}{2}}\n", encoding="utf-8")
+    (tmp_path / "refs.bib").write_text("@book{knuth84,\n}\n@book{unused,\n}\n", encoding="utf-8")
+    return tmp_path
+
+
+class TestDocumentScope:
+    """Tests for indexing one root document."""
+
+    def test_document_files_follow_includes(self, tmp_path):
+        """Subfiles, includes, their .aux and the .bib are followed; comments are not."""
+        root = book(tmp_path)
+        names = sorted(os.path.relpath(name, root) for name in document_files(root / "main.tex"))
+        assert names == ["appendix.aux", "appendix.tex", os.path.join("chapters", "ch1.tex"), "main.tex", "refs.bib"]
+
+    def test_standalone_copy_is_not_a_duplicate(self, tmp_path):
+        """detect_project scopes to main.tex, so a standalone copy adds no duplicates."""
+        root = book(tmp_path)
+        rules = {i.rule for i in XrefDetector().detect_project(root)}
+        assert "ref-duplicate-label" not in rules
+        graph = XrefGraph()
+        graph.scan_project(root)
+        assert "sec:a" in graph.duplicates()
+
+    def test_bib_detector_uses_graph(self, tmp_path):
+        """BibDetector cross-checks through its graph and re-parses nothing unchanged."""
+        root = book(tmp_path)
+        detector = BibDetector()
+        result = detector.detect_in_project(root, root / "refs.bib")
+        found = sorted((i.type.value, i.key) for i in result.issues if i.key)
+        assert found == [("missing_entry", "lamport94"), ("unused_entry", "unused")]
+        assert result.citations_total == 4 and result.bib_entries == ["knuth84", "unused"]
+        assert detector.graph.scan_files(detector.graph.files()) == 0
+
+
+class TestXrefDetector:
+    """Tests for XrefDetector."""
+
+    def test_detect_file_after_scan(self, tmp_path):
+        """Issues of one file of a scanned project, with rule names from XREF_RULES."""
+        (tmp_path / "ch2.tex").write_text("\\label{sec:b}\n", encoding="utf-8")
+        detector = XrefDetector()
+        detector.detect_project(tmp_path)
+        path = str(tmp_path / "ch1.tex")
+        issues = detector.detect(CHAPTER, path)
+        found = sorted((i.rule, i.line, i.content) for i in issues)
+        assert found == [
+            ("ref-orphan-label", 1, "ch:intro"),
+            ("ref-undefined-label", 2, "fig:x"),
+        ]
+        assert all(i.file == path for i in issues)
+
+    def test_detect_file_without_scan_is_order_independent(self):
+        """Before a project scan only in-file duplicates are reported."""
+        first, second = XrefDetector(), XrefDetector()
+        first.detect("\\ref{sec:a}\n", "ch2.tex")
+        issues = first.detect(CHAPTER + "\\label{ch:intro}\n", "ch1.tex")
+        alone = second.detect(CHAPTER + "\\label{ch:intro}\n", "ch1.tex")
+        found = sorted((i.rule, i.line, i.content) for i in issues)
+        assert found == sorted((i.rule, i.line, i.content) for i in alone)
+        assert found == [("ref-duplicate-label", 1, "ch:intro"), ("ref-duplicate-label", 6, "ch:intro")]